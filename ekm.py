@@ -13,20 +13,26 @@ if __name__ == '__main__':
   import __init__
 
 # System packages
-import argparse
-import json
-import random
+import bisect
 import sys
 import time
+import warnings
 
 # Numerical packages
+from math import log
+from operator import itemgetter
 import numpy as np
-from scipy.integrate import ode, quad
-from scipy.optimize import brentq
-from scipy.special import ellipk, ellipe
+from numpy.polynomial.chebyshev import chebinterpolate
+from scipy.special import ellipk, ellipe, ellipkm1
 
 # Triplesec packages
 from ts_constants import *
+import ts_cache
+import ts_checkpoint
+import ts_events
+import ts_output
+import ts_solvers
+import ts_stats
 
 class Triple_octupole:
   '''A hierachical triple where only the octupole term of the Hamiltonian is
@@ -48,15 +54,46 @@ class Triple_octupole:
     tstop: The time to integrate (units of t_KL)
     cputstop: The number of CPU seconds to integrate for
     outfreq: Print out state every n steps (-1 for no output)
-    outfile: Filename to write output to (None for stdout)
+    outfilename: Filename to write output to (None for stdout)
+    outformat: The format of the output file, 'text', 'npy', or 'none'.  See
+      ts_output.
     atol: Absolute tolerance of the integrator
     rtol: Relative tolerance of the integrator
+    integration_algo: The integration algorithm.  See ts_solvers.
+    outtimes: Print output only at these times (units of t_KL).  If set,
+      the solver integrates without interruption between output times and
+      the output is interpolated by the solver.  The final state at tstop
+      is always printed.  outfreq is ignored.
+    exact: Calculate F by numerical integration rather than interpolating
+      it from a table.  See F.
+    stats: Count and time the parts of the integration.  See ts_stats.
+    stats_outfilename: Write the stats in JSON format to this file at the
+      end of the integration ('stderr' for stderr).
+    checkpoint_filename: Write a checkpoint to this file every
+      checkpoint_interval seconds and at the end of the integration.  See
+      ts_checkpoint.
+    checkpoint_interval: The wall time between checkpoints in seconds
+    decimate: Write only the rows at which jz or CKL is largest or smallest
+      in each interval of this length (units of t_KL), as well as the first
+      and last rows.  See ts_output.DecimatedOutput.
   '''
 
+  # The columns of the output.  See printout.
+  columns = ['t', 'jz', 'Omega', 'fj', 'fOmega', 'x', 'CKL']
+
+  # The columns whose extrema are kept when the output is decimated: jz and
+  # CKL.  See ts_output.DecimatedOutput.
+  decimation_keys = [itemgetter(1), itemgetter(6)]
+
   def __init__(self, a1=1, a2=20, e1=.1, e2=.3, inc=80, longascnode=180,
     argperi=0, epsoct=None, phiq=None, chi=None, tstop=1e3, cputstop=300, 
     outfreq=1, outfilename=None, atol=1e-9, rtol=1e-9,
-    integration_algo='vode'):
+    integration_algo='vode', outtimes=None, exact=False, outformat='text',
+    stats=False, stats_outfilename=None, checkpoint_filename=None,
+    checkpoint_interval=600, decimate=None):
+
+    # The parameters, to be saved in checkpoints
+    self._params = ts_checkpoint.parameters(locals())
 
     #
     # Given parameters
@@ -68,6 +105,7 @@ class Triple_octupole:
     self.inc = inc
     self.Omega = longascnode * np.pi / 180
     self.omega = argperi * np.pi / 180
+    self.exact = exact
 
     #
     # Derived parameters
@@ -91,10 +129,11 @@ class Triple_octupole:
     else:
       self.epsoct = epsoct
     if chi is None:
-      self.chi = F(self.CKL) - self.epsoct * np.cos(self.Omega)
+      self.chi = self.calc_F(self.CKL) - self.epsoct * np.cos(self.Omega)
     else:
       self.chi = chi
-      self.Omega = np.arccos((F(self.CKL) - self.chi) / self.epsoct)
+      self.Omega = np.arccos((self.calc_F(self.CKL) - self.chi) /
+        self.epsoct)
 
     self.set_x()
     self.set_fj()
@@ -108,23 +147,30 @@ class Triple_octupole:
     self.tstop = tstop
     self.cputstop = cputstop
     self.outfreq = outfreq
+    self.outtimes = outtimes
     self.outfilename = outfilename
+    self.outformat = outformat
+    self.decimate = decimate
     self.integration_algo = integration_algo
     self.y = [self.jz, self.Omega]
     self.tol = 1e-9
     self.atol = atol
     self.rtol = rtol
 
-    if self.outfilename is not None:
-      self.outfile = open(self.outfilename, 'w')
-
-    # Set up the integrator
-    self.solver = ode(self._deriv)
-    self.solver.set_integrator(self.integration_algo, nsteps=1, 
-      atol=self.atol, rtol=self.rtol)
-    self.solver.set_initial_value(self.y, self.t).set_f_params(self.epsoct,
-      self.phiq)
-    self.solver._integrator.iwork[2] = -1 # Don't print FORTRAN errors
+    self.outfile = ts_output.open_output(self.outfilename, self.columns,
+      self.outformat)
+    ts_output.decimate(self)
+
+    # Set up the integrator.  See ts_solvers.
+    self.stats = ts_stats.Stats() if stats else None
+    self.stats_outfilename = stats_outfilename
+    self.checkpoint_filename = checkpoint_filename
+    self.checkpoint_interval = checkpoint_interval
+    self._tcheckpoint = time.time()
+    self.solver = ts_solvers.make_solver(self.integration_algo, self._deriv,
+      self.y, self.t, self.tstop, self.atol, self.rtol, args=(self.epsoct,
+      self.phiq), stats=self.stats)
+    ts_stats.instrument(self)
 
   def _deriv(self, t, y, epsoct, phiq):
     # Eqs. 11 of Katz (2011)
@@ -141,17 +187,66 @@ class Triple_octupole:
     return [jzdot, Omegadot]
 
   def _step(self):
-    self.solver.integrate(self.tstop, step=True)
+    self.solver.step()
+    self._read_solver()
+    self.nstep += 1
 
-    self.t = self.solver.t
-    self.jz, self.Omega = self.solver.y
+  def _read_solver(self):
+    '''Set the state of the triple from the solver.'''
+    self._set_state(self.solver.t, self.solver.y)
+
+  def _set_state(self, t, y):
+    '''Set the state of the triple from a time and state of the solver.'''
+    self.t = t
+    self.jz, self.Omega = y
 
     # Update all the parameters
     self.set_CKL()
     self.set_x()
     self.set_fj()
     self.set_fOmega()
-    self.nstep += 1
+
+  def checkpoint(self, filename=None):
+    '''Write a checkpoint of the integration to filename, or to
+    checkpoint_filename if filename is None.  See ts_checkpoint.'''
+    ts_checkpoint.save(self, filename or self.checkpoint_filename)
+
+  @classmethod
+  def resume(cls, filename, **kwargs):
+    '''Continue an integration from a checkpoint.  Parameters given as
+    keyword arguments (e.g., tstop) override those of the checkpoint.  See
+    ts_checkpoint.load.'''
+    return ts_checkpoint.load(cls, filename, **kwargs)
+
+  def _advance(self, tout):
+    '''Integrate without interruption to tout.  Return False if the CPU
+    time limit or an integration failure stopped the solver first.'''
+    while self.solver.t < tout:
+      if time.time() - self.tstart > self.cputstop:
+        return False
+      if not self.solver.advance(tout):
+        return False
+    return True
+
+  def _integrate_dense(self):
+    '''Integrate the triple, printing out only at the times in outtimes.'''
+    self.tstart = time.time()
+    # A resumed integration continues after the last output time
+    outtimes = sorted(t for t in self.outtimes if t < self.tstop and (t >
+      self.t or self.nstep == 0))
+    for tout in outtimes + [self.tstop]:
+      finished = self._advance(tout)
+      self.nstep = self.solver.nsteps
+      self._read_solver()
+      self.printout()
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
+      if not finished:
+        break
+
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
+    self.outfile.close()
 
   def set_CKL(self):
     self.CKL = self.calc_CKL()
@@ -179,9 +274,19 @@ class Triple_octupole:
   def set_fOmega(self):
     self.fOmega = self.calc_fOmega()
 
+  def calc_F(self, CKL):
+    return F(CKL, self.exact)
+
+  @ts_stats.measured
   def integrate(self):
     '''Integrate the triple in time.'''
-    self.printout()
+    if self.outtimes is not None:
+      self._integrate_dense()
+      return
+
+    # A resumed integration has already printed its state
+    if self.nstep == 0:
+      self.printout()
 
     self.tstart = time.time()
     while ((self.t < self.tstop) and 
@@ -189,10 +294,13 @@ class Triple_octupole:
       self._step()
       if self.nstep % self.outfreq == 0:
         self.printout()
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
 
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
     self.printout()
-    if self.outfilename is not None:
-      self.outfile.close()
+    self.outfile.close()
 
   def printout(self):
     '''Print out the state of the system in the format:
@@ -200,58 +308,62 @@ class Triple_octupole:
     time  jz  Omega  <f_j>  <f_Omega>  x  C_KL
 
     '''
-    outstring = ' '.join(map(str, [self.t, self.jz, self.Omega, self.fj,
-      self.fOmega, self.x, self.CKL]))
-    if self.outfilename is None:
-      print outstring
-    else:
-      self.outfile.write(outstring + '\n')
+    self.outfile.write([self.t, self.jz, self.Omega, self.fj, self.fOmega,
+      self.x, self.CKL])
 
   def period(self):
     '''Analytically calculate the period of EKM oscillations.'''
+    from scipy.integrate import quad
+    from scipy.optimize import brentq
 
     # First calculate the limits. 
     xcrit = brentq(lambda x: ellipk(x) - 2 * ellipe(x), 0, 1)
     phicrit = 3 * (1 - xcrit) / (3 + 2 * xcrit)
 
     if self.phiq < phicrit:
-      CKLmin = brentq(lambda CKL: self.chi - self.epsoct - F(CKL), self.tol, self.phiq)
+      CKLmin = brentq(lambda CKL: self.chi - self.epsoct - self.calc_F(CKL),
+        self.tol, self.phiq)
     else:
       # Check if flips occur for Omega = Pi or 0
-      if (np.sign(self.chi - self.epsoct - F(self.tol)) != 
-          np.sign(self.chi - self.epsoct - F(self.phiq))):
-        CKLmin = brentq(lambda CKL: self.chi - self.epsoct - F(CKL), self.tol, self.phiq)
+      if (np.sign(self.chi - self.epsoct - self.calc_F(self.tol)) != 
+          np.sign(self.chi - self.epsoct - self.calc_F(self.phiq))):
+        CKLmin = brentq(lambda CKL: self.chi - self.epsoct -
+          self.calc_F(CKL), self.tol, self.phiq)
       else:
-        CKLmin = brentq(lambda CKL: self.chi + self.epsoct - F(CKL), self.tol, self.phiq)
+        CKLmin = brentq(lambda CKL: self.chi + self.epsoct -
+          self.calc_F(CKL), self.tol, self.phiq)
     if self.doesflip():
       CKLmax = self.phiq
     else:
-      CKLmax = brentq(lambda CKL: self.chi + self.epsoct - F(CKL), 0, 1)
+      CKLmax = brentq(lambda CKL: self.chi + self.epsoct - self.calc_F(CKL),
+        self.tol, self.phiq)
 
     prefactor = 256 * np.sqrt(10) / (15 * np.pi) / self.epsoct
     P = quad(lambda CKL: (prefactor * ellipk((3 - 3*CKL)/(3 + 2*CKL)) / 
       (4 - 11*CKL) / np.sqrt(6 + 4*CKL) / np.sqrt(1 - 1/self.epsoct**2 *
-      (F(CKL) - self.chi)**2) / np.sqrt(2* np.fabs(self.phiq - CKL))), 
-      CKLmin, CKLmax, epsabs=1e-12, epsrel=1e-12, limit=100)
+      (self.calc_F(CKL) - self.chi)**2) / np.sqrt(2* np.fabs(self.phiq -
+      CKL))), CKLmin, CKLmax, epsabs=1e-12, epsrel=1e-12, limit=100)
 
     return P[0]
 
+  @ts_stats.measured
   def numeric_period(self, n_flips=3):
     '''Calculate the period of EKM oscillations by integrating the EOMs and
     taking the average flip time for n_flips flips.'''
 
-    t_flip_prev = 0
-    sign_prev = np.sign(self.jz)
-    periods = []
-    while (len(periods) < n_flips) and (self.t < self.tstop):
-      self._step()
-      if np.sign(self.jz) != sign_prev:
-        if t_flip_prev != 0:
-          periods.append(self.t - t_flip_prev)
-        t_flip_prev = self.t
-        sign_prev = np.sign(self.jz)
+    finder = ts_events.EventFinder(self, [self.flip_event()])
+    fliptimes = []
+    while (len(fliptimes) <= n_flips) and (self.t < self.tstop):
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        fliptimes.append(self.t)
+
+    return np.mean(np.diff(fliptimes[:n_flips + 1]))
 
-    return np.mean(periods)
+  def flip_event(self):
+    '''An event whenever the inner orbit flips between prograde and
+    retrograde.  See ts_events.'''
+    return ts_events.Event(lambda t, y: y[0])
 
   def doesflip(self):
     '''Return True if the triple flips, false otherwise.  This is determined
@@ -264,7 +376,7 @@ class Triple_octupole:
     # C_KL < x < C_KL + j_z^2 / 2
     #
     X = np.linspace(self.CKL, self.CKL + (self.jz)**2 / 2.)
-    DeltaF = np.fabs(np.array(map(F, X)) - F(self.CKL))
+    DeltaF = np.fabs(self.calc_F(X) - self.calc_F(self.CKL))
 
     epsoct_crit = np.max(DeltaF) / 2.
 
@@ -279,11 +391,264 @@ class Triple_octupole:
 def _F_integrand(x):
   return (ellipk(x) - 2 * ellipe(x)) / (41*x - 21) / np.sqrt(2*x + 3)
 
-def F(CKL):
+def _F_quad(CKL):
+  from scipy.integrate import quad
   x_low = (3 - 3 * CKL) / (3 + 2 * CKL)
   integral = quad(_F_integrand, x_low, 1)[0]
   return 32 * np.sqrt(3) / np.pi * integral
 
+#
+# In terms of s = 1 - x, F is an integral from 0 to s_max = 5 CKL / (3 + 2
+# CKL).  The integrand has a pole at s0 = 20/41, i.e., at CKL = 4/11, so F
+# diverges logarithmically there.  We split F into this logarithm and a
+# regular part,
+#
+#   F = _F_regular + _F_LOG * log(s0 / (s0 - s_max)),
+#
+# and tabulate the regular part for 0 < CKL < 4/11 as piecewise Chebyshev
+# series.  The regular part behaves like CKL log CKL at CKL = 0, so the
+# panels are spaced geometrically towards CKL = 0.
+#
+_F_S0 = 20 / 41.
+_F_CKL_MAX = 4 / 11.
+_F_PREFACTOR = 32 * np.sqrt(3) / np.pi / 41
+
+def _F_numerator(s):
+  return (ellipkm1(s) - 2 * ellipe(1 - s)) / np.sqrt(5 - 2*s)
+
+_F_LOG = _F_PREFACTOR * _F_numerator(_F_S0)
+
+def _F_regular(CKL):
+  '''The regular part of F, calculated by numerical integration.'''
+  from scipy.integrate import quad
+  s_max = 5 * CKL / (3 + 2 * CKL)
+  g0 = _F_numerator(_F_S0)
+  integral = quad(lambda s: (_F_numerator(s) - g0) / (_F_S0 - s), 0, s_max,
+    epsabs=1e-15, epsrel=1e-14, limit=200)[0]
+  return _F_PREFACTOR * integral
+
+# The layout of the table.  Change the version if any of these change.
+_F_TABLE_VERSION = 1
+_F_NPANELS = 40
+_F_DEGREE = 20
+_F_TABLE = None
+
+def _build_F_table():
+  '''Tabulate the regular part of F.  Returns a dictionary of the edges of
+  the panels, the Chebyshev coefficients on each panel, and a bound on the
+  absolute error of the interpolant.'''
+  from scipy.integrate import IntegrationWarning
+
+  edges = _F_CKL_MAX * 2.**-np.arange(_F_NPANELS, -1, -1)
+  regular = np.vectorize(_F_regular, otypes=[float])
+
+  with warnings.catch_warnings():
+    # The integrals are asked for more accuracy than quad can guarantee
+    warnings.simplefilter('ignore', IntegrationWarning)
+
+    coeffs = np.array([chebinterpolate(lambda t: regular(a + (b - a) * (t +
+      1) / 2.), _F_DEGREE) for a, b in zip(edges[:-1], edges[1:])])
+
+    # Bound the error by the size of the last coefficients and by comparing
+    # to the integral between the interpolation nodes
+    error = np.abs(coeffs[:, -2:]).sum(axis=1).max()
+    for a, b in zip(edges[:-1], edges[1:]):
+      check = np.linspace(a, b, 12)[1:-1]
+      error = max(error, np.max(np.abs(_F_table_regular(check, edges, coeffs)
+        - regular(check))))
+
+  return {'edges': edges, 'coeffs': coeffs, 'error': np.array(error)}
+
+def _load_F_table():
+  '''Load the table of F, building it if necessary.'''
+  global _F_TABLE
+  if _F_TABLE is None:
+    table = ts_cache.load_table('F_table', _F_TABLE_VERSION, _build_F_table)
+    _F_TABLE = (table['edges'], table['coeffs'], float(table['error']),
+      list(table['edges']), table['coeffs'].tolist())
+  return _F_TABLE
+
+def _F_table_regular(CKL, edges, coeffs):
+  '''Evaluate the tabulated regular part of F at an array of CKL.'''
+  # The panels double in size, so the panel is given by the exponent
+  i = np.clip(np.frexp(CKL / edges[0])[1] - 1, 0, len(edges) - 2)
+  a = edges[i]
+  b = edges[i + 1]
+  t = (2 * CKL - a - b) / (b - a)
+  coeffs = np.take(coeffs.T, i, axis=1)
+  t2 = 2 * t
+  b1 = coeffs[-1].copy()
+  b2 = np.zeros_like(CKL)
+  for coeff in coeffs[-2:0:-1]:
+    b1, b2 = t2 * b1 - b2 + coeff, b1
+  return t * b1 - b2 + coeffs[0]
+
+def F_error():
+  '''Return a bound on the absolute error of the tabulated F.'''
+  return _load_F_table()[2]
+
+def F(CKL, exact=False):
+  '''The function F of Katz et al. (2011).  For 0 < CKL < 4/11,
+  F is interpolated from a table that is built the first time it is needed
+  and then cached (see ts_cache).  The absolute error of the table is
+  bounded by F_error().  Outside of this range, or if exact is True, F is
+  calculated by numerical integration.
+
+  Parameters:
+    CKL: The value of CKL.  May be an array.
+    exact: Calculate F by numerical integration rather than interpolating
+  '''
+
+  if exact:
+    if np.ndim(CKL) == 0:
+      return _F_quad(CKL)
+    return np.vectorize(_F_quad)(CKL)
+
+  edges, coeffs, error, edge_list, coeff_list = _load_F_table()
+
+  if np.ndim(CKL) == 0:
+    if not edges[0] <= CKL < _F_CKL_MAX:
+      return _F_quad(CKL)
+    i = bisect.bisect_right(edge_list, CKL) - 1
+    a = edge_list[i]
+    b = edge_list[i + 1]
+    t = (2 * CKL - a - b) / (b - a)
+    b1 = b2 = 0.
+    for coeff in coeff_list[i][:0:-1]:
+      b1, b2 = 2 * t * b1 - b2 + coeff, b1
+    s_max = 5 * CKL / (3 + 2 * CKL)
+    return (t * b1 - b2 + coeff_list[i][0] + _F_LOG * log(_F_S0 / (_F_S0 -
+      s_max)))
+
+  CKL = np.asarray(CKL, dtype=float)
+  intable = (edges[0] <= CKL) & (CKL < _F_CKL_MAX)
+  if intable.all():
+    s_max = 5 * CKL / (3 + 2 * CKL)
+    return (_F_table_regular(CKL, edges, coeffs) + _F_LOG * np.log(_F_S0 /
+      (_F_S0 - s_max)))
+
+  result = np.empty_like(CKL)
+  result[intable] = F(CKL[intable])
+  outside = ~intable & np.isfinite(CKL)
+  if outside.any():
+    result[outside] = np.vectorize(_F_quad, otypes=[float])(CKL[outside])
+  result[~intable & ~outside] = np.nan
+  return result
+
+def _find_root(f, a, b, xtol=1e-14, maxiter=100):
+  '''Find a root of f between a and b for arrays of brackets using the
+  Illinois variant of regula falsi.  The result is nan where f does not
+  change sign over the bracket.'''
+
+  fa = f(a)
+  fb = f(b)
+  bracketed = np.sign(fa) * np.sign(fb) <= 0
+  for i in range(maxiter):
+    x = b - fb * (b - a) / (fb - fa)
+    x = np.where(bracketed & np.isfinite(x), x, (a + b) / 2.)
+    fx = f(x)
+
+    # Keep the root bracketed between a and the new point.  If the same
+    # end of the bracket is kept twice in a row, halve its value.
+    crossed = np.sign(fx) != np.sign(fb)
+    a = np.where(crossed, b, a)
+    fa = np.where(crossed, fb, fa / 2.)
+    b = x
+    fb = fx
+    if np.all((np.fabs(b - a) < xtol) | (fb == 0) | ~bracketed):
+      break
+
+  return np.where(bracketed, b, np.nan)
+
+def _flip_map_chunk(epsoct, phiq, CKL, chi, npoints, nodes, tol):
+  '''Calculate the flip criterion and the period for 1-D arrays.  See
+  flip_map.'''
+  from scipy.optimize import brentq
+
+  # The flip criterion.  See Triple_octupole.doesflip.
+  X = CKL[:, np.newaxis] + ((phiq - CKL)[:, np.newaxis] * np.linspace(0, 1,
+    npoints))
+  crit = np.max(np.fabs(F(X) - F(CKL)[:, np.newaxis]), axis=1) / 2.
+  flips = epsoct > crit
+
+  # The limits of the period integral.  See Triple_octupole.period.
+  xcrit = brentq(lambda x: ellipk(x) - 2 * ellipe(x), 0, 1)
+  phicrit = 3 * (1 - xcrit) / (3 + 2 * xcrit)
+  lo = np.zeros_like(phiq) + tol
+  sign_change = (np.sign(chi - epsoct - F(lo)) != np.sign(chi - epsoct -
+    F(phiq)))
+  target = np.where((phiq < phicrit) | sign_change, chi - epsoct, chi +
+    epsoct)
+  CKLmin = _find_root(lambda x: target - F(x), lo, phiq)
+  CKLmax = np.where(flips, phiq, _find_root(lambda x: chi + epsoct - F(x), lo,
+    phiq))
+
+  # The period integral has inverse square root singularities at both
+  # limits, so use Gauss-Chebyshev quadrature.
+  t = np.cos((2 * np.arange(1, nodes + 1) - 1) * np.pi / (2 * nodes))
+  mid = ((CKLmin + CKLmax) / 2.)[:, np.newaxis]
+  half = ((CKLmax - CKLmin) / 2.)[:, np.newaxis]
+  C = mid + half * t
+  prefactor = (256 * np.sqrt(10) / (15 * np.pi) / epsoct)[:, np.newaxis]
+  integrand = (prefactor * ellipk((3 - 3*C)/(3 + 2*C)) / (4 - 11*C) /
+    np.sqrt(6 + 4*C) / np.sqrt(1 - 1 / epsoct[:, np.newaxis]**2 * (F(C) -
+    chi[:, np.newaxis])**2) / np.sqrt(2 * np.fabs(phiq[:, np.newaxis] - C)))
+  period = (half[:, 0] * np.pi / nodes * np.sum(integrand * np.sqrt(1 -
+    t**2), axis=1))
+
+  return flips, crit, period
+
+def flip_map(epsoct, phiq, CKL, chi=None, Omega=np.pi, npoints=50,
+  nodes=64, chunksize=4096, tol=1e-9):
+  '''Classify a grid of triples as flipping or not and calculate their EKM
+  periods.  This does the same calculation as the doesflip and period
+  methods of Triple_octupole for every triple at once.  The arguments may
+  be arrays of any shape that can be broadcast together.
+
+  Parameters:
+    epsoct: epsilon_octupole
+    phiq: The value of the quadrupole term of the Hamiltonian
+    CKL: The initial value of CKL
+    chi: The other integral of motion of the octupole term.  If None,
+      calculate it from CKL and Omega.
+    Omega: The initial longitude of the ascending node in radians.  Only
+      used if chi is None.
+    npoints: The number of points at which to evaluate F for the flip
+      criterion
+    nodes: The number of nodes of the quadrature of the period
+    chunksize: The number of triples to calculate at once
+    tol: The smallest CKL at which to look for the limits of the period
+      integral
+
+  Returns:
+    flips: Whether each triple flips
+    epsoct_crit: The critical epsilon_octupole above which the triple flips
+    period: The period of EKM oscillations in units of t_KL.  This is nan
+      where the limits of the period integral could not be found.
+  '''
+
+  epsoct, phiq, CKL = [np.asarray(arr, dtype=float) for arr in (epsoct,
+    phiq, CKL)]
+  if chi is None:
+    chi = F(CKL) - epsoct * np.cos(Omega)
+  epsoct, phiq, CKL, chi = np.broadcast_arrays(epsoct, phiq, CKL, chi)
+
+  shape = epsoct.shape
+  epsoct, phiq, CKL, chi = [arr.ravel() for arr in (epsoct, phiq, CKL, chi)]
+  flips = np.empty(epsoct.size, dtype=bool)
+  crit = np.empty(epsoct.size)
+  period = np.empty(epsoct.size)
+
+  with warnings.catch_warnings():
+    warnings.simplefilter('ignore', RuntimeWarning)
+    for start in range(0, epsoct.size, chunksize):
+      chunk = slice(start, start + chunksize)
+      flips[chunk], crit[chunk], period[chunk] = _flip_map_chunk(
+        epsoct[chunk], phiq[chunk], CKL[chunk], chi[chunk], npoints, nodes,
+        tol)
+
+  return flips.reshape(shape), crit.reshape(shape), period.reshape(shape)
+
 def process_command_line(argv):
   '''Process the command line.'''
   
@@ -291,49 +656,63 @@ def process_command_line(argv):
     argv = sys.argv[1:]
 
   # Configure the command line options
+  import argparse
   parser = argparse.ArgumentParser()
 
-  def_trip = Triple_octupole()
+  defaults = ts_checkpoint.defaults(Triple_octupole)
   parser.add_argument('-a', '--a1', dest='a1', type=float, 
-    default=def_trip.a1, help = 
-    'Inner semi-major axis in au [%g]' % def_trip.a1, metavar='\b')
+    default=defaults['a1'], help = 
+    'Inner semi-major axis in au [%g]' % defaults['a1'], metavar='\b')
   parser.add_argument('-b', '--a2', dest='a2', type=float, 
-    default=def_trip.a2, help = 
-    'Outer semi-major axis in au [%g]' % def_trip.a2, metavar='\b')
+    default=defaults['a2'], help = 
+    'Outer semi-major axis in au [%g]' % defaults['a2'], metavar='\b')
   parser.add_argument('-e', '--e1', dest='e1', type=float, 
-    default=def_trip.e1, help = 
-    'Inner eccentricity [%g]' % def_trip.e1, metavar='\b')
+    default=defaults['e1'], help = 
+    'Inner eccentricity [%g]' % defaults['e1'], metavar='\b')
   parser.add_argument('-f', '--e2', dest='e2', type=float, 
-    default=def_trip.e2, help = 
-    'Outer eccentricity [%g]' % def_trip.e2, metavar='\b')
+    default=defaults['e2'], help = 
+    'Outer eccentricity [%g]' % defaults['e2'], metavar='\b')
   parser.add_argument('-i', '--inc', dest='inc', type=float,
-    default=def_trip.inc, help = 
-    'Inclination of the third body in degrees [%g]' % def_trip.inc,
+    default=defaults['inc'], help = 
+    'Inclination of the third body in degrees [%g]' % defaults['inc'],
     metavar='\b')
   parser.add_argument('-g', '--g1', dest='g1', type=float, 
-    default=def_trip.omega, help = 
-    'Inner argument of periapsis in degrees [%g]' % (def_trip.omega * 180 
-      / np.pi), metavar='\b')
+    default=defaults['argperi'], help = 
+    'Inner argument of periapsis in degrees [%g]' % defaults['argperi'],
+    metavar='\b')
   parser.add_argument('-L', '--Omega', dest='Omega', type=float, 
-    default=def_trip.Omega, help = 
-    'Longitude of ascending node in degrees [%g]' % def_trip.Omega,
+    default=defaults['longascnode'], help = 
+    'Longitude of ascending node in degrees [%g]' % defaults['longascnode'],
     metavar='\b')
   parser.add_argument('-t', '--end', dest='tstop', type=float, 
-    default=def_trip.tstop, help = 'Total time of integration in years [%g]' 
-    % def_trip.tstop, metavar='\b')
+    default=defaults['tstop'], help =
+    'Total time of integration in years [%g]' % defaults['tstop'],
+    metavar='\b')
   parser.add_argument('-C', '--cpu', dest='cputstop', type=float, 
-    default=def_trip.cputstop, help = 
+    default=defaults['cputstop'], help = 
     'cpu time limit in seconds, if -1 then no limit [%g]' %
-    def_trip.cputstop, metavar='\b')
+    defaults['cputstop'], metavar='\b')
   parser.add_argument('-F', '--freq', dest='outfreq', type=int, 
-    default=def_trip.outfreq, help = 'Output frequency [%g]' % 
-    def_trip.outfreq, metavar='\b')
+    default=defaults['outfreq'], help = 'Output frequency [%g]' % 
+    defaults['outfreq'], metavar='\b')
+  parser.add_argument('-N', '--nout', dest='nout', type=int, help = 
+    'Print output at this many evenly spaced times without stopping the '
+    'integrator in between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--dt', dest='dt', type=float, help =
+    'Print output every dt t_KL without stopping the integrator in '
+    'between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--log', dest='nlog', type=int, help =
+    'Print output at this many times spaced evenly in log from 1e-6 tstop '
+    'to tstop (overrides output frequency)', metavar='\b')
+  parser.add_argument('--decimate', dest='decimate', type=float, help =
+    'Print only the extrema of jz and CKL in each interval of this many '
+    't_KL', metavar='\b')
   parser.add_argument('-A', '--abstol', dest='atol', type=float, 
-    default=def_trip.atol, help = 'Absolute accuracy [%g]' % 
-    def_trip.atol, metavar='\b')
+    default=defaults['atol'], help = 'Absolute accuracy [%g]' % 
+    defaults['atol'], metavar='\b')
   parser.add_argument('-R', '--reltol', dest='rtol', type=float, 
-    default=def_trip.rtol, help = 'Relative accuracy [%g]' % 
-    def_trip.rtol, metavar='\b')
+    default=defaults['rtol'], help = 'Relative accuracy [%g]' % 
+    defaults['rtol'], metavar='\b')
   parser.add_argument('--epsoct', dest='epsoct', type=float, help = 
     'Set epsilon_octupole parameter (override SMA and e2 settings)',
     metavar='\b')
@@ -342,19 +721,61 @@ def process_command_line(argv):
   parser.add_argument('--chi', dest='chi', type=float, help =
     'Set the constant chi (override e1, g1, and Omega)', metavar='\b')
   parser.add_argument('--algorithm', dest='algo', type=str,
-    default=def_trip.integration_algo, help = 'Integration algorithm [%s]' 
-    % def_trip.integration_algo)
+    default=defaults['integration_algo'], choices=ts_solvers.SOLVERS, help =
+    'Integration algorithm [%s]' % defaults['integration_algo'])
+  parser.add_argument('--exact', dest='exact', action='store_true',
+    default=defaults['exact'], help =
+    'Calculate F by numerical integration rather than from a table')
+  parser.add_argument('-O', '--outfile', dest='outfilename', type=str, help =
+    'Write output to this file [stdout]', metavar='\b')
+  parser.add_argument('--format', dest='outformat', type=str,
+    default=defaults['outformat'], choices=ts_output.FORMATS, help =
+    'Format of the output file [%s]' % defaults['outformat'])
+  parser.add_argument('--stats', dest='stats_outfilename', type=str, help =
+    'Write counts and timings of the integration in JSON format to this '
+    'file (stderr for stderr)', metavar='\b')
+  parser.add_argument('--checkpoint', dest='checkpoint_filename', type=str,
+    help = 'Write checkpoints of the integration to this file',
+    metavar='\b')
+  parser.add_argument('--checkpoint-interval', dest='checkpoint_interval',
+    type=float, default=defaults['checkpoint_interval'], help =
+    'Wall time between checkpoints in seconds [%g]' %
+    defaults['checkpoint_interval'], metavar='\b')
+  parser.add_argument('--resume', dest='resume', type=str, help =
+    'Continue the integration from this checkpoint.  Only the time and CPU '
+    'limits and the checkpoint options are taken from the command line.',
+    metavar='\b')
 
   arguments = parser.parse_args()
   return arguments
 
 def main(argv=None):
   args = process_command_line(argv)
-  to = Triple_octupole(a1=args.a1, a2=args.a2, e1=args.e1, e2=args.e2, 
-        inc=args.inc, argperi=args.g1, longascnode=args.Omega, 
-        epsoct=args.epsoct, phiq=args.phiq, chi=args.chi, tstop=args.tstop,
-        cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol, 
-        rtol=args.rtol, integration_algo=args.algo)
+  outtimes = None
+  if args.nout is not None:
+    outtimes = np.linspace(0, args.tstop, args.nout)
+  elif args.dt is not None:
+    outtimes = ts_output.uniform_times(args.tstop, args.dt)
+  elif args.nlog is not None:
+    outtimes = ts_output.log_times(args.tstop, args.nlog, 1e-6 * args.tstop)
+  if args.resume is not None:
+    kwargs = {'tstop': args.tstop, 'cputstop': args.cputstop}
+    if args.checkpoint_filename is not None:
+      kwargs.update(checkpoint_filename=args.checkpoint_filename,
+        checkpoint_interval=args.checkpoint_interval)
+    to = Triple_octupole.resume(args.resume, **kwargs)
+  else:
+    to = Triple_octupole(a1=args.a1, a2=args.a2, e1=args.e1, e2=args.e2, 
+          inc=args.inc, argperi=args.g1, longascnode=args.Omega, 
+          epsoct=args.epsoct, phiq=args.phiq, chi=args.chi, tstop=args.tstop,
+          cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol, 
+          rtol=args.rtol, integration_algo=args.algo, outtimes=outtimes,
+          exact=args.exact, outfilename=args.outfilename,
+          outformat=args.outformat, stats=args.stats_outfilename is not None,
+          stats_outfilename=args.stats_outfilename,
+          checkpoint_filename=args.checkpoint_filename,
+          checkpoint_interval=args.checkpoint_interval,
+          decimate=args.decimate)
 
   to.integrate()
   return 0
@@ -4,7 +4,9 @@
 kl_period
 
 Calculate the period of a hierarchical triple, either semi-analytically or
-by numerically integrating the triple.
+by numerically integrating the triple.  The semi-analytic period is a
+complete elliptic integral, so it can be calculated for whole arrays of
+triples at once (see kl_period_map).
 '''
 
 # System modules
@@ -14,10 +16,12 @@ import time
 # Numerical modules
 from math import sqrt, cos
 import numpy as np
-from scipy.integrate import quad
+from scipy.special import ellipk
 
 # Other modules from this package
 from ts_constants import *
+import ts_events
+import ts_output
 
 def P_out(triple):
   '''Return the outer period of a hierarchical triple in years.'''
@@ -42,6 +46,21 @@ def kl_period_oom(triple):
   return (8 / (15 * np.pi) * (1 + triple.m1 / triple.m3) * P_out(triple)**2 
     / P_in(triple) * (1 - triple.e2**2)**(3./2))
 
+def kl_times(triple, n):
+  '''Return output times from 0 to the tstop of a triple with n times per
+  KL period, as estimated by kl_period_oom.
+
+  Parameters:
+    triple: A Triple object, or anything with its a1, a2, e2, m1, m2, m3,
+      and tstop (e.g., the command line arguments of triplesec)
+    n: The number of output times per KL period
+
+  Returns:
+    The output times in years, for the outtimes parameter of Triple
+  '''
+
+  return ts_output.uniform_times(triple.tstop, kl_period_oom(triple) / n)
+
 def is_librating(triple):
   '''Determine whether the triple is librating or rotating.
 
@@ -64,7 +83,9 @@ def depsdh(eps, H, Th):
     eps**2 * (H - 9 * Th - 5) + 15*Th)**2 / (225 * (1-eps**2)**2 * (eps**2 -
     Th)**2))))
 
-def kl_period_norm(Hhat, Th):
+def _kl_period_norm_quad(Hhat, Th):
+  '''kl_period_norm by numerical integration of depsdh.'''
+  from scipy.integrate import quad
   zeta = 20 - Hhat + 24 * Th
   epsmin = 1/6. * sqrt(zeta - sqrt(zeta**2 - 2160 * Th))
 
@@ -76,6 +97,67 @@ def kl_period_norm(Hhat, Th):
 
   return quad(depsdh, epsmin, epsmax, args=(Hhat, Th), epsabs=1e-13, epsrel=1e-13)[0]
 
+def kl_period_norm(Hhat, Th, numerical=False):
+  '''The period of KL oscillations in units of L1 / (15 C2) as a function of
+  the integrals of motion.  See kl_period.
+
+  The period is the integral of depsdh between the extrema of eps.  In
+  terms of x = eps^2 the integrand is 15 / (2 sqrt(216 p(x))), where p is a
+  cubic with roots x1 < x2 (the extrema of a librating triple) and x3 (the
+  maximum of a rotating triple).  With a = min(x2, x3) and b = max(x2, x3),
+  the integral from x1 to a is then a complete elliptic integral of the
+  first kind,
+
+    15 / sqrt(216 (b - x1)) K((a - x1) / (b - x1)).
+
+  This agrees with the numerical integral to a relative error of about
+  1e-12 for most triples.  Where the two differ by more (up to ~1e-7 for
+  e1 ~ 1e-3), quad is the less accurate of the two.
+
+  Parameters:
+    Hhat: The normalized quadrupole Hamiltonian.  May be an array.
+    Th: Kozai's integral, (1 - e1^2) cos^2 i.  May be an array.
+    numerical: Integrate depsdh numerically with quad rather than using
+      the elliptic integral
+
+  Returns:
+    The normalized period.  This is nan if there are no real extrema.
+  '''
+
+  scalar = np.ndim(Hhat) == 0 and np.ndim(Th) == 0
+  if numerical:
+    if scalar:
+      return _kl_period_norm_quad(Hhat, Th)
+    return np.vectorize(_kl_period_norm_quad, otypes=[float])(Hhat, Th)
+
+  # A single triple is calculated with scalar arithmetic, which is several
+  # times faster than going through NumPy
+  if scalar:
+    zeta = 20 - Hhat + 24 * Th
+    disc = zeta**2 - 2160 * Th
+    if disc < 0:
+      return np.nan
+    x1 = (zeta - sqrt(disc)) / 36.
+    x2 = (zeta + sqrt(disc)) / 36.
+    x3 = (Hhat + 6 * Th + 10) / 12.
+    a = min(x2, x3)
+    b = max(x2, x3)
+    if b <= x1:
+      return np.nan
+    return 15 / sqrt(216 * (b - x1)) * float(ellipk((a - x1) / (b - x1)))
+
+  Hhat = np.asarray(Hhat, dtype=float)
+  Th = np.asarray(Th, dtype=float)
+  with np.errstate(invalid='ignore'):
+    zeta = 20 - Hhat + 24 * Th
+    disc = np.sqrt(zeta**2 - 2160 * Th)
+    x1 = (zeta - disc) / 36.
+    x2 = (zeta + disc) / 36.
+    x3 = (Hhat + 6 * Th + 10) / 12.
+    a = np.minimum(x2, x3)
+    b = np.maximum(x2, x3)
+    return 15 / np.sqrt(216 * (b - x1)) * ellipk((a - x1) / (b - x1))
+
 def kl_period(triple):
   '''Calculate the period of KL oscillations semi-analytically.
 
@@ -91,10 +173,48 @@ def kl_period(triple):
 
   return L1toC2 * kl_period_norm(triple.Hhatquad, triple.Th) / 15
 
+def kl_period_map(a1, a2, e1, e2, inc, argperi, m1=1., m3=1.):
+  '''Calculate the period of KL oscillations semi-analytically for arrays
+  of triples in the test particle limit.  This does the same calculation as
+  kl_period on a Triple_vector for every triple at once.  The arguments may
+  be arrays of any shape that can be broadcast together.
+
+  Parameters:
+    a1: Semi-major axis of inner binary in AU
+    a2: Semi-major axis of outer binary in AU
+    e1: Eccentricity of inner binary
+    e2: Eccentricity of outer binary
+    inc: Inclination between inner and outer binaries in degrees
+    argperi: Argument of periapsis of the inner binary in degrees
+    m1: Mass of component 1 of the inner binary in solar masses
+    m3: Mass of the tertiary in solar masses
+
+  Returns:
+    The periods in years
+  '''
+
+  a1, a2, e1, e2, inc, argperi, m1, m3 = [np.asarray(arr, dtype=float) for
+    arr in (a1, a2, e1, e2, inc, argperi, m1, m3)]
+  th = np.cos(inc * np.pi / 180)
+  g1 = argperi * np.pi / 180
+
+  # See Triple_vector
+  Hhat = ((2 + 3 * e1**2) * (1 - 3 * th**2) - 15 * e1**2 * (1 - th**2) *
+    np.cos(2 * g1))
+  Th = (1 - e1**2) * th**2
+
+  L1toC2 = (16 * a2 * (1 - e2**2)**(3/2.) / m3 * (a2 / a1)**2 * np.sqrt(m1
+    * a1) / (2 * np.pi))
+  return L1toC2 * kl_period_norm(Hhat, Th) / 15
+
 def numerical_kl_period(triple, nperiods=3):
   '''Calculate the period of KL oscillations by explicitly integrating the
   secular equations of motion.
 
+  The period is measured between successive eccentricity maxima and
+  between successive eccentricity minima, the times of which are found as
+  events.  See ts_events.
+
   Input:
     triple: A triple class
     n_periods: (optional) The number of KL cycles over which to integrate
@@ -103,30 +223,19 @@ def numerical_kl_period(triple, nperiods=3):
     The average period of KL oscillations in yr.
   '''
 
-  e_prev2 = 0.
-  e_prev  = 0.
-
-  periods = []
-  emin_tstart = 0
-  emax_tstart = 0
+  emax = triple.ecc_event(-1)
+  emin = triple.ecc_event(1)
+  finder = ts_events.EventFinder(triple, [emax, emin])
+  times = {emax: [], emin: []}
 
   cpu_starttime = time.time()
 
-  while time.time() - cpu_starttime < triple.cputstop:
-    triple._step()
-
-    if len(periods) == 2 * nperiods:
-      break
-    if e_prev2 < e_prev > triple.e1:
-      if emax_tstart > 0:
-        periods.append(triple.t - emax_tstart)
-      emax_tstart = triple.t
-    elif e_prev2 > e_prev < triple.e1:
-      if emin_tstart > 0:
-        periods.append(triple.t - emin_tstart)
-      emin_tstart = triple.t
-
-    e_prev2 = e_prev
-    e_prev = triple.e1
-  
+  while (time.time() - cpu_starttime < triple.cputstop and
+    min(len(times[emax]), len(times[emin])) <= nperiods):
+    for event, t, y in finder.step():
+      triple._set_state(t, y)
+      times[event].append(triple.t)
+
+  periods = np.concatenate([np.diff(times[emax][:nperiods + 1]),
+    np.diff(times[emin][:nperiods + 1])])
   return np.mean(periods)
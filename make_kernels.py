@@ -0,0 +1,452 @@
+#! /usr/bin/env python
+
+'''
+make_kernels
+
+Generate the compiled-in kernels for the Hamiltonian equations of motion of
+a hierarchical triple.  The equations of motion of Blaes et al. (2002) are
+written out once here, symbolically differentiated with SymPy, and the
+results are written out as plain Python with common subexpressions
+eliminated.
+
+The kernels work in any system of units in which G = 1, and take the speed
+of light in those units as an argument.  Evaluating them in units of the
+total mass and the outer semi-major axis keeps every intermediate quantity
+of order unity, which avoids the overflows that the SI values of the masses
+and angular momenta would otherwise cause.
+
+This is a development tool.  SymPy is only needed to regenerate the
+kernels, not to use triplesec.  Run it from the package directory:
+
+  python make_kernels.py
+'''
+
+# System modules
+import itertools
+import textwrap
+
+# Symbolic modules
+import sympy
+from sympy import sqrt, sin, cos
+from sympy.printing.str import StrPrinter
+
+# The terms of the Hamiltonian that may be toggled
+TERMS = ['quadrupole', 'octupole', 'hexadecapole', 'gr']
+
+# The variables integrated by the Triple class
+Y = sympy.symbols('a1 e1 g1 e2 g2 H', real=True)
+
+# Constant parameters of the triple
+PARAMS = sympy.symbols('m1 m2 m3 a2 c', positive=True)
+G = sympy.Integer(1)
+
+def blaes_eoms(y, m1, m2, m3, a2, c):
+  '''The EOMs.  See Eqs. 11 -- 17 of Blaes et al. (2002).
+
+  Returns:
+    A list of the derivatives of (a1, e1, g1, e2, g2, H).  Each derivative
+    is a dictionary mapping each term to its contribution.
+  '''
+
+  # Unpack the values
+  a1, e1, g1, e2, g2, H = y
+
+  # Calculate trig functions only once
+  sing1 = sin(g1)
+  sing2 = sin(g2)
+  cosg1 = cos(g1)
+  cosg2 = cos(g2)
+
+  G1 = m1 * m2 * sqrt(G * a1 * (1 - e1**2) / (m1 + m2))
+  G2 = (m1 + m2) * m3 * sqrt(G * a2 * (1 - e2**2) / (m1 + m2 + m3))
+
+  C2 = (G * m1 * m2 * m3 / (16 * (m1 + m2) * a2 * (1 - e2**2)**(3./2)) * 
+        (a1 / a2)**2)
+  C3 = (15 * G * m1 * m2 * m3 * (m2 - m1) / (64 * (m1 + m2)**2 * a2 *
+        (1 - e2**2)**(5./2)) * (a1 / a2)**3)
+
+  th = (H**2 - G1**2 - G2**2) / (2 * G1 * G2)
+  cosphi = cosg1 * cosg2 - th * sing1 * sing2
+  B = 2 + 5 * e1**2 - 7 * e1**2 * cos(2 * g1)
+  A = 4 + 3 * e1**2 - 5 / 2. * (1 - th**2) * B
+
+  # Eq. 11 of Blaes et al. (2002)
+  da1dt = dict.fromkeys(TERMS, 0)
+  da1dt['gr'] = (-(64 * G**3 * m1 * m2 * (m1 + m2) / (5 * c**5 * a1**3 *
+    sqrt((1 - e1**2)**7)) * (1 + 73 / 24. * e1**2 + 37 / 96. * e1**4)))
+
+  # Eq. 12 of Blaes et al. (2002)
+  dg1dt = dict.fromkeys(TERMS, 0)
+  dg1dt['quadrupole'] = (6 * C2 * (1 / G1 * (4 * th**2 + (5 * cos(2 * g1) - 1)
+    * (1 - e1**2 - th**2)) + th / G2 * (2 + e1**2 * (3 - 5 * cos(2 * g1)))))
+  dg1dt['octupole'] = (C3 * e2 * e1 * (1 / G2 + th / G1) * (sing1 * sing2 * (A
+    + 10 * (3 * th**2 - 1) * (1 - e1**2)) - 5 * th * B * cosphi) - C3 * e2 *
+    (1 - e1**2) / (e1 * G1) * (10 * th * (1 - th**2) * (1 - 3 * e1**2) * sing1
+    * sing2 + cosphi * (3 * A - 10 * th**2 + 2)))
+  dg1dt['gr'] = ((3 / (c**2 * a1 * (1 - e1**2)) * sqrt((G * (m1 + m2) /
+    a1)**3)))
+  dg1dt['hexadecapole'] = (1 / (4096. * a2**5 * sqrt(1 - e1**2) * (m1 +
+    m2)**5) * 45 * a1**3 * sqrt(a1 * G * (m1 + m2)) * (-1 / ((e2**2 - 1)**4 *
+    sqrt(a2 * G * (m1 + m2 + m3))) * (m1**2 - m1 * m2 + m2**2) * (sqrt(1 -
+    e2**2) * m2**2 * m3 * sqrt(a2 * G * (m1 + m2 + m3)) * th + m1**2 * (sqrt(1
+    - e1**2) * m2 * sqrt(a1 * G * (m1 + m2)) + sqrt(1 - e2**2) * m3 * sqrt(a2
+    * G * (m1 + m2 + m3)) * th) + m1 * m2 * (sqrt(1 - e1**2) * m2 * sqrt(a1 *
+    G * (m1 + m2)) + sqrt(1 - e1**2) * sqrt(a1 * G * (m1 + m2)) * m3 + 2 *
+    sqrt(1 - e2**2) * m3 * sqrt(a2 * G * (m1 + m2 + m3)) * th)) * (96 * th +
+    480 * e1**2 * th + 180 * e1**4 * th + 144 * e2**2 * th + 720 * e1**2 *
+    e2**2 * th + 270 * e1**4 * e2**2 * th - 224 * th**3 - 1120 * e1**2 * th**3
+    - 420 * e1**4 * th**3 - 336 * e2**2 * th**3 - 1680 * e1**2 * e2**2 * th**3
+    - 630 * e1**4 * e2**2 * th**3 + 56 * e1**2 * (2 + e1**2) * (2 + 3 * e2**2)
+    * th * (7 * th**2 - 4) * cos(2 * g1) - 294 * e1**4 * (2 + 3 * e2**2) * th
+    * (th**2 - 1) * cos(4 * g1) - 147 * e1**4 * e2**2 * cos(4 * g1 - 2 * g2) +
+    441 * e1**4 * e2**2 * th**2 * cos(4 * g1 - 2 * g2) + 294 * e1**4 * e2**2 *
+    th**3 * cos(4 * g1 - 2 * g2) + 140 * e1**2 * e2**2 * cos(2 * (g1 - g2)) +
+    70 * e1**4 * e2**2 * cos(2 * (g1 - g2)) + 336 * e1**2 * e2**3 * th * cos(2
+    * (g1 - g2)) + 168 * e1**4 * e2**2 * th * cos(2 * (g1 - g2)) - 588 * e1**2
+    * e2**2 * th**2 * cos(2 * (g1 - g2)) - 294 * e1**4 * e2**2 * th**2 * cos(2
+    * (g1 - g2)) - 784 * e1**2 * e2**2 * th**3 * cos(2 * (g1 - g2)) - 392 *
+    e1**4 * e2**2 * th**3 * cos(2 * (g1 - g2)) - 128 * e2**2 * th * cos(2 *
+    g2) - 640 * e1**2 * e2**2 * th * cos(2 * g2) - 240 * e1**4 * e2**2 * th *
+    cos(2 * g2) + 224 * e2**2 * th**3 * cos(2 * g2) + 1120 * e1**2 * e2**2 *
+    th**3 * cos(2 * g2) + 420 * e1**4 * e2**2 * th**3 * cos(2 * g2) - 140 *
+    e1**2 * e2**2 * cos(2 * (g1 + g2)) - 70 * e1**4 * e2**2 * cos(2 * (g1 +
+    g2)) + 336 * e1**2 * e2**2 * th * cos(2 * (g1 + g2)) + 168 * e1**4 * e2**2
+    * th * cos(2 * (g1 + g2)) + 588 * e1**2 * e2**2 * th**2 * cos(2 * (g1 +
+    g2)) + 294 * e1**4 * e2**2 * th**2 * cos(2 * (g1 + g2)) - 784 * e1**2 *
+    e2**2 * th**3 * cos(2 * (g1 + g2)) - 392 * e1**4 * e2**2 * th**3 * cos(2 *
+    (g1 + g2)) + 147 * e1**4 * e2**2 * cos(2 * (2 * g1 + g2)) - 441 * e1**4 *
+    e2**2 * th**2 * cos(2 * (2 * g1 + g2)) + 294 * e1**4 * e2**2 * th**3 *
+    cos(2 * (2 * g1 + g2))) + 1 / (e1 * sqrt((1 - e2**2)**7)) * 2 * (1 -
+    e1**2) * (m1 + m2) * (m1**3 + m2**3) * m3 * (e1 * (4 + 3 * e1**2) * (2 + 3
+    * e2**2) * (3 - 30 * th**2 + 35 * th**4) - 28 * (e1 + e1**3) * (2 + 3 *
+    e2**2) * (1 - 8 * th**2 + 7 * th**4) * cos(2 * g1) + 147 * e1**3 * (2 + 3
+    * e2**2) * (th**2 - 1)**2 * cos(4 * g1) - 10 * e1 * (4 + 3 * e1**2) *
+    e2**2 * (1 - 8 * th**2 + 7 * th**4) * cos(2 * g2) + 28 * (e1 + e1**3) *
+    e2**2 * ((1 + th)**2 * (1 - 7 * th + 7 * th**2) * cos(2 * (g1 - g2)) + (th
+    - 1)**2 * (1 + 7 * th + 7 * th**2) * cos(2 * (g1 + g2))) - 147 * e1**3 *
+    e2**2 * (th**2 - 1) * ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (th - 1)**2 *
+    cos(2 * (2 * g1 + g2))))))
+
+  # Eq. 13 of Blaes et al. (2002)
+  de1dt = dict.fromkeys(TERMS, 0)
+  de1dt['quadrupole'] = (30 * C2 * e1 * (1 - e1**2) / G1 * (1 - th**2) * sin(2
+    * g1))
+  de1dt['octupole'] = (-C3 * e2 * (1 - e1**2) / G1 * (35 * cosphi * (1 -
+    th**2) * e1**2 * sin(2 * g1) - 10 * th * (1 - e1**2) * (1 - th**2) * cosg1
+    * sing2 - A * (sing1 * cosg2 - th * cosg1 * sing2)))
+  de1dt['gr'] = (-304 * G**3 * m1 * m2 * (m1 + m2) * e1 / (15 * c**5 * a1**4 *
+    sqrt((1 - e1**2)**5)) * (1 + 121 / 304. * e1**2))
+  de1dt['hexadecapole'] = (-(315 * a1**3 * e1 * sqrt(1 - e1**2) * sqrt(a1 * G
+    * (m1 +
+  m2)) * (m1**2 - m1 * m2 + m2**2) * m3 * (2 * (2 + e1**2) * (2 + 3 *
+  e2**2) * (1 - 8 * th**2 + 7 * th**4) * sin(2 * g1) - 21 * e1**2 * (2 +
+  3 * e2**2) * (th**2 - 1)**2 * sin(4 * g1) + e2**2 * (21 * e1**2 * (th -
+  1) * (1 + th)**3 * sin(4 * g1 - 2 * g2) - 2 * (2 + e1**2) * (1 + th)**2
+  * (1 - 7 * th + 7 * th**2) * sin(2 * (g1 - g2)) - (th - 1)**2 * (2 * (2
+  + e1**2) * (1 + 7 * th + 7 * th**2) * sin(2 * (g1 + g2)) - 21 * e1**2 *
+  (th**2 - 1) * sin(2 * (2 * g1 + g2)))))) / (2048 * a2**5 * sqrt((1 -
+  e2**2)**7) * (m1 + m2)**3))
+
+  dg2dt = dict.fromkeys(TERMS, 0)
+  dg2dt['quadrupole'] = (3 * C2 * (2 * th / G1 * (2 + e1**2 * (3 - 5 * cos(2 *
+    g1))) + 1 / G2 * (4 + 6 * e1**2 + (5 * th**2 - 3) * (2 + 3 * e1**2 - 5 *
+    e1**2 * cos(2 * g1)))))
+  dg2dt['octupole'] = (-C3 * e1 * sing1 * sing2 * ((4 * e2**2 + 1) / (e2 * G2)
+    * 10 * th * (1 - th**2) * (1 - e1**2) - e2 * (1 / G1 + th / G2) * (A + 10
+    * (3 * th**2 - 1) * (1 - e1**2))) - C3 * e1 * cosphi * (5 * B * th * e2 *
+    (1 / G1 + th / G2) + (4 * e2**2 + 1) / (e2 * G2) * A))
+  dg2dt['hexadecapole'] = ((9 * a1**3 * (-1 / sqrt(1 - e1**2) * 10 * a2 *
+    sqrt(a1 * G *
+  (m1 + m2)) * (m1**2 - m1 * m2 + m2**2) * (sqrt(1 - e2**2) * m2**2 * m3
+  * sqrt(a2 * G * (m1 + m2 + m3)) + m1**2 * (sqrt(1 - e2**2) * m3 *
+  sqrt(a2 * G * (m1 + m2 + m3)) + sqrt(1 - e1**2) * m2 * sqrt(a1 * G *
+  (m1 + m2)) * th) + m1 * m2 * (2 * sqrt(1 - e2**2) * m3 * sqrt(a2 * G *
+  (m1 + m2 + m3)) + sqrt(1 - e1**2) * m2 * sqrt(a1 * G * (m1 + m2)) * th
+  + sqrt(1 - e1**2) * sqrt(a1 * G * (m1 + m2)) * m3 * th)) * (96 * th +
+  480 * e1**2 * th + 180 * e1**4 * th + 144 * e2**2 * th + 720 * e1**2 *
+  e2**2 * th + 270 * e1**4 * e2**2 * th - 224 * th**3 - 1120 * e1**2 *
+  th**3 - 420 * e1**4 * th**3 - 336 * e2**2 * th**3 - 1680 * e1**2 *
+  e2**2 * th**3 - 630 * e1**4 * e2**2 * th**3 + 56 * e1**2 * (2 + e1**2)
+  * (2 + 3 * e2**2) * th * (7 * th**2 - 4) * cos(2 * g1) - 294 * e1**4 *
+  (2 + 3 * e2**2) * th * (th**2 - 1) * cos(4 * g1) - 147 * e1**4 *
+  e2**2 * cos(4 * g1 - 2 * g2) + 441 * e1**4 * e2**2 * th**2 *
+  cos(4 * g1 - 2 * g2) + 294 * e1**4 * e2**2 * th**3 * cos(4 * g1 - 2 *
+  g2) + 140 * e1**2 * e2**2 * cos(2 * (g1 - g2)) + 70 * e1**4 * e2**2 *
+  cos(2 * (g1 - g2)) + 336 * e1**2 * e2**2 * th * cos(2 * (g1 - g2)) +
+  168 * e1**4 * e2**2 * th * cos(2 * (g1 - g2)) - 588 * e1**2 * e2**2 *
+  th**2 * cos(2 * (g1 - g2)) - 294 * e1**4 * e2**2 * th**2 * cos(2 * (g1
+  - g2)) - 784 * e1**2 * e2**2 * th**3 * cos(2 * (g1 - g2)) - 392 * e1**4
+  * e2**2 * th**3 * cos(2 * (g1 - g2)) - 128 * e2**2 * th * cos(2 * g2) -
+  640 * e1**2 * e2**2 * th * cos(2 * g2) - 240 * e1**4 * e2**2 * th *
+  cos(2 * g2) + 224 * e2**2 * th**3 * cos(2 * g2) + 1120 * e1**2 * e2**2
+  * th**3 * cos(2 * g2) + 420 * e1**4 * e2**2 * th**3 * cos(2 * g2) - 140
+  * e1**2 * e2**2 * cos(2 * (g1 + g2)) - 70 * e1**4 * e2**2 * cos(2 * (g1
+  + g2)) + 336 * e1**2 * e2**2 * th * cos(2 * (g1 + g2)) + 168 * e1**4 *
+  e2**2 * th * cos(2 * (g1 + g2)) + 588 * e1**2 * e2**2 * th**2 * cos(2
+  * (g1 + g2)) + 294 * e1**4 * e2**2 * th**2 * cos(2 * (g1 + g2)) - 784 *
+  e1**2 * e2**2 * th**3 * cos(2 * (g1 + g2)) - 392 * e1**4 * e2**2 *
+  th**3 * cos(2 * (g1 + g2)) + 147 * e1**4 * e2**2 * cos(2 * (2 * g1 +
+  g2)) - 441 * e1**4 * e2**2 * th**2 * cos(2 * (2 * g1 + g2)) + 294 *
+  e1**4 * e2**2 * th**3 * cos(2 * (2 * g1 + g2))) + a1 * a2 * G * m1 * m2
+  * (m1**3 + m2**3) * (m1 + m2 + m3) * (-6 * (8 + 40 * e1**2 + 15 *
+  e1**4) * (-1 + e2**2) * (3 - 30 * th**2 + 35 * th**4) + 7 * (8 + 40 *
+  e1**2 + 15 * e1**4) * (2 + 3 * e2**2) * (3 - 30 * th**2 + 35 * th**4)
+  + 840 * e1**2 * (2 + e1**2) * (-1 + e2**2) * (1 - 8 * th**2 + 7 *
+  th**4) * cos(2 * g1) - 980 * e1**2 * (2 + e1**2) * (2 + 3 * e2**2) * (1
+  - 8 * th**2 + 7 * th**4) * cos(2 * g1) - 4410 * e1**4 * (-1 + e2**2) *
+  (-1 + th**2)**2 * cos(4 * g1) + 5145 * e1**4 * (2 + 3 * e2**2) * (-1 +
+  th**2)**2 * cos(4 * g1) - 70 * (8 + 40 * e1**2 + 15 * e1**4) * e2**2 *
+  (1 - 8 * th**2 + 7 * th**4) * cos(2 * g2) + 20 * (8 + 40 * e1**2 + 15 *
+  e1**4) * (-1 + e2**2) * (1 - 8 * th**2 + 7 * th**4) * cos(2 * g2) + 980
+  * e1**2 * (2 + e1**2) * e2**2 * ((1 + th)**2 * (1 - 7 * th + 7 * th**2)
+  * cos(2 * (g1 - g2)) + (-1 + th)**2 * (1 + 7 * th + 7 * th**2) * cos(2
+  * (g1 + g2))) - 280 * e1**2 * (2 + e1**2) * (-1 + e2**2) * ((1 + th)**2
+  * (1 - 7 * th + 7 * th**2)  * cos(2 * (g1 - g2)) + (-1 + th)**2 * (1 +
+  7 * th + 7 * th**2) * cos(2 * (g1 + g2))) - 1470 * e1**4 * (1 - e2**2)
+  * (-1 + th) * (1 + th) * ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (-1 +
+  th)**2 * cos(2 * (2 * g1 + g2))) - 5145 * e1**4 * e2**2 * (-1 + th**2)
+  * ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (-1 + th)**2 * cos(2 * (2 * g1
+  + g2)))))) / (8192 * a2**6 * (-1 + e2**2)**4 * (m1 + m2)**5 * sqrt(a2 *
+  G * (m1 + m2 + m3))))
+
+  # Eq. 16 of Blaes et al. (2002)
+  de2dt = dict.fromkeys(TERMS, 0)
+  de2dt['octupole'] = (C3 * e1 * (1 - e2**2) / G2 * (10 * th * (1 - th**2) *
+    (1 -
+  e1**2) * sing1 * cosg2 + A * (cosg1 * sing2 - th * sing1 * cosg2)))
+  de2dt['hexadecapole'] = ((45 * a1**4 * e2 * m1 * m2 * (m1**2 - m1 * m2 +
+    m2**2) * sqrt(a2 * G * (m1 + m2 + m3)) * (-147 * e1**4 * (-1 + th) * (1 +
+    th)**3 * sin(4 * g1 - 2 * g2) + 28 * e1**2 * (2 + e1**2) * (1 + th)**2 *
+    (1 - 7 * th + 7 * th**2) * sin(2 * (g1 - g2)) + (-1 + th) * (2 * (8 + 40 *
+    e1**2 + 15 * e1**4) * (-1 - th + 7 * th**2 + 7 * th**3) * sin(2 * g2) - 7
+    * e1**2 * (-1 + th) * (4 * (2 + e1**2) * (1 + 7 * th + 7 * th**2) * sin(2
+    * (g1 + g2)) - 21 * e1**2 * (-1 + th**2) * sin(2 * (2 * g1 + g2))))) /
+    (4096 * a2**6 * (-1 + e2**2)**3 * (m1 + m2)**4)))
+
+  # Eq. 17 of Blaes et al. (2002)
+  dHdt = dict.fromkeys(TERMS, 0)
+  dHdt['gr'] = (-32 * G**3 * m1**2 * m2**2 / (5 * c**5 * a1**3 * (1 -
+    e1**2)**2) * sqrt(G * (m1 + m2) / a1) * (1 + 7 / 8. * e1**2) * (G1 + G2 *
+    th) / H)
+
+  return [da1dt, de1dt, dg1dt, de2dt, dg2dt, dHdt]
+
+class _KernelPrinter(StrPrinter):
+  '''Print expressions as Python source.  Floats are printed exactly.'''
+
+  def _print_Float(self, expr):
+    return repr(float(expr))
+
+def _statement(lhs, rhs):
+  '''Return a line of generated code, wrapped to 79 characters.'''
+  line = '  %s %s' % (lhs, rhs)
+  if len(line) <= 79:
+    return line
+  return '\n'.join(textwrap.wrap('%s (%s)' % (lhs, rhs), width=79,
+    initial_indent='  ', subsequent_indent='    ', break_long_words=False,
+    break_on_hyphens=False))
+
+def _hoist(expr, constant, hoisted, symbols):
+  '''Replace the parts of expr that depend only on the parameters by new
+  symbols.
+
+  Parameters:
+    expr: A SymPy expression
+    constant: The set of symbols that are constant.  New symbols are added
+      to this.
+    hoisted: A list of (symbol, expression) pairs of the hoisted parts.  New
+      pairs are appended to this.
+    symbols: An iterator of new symbols
+  '''
+
+  def new_symbol(subexpr):
+    for symbol, other in hoisted:
+      if other == subexpr:
+        return symbol
+    symbol = next(symbols)
+    hoisted.append((symbol, subexpr))
+    constant.add(symbol)
+    return symbol
+
+  if expr.is_Atom:
+    return expr
+  if expr.free_symbols <= constant:
+    return new_symbol(expr)
+
+  args = [_hoist(arg, constant, hoisted, symbols) for arg in expr.args]
+  if expr.is_Add or expr.is_Mul:
+    # Combine the constant terms or factors into a single constant
+    const = [arg for arg in args if arg.free_symbols <= constant]
+    if len(const) > 1 and not all(arg.is_Number for arg in const):
+      args = ([new_symbol(expr.func(*const))] + [arg for arg in args if arg
+        not in const])
+  return expr.func(*args)
+
+def kernel_source(name, docstring, exprs, shape):
+  '''Return the source of a function that evaluates exprs with common
+  subexpressions eliminated.  The subexpressions that depend only on the
+  parameters are evaluated by a second function, name_constants, whose
+  result is passed to the kernel, so that the kernel only evaluates what
+  depends on the state.
+
+  Parameters:
+    name: The name of the function
+    docstring: The docstring of the function
+    exprs: A flat list of SymPy expressions
+    shape: The number of columns to arrange the result in, or None to
+      return a flat list
+  '''
+
+  printer = _KernelPrinter()
+  subexprs, reduced = sympy.cse(exprs, optimizations='basic')
+
+  # Move the constant subexpressions out of the kernel
+  constant = set(PARAMS)
+  hoisted = []
+  varying = []
+  symbols = sympy.numbered_symbols('k')
+  for symbol, subexpr in subexprs:
+    if subexpr.free_symbols <= constant:
+      hoisted.append((symbol, subexpr))
+      constant.add(symbol)
+    else:
+      varying.append((symbol, _hoist(subexpr, constant, hoisted, symbols)))
+  reduced = [_hoist(expr, constant, hoisted, symbols) for expr in reduced]
+
+  # The constants that the kernel uses
+  used = set()
+  for expr in [subexpr for symbol, subexpr in varying] + reduced:
+    used |= expr.free_symbols
+  needed = ([param for param in PARAMS if param in used] + [symbol for
+    symbol, subexpr in hoisted if symbol in used])
+  names = '(%s)' % ', '.join(map(str, needed))
+  if len(needed) == 1:
+    names = names[:-1] + ',)'
+
+  lines = [
+    'def %s_constants(%s):' % (name, ', '.join(map(str, PARAMS))),
+    "  '''The constants used by %s.'''" % name]
+  for symbol, subexpr in hoisted:
+    lines.append(_statement('%s =' % symbol, printer.doprint(subexpr)))
+  lines.append(_statement('return', names))
+  lines.append('')
+
+  lines += [
+    'def %s(y, k):' % name,
+    "  '''%s" % docstring,
+    '',
+    "  k is returned by %s_constants.'''" % name,
+    '  %s = y' % ', '.join(map(str, Y))]
+  if needed:
+    lines += textwrap.wrap(names, width=75, initial_indent='  ',
+      subsequent_indent='    ')
+    lines[-1] += ' = k'
+  for symbol, subexpr in varying:
+    lines.append(_statement('%s =' % symbol, printer.doprint(subexpr)))
+
+  values = [printer.doprint(expr) for expr in reduced]
+  if shape is not None:
+    values = ['[%s]' % ', '.join(values[i:i + shape]) for i in range(0,
+      len(values), shape)]
+  lines.append(_statement('return', '[%s]' % ', '.join(values)))
+
+  return '\n'.join(lines) + '\n'
+
+def jacobian_source():
+  '''Return the source of the ts_jacobian module.'''
+
+  eoms = blaes_eoms(Y, *PARAMS)
+  chunks = ['''#! /usr/bin/env python
+
+\'\'\'
+ts_jacobian
+
+The Jacobian of the Hamiltonian equations of motion of a hierarchical
+triple, split up by term of the Hamiltonian.  Everything that depends only
+on the masses and the outer semi-major axis is computed once per triple by
+each Jacobian's _constants function.  The Jacobians are evaluated in units
+in which G = 1.
+
+This file is generated by make_kernels.py.  Do not edit it by hand.
+\'\'\'
+
+from __future__ import division
+from math import sqrt, sin, cos
+''']
+
+  for term in TERMS:
+    exprs = [sympy.diff(eom[term], yj) for eom in eoms for yj in Y]
+    chunks.append(kernel_source('jac_' + term, 'The Jacobian of the %s '
+      'terms of the EOMs.' % term, exprs, len(Y)))
+
+  # A list of the kernels
+  lines = ['# The constants functions and Jacobians of each term, in the',
+    '# order (%s)' % ', '.join(TERMS), 'JACOBIANS = [']
+  for term in TERMS:
+    lines.append('  (jac_%s_constants, jac_%s),' % (term, term))
+  lines[-1] = lines[-1][:-1] + ']'
+  chunks.append('\n'.join(lines) + '\n')
+
+  return '\n'.join(chunks)
+
+def kernel_name(prefix, flags):
+  '''The name of the kernel for the terms turned on in flags.'''
+  terms = [term for term, flag in zip(TERMS, flags) if flag]
+  return prefix + '_'.join(terms or ['none'])
+
+def deriv_source():
+  '''Return the source of the ts_kernels module.'''
+
+  eoms = blaes_eoms(Y, *PARAMS)
+  chunks = ['''#! /usr/bin/env python
+
+\'\'\'
+ts_kernels
+
+The Hamiltonian equations of motion of a hierarchical triple.  There is one
+kernel for each combination of terms of the Hamiltonian, and each kernel
+computes every common subexpression only once.  Everything that depends only
+on the masses and the outer semi-major axis is computed once per triple by
+the kernel's _constants function.  The kernels are evaluated in units in
+which G = 1.
+
+This file is generated by make_kernels.py.  Do not edit it by hand.
+\'\'\'
+
+from __future__ import division
+from math import sqrt, sin, cos
+''']
+
+  combinations = list(itertools.product([True, False], repeat=len(TERMS)))
+  for flags in combinations:
+    exprs = [sympy.Add(*[eom[term] for term, flag in zip(TERMS, flags) if
+      flag]) for eom in eoms]
+    terms = [term for term, flag in zip(TERMS, flags) if flag]
+    if terms:
+      docstring = 'The EOMs with the %s terms.' % ', '.join(terms)
+    else:
+      docstring = 'The EOMs with every term turned off.'
+    chunks.append(kernel_source(kernel_name('deriv_', flags), docstring,
+      exprs, None))
+
+  # A lookup table of the kernels
+  lines = ['# The constants functions and kernels, indexed by',
+    '# (%s)' % ', '.join(TERMS), 'DERIVS = {']
+  for flags in combinations:
+    name = kernel_name('deriv_', flags)
+    lines.append('  (%s):' % ', '.join(map(str, flags)))
+    lines.append('    (%s_constants,' % name)
+    lines.append('     %s),' % name)
+  lines[-1] = lines[-1][:-1] + '}'
+  chunks.append('\n'.join(lines) + '\n')
+
+  return '\n'.join(chunks)
+
+def main():
+  with open('ts_kernels.py', 'w') as outfile:
+    outfile.write(deriv_source())
+  with open('ts_jacobian.py', 'w') as outfile:
+    outfile.write(jacobian_source())
+
+if __name__ == '__main__':
+  main()
@@ -1,6 +1,7 @@
 #! /usr/bin/env python
 
 import os
+import numpy as np
 from numpy.testing import assert_allclose
 
 from ..ekm import *
@@ -12,6 +13,33 @@ from ..ekm import *
 def test_F():
   '''Test the calculation of F.'''
   assert_allclose(F(.015), .017068821850895335)
+  assert_allclose(F(.015, exact=True), .017068821850895335)
+
+def test_F_table():
+  '''The tabulated F should agree with the numerical integral.'''
+  CKL = np.concatenate([np.logspace(-8, -1, 20), np.linspace(.1, .36, 20)])
+  assert F_error() < 1e-12
+  assert_allclose(F(CKL), [F(x, exact=True) for x in CKL], rtol=1e-7,
+    atol=1e-9)
+  assert_allclose(F(CKL), [F(x) for x in CKL], rtol=1e-15)
+
+def test_flip_map():
+  '''The batch calculation should agree with Triple_octupole.'''
+  triples = [Triple_octupole(e1=e1, inc=inc, epsoct=epsoct, argperi=30) for
+    e1, inc, epsoct in [(.05, 70, .01), (.3, 80, .01), (.1, 85, .03)]]
+  flips, crit, period = flip_map([to.epsoct for to in triples], [to.phiq
+    for to in triples], [to.CKL for to in triples], [to.chi for to in
+    triples])
+  assert list(flips) == [to.doesflip() for to in triples]
+  assert_allclose(period, [to.period() for to in triples], rtol=1e-6)
+
+def test_flip_map_grid():
+  '''Calculate the flip map over a grid.'''
+  epsoct, phiq = np.meshgrid(np.linspace(.001, .03, 5), np.linspace(.05, .3,
+    4))
+  flips, crit, period = flip_map(epsoct, phiq, .01, chunksize=7)
+  assert flips.shape == crit.shape == period.shape == (4, 5)
+  assert (flips == (epsoct > crit)).all()
 
 ###
 ### Object creation tests
@@ -42,6 +70,16 @@ def test_integrate_tofile():
   to.integrate()
   os.remove('foo.dat') # Clean up
 
+def test_integrate_dense():
+  '''Integrate with output only at fixed times.'''
+  outtimes = [0, 250, 500, 750]
+  to = Triple_octupole(tstop=1000, outtimes=outtimes, outfilename='foo.dat')
+  to.integrate()
+  data = np.loadtxt('foo.dat')
+  assert_allclose(data[:, 0], outtimes + [1000])
+  assert to.t == 1000
+  os.remove('foo.dat') # Clean up
+
 def test_cputimeout():
   '''Make sure that the integration halts after exceeding the maximum CPU
   integration time.'''
@@ -21,6 +21,13 @@ def test_klperiod_oom():
   tv = Triple_vector(a1=1, a2=20, m1=1, m3=1, e2=.3)
   assert_allclose(kl_period_oom(tv), 1178.965050)
 
+def test_kl_times():
+  '''There should be n output times per KL period.'''
+  tv = Triple_vector(a1=1, a2=20, m1=1, m3=1, e2=.3, tstop=1e4)
+  times = kl_times(tv, 10)
+  assert_allclose(times[1], 117.8965050)
+  assert times[-1] < 1e4 and len(times) == 85
+
 def test_islibrating():
   '''Test the islibrating calculation.'''
   tv = Triple_vector(e1=.1, inc=80, argperi=45)
@@ -41,9 +48,32 @@ def test_numerical_kl_period():
   # Triple_vector test
   tv = Triple_vector(a1=1, a2=20, e1=.1, e2=.3, m1=1, m3=1, argperi=0,
     longascnode=np.pi, octupole=False)
-  assert_allclose(numerical_kl_period(tv, nperiods=3), 4368.4247305281269)
+  assert_allclose(numerical_kl_period(tv, nperiods=3), 4373.4523816599385)
 
   # Triple test
   t = Triple(a1=1, a2=20, e1=.1, e2=.3, m1=1, m2=1, m3=1, argperi1=0, 
     argperi2=0, octupole=False)
-  assert_allclose(numerical_kl_period(t, nperiods=3), 5862.9998908353418)
+  assert_allclose(numerical_kl_period(t, nperiods=3), 5864.1235956488135)
+
+def test_kl_period_norm():
+  '''The elliptic integral should agree with the numerical integral.'''
+  e1 = np.linspace(.05, .95, 7)[:, np.newaxis]
+  th = np.cos(np.linspace(40, 140, 9) * np.pi / 180)
+  g1 = np.pi / 3
+  Hhat = ((2 + 3 * e1**2) * (1 - 3 * th**2) - 15 * e1**2 * (1 - th**2) *
+    np.cos(2 * g1))
+  Th = (1 - e1**2) * th**2
+  assert_allclose(kl_period_norm(Hhat, Th), kl_period_norm(Hhat, Th,
+    numerical=True), rtol=1e-9)
+
+def test_kl_period_map():
+  '''The periods of arrays of triples should be those of each triple.'''
+  e1 = np.array([.1, .3, .6])
+  inc = np.array([[50], [70], [85]])
+  periods = kl_period_map(1, 20, e1, .3, inc, 30)
+  assert periods.shape == (3, 3)
+  for i in range(3):
+    for j in range(3):
+      tv = Triple_vector(a1=1, a2=20, e1=e1[j], e2=.3, inc=inc[i, 0],
+        argperi=30)
+      assert_allclose(periods[i, j], kl_period(tv), rtol=1e-12)
@@ -1,9 +1,11 @@
 #! /usr/bin/env python
 
 import os
+import numpy as np
 from numpy.testing import assert_allclose
 
 from ..triplesec import Triple
+from ..ts_constants import yr2s
 
 
 ###
@@ -23,6 +25,71 @@ def test_setoptions():
   t = Triple(a1=1, a2=20, e1=.1, e2=.3, m1=1, m2=.5, m3=2, argperi1=90,
         argperi2=25, r1=1, r2=2, inc=70)
 
+###
+### Equation of motion tests
+###
+
+def _numerical_jacobian(deriv, y, *args):
+  '''Calculate the Jacobian of deriv by central differences.'''
+  y = np.array(y, dtype=float)
+  jac = np.zeros((len(y), len(y)))
+  for j in range(len(y)):
+    h = 1e-6 * max(abs(y[j]), 1e-3)
+    yp = y.copy()
+    ym = y.copy()
+    yp[j] += h
+    ym[j] -= h
+    jac[:, j] = (np.array(deriv(0, yp, *args)) - np.array(deriv(0, ym,
+      *args))) / (2 * h)
+  return jac
+
+def test_jacobian():
+  '''Compare the analytic Jacobian to a numerical Jacobian for each term of
+  the EOMs.'''
+  terms = ['quadrupole', 'octupole', 'hexadecapole', 'gr']
+  for term in terms:
+    flags = dict((name, name == term) for name in terms)
+    t = Triple(a1=1, a2=10, e1=.3, e2=.4, inc=60, argperi1=30, argperi2=70,
+          m1=1, m2=.5, m3=1, **flags)
+    jac = t._jac(0, t._y)
+    jac_num = _numerical_jacobian(t._deriv, t._y)
+    scale = np.abs(jac_num).max(axis=1)[:, np.newaxis] + 1e-300
+    assert_allclose(jac / scale, jac_num / scale, atol=1e-8)
+
+def test_jacobian_nonsingular():
+  '''Compare the analytic Jacobian in the nonsingular variables to a
+  numerical Jacobian.'''
+  for e1 in [.3, .999]:
+    t = Triple(a1=1, a2=10, e1=e1, e2=.4, inc=60, argperi1=30, argperi2=70,
+      m1=1, m2=.5, m3=1, gr=True, variables='nonsingular')
+    jac = t._jac(0, t._y)
+    jac_num = _numerical_jacobian(t._deriv, t._y)
+    scale = np.abs(jac_num).max(axis=1)[:, np.newaxis] + 1e-300
+    assert_allclose(jac / scale, jac_num / scale, atol=1e-7)
+
+def test_deriv_kernels():
+  '''The kernel for a combination of terms should be the sum of the kernels
+  for each term separately.'''
+  terms = ['quadrupole', 'octupole', 'hexadecapole', 'gr']
+  kwargs = dict(a1=1, a2=10, e1=.3, e2=.4, inc=60, argperi1=30, argperi2=70,
+    m1=1, m2=.5, m3=1)
+  der = np.zeros(6)
+  for term in terms:
+    flags = dict((name, name == term) for name in terms)
+    t = Triple(**dict(kwargs, **flags))
+    der += t._deriv(0, t._y)
+  t = Triple(hexadecapole=True, gr=True, **kwargs)
+  assert_allclose(t._deriv(0, t._y), der, rtol=1e-12, atol=1e-300)
+
+def test_constants():
+  '''The constants should be rebuilt if the masses change.'''
+  t = Triple(m2=.5)
+  t.m2 = .7
+  t._step()
+  assert t._constants.key[1] == .7
+  t2 = Triple(m2=.7)
+  assert_allclose(t._deriv(0, t2._y), t2._deriv(0, t2._y), rtol=1e-14)
+
 ###
 ### Integration tests
 ###
@@ -38,6 +105,45 @@ def test_integrate_tofile():
   t.integrate()
   os.remove('foo.dat') # Clean up
 
+def test_integrate_dense():
+  '''Integrate with output only at fixed times.'''
+  outtimes = [0, 2.5, 5, 7.5]
+  t = Triple(tstop=10, outtimes=outtimes, outfilename='foo.dat')
+  t.integrate()
+  t_ref = Triple(tstop=10, outfilename='bar.dat')
+  t_ref.solver.integrate(10 * yr2s)
+  t_ref._read_solver()
+  data = np.loadtxt('foo.dat')
+  assert_allclose(data[:, 0], outtimes + [10])
+  assert_allclose(data[-1, 1:], [t_ref.a1, t_ref.e1, t_ref.g1, t_ref.e2,
+    t_ref.g2, t_ref.inc], rtol=1e-6)
+  os.remove('foo.dat') # Clean up
+  os.remove('bar.dat')
+
+def test_integrate_nonsingular():
+  '''The nonsingular variables should give the same evolution as the
+  orbital elements, and should integrate from e1 = 0.'''
+  kwargs = dict(tstop=1e4, outtimes=[], outfilename=os.devnull, atol=1e-11,
+    rtol=1e-11)
+  t = Triple(argperi1=30, **kwargs)
+  tn = Triple(argperi1=30, variables='nonsingular', **kwargs)
+  assert_allclose(tn._elements(tn._y), t._y, rtol=1e-14)
+  t.integrate()
+  tn.integrate()
+  assert_allclose([tn.t, tn.e1, tn.g1, tn.inc], [t.t, t.e1, t.g1, t.inc],
+    rtol=1e-6)
+
+  t = Triple(e1=0, variables='nonsingular', **kwargs)
+  t.integrate()
+  assert t.t == t.tstop
+  assert np.isfinite(t.e1)
+
+def test_integrate_stiff():
+  '''Integrate with the stiff integrator and the analytic Jacobian.'''
+  t = Triple(tstop=10, stiff=True, gr=True)
+  t.integrate()
+  assert t.t >= 10
+
 def test_ecc_extrema():
   '''See that we can use the eccmaxima function.'''
   t = Triple(tstop=10)
@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+
+import os
+
+from ..ts_benchmark import *
+
+def test_run_scenario():
+  '''A short scenario should count its evaluations of the EOMs and its
+  steps.'''
+  for name in ['quadrupole', 'numerical_kl_period']:
+    result = run_scenario(name, scale=.01)
+    assert result['scenario'] == name
+    assert result['steps'] > 0
+    assert result['rhs'] >= result['steps']
+    assert result['maxrss_mb'] > 0
+
+def test_save_load(tmpdir):
+  '''Saved results should be read back and compared with the earlier
+  commit.'''
+  filename = str(tmpdir.join('benchmarks.jsonl'))
+  results = [run_scenario('quadrupole', scale=.01)]
+  save_results(results, filename)
+  history = load_results(filename)
+  assert len(history) == 1
+  assert history[0]['steps'] == results[0]['steps']
+  assert history[0]['commit'] == git_commit()
+
+  history[0]['commit'] = 'previous'
+  table = compare(results, history)
+  assert 'quadrupole' in table.splitlines()[1]
+  assert '1.00' in table
+
+def test_import_time():
+  '''Importing the integrators should not import the modules that are
+  only needed to integrate or to parse the command line, and should take
+  little longer than importing numpy and scipy themselves.'''
+  modules = 'triplesec, ts_vector, ekm, ts_hybrid'
+  tbase = import_time('numpy, scipy')[0]
+  timport, heavy = import_time(modules)
+  assert heavy == []
+  assert timport < tbase + .25
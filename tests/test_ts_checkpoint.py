@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from ..ts_output import read_output
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+from ..ekm import Triple_octupole
+
+def test_resume(tmpdir):
+  '''An integration that is interrupted after a checkpoint and resumed
+  should write the same output as one that is not interrupted.  The
+  Runge-Kutta methods of solve_ivp are restarted exactly.'''
+  checkpoint = str(tmpdir.join('checkpoint.json'))
+  for algo in ['RK45', 'RK23']:
+    for outformat in ['text', 'npy']:
+      straight = str(tmpdir.join('straight'))
+      resumed = str(tmpdir.join('resumed'))
+      t = Triple(tstop=3e3, outfilename=straight, outformat=outformat,
+        integration_algo=algo)
+      t.integrate()
+
+      t = Triple(tstop=3e3, outfilename=resumed, outformat=outformat,
+        integration_algo=algo, checkpoint_filename=checkpoint)
+      t.ts_printout()
+      for i in range(20):
+        t._step()
+        t.ts_printout()
+      t.checkpoint()
+
+      # These steps are lost
+      for i in range(5):
+        t._step()
+        t.ts_printout()
+      t.outfile.flush()
+
+      t = Triple.resume(checkpoint)
+      assert t.nstep == 20
+      t.integrate()
+
+      if outformat == 'text':
+        assert (np.loadtxt(resumed) == np.loadtxt(straight)).all()
+      else:
+        assert (read_output(resumed) == read_output(straight)).all()
+
+def test_resume_dense(tmpdir):
+  '''An integration that is continued from its final checkpoint to a later
+  time should agree with one that is not stopped.'''
+  checkpoint = str(tmpdir.join('checkpoint.json'))
+  for cls, kwargs in [(Triple_vector, {}), (Triple_octupole, {'e1': .1,
+    'inc': 85, 'epsoct': .03})]:
+    outtimes = np.linspace(0, 20, 11)
+    straight = str(tmpdir.join('straight.dat'))
+    resumed = str(tmpdir.join('resumed.dat'))
+    cls(tstop=20, outtimes=outtimes, outfilename=straight, atol=1e-11,
+      rtol=1e-11, **kwargs).integrate()
+    cls(tstop=10, outtimes=outtimes, outfilename=resumed, atol=1e-11,
+      rtol=1e-11, checkpoint_filename=checkpoint, **kwargs).integrate()
+    cls.resume(checkpoint, tstop=20).integrate()
+    assert_allclose(np.loadtxt(resumed), np.loadtxt(straight), rtol=1e-7,
+      atol=1e-9)
+
+def test_wrong_class(tmpdir):
+  checkpoint = str(tmpdir.join('checkpoint.json'))
+  Triple(tstop=10, outfilename=os.devnull,
+    checkpoint_filename=checkpoint).integrate()
+  with pytest.raises(ValueError):
+    Triple_vector.resume(checkpoint)
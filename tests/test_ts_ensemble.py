@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.integrate import ode
+
+from ..triplesec import Triple
+from ..ts_constants import yr2s
+from ..ts_ensemble import Triple_ensemble
+
+###
+### Object creation tests
+###
+
+def test_make_Triple_ensemble():
+  '''Try to create a Triple_ensemble class.'''
+  te = Triple_ensemble()
+  assert te.n == 1
+
+def test_setoptions():
+  '''Try to set some options, mixing arrays and scalars.'''
+  te = Triple_ensemble(a1=1, a2=[20, 30, 40], e1=.1, e2=[.3, .2, .1],
+        m1=1, m2=.5, m3=2, argperi1=[0, 45, 90], inc=70, tstop=[10, 20, 30])
+  assert te.n == 3
+  assert_allclose(te.inc, 70)
+
+###
+### Integration tests
+###
+
+def _final_state(kwargs, tstop):
+  '''Integrate a single Triple to exactly tstop years with VODE.'''
+  t = Triple(**kwargs)
+  solver = ode(t._deriv)
+  solver.set_integrator('vode', nsteps=10**6, atol=1e-12, rtol=1e-12)
+  solver.set_initial_value(t._y, 0)
+  return solver.integrate(tstop * yr2s)
+
+def test_matches_Triple():
+  '''Make sure that the ensemble integrator agrees with integrating each
+  triple individually.'''
+  params = dict(a1=[1, 1, 2], a2=[20, 30, 25], e1=[.1, .2, .05], e2=[.3,
+    .1, .5], inc=[80, 70, 95], argperi1=[0, 30, 60], m2=[1, .5, .3])
+  for hexadecapole in [False, True]:
+    te = Triple_ensemble(tstop=1e3, hexadecapole=hexadecapole, gr=True,
+          **params)
+    te.integrate()
+    assert list(te.termination) == ['tstop'] * 3
+    assert_allclose(te.t, 1e3)
+    for i in range(te.n):
+      kwargs = dict((key, val[i]) for key, val in params.items())
+      y = _final_state(dict(kwargs, hexadecapole=hexadecapole, gr=True), 1e3)
+      assert_allclose(te._y[:, i], y, rtol=1e-6)
+
+def test_circular_outer_orbit():
+  '''The octupole term is turned off if the outer orbit is circular.'''
+  te = Triple_ensemble(e2=[0, .3], m2=.5, tstop=1e3)
+  te.integrate()
+  assert te.e2[0] == 0
+  assert te.e2[1] != .3
+
+def test_collision():
+  '''Make sure that colliding triples stop and the rest keep going.'''
+  te = Triple_ensemble(e1=.1, inc=[89.9, 60], r1=10, r2=10, tstop=1e4)
+  te.integrate()
+  assert list(te.termination) == ['collision', 'tstop']
+  assert list(te.collision) == [True, False]
+  assert te.t[0] < 1e4
+
+def test_collision_matches_Triple():
+  '''The ensemble and Triple should agree on which triples collide.'''
+  kwargs = dict(e1=.1, r1=10, r2=10, tstop=1e4)
+  incs = [89.9, 85, 60]
+  te = Triple_ensemble(inc=incs, **kwargs)
+  te.integrate()
+  for i, inc in enumerate(incs):
+    t = Triple(inc=inc, outfilename=os.devnull, **kwargs)
+    t.integrate()
+    assert te.collision[i] == t.collision
+    if t.collision:
+      assert_allclose(te.t[i], t.t, rtol=1e-2)
+  assert list(te.collision) == [True, True, False]
+
+def test_cputimeout():
+  '''Make sure that the integration halts after exceeding the maximum CPU
+  integration time.'''
+  large_time = 1e9
+  te = Triple_ensemble(tstop=[large_time, large_time], cputstop=.1)
+  te.integrate()
+  assert list(te.termination) == ['cputstop', 'cputstop']
+  assert np.all(te.t < large_time)
+
+def test_printout_tofile():
+  '''See if we can write the final states to a file.'''
+  te = Triple_ensemble(inc=[70, 80], tstop=10)
+  te.integrate()
+  te.printout('foo.dat')
+  with open('foo.dat') as infile:
+    assert len(infile.readlines()) == 2
+  os.remove('foo.dat') # Clean up
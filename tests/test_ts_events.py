@@ -0,0 +1,50 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ..ts_events import *
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+from ..ekm import Triple_octupole
+from ..ts_constants import R_sun, au
+
+def test_ecc_maxima():
+  '''The eccentricity maxima should be stationary points with the same
+  eccentricity whichever solver finds them.'''
+  emax = []
+  for algo in ['vode', 'lsoda', 'dop853', 'RK45']:
+    t = Triple(tstop=1.2e4, integration_algo=algo, atol=1e-11, rtol=1e-11)
+    finder = EventFinder(t, [t.ecc_event(-1)])
+    edot = 0
+    while t.t < t.tstop:
+      for event, time, y in finder.step():
+        assert abs(t._deriv(time, y)[1]) < 1e-6 * edot
+        emax.append(y[1])
+      edot = max(edot, abs(t._deriv(t.solver.t, t.solver.y)[1]))
+  assert len(emax) == 8
+  assert_allclose(emax, emax[0], rtol=1e-8)
+
+def test_collision():
+  '''The integration should stop when the periapsis reaches the sum of the
+  radii.'''
+  t = Triple(tstop=3e3, inc=85, r1=5, r2=5, outfilename=os.devnull)
+  t.integrate()
+  assert t.collision
+  assert_allclose(t.a1 * (1 - t.e1), 10 * R_sun / au, rtol=1e-10)
+
+def test_initial_collision():
+  '''A triple that starts with the periapsis below the sum of the radii has
+  collided, whether or not the output is dense.'''
+  for outtimes in [None, [1, 2]]:
+    t = Triple(e1=.99, tstop=1e3, r1=5, r2=5, outtimes=outtimes,
+      outfilename=os.devnull)
+    t.integrate()
+    assert t.collision
+    assert t.t == 0
+
+def test_flip_period():
+  '''The time between flips should agree with the analytic period.'''
+  to = Triple_octupole(e1=.1, inc=85, epsoct=.03, argperi=30, tstop=1e4)
+  assert_allclose(to.numeric_period(n_flips=2), to.period(), rtol=1e-6)
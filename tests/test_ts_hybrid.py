@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ..ts_hybrid import *
+from ..ts_events import EventFinder
+from ..ts_vector import Triple_vector, vector_elements
+
+def test_elements():
+  '''Mapping the averaged variables to a KL cycle and back should give the
+  same variables, and the maximum eccentricity should be that of the
+  cycle.'''
+  jz, Omega, CKL = .2, 1., .15
+  e1, inc, longascnode, argperi = cycle_elements(jz, Omega, CKL)
+  jvec, evec = vector_elements(e1, np.radians(inc), np.radians(longascnode),
+    np.radians(argperi))
+  assert_allclose(averaged_elements(jvec, evec), [jz, Omega, CKL])
+
+  tv = Triple_vector(e1=e1, inc=inc, longascnode=longascnode,
+    argperi=argperi, e2=0, outfilename=os.devnull)
+  finder = EventFinder(tv, [tv.ecc_event(-1)])
+  events = []
+  while not events:
+    events = finder.step()
+  assert_allclose(np.linalg.norm(events[0][2][3:]), ecc_max(jz, CKL),
+    rtol=1e-6)
+
+def test_flips():
+  '''The hybrid integration should flip at nearly the same times as the
+  full integration.'''
+  kwargs = dict(a1=1, a2=20, e1=.3, e2=.3, inc=80)
+  tv = Triple_vector(tstop=1e12, outfilename=os.devnull, **kwargs)
+  tstop = 700 * tv.tsec
+  finder = EventFinder(tv, [tv.flip_event()])
+  fliptimes = []
+  while tv.t < tstop:
+    fliptimes += [t * tv.tsec for event, t, y in finder.step()]
+
+  th = Triple_hybrid(tstop=tstop, outfilename=os.devnull, **kwargs)
+  hybrid_fliptimes = []
+  while th.t < tstop:
+    jz = th.jz
+    th._step()
+    if np.sign(th.jz) != np.sign(jz):
+      hybrid_fliptimes.append(th.t)
+
+  assert th.nswitch > 0
+  assert 0 < th.t_averaged < tstop
+  assert len(hybrid_fliptimes) == len(fliptimes)
+  assert_allclose(hybrid_fliptimes, fliptimes, rtol=.03)
+
+def test_ecc_envelope():
+  '''The largest eccentricity of the hybrid integration should be that of
+  the full integration, whether or not the triple flips.'''
+  for kwargs, atol in [(dict(e1=.3, inc=80), .5), (dict(e1=.5, inc=70),
+    1e-3)]:
+    tv = Triple_vector(tstop=1e12, outfilename=os.devnull, **kwargs)
+    tstop = 700 * tv.tsec
+    finder = EventFinder(tv, [tv.ecc_event(-1)])
+    e1max = 0
+    while tv.t < tstop:
+      for event, t, y in finder.step():
+        e1max = max(e1max, np.linalg.norm(y[3:]))
+
+    th = Triple_hybrid(tstop=tstop, outfilename=os.devnull, **kwargs)
+    th.integrate()
+    # Compare log(1 - e1), which is what matters near a flip
+    assert_allclose(np.log10(1 - th.e1max), np.log10(1 - e1max), atol=atol)
+
+def test_command_line():
+  '''The switching parameters should be settable from the command line.'''
+  args = process_command_line(['--jz-switch', '4', '--ckl-switch', '.02',
+    '--hysteresis', '1.5'])
+  assert (args.jz_switch, args.ckl_switch, args.hysteresis) == (4, .02, 1.5)
+
+def test_averaged():
+  '''A triple that stays far from flipping should be integrated with the
+  doubly averaged equations throughout, in far fewer steps.'''
+  kwargs = dict(a1=1, a2=20, e1=.5, e2=.3, inc=70)
+  tv = Triple_vector(outfilename=os.devnull, **kwargs)
+  th = Triple_hybrid(tstop=100 * tv.tsec, outfilename=os.devnull, **kwargs)
+  th.integrate()
+  assert th.nswitch == 0
+  assert_allclose(th.t_averaged, th.t)
+  assert th.nstep < 100
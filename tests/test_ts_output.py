@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ..ts_output import *
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+
+def test_text_output():
+  '''Write a few rows of text.'''
+  output = open_output('foo.dat', ['a', 'b'])
+  output.write([1, 2.5])
+  output.write([3, 4])
+  output.close()
+  assert_allclose(np.loadtxt('foo.dat'), [[1, 2.5], [3, 4]])
+  os.remove('foo.dat') # Clean up
+
+def test_npy_output():
+  '''Write enough rows to fill the buffer several times and read them back
+  while the file is still open.'''
+  output = NpyOutput('foo.npy', ['t', 'x'], bufsize=16)
+  for i in range(100):
+    output.write([i, i**2])
+  assert len(read_output('foo.npy')) == 96
+  output.close()
+  data = read_output('foo.npy')
+  assert data.dtype.names == ('t', 'x')
+  assert_allclose(data['x'], np.arange(100)**2)
+  assert_allclose(data.view('<f8').reshape(len(data), -1)[7], [7, 49])
+  del data
+  os.remove('foo.npy') # Clean up
+
+def test_unknown_format():
+  '''Make sure that an unknown format is rejected.'''
+  try:
+    open_output('foo.dat', ['a'], 'foo')
+  except ValueError:
+    pass
+  else:
+    assert False
+
+def test_integrate_npy():
+  '''The npy output should contain the same trajectory as the text output.'''
+  for cls in [Triple, Triple_vector]:
+    cls(tstop=10, outfilename='foo.dat').integrate()
+    cls(tstop=10, outfilename='foo.npy', outformat='npy').integrate()
+    data = read_output('foo.npy')
+    assert data.dtype.names == tuple(cls.columns)
+    assert_allclose(data.view('<f8').reshape(len(data), -1),
+      np.loadtxt('foo.dat'), rtol=1e-11)
+    del data
+    os.remove('foo.dat') # Clean up
+    os.remove('foo.npy')
+
+def test_decimated_output():
+  '''The decimated output should keep the first and last rows and the
+  extrema of each key in each bucket, in order.'''
+  t = np.linspace(0, 10, 1001)
+  x = np.sin(7 * t)
+  output = DecimatedOutput(open_output('foo.dat', ['t', 'x']), 1.,
+    [lambda row: row[1]])
+  for row in zip(t, x):
+    output.write(row)
+  output.close()
+  data = np.loadtxt('foo.dat')
+  assert len(data) <= 2 * 11 + 1
+  assert_allclose(data[0], [t[0], x[0]])
+  assert_allclose(data[-1], [t[-1], x[-1]])
+  assert np.all(np.diff(data[:,0]) > 0)
+  for k in range(10):
+    inside = (data[:,0] >= k) & (data[:,0] < k + 1)
+    assert data[inside,1].max() == x[(t >= k) & (t < k + 1)].max()
+    assert data[inside,1].min() == x[(t >= k) & (t < k + 1)].min()
+  os.remove('foo.dat') # Clean up
+
+def test_integrate_decimated():
+  '''Decimating the output of an integration should keep its extrema.'''
+  for cls in [Triple, Triple_vector]:
+    cls(tstop=3e4, outfilename='foo.npy', outformat='npy').integrate()
+    cls(tstop=3e4, outfilename='bar.npy', outformat='npy',
+      decimate=3e3).integrate()
+    full = read_output('foo.npy')
+    decimated = read_output('bar.npy')
+    assert len(decimated) < len(full) / 10
+    for key in cls.decimation_keys:
+      assert max(map(key, full)) == max(map(key, decimated))
+      assert min(map(key, full)) == min(map(key, decimated))
+    del full, decimated
+    os.remove('foo.npy') # Clean up
+    os.remove('bar.npy')
+
+def test_schedules():
+  '''Make sure that the output schedules span the integration.'''
+  assert_allclose(uniform_times(10, 2.5), [0, 2.5, 5, 7.5])
+  times = log_times(1e6, 7, 1)
+  assert_allclose(times, [0, 1, 10, 100, 1e3, 1e4, 1e5, 1e6])
@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+
+import os
+from numpy.testing import assert_allclose
+
+from ..ts_population import *
+
+def _write_table(filename):
+  '''Write a small table of initial conditions.'''
+  with open(filename, 'w') as outfile:
+    outfile.write('# A test population\n')
+    outfile.write('a1 a2 e1 inc\n')
+    outfile.write('1 20 .1 80\n')
+    outfile.write('1 30 .2 70\n')
+    outfile.write('2 25 .05 60\n')
+
+def _read_results(filename):
+  '''Read the results of a population run, keyed by index.'''
+  results = {}
+  with open(filename) as infile:
+    for line in infile:
+      if not line.startswith('#'):
+        results[int(line.split()[0])] = line.split()
+  return results
+
+def _clean_up():
+  for filename in ['pop.in', 'pop.out', 'pop.out.journal']:
+    if os.path.exists(filename):
+      os.remove(filename)
+
+def test_read_table():
+  '''Test reading a table of initial conditions.'''
+  _write_table('pop.in')
+  rows = read_table('pop.in')
+  assert len(rows) == 3
+  assert rows[1] == {'a1': 1, 'a2': 30, 'e1': .2, 'inc': 70}
+  _clean_up()
+
+def test_run_population():
+  '''Integrate a small population with each model.'''
+  _write_table('pop.in')
+  for model in ['triple', 'vector', 'octupole']:
+    nrun = run_population('pop.in', 'pop.out', model=model, processes=2,
+      tstop=10)
+    assert nrun == 3
+    results = _read_results('pop.out')
+    assert sorted(results.keys()) == [0, 1, 2]
+    assert results[1][-1] == 'tstop'
+    assert read_journal('pop.out.journal') == set([0, 1, 2])
+    os.remove('pop.out')
+    os.remove('pop.out.journal')
+  _clean_up()
+
+def test_results_match_serial():
+  '''The parallel results should be the same as integrating directly.'''
+  _write_table('pop.in')
+  run_population('pop.in', 'pop.out', processes=2, tstop=10)
+  results = _read_results('pop.out')
+  t = Triple(a1=2, a2=25, e1=.05, inc=60, tstop=10, outfilename=os.devnull)
+  t.integrate()
+  assert_allclose(map(float, results[2][1:8]), final_state(t))
+  assert int(results[2][8]) == t.nstep
+  _clean_up()
+
+def test_resume():
+  '''Make sure that triples recorded in the journal are not rerun and that
+  unrecorded rows from an interrupted run are discarded.'''
+  _write_table('pop.in')
+  with open('pop.out', 'w') as outfile:
+    outfile.write('0 sentinel\n')
+    outfile.write('2 unfinished\n')
+  with open('pop.out.journal', 'w') as journal:
+    journal.write('0\n')
+
+  nrun = run_population('pop.in', 'pop.out', processes=2, tstop=10)
+  assert nrun == 2
+  results = _read_results('pop.out')
+  assert results[0] == ['0', 'sentinel']
+  assert results[2][-1] == 'tstop'
+  assert len(results) == 3
+  _clean_up()
+
+def test_resume_damaged():
+  '''Blank lines and a last line that was cut short should be discarded on
+  resuming.'''
+  _write_table('pop.in')
+  with open('pop.out', 'w') as outfile:
+    outfile.write('0 sentinel\n')
+    outfile.write('\n')
+    outfile.write('  \n')
+    outfile.write('1 cut')
+  with open('pop.out.journal', 'w') as journal:
+    journal.write('0\n')
+
+  nrun = run_population('pop.in', 'pop.out', processes=2, tstop=10)
+  assert nrun == 2
+  results = _read_results('pop.out')
+  assert results[0] == ['0', 'sentinel']
+  assert results[1][-1] == 'tstop'
+  assert len(results) == 3
+  _clean_up()
+
+def test_resume_columns():
+  '''A run should not be resumed with different columns.'''
+  _write_table('pop.in')
+  run_population('pop.in', 'pop.out', model='vector', processes=2, tstop=10,
+    reducers=['e1_max'])
+  os.remove('pop.out.journal')
+  try:
+    run_population('pop.in', 'pop.out', model='vector', processes=2,
+      tstop=10, reducers=['nflips'])
+  except ValueError:
+    pass
+  else:
+    assert False
+  _clean_up()
+
+def test_stop_conditions():
+  '''The name of the stopping condition should be reported for each
+  triple.'''
+  with open('pop.in', 'w') as outfile:
+    outfile.write('a1 a2 e1 inc\n')
+    outfile.write('1 20 .1 80\n')
+    outfile.write('1 20 .1 30\n')
+  run_population('pop.in', 'pop.out', model='vector', processes=2,
+    tstop=1e4, stop_conditions=['kozai_window=1'])
+  results = _read_results('pop.out')
+  assert results[0][-1] == 'tstop'
+  assert results[1][-1] == 'kozai_window'
+  assert float(results[1][1]) < 1e4
+  _clean_up()
@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+from ..ts_sampling import *
+from ..ts_population import read_table, run_population
+from ..ts_ensemble import Triple_ensemble
+
+def test_draw():
+  '''The candidates should follow their distributions.'''
+  chunk = draw(np.random.RandomState(0), 100000, a1=(1, 10), m1=(1, 2),
+    q=(.5, 1))
+  assert chunk['a1'].min() >= 1 and chunk['a1'].max() <= 10
+  assert abs(np.median(np.log10(chunk['a1'])) - .5) < .01
+  # Thermal: <e> = 2/3
+  assert abs(chunk['e1'].mean() - 2/3.) < .01
+  # Isotropic: <cos i> = 0
+  assert abs(np.cos(np.radians(chunk['inc'])).mean()) < .01
+  assert np.all((chunk['m1'] >= 1) & (chunk['m1'] <= 2))
+  assert np.all(chunk['m2'] >= .5 * chunk['m1'])
+
+def test_sample():
+  '''A sample should have n triples that pass the cuts, numbered in order,
+  and each chunk should depend only on the seed and its number.'''
+  chunks = list(sample(25000, chunksize=10000, seed=3))
+  population = np.concatenate(chunks)
+  assert len(population) == 25000
+  assert_array_equal(population['index'], np.arange(25000))
+  assert np.all(stable(population))
+  assert np.all(hierarchical(population))
+
+  again = list(sample(1e6, chunksize=10000, seed=3))
+  assert_array_equal(again[1][PARAMS], chunks[1][PARAMS])
+  other = next(sample(1e6, chunksize=10000, seed=4))
+  assert not np.any(other['a1'] == chunks[0]['a1'][:len(other)])
+
+def test_sample_rejected():
+  '''A sample that the cuts reject entirely should raise an error naming
+  the parameters instead of drawing forever.'''
+  try:
+    list(sample(10, chunksize=100, a1=(100, 200), a2=(100, 150)))
+  except ValueError as error:
+    assert 'a1=(100, 200)' in str(error)
+  else:
+    assert False
+
+def test_stable():
+  '''Test the stability criterion on either side of the boundary.'''
+  chunk = draw(np.random.RandomState(0), 2)
+  chunk['m1'] = chunk['m2'] = chunk['m3'] = 1
+  chunk['e2'] = 0
+  chunk['inc'] = 0
+  chunk['a1'] = 1
+  chunk['a2'] = [2.8 * 1.5**.4 * .99, 2.8 * 1.5**.4 * 1.01]
+  assert_array_equal(stable(chunk), [False, True])
+
+def test_table(tmpdir):
+  '''A written table should be read back by ts_population.'''
+  filename = str(tmpdir.join('ics.dat'))
+  chunks = list(sample(10, chunksize=100, seed=1))
+  with open(filename, 'w') as outfile:
+    write_table(chunks, outfile)
+  table = read_table(filename)
+  assert table == list(rows(chunks))
+
+def test_integrate(tmpdir):
+  '''A sample should be integrated by Triple_ensemble and by
+  ts_population.'''
+  chunk = next(sample(4, chunksize=100, seed=1))
+  ensemble = Triple_ensemble(tstop=1, **params(chunk))
+  ensemble.integrate()
+  assert np.all(ensemble.termination == 'tstop')
+
+  outfilename = str(tmpdir.join('pop.out'))
+  nrun = run_population(rows(sample(4, chunksize=100, seed=1)), outfilename,
+    processes=2, batchsize=3, tstop=1)
+  assert nrun == 4
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from ..ts_solvers import *
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+from ..ekm import Triple_octupole
+
+def _oscillator(t, y, omega):
+  return [y[1], -omega**2 * y[0]]
+
+def _oscillator_jac(t, y, omega):
+  return [[0, 1], [-omega**2, 0]]
+
+@pytest.mark.parametrize('name', SOLVERS)
+def test_integrate(name):
+  '''Every solver should integrate a harmonic oscillator to the requested
+  time.'''
+  solver = make_solver(name, _oscillator, [1, 0], 0, 10, 1e-10, 1e-10,
+    jac=_oscillator_jac, args=(2.,))
+  assert solver.integrate(10)
+  assert solver.t == 10
+  assert_allclose(solver.y, [np.cos(20), -2 * np.sin(20)], atol=1e-6)
+
+@pytest.mark.parametrize('name', SOLVERS)
+def test_step_interpolate(name):
+  '''Steps should advance the solver, and the state within the last step
+  should be interpolated without changing the state of the solver.'''
+  solver = make_solver(name, _oscillator, [1, 0], 0, 10, 1e-10, 1e-10,
+    args=(2.,))
+  for i in range(5):
+    t0 = solver.t
+    solver.step()
+    assert solver.t > t0
+  t1, y1 = solver.t, solver.y.copy()
+  t = (t0 + t1) / 2.
+  assert_allclose(solver.interpolate(t), [np.cos(2 * t), -2 * np.sin(2 *
+    t)], atol=1e-7)
+  assert solver.t == t1
+  assert_allclose(solver.y, y1)
+  assert solver.nsteps >= 5
+
+def test_unknown():
+  with pytest.raises(ValueError):
+    make_solver('euler', _oscillator, [1, 0], 0, 10, 1e-10, 1e-10,
+      args=(2.,))
+
+def test_integrators():
+  '''Each integrator should give the same state with each solver.'''
+  for cls, kwargs in [(Triple, {}), (Triple_vector, {}), (Triple_octupole,
+    {'e1': .1, 'inc': 85, 'epsoct': .03})]:
+    final = []
+    for name in ['vode', 'lsoda', 'dop853', 'RK45']:
+      triple = cls(tstop=10, outtimes=[5], integration_algo=name,
+        outfilename=os.devnull, atol=1e-11, rtol=1e-11, **kwargs)
+      triple.integrate()
+      final.append(triple.solver.y)
+    assert_allclose(final, [final[0]] * len(final), rtol=1e-7, atol=1e-12)
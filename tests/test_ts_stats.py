@@ -0,0 +1,44 @@
+#! /usr/bin/env python
+
+import json
+import os
+from numpy.testing import assert_allclose
+
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+from ..ekm import Triple_octupole
+
+def test_stats():
+  '''The stats should count the evaluations and steps of the integration
+  without changing it.'''
+  for cls, kwargs in [(Triple, {}), (Triple_vector, {}), (Triple_octupole,
+    {'e1': .1, 'inc': 85, 'epsoct': .03})]:
+    plain = cls(tstop=10, outfilename=os.devnull, **kwargs)
+    plain.integrate()
+    assert plain.stats is None
+
+    triple = cls(tstop=10, outfilename=os.devnull, stats=True, **kwargs)
+    triple.integrate()
+    assert_allclose(triple.solver.y, plain.solver.y)
+
+    stats = triple.stats.as_dict()
+    assert stats['steps'] == triple.nstep
+    assert stats['deriv_calls'] >= stats['steps']
+    assert stats['rejected_steps'] >= 0
+    assert sum(stats['step_sizes'].values()) == stats['steps']
+    assert triple.stats.calls['output'] == triple.nstep + 2
+    times = stats['times']
+    assert_allclose(sum(times[name] for name in ['deriv', 'jac', 'solver',
+      'update', 'output', 'other']), times['total'])
+
+def test_stats_outfile(tmpdir):
+  '''The stats should be written to a file at the end of the
+  integration.'''
+  filename = str(tmpdir.join('stats.json'))
+  t = Triple(tstop=10, outfilename=os.devnull, stats=True,
+    stats_outfilename=filename, integration_algo='dop853')
+  t.ecc_extrema()
+  with open(filename) as infile:
+    stats = json.load(infile)
+  assert stats['steps'] == t.solver.nsteps
+  assert stats['deriv_calls'] > 0
@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+
+import os
+import pytest
+
+from ..ts_stopping import *
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+from .. import ts_checkpoint
+
+def test_gr_quenched():
+  '''A triple whose KL oscillations are quenched by GR should stop right
+  away, but only if the GR terms are on.'''
+  t = Triple(a1=.02, a2=2, gr=True, tstop=1e3, outfilename=os.devnull,
+    stop_conditions=['gr_quenched'])
+  t.integrate()
+  assert t.stop_reason == 'gr_quenched'
+  assert t.nstep == 1
+
+  for kwargs in [{'a1': .1, 'a2': 10, 'gr': True}, {'a1': .02, 'a2': 2}]:
+    t = Triple(tstop=1, outfilename=os.devnull,
+      stop_conditions=['gr_quenched'], **kwargs)
+    t.integrate()
+    assert t.stop_reason is None
+    assert t.t >= 1
+
+def test_merger_time():
+  '''The integration should stop if the merger time is below tmax.'''
+  for tmax, reason in [(1e14, 'merger_time'), (1e12, None)]:
+    t = Triple(a1=.1, a2=10, tstop=1, outfilename=os.devnull,
+      stop_conditions=[MergerTime(tmax)])
+    t.integrate()
+    assert t.stop_reason == reason
+
+def test_merger_time_value():
+  '''The merger time of PSR B1913+16 (Hulse-Taylor) is 301 Myr (Weisberg
+  et al. 2010).'''
+  m1, m2 = 1.4398, 1.3886
+  period = 0.322997448918 / 365.25 # years
+  a1 = ((m1 + m2) * period**2)**(1/3.) # AU
+  assert abs(merger_time(a1, .6171334, m1, m2) / 3.01e8 - 1) < .03
+
+def test_kozai_window():
+  '''A triple outside the Kozai window should stop after ncycles KL
+  timescales.'''
+  tv = Triple_vector(inc=30, tstop=1e5, outfilename=os.devnull,
+    stop_conditions=['kozai_window=2'])
+  tv.integrate()
+  assert tv.stop_reason == 'kozai_window'
+  assert 2 * tv.tsec < tv.t < 3 * tv.tsec
+  assert abs(kl_timescale(tv) / tv.tsec - 1) < 1e-12
+
+  tv = Triple_vector(inc=80, tstop=5 * tv.tsec, outfilename=os.devnull,
+    stop_conditions=['kozai_window=2'])
+  tv.integrate()
+  assert tv.stop_reason is None
+
+def test_kozai_window_resume(tmpdir):
+  '''A resumed integration should stop where an uninterrupted one does,
+  since the time spent outside the Kozai window is checkpointed.'''
+  checkpoint = str(tmpdir.join('checkpoint.json'))
+  kwargs = dict(inc=30, tstop=1e5, outformat='none', integration_algo='RK45',
+    stop_conditions=['kozai_window=2'])
+  tv = Triple_vector(**kwargs)
+  tv.integrate()
+
+  resumed = Triple_vector(checkpoint_filename=checkpoint, **kwargs)
+  while resumed.t < tv.tsec:
+    resumed._step()
+    assert check(resumed) is None
+  resumed.checkpoint()
+  resumed = Triple_vector.resume(checkpoint)
+  resumed.integrate()
+  assert resumed.stop_reason == 'kozai_window'
+  assert resumed.t == tv.t
+
+def test_kl_timescale_epsoct():
+  '''A triple given by epsoct has no KL timescale in years.'''
+  class Triple_epsoct:
+    a1 = a2 = None
+  with pytest.raises(ValueError):
+    kl_timescale(Triple_epsoct())
+
+def test_custom():
+  '''A custom condition should stop the integration and be reported by
+  name, also when printing only at outtimes.'''
+  for outtimes in [None, range(0, 3000, 10)]:
+    t = Triple(tstop=3e3, outtimes=outtimes, outfilename=os.devnull,
+      stop_conditions=[Condition('high_e', lambda triple: triple.e1 > .5)])
+    t.integrate()
+    assert t.stop_reason == 'high_e'
+    assert t.e1 > .5
+    assert t.t < 3e3
+
+def test_specs():
+  '''Built-in conditions should be saved in checkpoints by name.'''
+  conditions = ['merger_time=1e8', GRQuenched(2),
+    Condition('custom', lambda triple: False)]
+  assert specs(conditions) == ['merger_time=100000000.0', 'gr_quenched=2.0']
+  assert [cond.name for cond in make_conditions(specs(conditions))] == [
+    'merger_time', 'gr_quenched']
+  params = ts_checkpoint.parameters({'stop_conditions': conditions})
+  assert params['stop_conditions'] == specs(conditions)
+  with pytest.raises(ValueError):
+    make_condition('collision')
+
+def test_bare_specs():
+  '''Every built-in condition should have a default value, and a value that
+  is not a number should be reported by name.'''
+  for name in CONDITIONS:
+    assert make_condition(name).name == name
+  assert make_condition('merger_time').spec == 'merger_time=100000000.0'
+  with pytest.raises(ValueError) as error:
+    make_condition('merger_time=abc')
+  assert 'merger_time=abc' in str(error.value)
+  assert 'merger_time=100000000.0' in str(error.value)
@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+
+import os
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ..ts_summary import *
+from ..ts_output import read_output
+from ..ts_events import EventFinder
+from ..triplesec import Triple
+from ..ts_vector import Triple_vector
+
+def test_summary():
+  '''The summary should agree with the trajectory.'''
+  t = Triple(tstop=3e4, inc=85, outfilename='foo.npy', outformat='npy',
+    reducers=['default'])
+  t.integrate()
+  data = read_output('foo.npy')
+  assert t.summary['e1_max'] == data['e1'].max()
+  assert_allclose(t.summary['inc_min'], data['inc'].min(), rtol=1e-12)
+  assert_allclose(t.summary['inc_max'], data['inc'].max(), rtol=1e-12)
+  assert t.summary['periapsis_min'] == (data['a1'] * (1 - data['e1'])).min()
+  assert t.summary['nflips'] == 0
+  assert t.summary['t_first_flip'] is None
+  dt = np.diff(data['t'])
+  assert_allclose(t.summary['time_above'], dt[data['e1'][:-1] >
+    .9].sum() / data['t'][-1])
+  del data
+  os.remove('foo.npy') # Clean up
+
+def test_flips():
+  '''Count the flips of a triple in the test particle limit.'''
+  tv = Triple_vector(tstop=1e5, inc=85, outfilename='foo.npy',
+    outformat='npy', reducers=['nflips', 't_first_flip'])
+  tv.integrate()
+  data = read_output('foo.npy')
+  retrograde = data['jz'] < 0
+  flips = np.flatnonzero(retrograde[1:] != retrograde[:-1])
+  assert tv.summary['nflips'] == len(flips) > 0
+  del data
+  os.remove('foo.npy') # Clean up
+
+  # The time of the first flip is that of the flip event
+  finder_tv = Triple_vector(tstop=1e5, inc=85, outfilename=os.devnull)
+  finder = EventFinder(finder_tv, [finder_tv.flip_event()])
+  events = []
+  while not events:
+    events = finder.step()
+  event, t, y = events[0]
+  assert_allclose(tv.summary['t_first_flip'], t * finder_tv.tsec,
+    rtol=1e-10)
+
+def test_flips_outtimes():
+  '''With outtimes the flips are only seen at the output times.'''
+  outtimes = np.arange(1e3, 1e5, 1e3)
+  tv = Triple_vector(tstop=1e5, inc=85, outtimes=outtimes,
+    outformat='none', reducers=['nflips', 't_first_flip'])
+  tv.integrate()
+  assert tv.summary['nflips'] > 0
+  assert tv.summary['t_first_flip'] in outtimes
+
+def test_custom_reducer():
+  '''A custom reducer should be updated after every step.'''
+  nstep = Reducer('nstep', lambda value, triple: value + 1, 0)
+  t = Triple(tstop=1e3, outformat='none', reducers=[nstep, 'e1_max'])
+  t.integrate()
+  assert t.summary['nstep'] == t.nstep + 1
+  assert names(t.reducers) == ['nstep', 'e1_max']
+  assert specs(t.reducers) == ['e1_max']
+
+def test_summary_only():
+  '''Nothing should be written with outformat='none'.'''
+  t = Triple(tstop=1e3, outfilename='foo.dat', outformat='none',
+    reducers=['e1_max'])
+  t.integrate()
+  assert not os.path.exists('foo.dat')
+  assert t.summary['e1_max'] > .1
+
+def test_resume_summary(tmpdir):
+  '''A resumed integration should continue its summary.'''
+  checkpoint = str(tmpdir.join('checkpoint.json'))
+  kwargs = dict(tstop=1e5, inc=85, outformat='none', reducers=['default'],
+    integration_algo='RK45')
+  tv = Triple_vector(**kwargs)
+  tv.integrate()
+
+  resumed = Triple_vector(checkpoint_filename=checkpoint, **kwargs)
+  update(resumed)
+  finder = EventFinder(resumed, [resumed.flip_event()])
+  while resumed.t < 5e4:
+    for event, t, y in finder.step():
+      flip(resumed, t * resumed.tsec)
+    update(resumed)
+  resumed.checkpoint()
+  resumed = Triple_vector.resume(checkpoint)
+  resumed.integrate()
+  assert resumed.summary == tv.summary
@@ -1,8 +1,9 @@
 #! /usr/bin/env python
 
 import os
+import numpy as np
 from numpy.testing import assert_allclose
-from ..ts_vector import Triple_vector
+from ..ts_vector import Triple_vector, vector_elements, _deriv_python
 
 ###
 ### Object creation tests
@@ -40,6 +41,64 @@ def test_CKL():
   tv = Triple_vector(e1=.1, inc=80, argperi=45)
   assert_allclose(tv.CKL, -.00212307888)
 
+def test_vector_elements():
+  '''The vectors should be orthogonal, have the right lengths, and give
+  back the argument of periapsis, both for scalars and for arrays.'''
+  e1 = np.array([.1, .5, .9, .3])
+  inc = np.array([0, 60, 100, 140]) * np.pi / 180
+  Omega = np.array([180, 45, 10, 300]) * np.pi / 180
+  g1 = np.array([0, 30, 120, 250]) * np.pi / 180
+  jvec, evec = vector_elements(e1, inc, Omega, g1)
+  assert jvec.shape == evec.shape == (4, 3)
+  assert_allclose(np.sum(jvec * evec, axis=1), 0, atol=1e-15)
+  assert_allclose(np.sum(jvec**2, axis=1), 1 - e1**2)
+  assert_allclose(np.sum(evec**2, axis=1), e1**2)
+  node = np.array([np.cos(Omega), np.sin(Omega), np.zeros(4)]).T
+  assert_allclose(np.sum(evec * node, axis=1), e1 * np.cos(g1), atol=1e-15)
+  assert_allclose(np.sign(evec[:, 2]), np.sign(np.sin(g1) * np.sin(inc)))
+
+  for i in range(4):
+    tv = Triple_vector(e1=e1[i], inc=inc[i] * 180 / np.pi,
+      longascnode=Omega[i] * 180 / np.pi, argperi=g1[i] * 180 / np.pi)
+    assert_allclose(tv.jvec, jvec[i])
+    assert_allclose(tv.evec, evec[i])
+
+def test_deriv():
+  '''Compare the derivatives, both compiled (if Numba is installed) and
+  not, to the vector form of the EOMs.'''
+  tv = Triple_vector()
+  y = np.array([.1, .5, .7, .3, -.2, .25])
+  epsoct = .03
+  jvec = y[:3]
+  evec = y[3:]
+  jx, jy, jz, ex, ey, ez = y
+  grad_j_phi = np.array([0, 0, 3/4. * jz]) + epsoct * -75/32. * np.array([
+    ez * jz, 0, ex * jz + ez * jx])
+  grad_e_phi = np.array([3/2. * ex, 3/2. * ey, -9/4. * ez]) + epsoct * (
+    np.array([75/64. * (1/5. - 8/5. * np.dot(evec, evec) + 7 * ez**2 -
+    jz**2) - 15/4. * ex**2, -15/4. * ex * ey, 75/64. * (54/5. * ex * ez - 2
+    * jx * jz)]))
+  expected = np.concatenate((
+    np.cross(jvec, grad_j_phi) + np.cross(evec, grad_e_phi),
+    np.cross(jvec, grad_e_phi) + np.cross(evec, grad_j_phi)))
+  assert_allclose(tv._deriv(0, y, epsoct), expected, rtol=1e-14)
+  assert_allclose(_deriv_python(list(y), epsoct, [0.] * 6), expected,
+    rtol=1e-14)
+
+def test_jacobian():
+  '''Compare the analytic Jacobian to a numerical Jacobian.'''
+  tv = Triple_vector(e1=.4, inc=70, argperi=30, longascnode=40)
+  y = np.array([.1, .5, .7, .3, -.2, .25])
+  jac_num = np.zeros((6, 6))
+  for j in range(6):
+    yp = y.copy()
+    ym = y.copy()
+    yp[j] += 1e-6
+    ym[j] -= 1e-6
+    jac_num[:, j] = (np.array(tv._deriv(0, yp, .03)) -
+      np.array(tv._deriv(0, ym, .03))) / 2e-6
+  assert_allclose(tv._jac(0, y, .03), jac_num, atol=1e-9)
+
 ###
 ### Integration tests
 ###
@@ -55,6 +114,24 @@ def test_integrate_tofile():
   tv.integrate()
   os.remove('foo.dat') # Clean up
 
+def test_integrate_dense():
+  '''Integrate with output only at fixed times.'''
+  outtimes = [0, 2.5, 5, 7.5]
+  tv = Triple_vector(tstop=10, outtimes=outtimes, outfilename='foo.dat')
+  tv.integrate()
+  tv_ref = Triple_vector(tstop=10)
+  tv_ref.solver.integrate(10 / tv_ref.tsec)
+  data = np.loadtxt('foo.dat')
+  assert_allclose(data[:, 0], outtimes + [10])
+  assert_allclose(data[-1, 1:], tv_ref.solver.y, rtol=1e-6)
+  os.remove('foo.dat') # Clean up
+
+def test_integrate_stiff():
+  '''Integrate with the stiff integrator and the analytic Jacobian.'''
+  tv = Triple_vector(tstop=10, stiff=True)
+  tv.integrate()
+  assert tv.t >= 10
+
 def test_ecc_extrema():
   '''See that we can use the eccmaxima function.'''
   tv = Triple_vector(tstop=10)
@@ -11,18 +11,33 @@ if __name__ == '__main__':
   import __init__
 
 # System modules
-import argparse
-import json
-import random
 import sys
 import time
+from collections import namedtuple
+from operator import itemgetter
 
 # Numerical modules
-from math import sqrt, cos, sin, pi, acos
+from math import sqrt, cos, sin, acos, atan2, cosh, hypot, tanh
 import numpy as np
-from scipy.integrate import ode, quad
-from scipy.optimize import root, fsolve
 from ts_constants import *
+import ts_checkpoint
+import ts_events
+import ts_jacobian
+import ts_kernels
+import ts_output
+import ts_solvers
+import ts_stats
+import ts_stopping
+import ts_summary
+
+# The quantities of a triple that only depend on the masses, the outer
+# semi-major axis, and which terms are turned on.  See Triple._set_constants.
+_Constants = namedtuple('_Constants', ['key', 'Lu', 'Hu', 'G1', 'G2', 'C2',
+  'C3', 'kernel', 'kernel_constants', 'deriv_scale', 'jacobians',
+  'jac_scale'])
+
+# The state variables that the solver may integrate.  See Triple.
+VARIABLES = ['elements', 'nonsingular']
 
 class Triple:
   '''Evolve a hierarchical triple using the Hamiltonian equations of motion.
@@ -48,25 +63,74 @@ class Triple:
     cputstop: The maximum amount of CPU time to integrate in seconds
     outfreq: Print output on every nth step
     outfilename: Write output to this file.  If None, print to stdout.
+    outformat: The format of the output file, 'text', 'npy', or 'none'.  See
+      ts_output.
     atol: Absolute tolerance of the integrator
     rtol: Relative tolerance of the integrator
     quadrupole: Include the quadrupole term of the Hamiltonian
     octupole: Include the octupole term of the Hamiltonian
     hexadecapole: Include the hexadecapole term of the Hamiltonian
     gr: Include post-Newtonian terms in the equations of motion
-    integration_algo: The integration algorithm.  See scipy.ode
-      documentation
+    integration_algo: The integration algorithm.  See ts_solvers.
+    stiff: Use the stiff (BDF) method of VODE rather than the Adams method
+    jacobian: Supply the analytic Jacobian of the EOMs to the integrator.
+      The Jacobian is only used by the implicit methods.  See ts_solvers.
     print_properties: Print the properties of the triple in JSON format
     properties_outfilename: Filename to which properties will be written.
       If None and print_properties is True, print to stderr.
+    outtimes: Print output only at these times in years.  If set, the
+      solver integrates without interruption between output times and the
+      output is interpolated by the solver.  The final state at tstop is
+      always printed.  outfreq is ignored.
+    stats: Count and time the parts of the integration.  See ts_stats.
+    stats_outfilename: Write the stats in JSON format to this file at the
+      end of the integration ('stderr' for stderr).
+    checkpoint_filename: Write a checkpoint to this file every
+      checkpoint_interval seconds and at the end of the integration.  See
+      ts_checkpoint.
+    checkpoint_interval: The wall time between checkpoints in seconds
+    stop_conditions: Stop the integration early when any of these
+      conditions is met, and record its name in stop_reason.  A list of
+      ts_stopping.Conditions or their names, e.g., ['gr_quenched',
+      'merger_time=1e8'].  See ts_stopping.
+    variables: The state variables of the solver.  'elements' integrates
+      (a1, e1, g1, e2, g2, H) directly.  'nonsingular' replaces e1 and g1
+      with (l1 cos g1, l1 sin g1), where l1 = artanh(e1).  These have no
+      singularity at e1 = 0, where g1 is undefined, and the tolerance on
+      l1 is a tolerance on log(1 - e1) as e1 approaches 1, which keeps the
+      steps at the peaks of highly eccentric KL cycles accurate.  The
+      output is the same in either case.  (The octupole EOMs still depend
+      on g1 as e1 goes to zero, so an orbit that passes within ~1e-6 of
+      e1 = 0 takes very small steps there.)
+    decimate: Write only the rows at which e1 or the inclination is
+      largest or smallest in each interval of this many years, as well as
+      the first and last rows.  See ts_output.DecimatedOutput.
+    reducers: Summary statistics to accumulate during the integration,
+      e.g., ['e1_max', 'nflips'] or ['default'].  A list of
+      ts_summary.Reducers or their names.  Their values are the summary of
+      the triple after integrate.  See ts_summary.
   '''
 
+  # The columns of the output.  See ts_printout.
+  columns = ['t', 'a1', 'e1', 'g1', 'e2', 'g2', 'inc']
+
+  # The columns whose extrema are kept when the output is decimated: e1 and
+  # inc.  See ts_output.DecimatedOutput.
+  decimation_keys = [itemgetter(2), itemgetter(6)]
+
   def __init__(self, a1=1, a2=20, e1=.1, e2=.3, inc=80, argperi1=0, 
     argperi2=0, m1=1., m2=1., m3=1., r1=0, r2=0, epsoct=None, tstop=1e3,
     cputstop=300, outfreq=1, outfilename=None, atol=1e-9, rtol=1e-9,
     quadrupole=True, octupole=True, hexadecapole=False, gr=False,
     integration_algo='vode', print_properties=False,
-    properties_outfilename=None):
+    properties_outfilename=None, outtimes=None, stiff=False,
+    jacobian=True, outformat='text', stats=False, stats_outfilename=None,
+    checkpoint_filename=None, checkpoint_interval=600,
+    stop_conditions=None, variables='elements', decimate=None,
+    reducers=None):
+
+    # The parameters, to be saved in checkpoints
+    self._params = ts_checkpoint.parameters(locals())
 
     self.a1 = float(a1)
     self.a2 = float(a2)
@@ -80,9 +144,12 @@ class Triple:
     self.m3 = float(m3)
     self.r1 = float(r1)
     self.r2 = float(r2)
+    # The periapsis in AU below which the inner binary collides
+    self._rp_min = (self.r1 + self.r2) * R_sun / au
     self.tstop = tstop
     self.cputstop = cputstop
     self.outfreq = outfreq
+    self.outtimes = outtimes
     self.print_properties = print_properties
     self.properties_outfilename = properties_outfilename
 
@@ -99,11 +166,7 @@ class Triple:
     self.t = 0
     self._t = 0
     self.th = np.cos(self.inc)
-    self._m1 = self.m1 * M_sun
-    self._m2 = self.m2 * M_sun
-    self._m3 = self.m3 * M_sun
     self._a1 = self.a1 * au
-    self._a2 = self.a2 * au
 
     self.quadrupole = quadrupole
     self.octupole = octupole
@@ -111,6 +174,7 @@ class Triple:
     self.gr = gr
     if self.e2 == 0:
       self.octupole = False
+    self._set_constants()
 
     self.calc_C()
     self.calc_G1()
@@ -120,28 +184,100 @@ class Triple:
     self.update()
 
     self.outfilename = outfilename
-    if self.outfilename is not None:
-      self.outfile = open(self.outfilename, 'w')
+    self.outformat = outformat
+    self.decimate = decimate
+    self.outfile = ts_output.open_output(self.outfilename, self.columns,
+      self.outformat)
+    ts_output.decimate(self)
 
     # Integration parameters
     self.nstep = 0
     self.atol = atol
     self.rtol = rtol
     self.collision = False # Has a collision occured?
+    self.stop_conditions = ts_stopping.make_conditions(stop_conditions)
+    self.stop_reason = None # The stopping condition that was met
+    self.reducers = ts_summary.make_reducers(reducers)
+    self.summary = None # The values of the reducers
 
     if self.properties_outfilename is not None:
       self.ts_printjson()
 
     self.integration_algo = integration_algo
-    self._y = [self._a1, self.e1, self.g1, self.e2, self.g2, self._H]
+    self.stiff = stiff
+    self.jacobian = jacobian
+    if variables not in VARIABLES:
+      raise ValueError('Unknown variables %s' % variables)
+    self.variables = variables
+    self._y = self._to_solver((self._a1, self.e1, self.g1, self.e2, self.g2,
+      self._H))
+    self.stats = ts_stats.Stats() if stats else None
+    self.stats_outfilename = stats_outfilename
+    self.checkpoint_filename = checkpoint_filename
+    self.checkpoint_interval = checkpoint_interval
+    self._tcheckpoint = time.time()
+
+    # Set up the integrator.  See ts_solvers.
+    self.solver = ts_solvers.make_solver(self.integration_algo, self._deriv,
+      self._y, self._t, self.tstop * yr2s, atol, rtol, jac=self._jac if
+      self.jacobian else None, stiff=self.stiff, stats=self.stats)
+    ts_stats.instrument(self)
+
+  def _constants_key(self):
+    '''The parameters that the constants of the triple depend on.'''
+    return (self.m1, self.m2, self.m3, self.a2, self.quadrupole,
+      self.octupole, self.hexadecapole, self.gr)
+
+  def _set_constants(self):
+    '''Compute everything that depends only on the masses, the outer
+    semi-major axis, and which terms are turned on.  These are stored in the
+    immutable _constants record, which is rebuilt if any of them change.'''
 
-    # Set up the integrator
-    self.solver = ode(self._deriv)
-    self.solver.set_integrator(self.integration_algo, nsteps=1, atol=atol,
-      rtol=rtol)
-    self.solver.set_initial_value(self._y, self._t)
-    if self.integration_algo == 'vode':
-      self.solver._integrator.iwork[2] = -1 # Don't print FORTRAN errors
+    self._m1 = self.m1 * M_sun
+    self._m2 = self.m2 * M_sun
+    self._m3 = self.m3 * M_sun
+    self._a2 = self.a2 * au
+    m1 = self._m1
+    m2 = self._m2
+    m3 = self._m3
+    a2 = self._a2
+
+    # The EOMs and the Jacobian are evaluated in units of the total mass and
+    # the outer semi-major axis with G = 1.  See make_kernels.py.
+    Mu = m1 + m2 + m3
+    Lu = a2
+    Tu = sqrt(Lu**3 / (G * Mu))
+    Hu = Mu * Lu**2 / Tu
+    params = (m1 / Mu, m2 / Mu, m3 / Mu, 1., c * Tu / Lu)
+    units = np.array([Lu, 1, 1, 1, 1, Hu])
+
+    flags = (bool(self.quadrupole), bool(self.octupole),
+      bool(self.hexadecapole), bool(self.gr))
+    constants, kernel = ts_kernels.DERIVS[flags]
+    jacobians = [(jac, jac_constants(*params)) for flag, (jac_constants,
+      jac) in zip(flags, ts_jacobian.JACOBIANS) if flag]
+
+    if self.quadrupole:
+      C2 = G * m1 * m2 * m3 / (16 * (m1 + m2) * a2**3)
+    else:
+      C2 = 0
+    if self.octupole:
+      C3 = (15 * G * m1 * m2 * m3 * (m1 - m2) / (64 * (m1 + m2)**2 *
+        a2**4))
+    else:
+      C3 = 0
+
+    self._constants = _Constants(key=self._constants_key(), Lu=Lu, Hu=Hu,
+      G1=m1 * m2 * sqrt(G / (m1 + m2)), G2=(m1 + m2) * m3 * sqrt(G * a2 /
+      Mu), C2=C2, C3=C3, kernel=kernel, kernel_constants=constants(*params),
+      deriv_scale=[float(unit / Tu) for unit in units], jacobians=jacobians,
+      jac_scale=np.outer(units, 1 / units) / Tu)
+
+  def _check_constants(self):
+    '''Rebuild the constants if the masses, the outer semi-major axis, or
+    the terms have changed.'''
+    if self._constants_key() != self._constants.key:
+      self._set_constants()
 
   def calc_cosphi(self):
     '''Calculate the angle between periastron directions.  See Eq. 23 of
@@ -152,30 +288,16 @@ class Triple:
 
   def calc_G1(self):
     '''Calculate G1.  See Eq. 6 of Blaes et al. (2002).'''
-    self._G1 = (self._m1 * self._m2 * np.sqrt(G * self._a1 * (1 -
-      self.e1**2) / (self._m1 + self._m2)))
+    self._G1 = self._constants.G1 * np.sqrt(self._a1 * (1 - self.e1**2))
 
   def calc_G2(self):
     '''Calculate G2.  See Eq. 7 of Blaes et al. (2002).'''
-    self._G2 = ((self._m1 + self._m2) * self._m3 * np.sqrt(G * self._a2 * (1
-      - self.e2**2) / (self._m1 + self._m2 + self._m3)))
+    self._G2 = self._constants.G2 * np.sqrt(1 - self.e2**2)
 
   def calc_C(self):
     '''Calculate C2 and C3.  Eqs. 18 & 19 of BLaes et al. (2002)'''
-
-    if self.quadrupole:
-      self.C2 = (G * self._m1 * self._m2 * self._m3 / (16 * (self._m1 +
-        self._m2) * self._a2 * (1 - self.e2**2)**(3./2)) * (self._a1 /
-        self._a2)**2)
-    else:
-      self.C2 = 0
-
-    if self.octupole:
-      self.C3 = (15 * G * self._m1 * self._m2 * self._m3 * (self._m1 -
-        self._m2) / (64 * (self._m1 + self._m2)**2 * self._a2 * (1 -
-        self.e2**2)**(5./2)) * (self._a1 / self._a2)**3)
-    else:
-      self.C3 = 0
+    self.C2 = self._constants.C2 * self._a1**2 / (1 - self.e2**2)**(3./2)
+    self.C3 = self._constants.C3 * self._a1**3 / (1 - self.e2**2)**(5./2)
 
   def calc_th(self):
     '''Calculate the cosine of the inclination.  See Eq. 22 of Blaes et al.
@@ -200,279 +322,281 @@ class Triple:
     self.a1 = self._a1 / au
     self.t = self._t / yr2s
 
-  def _deriv(self, t, y):
-    '''The EOMs.  See Eqs. 11 -- 17 of Blaes et al. (2002).'''
+  def _to_solver(self, elements):
+    '''The state of the solver for the orbital elements (a1, e1, g1, e2, g2,
+    H), in SI units.  See variables.'''
+    if self.variables == 'elements':
+      return list(elements)
+    a1, e1, g1, e2, g2, H = elements
+    l1 = np.arctanh(e1)
+    return [a1, l1 * cos(g1), l1 * sin(g1), e2, g2, H]
+
+  def _l1(self, y):
+    '''artanh(e1) for a state of the solver in nonsingular variables.  This
+    is kept away from zero, where the EOMs for g1 are singular.'''
+    return max(hypot(y[1], y[2]), 1e-100)
+
+  def _elements(self, y):
+    '''The orbital elements (a1, e1, g1, e2, g2, H) of a state of the
+    solver.'''
+    if self.variables == 'elements':
+      return tuple(y)
+    a1, x1, y1, e2, g2, H = y
+    return (a1, tanh(self._l1(y)), atan2(y1, x1), e2, g2, H)
 
-    # Unpack the values
+  def _deriv(self, t, y):
+    '''The EOMs in the variables of the solver.  See _deriv_elements.'''
+    if self.variables == 'elements':
+      return self._deriv_elements(t, y)
+
+    # With l1 = artanh(e1), dl1/dt = de1/dt / (1 - e1^2), and l1 dg1/dt is
+    # finite as e1 goes to zero
+    l1 = self._l1(y)
+    elements = self._elements(y)
+    g1 = elements[2]
+    da1, de1, dg1, de2, dg2, dH = self._deriv_elements(t, elements)
+    dl1 = de1 * cosh(l1)**2
+    return [da1, dl1 * cos(g1) - l1 * sin(g1) * dg1, dl1 * sin(g1) + l1 *
+      cos(g1) * dg1, de2, dg2, dH]
+
+  def _deriv_elements(self, t, y):
+    '''The EOMs.  See Eqs. 11 -- 17 of Blaes et al. (2002).  The EOMs are
+    evaluated by a kernel specialized to the terms that are turned on.  See
+    ts_kernels.'''
+
+    const = self._constants
     a1, e1, g1, e2, g2, H = y
+    der = const.kernel((a1 / const.Lu, e1, g1, e2, g2, H / const.Hu),
+      const.kernel_constants)
+    return [d * scale for d, scale in zip(der, const.deriv_scale)]
+
+  def _jac(self, t, y):
+    '''The Jacobian of the EOMs in the variables of the solver.  See
+    _jac_elements.'''
+    if self.variables == 'elements':
+      return self._jac_elements(t, y)
+
+    # For the change of variables y = phi(x) with dx/dt = f(x), the
+    # Jacobian is (Dphi J + D(Dphi f)) Dphi^-1, where D(Dphi f) only
+    # differentiates Dphi.  Only the rows and columns of e1 and g1 change.
+    l1 = self._l1(y)
+    elements = self._elements(y)
+    e1, g1 = elements[1:3]
+    de1, dg1 = self._deriv_elements(t, elements)[1:3]
+    c, s = cos(g1), sin(g1)
+    dl1 = cosh(l1)**2
+    d2l1 = 2 * e1 * dl1**2
+
+    dphi = np.eye(6)
+    dphi[1:3, 1:3] = [[dl1 * c, -l1 * s], [dl1 * s, l1 * c]]
+    dphi_inv = np.eye(6)
+    dphi_inv[1:3, 1:3] = [[c / dl1, s / dl1], [-s / l1, c / l1]]
+    ddphi = np.zeros((6, 6))
+    ddphi[1:3, 1:3] = [
+      [d2l1 * c * de1 - dl1 * s * dg1, -dl1 * s * de1 - l1 * c * dg1],
+      [d2l1 * s * de1 + dl1 * c * dg1, dl1 * c * de1 - l1 * s * dg1]]
+
+    jac = self._jac_elements(t, elements)
+    return (dphi.dot(jac) + ddphi).dot(dphi_inv)
+
+  def _jac_elements(self, t, y):
+    '''The Jacobian of the EOMs for the orbital elements.  See
+    ts_jacobian.'''
+
+    const = self._constants
+    a1, e1, g1, e2, g2, H = y
+    y = (a1 / const.Lu, e1, g1, e2, g2, H / const.Hu)
 
-    # Calculate trig functions only once
-    sing1 = sin(g1)
-    sing2 = sin(g2)
-    cosg1 = cos(g1)
-    cosg2 = cos(g2)
+    jac = np.zeros((6, 6))
+    for kernel, constants in const.jacobians:
+      jac += kernel(y, constants)
 
-    m1 = self._m1
-    m2 = self._m2
-    m3 = self._m3
-    a2 = self._a2
-  
-    G1 = m1 * m2 * np.sqrt(G * a1 * (1 - e1**2) / (m1 + m2))
-    G2 = (m1 + m2) * m3 * np.sqrt(G * a2 * (1 - e2**2) / (m1 + m2 + m3))
-
-    C2 = (G * m1 * m2 * m3 / (16 * (m1 + m2) * a2 * (1 - e2**2)**(3./2)) * 
-          (a1 / a2)**2)
-    C3 = (15 * G * m1 * m2 * m3 * (m2 - m1) / (64 * (m1 + m2)**2 * a2 *
-          (1 - e2**2)**(5./2)) * (a1 / a2)**3)
-
-    th = (H**2 - G1**2 - G2**2) / (2 * G1 * G2)
-    cosphi = cosg1 * cosg2 - th * sing1 * sing2
-    B = 2 + 5 * e1**2 - 7 * e1**2 * cos(2 * g1)
-    A = 4 + 3 * e1**2 - 5 / 2. * (1 - th**2) * B
-
-    # Eq. 11 of Blaes et al. (2002)
-    da1dt = 0
-    if self.gr:
-      da1dt += -(64 * G**3 * m1 * m2 * (m1 + m2) / (5 * c**5 * a1**3 * 
-        sqrt((1 - e1**2)**7)) * (1 + 73 / 24. * e1**2 + 37 / 96. * e1**4))
-
-    # Eq. 12 of Blaes et al. (2002)
-    dg1dt = 0
-    if self.quadrupole:
-      dg1dt += (6 * C2 * (1 / G1 * (4 * th**2 + (5 * cos(2 * g1) - 1) * (1 -
-        e1**2 - th**2)) + th / G2 * (2 + e1**2 * (3 - 5 * cos(2 * g1)))))
-    if self.octupole:
-      dg1dt += (C3 * e2 * e1 * (1 / G2 + th / G1) * (sing1 * sing2 * 
-        (A + 10 * (3 * th**2 - 1) * (1 - e1**2)) - 5 * th * B * cosphi) - C3
-        * e2 * (1 - e1**2) / (e1 * G1) * (10 * th * (1 - th**2) * (1 - 3 *
-        e1**2) * sing1 * sing2 + cosphi * (3 * A - 10 * th**2 + 2)))
-    if self.gr:
-      dg1dt += ((3 / (c**2 * a1 * (1 - e1**2)) * 
-        sqrt((G * (m1 + m2) / a1)**3)))
-    if self.hexadecapole:
-      dg1dt += (1 / (4096. * a2**5 * sqrt(1 - e1**2) * (m1 + m2)**5) * 45 *
-        a1**3 * sqrt(a1 * G * (m1 + m2)) * (-1 / ((e2**2 - 1)**4 * sqrt(a2 *
-        G * (m1 + m2 + m3))) * (m1**2 - m1 * m2 + m2**2) * (sqrt(1 - e2**2) *
-        m2**2 * m3 * sqrt(a2 * G * (m1 + m2 + m3)) * th + m1**2 * (sqrt( 1 -
-        e1**2) * m2 * sqrt(a1 * G * (m1 + m2)) + sqrt(1 - e2**2) * m3 *
-        sqrt(a2 * G * (m1 + m2 + m3)) * th) + m1 * m2 * (sqrt(1 - e1**2) * m2
-        * sqrt(a1 * G * (m1 + m2)) + sqrt(1 - e1**2) * sqrt(a1 * G * (m1
-        + m2)) * m3 + 2 * sqrt(1 - e2**2) * m3 * sqrt(a2 * G * (m1 + m2 +
-        m3)) * th)) * (96 * th + 480 * e1**2 * th + 180 * e1**4 * th + 144 *
-        e2**2 * th + 720 * e1**2 * e2**2 * th + 270 * e1**4 * e2**2 * th -
-        224 * th**3 - 1120 * e1**2 * th**3 - 420 * e1**4 * th**3 - 336 *
-        e2**2 * th**3 - 1680 * e1**2 * e2**2 * th**3 - 630 * e1**4 * e2**2 *
-        th**3 + 56 * e1**2 * (2 + e1**2) * (2 + 3 * e2**2) * th * (7 * th**2
-        - 4) * cos(2 * g1) - 294 * e1**4 * (2 + 3 * e2**2) * th * (th**2 - 1)
-        * cos(4 * g1) - 147 * e1**4 * e2**2 * cos(4 * g1 - 2 * g2) + 441 *
-        e1**4 * e2**2 * th**2 * cos(4 * g1 - 2 * g2) + 294 * e1**4 * e2**2 *
-        th**3 * cos(4 * g1 - 2 * g2) + 140 * e1**2 * e2**2 * cos(2 * (g1 -
-        g2)) + 70 * e1**4 * e2**2 * cos(2 * (g1 - g2)) + 336 * e1**2 * e2**3
-        * th * cos(2 * (g1 - g2)) + 168 * e1**4 * e2**2 * th * cos(2 * (g1 -
-        g2)) - 588 * e1**2 * e2**2 * th**2 * cos(2 * (g1 - g2)) - 294 * e1**4
-        * e2**2 * th**2 * cos(2 * (g1 - g2)) - 784 * e1**2 * e2**2 * th**3 *
-        cos(2 * (g1 - g2)) - 392 * e1**4 * e2**2 * th**3 * cos(2 * (g1 - g2))
-        - 128 * e2**2 * th * cos(2 * g2) - 640 * e1**2 * e2**2 * th * cos(2 *
-        g2) - 240 * e1**4 * e2**2 * th * cos(2 * g2) + 224 * e2**2 * th**3 *
-        cos(2 * g2) + 1120 * e1**2 * e2**2 * th**3 * cos(2 * g2) + 420 *
-        e1**4 * e2**2 * th**3 * cos(2 * g2) - 140 * e1**2 * e2**2 * cos(2 *
-        (g1 + g2)) - 70 * e1**4 * e2**2 * cos(2 * (g1 + g2)) + 336 * e1**2 *
-        e2**2 * th * cos(2 * (g1 + g2)) + 168 * e1**4 * e2**2 * th * cos(2 *
-        (g1 + g2)) + 588 * e1**2 * e2**2 * th**2 * cos(2 * (g1 + g2)) + 294 *
-        e1**4 * e2**2 * th**2 * cos(2 * (g1 + g2)) - 784 * e1**2 * e2**2 *
-        th**3 * cos(2 * (g1 + g2)) - 392 * e1**4 * e2**2 * th**3 * cos(2 *
-        (g1 + g2)) + 147 * e1**4 * e2**2 * cos(2 * (2 * g1 + g2)) - 441 *
-        e1**4 * e2**2 * th**2 * cos(2 * (2 * g1 + g2)) + 294 * e1**4 * e2**2
-        * th**3 * cos(2 * (2 * g1 + g2))) + 1 / (e1 * sqrt((1 - e2**2)**7)) *
-        2 * (1 - e1**2) * (m1 + m2) * (m1**3 + m2**3) * m3 * (e1 * (4 + 3 *
-        e1**2) * (2 + 3 * e2**2) * (3 - 30 * th**2 + 35 * th**4) - 28 * (e1
-        + e1**3) * (2 + 3 * e2**2) * (1 - 8 * th**2 + 7 * th**4) * cos(2 *
-        g1) + 147 * e1**3 * (2 + 3 * e2**2) * (th**2 - 1)**2 * cos(4 * g1) -
-        10 * e1 * (4 + 3 * e1**2) * e2**2 * (1 - 8 * th**2 + 7 * th**4) *
-        cos(2 * g2) + 28 * (e1 + e1**3) * e2**2 * ((1 + th)**2 * (1 - 7 * th
-        + 7 * th**2) * cos(2 * (g1 - g2)) + (th - 1)**2 * (1 + 7 * th + 7 *
-        th**2) * cos(2 * (g1 + g2))) - 147 * e1**3 * e2**2 * (th**2 - 1) *
-        ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (th - 1)**2 * cos(2 * (2 * g1 +
-        g2))))))
-
-    # Eq. 13 of Blaes et al. (2002)
-    de1dt = 0
-    if self.quadrupole:
-      de1dt += (30 * C2 * e1 * (1 - e1**2) / G1 * (1 - th**2) * sin(2 * g1))
-    if self.octupole:
-      de1dt += (-C3 * e2 * (1 - e1**2) / G1 * (35 * cosphi * (1 - th**2) * 
-        e1**2 * sin(2 * g1) - 10 * th * (1 - e1**2) * (1 - th**2) * 
-        cosg1 * sing2 - A * (sing1 * cosg2 - th * cosg1 * sing2)))
-    if self.gr:
-      de1dt += (-304 * G**3 * m1 * m2 * (m1 + m2) * e1 / (15 * c**4 * a1**4 * 
-        sqrt((1 - e1**2)**5)) * (1 + 121 / 304. * e1**2))
-    if self.hexadecapole:
-      de1dt += (-(315 * a1**3 * e1 * sqrt(1 - e1**2) * sqrt(a1 * G * (m1 +
-      m2)) * (m1**2 - m1 * m2 + m2**2) * m3 * (2 * (2 + e1**2) * (2 + 3 *
-      e2**2) * (1 - 8 * th**2 + 7 * th**4) * sin(2 * g1) - 21 * e1**2 * (2 +
-      3 * e2**2) * (th**2 - 1)**2 * sin(4 * g1) + e2**2 * (21 * e1**2 * (th -
-      1) * (1 + th)**3 * sin(4 * g1 - 2 * g2) - 2 * (2 + e1**2) * (1 + th)**2
-      * (1 - 7 * th + 7 * th**2) * sin(2 * (g1 - g2)) - (th - 1)**2 * (2 * (2
-      + e1**2) * (1 + 7 * th + 7 * th**2) * sin(2 * (g1 + g2)) - 21 * e1**2 *
-      (th**2 - 1) * sin(2 * (2 * g1 + g2)))))) / (2048 * a2**5 * sqrt((1 -
-      e2**2)**7) * (m1 + m2)**3))
-
-    dg2dt = 0
-    if self.quadrupole:
-      dg2dt += (3 * C2 * (2 * th / G1 * (2 + e1**2 * (3 - 5 * cos(2 * g1))) + 1
-        / G2 * (4 + 6 * e1**2 + (5 * th**2 - 3) * (2 + 3 * e1**2 - 5 * e1**2 *
-        cos(2 * g1))))) 
-    if self.octupole:
-      dg2dt += (-C3 * e1 * sing1 * sing2 * ((4 * e2**2 + 1) / (e2 * G2) * 10 * 
-        th * (1 - th**2) * (1 - e1**2) - e2 * (1 / G1 + th / G2) * (A + 10 * 
-        (3 * th**2 - 1) * (1 - e1**2))) - C3 * e1 * cosphi * (5 * B * th * 
-        e2 * (1 / G1 + th / G2) + (4 * e2**2 + 1) / (e2 * G2) * A))
-    if self.hexadecapole:
-      dg2dt += ((9 * a1**3 * (-1 / sqrt(1 - e1**2) * 10 * a2 * sqrt(a1 * G *
-      (m1 + m2)) * (m1**2 - m1 * m2 + m2**2) * (sqrt(1 - e2**2) * m2**2 * m3
-      * sqrt(a2 * G * (m1 + m2 + m3)) + m1**2 * (sqrt(1 - e2**2) * m3 *
-      sqrt(a2 * G * (m1 + m2 + m3)) + sqrt(1 - e1**2) * m2 * sqrt(a1 * G *
-      (m1 + m2)) * th) + m1 * m2 * (2 * sqrt(1 - e2**2) * m3 * sqrt(a2 * G *
-      (m1 + m2 + m3)) + sqrt(1 - e1**2) * m2 * sqrt(a1 * G * (m1 + m2)) * th
-      + sqrt(1 - e1**2) * sqrt(a1 * G * (m1 + m2)) * m3 * th)) * (96 * th +
-      480 * e1**2 * th + 180 * e1**4 * th + 144 * e2**2 * th + 720 * e1**2 *
-      e2**2 * th + 270 * e1**4 * e2**2 * th - 224 * th**3 - 1120 * e1**2 *
-      th**3 - 420 * e1**4 * th**3 - 336 * e2**2 * th**3 - 1680 * e1**2 *
-      e2**2 * th**3 - 630 * e1**4 * e2**2 * th**3 + 56 * e1**2 * (2 + e1**2)
-      * (2 + 3 * e2**2) * th * (7 * th**2 - 4) * cos(2 * g1) - 294 * e1**4 *
-      (2 + 3 * e2**2) * th * (th**2 - 1) * cos(4 * g1) - 147 * e1**4 *
-      e2**2 * cos(4 * g1 - 2 * g2) + 441 * e1**4 * e2**2 * th**2 *
-      cos(4 * g1 - 2 * g2) + 294 * e1**4 * e2**2 * th**3 * cos(4 * g1 - 2 *
-      g2) + 140 * e1**2 * e2**2 * cos(2 * (g1 - g2)) + 70 * e1**4 * e2**2 *
-      cos(2 * (g1 - g2)) + 336 * e1**2 * e2**2 * th * cos(2 * (g1 - g2)) +
-      168 * e1**4 * e2**2 * th * cos(2 * (g1 - g2)) - 588 * e1**2 * e2**2 *
-      th**2 * cos(2 * (g1 - g2)) - 294 * e1**4 * e2**2 * th**2 * cos(2 * (g1
-      - g2)) - 784 * e1**2 * e2**2 * th**3 * cos(2 * (g1 - g2)) - 392 * e1**4
-      * e2**2 * th**3 * cos(2 * (g1 - g2)) - 128 * e2**2 * th * cos(2 * g2) -
-      640 * e1**2 * e2**2 * th * cos(2 * g2) - 240 * e1**4 * e2**2 * th *
-      cos(2 * g2) + 224 * e2**2 * th**3 * cos(2 * g2) + 1120 * e1**2 * e2**2
-      * th**3 * cos(2 * g2) + 420 * e1**4 * e2**2 * th**3 * cos(2 * g2) - 140
-      * e1**2 * e2**2 * cos(2 * (g1 + g2)) - 70 * e1**4 * e2**2 * cos(2 * (g1
-      + g2)) + 336 * e1**2 * e2**2 * th * cos(2 * (g1 + g2)) + 168 * e1**4 *
-      e2**2 * th * cos(2 * (g1 + g2)) + 588 * e1**2 * e2**2 * th**2 * cos(2
-      * (g1 + g2)) + 294 * e1**4 * e2**2 * th**2 * cos(2 * (g1 + g2)) - 784 *
-      e1**2 * e2**2 * th**3 * cos(2 * (g1 + g2)) - 392 * e1**4 * e2**2 *
-      th**3 * cos(2 * (g1 + g2)) + 147 * e1**4 * e2**2 * cos(2 * (2 * g1 +
-      g2)) - 441 * e1**4 * e2**2 * th**2 * cos(2 * (2 * g1 + g2)) + 294 *
-      e1**4 * e2**2 * th**3 * cos(2 * (2 * g1 + g2))) + a1 * a2 * G * m1 * m2
-      * (m1**3 + m2**3) * (m1 + m2 + m3) * (-6 * (8 + 40 * e1**2 + 15 *
-      e1**4) * (-1 + e2**2) * (3 - 30 * th**2 + 35 * th**4) + 7 * (8 + 40 *
-      e1**2 + 15 * e1**4) * (2 + 3 * e2**2) * (3 - 30 * th**2 + 35 * th**4)
-      + 840 * e1**2 * (2 + e1**2) * (-1 + e2**2) * (1 - 8 * th**2 + 7 *
-      th**4) * cos(2 * g1) - 980 * e1**2 * (2 + e1**2) * (2 + 3 * e2**2) * (1
-      - 8 * th**2 + 7 * th**4) * cos(2 * g1) - 4410 * e1**4 * (-1 + e2**2) *
-      (-1 + th**2)**2 * cos(4 * g1) + 5145 * e1**4 * (2 + 3 * e2**2) * (-1 +
-      th**2)**2 * cos(4 * g1) - 70 * (8 + 40 * e1**2 + 15 * e1**4) * e2**2 *
-      (1 - 8 * th**2 + 7 * th**4) * cos(2 * g2) + 20 * (8 + 40 * e1**2 + 15 *
-      e1**4) * (-1 + e2**2) * (1 - 8 * th**2 + 7 * th**4) * cos(2 * g2) + 980
-      * e1**2 * (2 + e1**2) * e2**2 * ((1 + th)**2 * (1 - 7 * th + 7 * th**2)
-      * cos(2 * (g1 - g2)) + (-1 + th)**2 * (1 + 7 * th + 7 * th**2) * cos(2
-      * (g1 + g2))) - 280 * e1**2 * (2 + e1**2) * (-1 + e2**2) * ((1 + th)**2
-      * (1 - 7 * th + 7 * th**2)  * cos(2 * (g1 - g2)) + (-1 + th)**2 * (1 +
-      7 * th + 7 * th**2) * cos(2 * (g1 + g2))) - 1470 * e1**4 * (1 - e2**2)
-      * (-1 + th) * (1 + th) * ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (-1 +
-      th)**2 * cos(2 * (2 * g1 + g2))) - 5145 * e1**4 * e2**2 * (-1 + th**2)
-      * ((1 + th)**2 * cos(4 * g1 - 2 * g2) + (-1 + th)**2 * cos(2 * (2 * g1
-      + g2)))))) / (8192 * a2**6 * (-1 + e2**2)**4 * (m1 + m2)**5 * sqrt(a2 *
-      G * (m1 + m2 + m3))))
-
-    # Eq. 16 of Blaes et al. (2002)
-    de2dt = 0
-    if self.octupole:
-      de2dt += (C3 * e1 * (1 - e2**2) / G2 * (10 * th * (1 - th**2) * (1 -
-      e1**2) * sing1 * cosg2 + A * (cosg1 * sing2 - th * sing1 * cosg2)))
-    if self.hexadecapole:
-      de2dt += ((45 * a1**4 * e2 * m1 * m2 * (m1**2 - m1 * m2 + m2**2) *
-        sqrt(a2 * G * (m1 + m2 + m3)) * (-147 * e1**4 * (-1 + th) * (1 +
-        th)**3 * sin(4 * g1 - 2 * g2) + 28 * e1**2 * (2 + e1**2) * (1 +
-        th)**2 * (1 - 7 * th + 7 * th**2) * sin(2 * (g1 - g2)) + (-1 + th) *
-        (2 * (8 + 40 * e1**2 + 15 * e1**4) * (-1 - th + 7 * th**2 + 7 *
-        th**3) * sin(2 * g2) - 7 * e1**2 * (-1 + th) * (4 * (2 + e1**2) * (1
-        + 7 * th + 7 * th**2) * sin(2 * (g1 + g2)) - 21 * e1**2 * (-1 + th**2)
-        * sin(2 * (2 * g1 + g2))))) / (4096 * a2**6 * (-1 + e2**2)**3 * (m1 +
-        m2)**4)))
-
-    # Eq. 17 of Blaes et al. (2002)
-    dHdt = 0
-    if self.gr:
-      dHdt += (-32 * G**3 * m1**2 * m2**2 / (5 * c**5 * a1**3 * 
-        (1 - e1**2)**2) * sqrt(G * (m1 + m2) / a1) * (1 + 7 / 8. * e1**2) * 
-        (G1 + G2 * th) / H)
-
-    der = [da1dt, de1dt, dg1dt, de2dt, dg2dt, dHdt]
-    return der
+    return jac * const.jac_scale
 
   def _step(self):
-    self.solver.integrate(self.tstop, step=True)
+    self._check_constants()
+    self.solver.step()
     self.nstep += 1
-    self._t = self.solver.t
-    self.a1, self.e1, self.g1, self.e2, self.g2, self._H = self.solver.y
+    self._read_solver()
+
+  def _read_solver(self):
+    '''Set the state of the triple from the solver.'''
+    self._set_state(self.solver.t, self.solver.y)
+
+  def _set_state(self, t, y):
+    '''Set the state of the triple from a time and state in the units of
+    the solver.'''
+    self._t = t
+    self._a1, self.e1, self.g1, self.e2, self.g2, self._H = self._elements(y)
     self.g1 %= (2 * np.pi)
     self.g2 %= (2 * np.pi)
     self.update()
 
+  def _cosi(self, y):
+    '''Calculate cos i from a state of the solver.  See calc_th.'''
+    const = self._constants
+    a1, e1, g1, e2, g2, H = self._elements(y)
+    G1 = const.G1 * np.sqrt(a1 * (1 - e1**2))
+    G2 = const.G2 * np.sqrt(1 - e2**2)
+    return (H**2 - G1**2 - G2**2) / (2 * G1 * G2)
+
+  def ecc_event(self, direction=0):
+    '''An event at the extrema of the inner eccentricity: maxima if
+    direction is -1, minima if it is 1, and both if it is 0.  See
+    ts_events.'''
+    return ts_events.Event(lambda t, y: self._deriv_elements(t,
+      self._elements(y))[1], direction)
+
+  def flip_event(self):
+    '''An event whenever the inner orbit flips between prograde and
+    retrograde.'''
+    return ts_events.Event(lambda t, y: self._cosi(y))
+
+  def collision_event(self):
+    '''A terminal event when the periapsis of the inner binary falls below
+    the sum of the radii.'''
+    def periapsis(t, y):
+      a1, e1 = self._elements(y)[:2]
+      return a1 / au * (1 - e1) - self._rp_min
+    return ts_events.Event(periapsis, direction=-1, terminal=True)
+
+  def _collided(self):
+    '''Return whether the periapsis of the inner binary is below the sum of
+    the radii.  This is the criterion of collision_event.'''
+    return self.a1 * (1 - self.e1) < self._rp_min
+
+  def checkpoint(self, filename=None):
+    '''Write a checkpoint of the integration to filename, or to
+    checkpoint_filename if filename is None.  See ts_checkpoint.'''
+    ts_checkpoint.save(self, filename or self.checkpoint_filename)
+
+  @classmethod
+  def resume(cls, filename, **kwargs):
+    '''Continue an integration from a checkpoint.  Parameters given as
+    keyword arguments (e.g., tstop) override those of the checkpoint.  See
+    ts_checkpoint.load.'''
+    return ts_checkpoint.load(cls, filename, **kwargs)
+
+  def _advance(self, tout):
+    '''Integrate without interruption to tout (in seconds).  Return False
+    if the CPU time limit or an integration failure stopped the solver
+    first.'''
+    self._check_constants()
+    while self.solver.t < tout:
+      if time.time() - self.tstart > self.cputstop:
+        return False
+      if not self.solver.advance(tout):
+        return False
+    return True
+
+  def _integrate_dense(self):
+    '''Integrate the triple, printing out only at the times in outtimes.'''
+    self.tstart = time.time()
+    if self.nstep == 0:
+      ts_summary.update(self)
+    # A resumed integration continues after the last output time
+    outtimes = sorted(t for t in self.outtimes if t < self.tstop and (t >
+      self.t or self.nstep == 0))
+    # A triple that starts (or resumes) collided is not integrated
+    self.collision = self._collided()
+    for tout in outtimes + [self.tstop]:
+      if self.collision:
+        break
+      finished = self._advance(tout * yr2s)
+      self.nstep = self.solver.nsteps
+      self._read_solver()
+      self.ts_printout()
+      ts_summary.update(self)
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
+
+      if self._collided():
+        self.collision = True
+        break
+      self.stop_reason = ts_stopping.check(self)
+      if not finished or self.stop_reason is not None:
+        break
+
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
+    self.outfile.close()
+    self.summary = ts_summary.summarize(self)
+
+  @ts_stats.measured
   def integrate(self):
     '''Integrate the triple in time.'''
-    self.ts_printout()
+    if self.outtimes is not None:
+      self._integrate_dense()
+      return
+
+    # A resumed integration has already printed its state
+    if self.nstep == 0:
+      self.ts_printout()
+      ts_summary.update(self)
+    events = [self.collision_event()]
+    if ts_summary.counts_flips(self):
+      events.append(self.flip_event())
+    finder = ts_events.EventFinder(self, events)
+    # collision_event only finds the periapsis falling below the sum of the
+    # radii, so a triple that starts (or resumes) below it is checked here
+    self.collision = self._collided()
     self.tstart = time.time()
-    while ((self.t < self.tstop) and 
+    while (not self.collision and (self.t < self.tstop) and 
       ((time.time() - self.tstart) < self.cputstop)):
 
-      self._step()
+      for event, t, y in finder.step():
+        if event.terminal:
+          # Stop at the moment of the collision
+          self._set_state(t, y)
+          self.collision = True
+        else:
+          ts_summary.flip(self, t / yr2s)
+      ts_summary.update(self)
+      if self.collision:
+        break
+      self.stop_reason = ts_stopping.check(self)
+      if self.stop_reason is not None:
+        break
+
       if self.nstep % self.outfreq == 0:
         self.ts_printout()
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
 
-      if self.a1 * (1 - self.e1) < self.r1 + self.r2:
-        self.collision = True
-        break
-
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
     self.ts_printout()
-    if self.outfilename is not None:
-      self.outfile.close()
+    self.outfile.close()
+    self.summary = ts_summary.summarize(self)
 
+  @ts_stats.measured
   def ecc_extrema(self):
     '''Integrate the triple, but only print out on eccentricity extrema.'''
-    t_prev = 0
-    e_prev = 0
-    e_prev2 = 0
+    self.outfile.close()
+    self.outfile = ts_output.open_output(self.outfilename, ['t', 'e1'],
+      self.outformat)
+    ts_stats.instrument_output(self)
+    finder = ts_events.EventFinder(self, [self.ecc_event(-1)])
     self.tstart = time.time()
     while (self.t < self.tstop and 
       time.time() - self.tstart < self.cputstop):
-      self._step()
-      if e_prev2 < e_prev > self.e1:
-        outstring = ' '.join(map(str, [t_prev, e_prev]))
-        if self.outfilename is None:
-          print outstring
-        else:
-          self.outfile.write(outstring + '\n')
-      t_prev = self.t
-      e_prev2 = e_prev
-      e_prev = self.e1
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        self.outfile.write([self.t, self.e1])
+    self.outfile.close()
 
+  @ts_stats.measured
   def printflips(self):
     '''Integrate the triple, but print out only when there is a flip.'''
-    t_prev = 0
-    e_prev = 0
-    e_prev2 = 0
-    sign_prev = np.sign(self.th)
+    self.outfile.close()
+    self.outfile = ts_output.open_output(self.outfilename, ['t', 'e1'],
+      self.outformat)
+    ts_stats.instrument_output(self)
+    finder = ts_events.EventFinder(self, [self.flip_event()])
     while self.t < self.tstop:
-      self._step()
-      if e_prev2 < e_prev > self.e1:
-        if np.sign(self.th) != sign_prev:
-          outstring = ' '.join(map(str, [t_prev, e_prev]))
-          if self.outfilename is None:
-            print outstring
-          else:
-            self.outfile.write(outstring + '\n')
-        sign_prev = np.sign(self.th)
-      t_prev = self.t
-      e_prev2 = e_prev
-      e_prev = e
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        self.outfile.write([self.t, self.e1])
     self.outfile.close()
 
   def ts_printout(self):
@@ -482,18 +606,16 @@ class Triple:
       
     '''
 
-    outstring = ' '.join(map(str, [self.t, self.a1, self.e1, 
-      self.g1, self.e2, self.g2, self.inc]))
-
-    if self.outfilename is None:
-      print outstring
-    else:
-      self.outfile.write(outstring + '\n')
+    self.outfile.write([self.t, self.a1, self.e1, self.g1, self.e2, self.g2,
+      self.inc])
 
   def ts_printjson(self):
     '''Print out the initial values in JSON format.'''
+    import json
 
-    json_data = self.__dict__
+    json_data = dict((key, val) for key, val in self.__dict__.items() if key
+      not in ['_constants', 'outfile', '_params', 'stop_conditions',
+      'reducers'])
     outstring = json.dumps(json_data, sort_keys=True, indent=2)
     if self.properties_outfilename == 'stderr':
       print >> sys.stderr, outstring
@@ -508,90 +630,172 @@ def process_command_line(argv):
     argv = sys.argv[1:]
 
   # Configure the command line options
+  import argparse
   parser = argparse.ArgumentParser()
 
-  def_trip = Triple()
+  defaults = ts_checkpoint.defaults(Triple)
   parser.add_argument('-m', '--m1', dest='m1', type=float, 
-    default=def_trip.m1, help = 
-    'Mass of star 1 in inner binary in solar masses [%g]' % def_trip.m1,
+    default=defaults['m1'], help = 
+    'Mass of star 1 in inner binary in solar masses [%g]' % defaults['m1'],
     metavar='\b')
   parser.add_argument('-n', '--m2', dest='m2', type=float, 
-    default=def_trip.m2, help = 
-    'Mass of star 2 in inner binary in solar masses [%g]' % def_trip.m2,
+    default=defaults['m2'], help = 
+    'Mass of star 2 in inner binary in solar masses [%g]' % defaults['m2'],
     metavar='\b')
   parser.add_argument('-o', '--m3', dest='m3', type=float, 
-    default=def_trip.m3, help = 
-    'Mass of tertiary in solar masses [%g]' % def_trip.m3, metavar='\b')
+    default=defaults['m3'], help = 
+    'Mass of tertiary in solar masses [%g]' % defaults['m3'], metavar='\b')
   parser.add_argument('-r', '--r1', dest='r1', type=float, 
-    default=def_trip.r1, help = 
-    'Radius of star 1 of the inner binary in R_Sun [%g]' % def_trip.r1,
+    default=defaults['r1'], help = 
+    'Radius of star 1 of the inner binary in R_Sun [%g]' % defaults['r1'],
     metavar='\b')
   parser.add_argument('-s', '--r2', dest='r2', type=float, 
-    default=def_trip.r2, help = 
-    'Radius of star 2 of the inner binary in R_Sun [%g]' % def_trip.r2,
+    default=defaults['r2'], help = 
+    'Radius of star 2 of the inner binary in R_Sun [%g]' % defaults['r2'],
     metavar='\b')
   parser.add_argument('-a', '--a1', dest='a1', type=float, 
-    default=def_trip.a1, help = 
-    'Inner semi-major axis in au [%g]' % def_trip.a1, metavar='\b')
+    default=defaults['a1'], help = 
+    'Inner semi-major axis in au [%g]' % defaults['a1'], metavar='\b')
   parser.add_argument('-b', '--a2', dest='a2', type=float, 
-    default=def_trip.a2, help = 
-    'Outer semi-major axis in au [%g]' % def_trip.a2, metavar='\b')
+    default=defaults['a2'], help = 
+    'Outer semi-major axis in au [%g]' % defaults['a2'], metavar='\b')
   parser.add_argument('-g', '--g1', dest='g1', type=float, 
-    default=def_trip.g1, help = 
-    'Inner argument of periapsis in degrees [%g]' % def_trip.g1,
+    default=defaults['argperi1'], help = 
+    'Inner argument of periapsis in degrees [%g]' % defaults['argperi1'],
     metavar='\b')
   parser.add_argument('-G', '--g2', dest='g2', type=float, 
-    default=def_trip.g2, help = 
-    'Outer argument of periapsis in degrees [%g]' % def_trip.g2,
+    default=defaults['argperi2'], help = 
+    'Outer argument of periapsis in degrees [%g]' % defaults['argperi2'],
     metavar='\b')
   parser.add_argument('-e', '--e1', dest='e1', type=float, 
-    default=def_trip.e1, help = 
-    'Inner eccentricity [%g]' % def_trip.e1, metavar='\b')
+    default=defaults['e1'], help = 
+    'Inner eccentricity [%g]' % defaults['e1'], metavar='\b')
   parser.add_argument('-f', '--e2', dest='e2', type=float, 
-    default=def_trip.e2, help = 
-    'Outer eccentricity [%g]' % def_trip.e2, metavar='\b')
+    default=defaults['e2'], help = 
+    'Outer eccentricity [%g]' % defaults['e2'], metavar='\b')
   parser.add_argument('-i', '--inc', dest='inc', type=float,
-    default=def_trip.inc, help = 
-    'Inclination of the third body in degrees [%g]' % def_trip.inc,
+    default=defaults['inc'], help = 
+    'Inclination of the third body in degrees [%g]' % defaults['inc'],
     metavar='\b')
   parser.add_argument('-t', '--tstop', dest='tstop', type=float, 
-    default=def_trip.tstop, help = 'Total time of integration in years [%g]' 
-    % def_trip.tstop, metavar='\b')
+    default=defaults['tstop'], help =
+    'Total time of integration in years [%g]' % defaults['tstop'],
+    metavar='\b')
   parser.add_argument('-C', '--cpu', dest='cputstop', type=float, 
-    default=def_trip.cputstop, help = 
+    default=defaults['cputstop'], help = 
     'cpu time limit in seconds, if -1 then no limit [%g]' %
-    def_trip.cputstop, metavar='\b')
+    defaults['cputstop'], metavar='\b')
   parser.add_argument('-F', '--freq', dest='outfreq', type=int, 
-    default=def_trip.outfreq, help = 'Output frequency [%g]' % 
-    def_trip.outfreq, metavar='\b')
+    default=defaults['outfreq'], help = 'Output frequency [%g]' % 
+    defaults['outfreq'], metavar='\b')
+  parser.add_argument('-N', '--nout', dest='nout', type=int, help = 
+    'Print output at this many evenly spaced times without stopping the '
+    'integrator in between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--dt', dest='dt', type=float, help =
+    'Print output every dt years without stopping the integrator in '
+    'between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--log', dest='nlog', type=int, help =
+    'Print output at this many times spaced evenly in log from 1e-6 tstop '
+    'to tstop (overrides output frequency)', metavar='\b')
+  parser.add_argument('--per-kl', dest='per_kl', type=int, help =
+    'Print output this many times per KL period, estimated by '
+    'kl_period_oom (overrides output frequency)', metavar='\b')
+  parser.add_argument('--decimate', dest='decimate', type=float, help =
+    'Print only the extrema of e1 and inc in each interval of this many '
+    'years', metavar='\b')
   parser.add_argument('-A', '--abstol', dest='atol', type=float, 
-    default=def_trip.atol, help = 'Absolute accuracy [%g]' % 
-    def_trip.atol, metavar='\b')
+    default=defaults['atol'], help = 'Absolute accuracy [%g]' % 
+    defaults['atol'], metavar='\b')
   parser.add_argument('-R', '--reltol', dest='rtol', type=float, 
-    default=def_trip.rtol, help = 'Relative accuracy [%g]' % 
-    def_trip.rtol, metavar='\b')
+    default=defaults['rtol'], help = 'Relative accuracy [%g]' % 
+    defaults['rtol'], metavar='\b')
   parser.add_argument('--noquad', dest='quad', action='store_false',
-    default=def_trip.quadrupole, help = 'Turn off quadrupole terms')
+    default=defaults['quadrupole'], help = 'Turn off quadrupole terms')
   parser.add_argument('--nooct', dest='oct', action='store_false',
-    default=def_trip.octupole, help = 'Turn off octupole terms')
+    default=defaults['octupole'], help = 'Turn off octupole terms')
   parser.add_argument('-c', '--GR', dest='gr', action='store_true', 
-    default = def_trip.gr, help = 'Turn on general relativity terms')
+    default = defaults['gr'], help = 'Turn on general relativity terms')
   parser.add_argument('-x', '--hex', dest='hex', action='store_true',
-    default = def_trip.hexadecapole, help = 'Turn on hexadecapole terms')
+    default = defaults['hexadecapole'], help = 'Turn on hexadecapole terms')
+  parser.add_argument('--algorithm', dest='algo', type=str,
+    default=defaults['integration_algo'], choices=ts_solvers.SOLVERS, help =
+    'Integration algorithm [%s]' % defaults['integration_algo'])
+  parser.add_argument('--stiff', dest='stiff', action='store_true',
+    default=defaults['stiff'], help = 'Use the stiff (BDF) integrator')
+  parser.add_argument('--variables', dest='variables', type=str,
+    default=defaults['variables'], choices=VARIABLES, help =
+    'State variables of the integrator [%s]' % defaults['variables'])
+  parser.add_argument('-O', '--outfile', dest='outfilename', type=str, help =
+    'Write output to this file [stdout]', metavar='\b')
+  parser.add_argument('--format', dest='outformat', type=str,
+    default=defaults['outformat'], choices=ts_output.FORMATS, help =
+    'Format of the output file [%s]' % defaults['outformat'])
+  parser.add_argument('--stats', dest='stats_outfilename', type=str, help =
+    'Write counts and timings of the integration in JSON format to this '
+    'file (stderr for stderr)', metavar='\b')
+  parser.add_argument('--checkpoint', dest='checkpoint_filename', type=str,
+    help = 'Write checkpoints of the integration to this file',
+    metavar='\b')
+  parser.add_argument('--checkpoint-interval', dest='checkpoint_interval',
+    type=float, default=defaults['checkpoint_interval'], help =
+    'Wall time between checkpoints in seconds [%g]' %
+    defaults['checkpoint_interval'], metavar='\b')
+  parser.add_argument('--resume', dest='resume', type=str, help =
+    'Continue the integration from this checkpoint.  Only the time and CPU '
+    'limits and the checkpoint options are taken from the command line.',
+    metavar='\b')
+  parser.add_argument('--stop', dest='stop_conditions', action='append',
+    help = 'Stop early on this condition, e.g., gr_quenched or '
+    'merger_time=1e8 (may be repeated).  See ts_stopping.', metavar='\b')
+  parser.add_argument('--summary', dest='reducers', action='append',
+    help = 'Accumulate this summary statistic, e.g., e1_max or '
+    'time_above=0.99, and print the summary in JSON format to stderr at the '
+    'end (may be repeated; default for all of them).  See ts_summary.',
+    metavar='\b')
 
   arguments = parser.parse_args()
   return arguments
 
 def main(argv=None):
   args = process_command_line(argv)
-  t = Triple(m1=args.m1, m2=args.m2, m3=args.m3, r1=args.r1, r2=args.r2,
-        a1=args.a1, a2=args.a2, argperi1=args.g1, argperi2=args.g2,
-        e1=args.e1, e2=args.e2, inc=args.inc, tstop=args.tstop,
-        cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol,
-        rtol=args.rtol, quadrupole=args.quad, octupole=args.oct,
-        hexadecapole=args.hex, gr=args.gr)
+  outtimes = None
+  if args.nout is not None:
+    outtimes = np.linspace(0, args.tstop, args.nout)
+  elif args.dt is not None:
+    outtimes = ts_output.uniform_times(args.tstop, args.dt)
+  elif args.nlog is not None:
+    outtimes = ts_output.log_times(args.tstop, args.nlog, 1e-6 * args.tstop)
+  elif args.per_kl is not None:
+    import kl_period
+    outtimes = kl_period.kl_times(args, args.per_kl)
+  if args.resume is not None:
+    kwargs = {'tstop': args.tstop, 'cputstop': args.cputstop}
+    if args.checkpoint_filename is not None:
+      kwargs.update(checkpoint_filename=args.checkpoint_filename,
+        checkpoint_interval=args.checkpoint_interval)
+    t = Triple.resume(args.resume, **kwargs)
+  else:
+    t = Triple(m1=args.m1, m2=args.m2, m3=args.m3, r1=args.r1, r2=args.r2,
+          a1=args.a1, a2=args.a2, argperi1=args.g1, argperi2=args.g2,
+          e1=args.e1, e2=args.e2, inc=args.inc, tstop=args.tstop,
+          cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol,
+          rtol=args.rtol, quadrupole=args.quad, octupole=args.oct,
+          hexadecapole=args.hex, gr=args.gr, outtimes=outtimes,
+          integration_algo=args.algo, stiff=args.stiff,
+          outfilename=args.outfilename, outformat=args.outformat,
+          stats=args.stats_outfilename is not None,
+          stats_outfilename=args.stats_outfilename,
+          checkpoint_filename=args.checkpoint_filename,
+          checkpoint_interval=args.checkpoint_interval,
+          stop_conditions=args.stop_conditions, variables=args.variables,
+          decimate=args.decimate, reducers=args.reducers)
 
   t.integrate()
+  if t.stop_reason is not None:
+    print >> sys.stderr, 'Stopped: %s' % t.stop_reason
+  if t.summary is not None:
+    import json
+    print >> sys.stderr, json.dumps(t.summary, sort_keys=True)
   return 0
 
 if __name__=='__main__':
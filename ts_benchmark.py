@@ -0,0 +1,324 @@
+#! /usr/bin/env python
+
+'''
+ts_benchmark
+
+Time a set of canonical integrations so that changes in performance can be
+tracked from commit to commit.  For each scenario the wall time, the number
+of evaluations of the equations of motion (RHS evaluations), the number of
+steps, and the peak memory of the process are recorded.  Every scenario is
+run in its own process, so that the memory of one does not count against
+another.
+
+Results are appended to a file with one JSON record per scenario, tagged
+with the git commit and the time of the run.  Running with --compare prints
+each scenario next to the most recent run of it at a different commit.
+
+    python ts_benchmark.py -o benchmarks.jsonl --compare
+'''
+
+# Ignore DeprecationWarnings if called from command line
+if __name__ == '__main__':
+  import __init__
+
+# System modules
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from collections import OrderedDict
+
+# Triplesec modules
+from ekm import Triple_octupole
+from kl_period import kl_period, numerical_kl_period
+from triplesec import Triple
+from ts_vector import Triple_vector
+
+# The classes whose equations of motion are counted
+_COUNTED = [Triple, Triple_vector, Triple_octupole]
+
+def _integrate(triple):
+  '''Integrate a triple and return the number of steps.'''
+  triple.integrate()
+  return triple.nstep
+
+def _quadrupole(scale):
+  return _integrate(Triple(tstop=3e5 * scale, octupole=False,
+    outfilename=os.devnull))
+
+def _octupole(scale):
+  return _integrate(Triple(tstop=3e5 * scale, outfilename=os.devnull))
+
+def _hexadecapole(scale):
+  return _integrate(Triple(tstop=1.5e5 * scale, hexadecapole=True,
+    outfilename=os.devnull))
+
+def _gr(scale):
+  # A tight, eccentric inner binary of 10 M_sun stars
+  return _integrate(Triple(a1=.05, a2=2, e1=.9, inc=90, m1=10, m2=10, m3=10,
+    tstop=2e3 * scale, gr=True, outfilename=os.devnull))
+
+def _vector_flips(scale):
+  tv = Triple_vector(a1=1, a2=30, e1=.1, e2=.6, inc=85, tstop=1e12,
+    outfilename=os.devnull)
+  tv.flip_period(nflips=max(1, int(5 * scale)))
+  return tv.nstep
+
+def _ekm_period(scale):
+  to = Triple_octupole(e1=.1, inc=85, epsoct=.03, argperi=30)
+  for i in range(max(1, int(10 * scale))):
+    to.period()
+  return 0
+
+def _ekm_numeric_period(scale):
+  to = Triple_octupole(e1=.1, inc=85, epsoct=.03, argperi=30, tstop=1e12)
+  to.numeric_period(n_flips=max(1, int(50 * scale)))
+  return to.nstep
+
+def _kl_period(scale):
+  tv = Triple_vector(a1=1, a2=20, e1=.1, e2=.3, octupole=False)
+  for i in range(max(1, int(10000 * scale))):
+    kl_period(tv)
+  return 0
+
+def _numerical_kl_period(scale):
+  tv = Triple_vector(a1=1, a2=20, e1=.1, e2=.3, octupole=False)
+  numerical_kl_period(tv, nperiods=max(1, int(100 * scale)))
+  return tv.nstep
+
+def _cli(scale):
+  # The whole command line program, writing every step to a file.  The
+  # number of steps is the number of lines less the initial and final
+  # states.
+  outfile, outfilename = tempfile.mkstemp(suffix='.dat')
+  os.close(outfile)
+  try:
+    subprocess.check_call([sys.executable, os.path.join(os.path.dirname(
+      os.path.abspath(__file__)), 'triplesec.py'), '-t', str(1e5 * scale),
+      '-O', outfilename])
+    with open(outfilename) as outfile:
+      return sum(1 for line in outfile) - 2
+  finally:
+    os.remove(outfilename)
+
+# The scenarios, in the order in which they are run.  Each is a function of
+# a scale factor for the length of the run that returns the number of steps.
+SCENARIOS = OrderedDict([
+  ('quadrupole', _quadrupole),
+  ('octupole', _octupole),
+  ('hexadecapole', _hexadecapole),
+  ('gr', _gr),
+  ('vector_flips', _vector_flips),
+  ('ekm_period', _ekm_period),
+  ('ekm_numeric_period', _ekm_numeric_period),
+  ('kl_period', _kl_period),
+  ('numerical_kl_period', _numerical_kl_period),
+  ('cli', _cli)])
+
+def _counting(deriv, counter):
+  '''Wrap the equations of motion so that they count their calls.  The
+  arguments are spelled out since VODE counts them to decide how to call
+  the function.'''
+  def counted(self, t, y, *args):
+    counter[0] += 1
+    return deriv(self, t, y, *args)
+  return counted
+
+def run_scenario(name, scale=1.):
+  '''Run a scenario in this process.
+
+  Parameters:
+    name: The name of the scenario.  See SCENARIOS.
+    scale: Multiply the length of the scenario by this
+
+  Returns:
+    A dictionary of the wall time in seconds, the number of RHS evaluations
+    and steps and their rates per second, and the peak resident memory of
+    the process in MB.  RHS evaluations are not counted for the cli
+    scenario, which runs in another process.
+  '''
+
+  counter = [0]
+  derivs = [cls.__dict__['_deriv'] for cls in _COUNTED]
+  for cls, deriv in zip(_COUNTED, derivs):
+    cls._deriv = _counting(deriv, counter)
+  try:
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore')
+      tstart = time.time()
+      nsteps = SCENARIOS[name](scale)
+      walltime = time.time() - tstart
+  finally:
+    for cls, deriv in zip(_COUNTED, derivs):
+      cls._deriv = deriv
+
+  # ru_maxrss is in kB on Linux and in bytes on Mac OS
+  maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  if name == 'cli':
+    maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+  maxrss /= 1024. if sys.platform != 'darwin' else 1024.**2
+
+  return {
+    'scenario': name,
+    'scale': scale,
+    'time': walltime,
+    'rhs': counter[0],
+    'rhs_per_s': counter[0] / walltime,
+    'steps': nsteps,
+    'steps_per_s': nsteps / walltime,
+    'maxrss_mb': maxrss}
+
+def _run_scenario(queue, name, scale):
+  queue.put(run_scenario(name, scale))
+
+def run_benchmarks(names=None, scale=1.):
+  '''Run each scenario in its own process.
+
+  Parameters:
+    names: The names of the scenarios.  If None, run them all.
+    scale: Multiply the length of every scenario by this
+
+  Returns:
+    A list of the results of run_scenario
+  '''
+
+  if names is None:
+    names = list(SCENARIOS)
+  for name in names:
+    if name not in SCENARIOS:
+      raise ValueError('Unknown scenario %s' % name)
+
+  results = []
+  for name in names:
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_scenario, args=(queue,
+      name, scale))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+      raise RuntimeError('Scenario %s failed with exit code %d' % (name,
+        process.exitcode))
+    results.append(queue.get())
+  return results
+
+# Modules that the library should not import until they are used
+HEAVY_MODULES = ['argparse', 'numba', 'scipy.integrate', 'scipy.optimize']
+
+def import_time(modules, nruns=5):
+  '''Time importing modules in a new process.
+
+  Parameters:
+    modules: A comma separated string of modules, e.g., 'triplesec, ekm'
+    nruns: The number of processes to time
+
+  Returns:
+    The shortest time to import the modules in seconds, and the list of
+    the HEAVY_MODULES that were imported along with them
+  '''
+
+  script = ('import sys, time\n'
+    'tstart = time.time()\n'
+    'import %s\n'
+    'print(time.time() - tstart)\n'
+    'print(\' \'.join(m for m in %r if m in sys.modules))\n' % (modules,
+      HEAVY_MODULES))
+  times = []
+  for i in range(nruns):
+    output = subprocess.check_output([sys.executable, '-c', script],
+      cwd=os.path.dirname(os.path.abspath(__file__))).decode().split('\n')
+    times.append(float(output[0]))
+  return min(times), output[1].split()
+
+def git_commit():
+  '''Return the commit of the working tree, or None if it is not known.'''
+  try:
+    with open(os.devnull, 'w') as devnull:
+      return subprocess.check_output(['git', 'rev-parse', '--short',
+        'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+        stderr=devnull).strip().decode()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+def save_results(results, filename):
+  '''Append results to a file, one JSON record per line, tagged with the
+  git commit, the time, and the machine.'''
+  info = {
+    'commit': git_commit(),
+    'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    'python': platform.python_version(),
+    'machine': platform.node()}
+  with open(filename, 'a') as outfile:
+    for result in results:
+      outfile.write(json.dumps(dict(result, **info), sort_keys=True) + '\n')
+
+def load_results(filename):
+  '''Read all the records from a file of results.'''
+  with open(filename) as infile:
+    return [json.loads(line) for line in infile if line.strip()]
+
+def compare(results, history):
+  '''Return a table of results next to the most recent result of the same
+  scenario and scale at a different commit.'''
+
+  commit = git_commit()
+  lines = ['%-20s %9s %9s %7s %12s %12s %9s' % ('scenario', 'time (s)',
+    'previous', 'ratio', 'rhs/s', 'steps/s', 'mem (MB)')]
+  for result in results:
+    previous = [record for record in history if record['scenario'] ==
+      result['scenario'] and record['scale'] == result['scale'] and
+      record['commit'] != commit]
+    if previous:
+      prevtime = '%9.3f' % previous[-1]['time']
+      ratio = '%7.2f' % (result['time'] / previous[-1]['time'])
+    else:
+      prevtime = '%9s' % '-'
+      ratio = '%7s' % '-'
+    lines.append('%-20s %9.3f %s %s %12.0f %12.0f %9.1f' % (
+      result['scenario'], result['time'], prevtime, ratio,
+      result['rhs_per_s'], result['steps_per_s'], result['maxrss_mb']))
+  return '\n'.join(lines)
+
+def process_command_line(argv):
+  '''Process the command line.'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  # Configure the command line options
+  parser = argparse.ArgumentParser()
+
+  parser.add_argument('scenarios', nargs='*', help =
+    'Scenarios to run [all]: %s' % ', '.join(SCENARIOS))
+  parser.add_argument('-s', '--scale', dest='scale', type=float, default=1.,
+    help = 'Multiply the length of every scenario by this [1]',
+    metavar='\b')
+  parser.add_argument('-o', '--outfile', dest='outfilename', type=str, help =
+    'Append the results to this file', metavar='\b')
+  parser.add_argument('--compare', dest='compare', action='store_true',
+    help = 'Compare to the previous commit in the results file')
+
+  arguments = parser.parse_args(argv)
+  return arguments
+
+def main(argv=None):
+  args = process_command_line(argv)
+  results = run_benchmarks(args.scenarios or None, args.scale)
+
+  history = []
+  if args.outfilename is not None:
+    if os.path.exists(args.outfilename):
+      history = load_results(args.outfilename)
+    save_results(results, args.outfilename)
+  print compare(results, history if args.compare else [])
+  return 0
+
+if __name__=='__main__':
+  status = main()
+  sys.exit(status)
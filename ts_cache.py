@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+
+'''
+ts_cache
+
+A disk cache for tables that are expensive to build but only depend on a
+few parameters, such as interpolation tables of special functions.  Tables
+are stored as NumPy .npz archives in the directory given by the
+TRIPLESEC_CACHE environment variable, or ~/.cache/triplesec if it is not
+set.  If the cache directory cannot be written to, tables are rebuilt every
+time they are first needed.
+'''
+
+# System modules
+import os
+import tempfile
+
+# Numerical modules
+import numpy as np
+
+def cache_dir():
+  '''Return the name of the cache directory.'''
+  return os.environ.get('TRIPLESEC_CACHE', os.path.join(
+    os.path.expanduser('~'), '.cache', 'triplesec'))
+
+def load_table(name, version, build):
+  '''Load a table from the cache, building it if it is not there.
+
+  Parameters:
+    name: The name of the table.  This is used as the filename.
+    version: The version of the table.  A cached table with a different
+      version is rebuilt.  Change this whenever the way the table is built
+      changes.
+    build: A function with no arguments that returns the table as a
+      dictionary of arrays
+
+  Returns:
+    The table as a dictionary of arrays
+  '''
+
+  filename = os.path.join(cache_dir(), name + '.npz')
+  try:
+    with np.load(filename) as data:
+      if data['version'] == version:
+        return dict((key, data[key]) for key in data.files if key !=
+          'version')
+  except (IOError, KeyError, ValueError):
+    pass
+
+  table = build()
+  save_table(filename, dict(table, version=version))
+  return table
+
+def save_table(filename, table):
+  '''Write a table to the cache.  The table is first written to a temporary
+  file that is then renamed, so a table that is being written is never
+  read by another process.'''
+
+  try:
+    dirname = os.path.dirname(filename)
+    if not os.path.isdir(dirname):
+      os.makedirs(dirname)
+    fd, tmpname = tempfile.mkstemp(dir=dirname, suffix='.npz')
+    with os.fdopen(fd, 'wb') as outfile:
+      np.savez(outfile, **table)
+    os.rename(tmpname, filename)
+  except (IOError, OSError):
+    pass
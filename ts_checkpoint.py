@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+
+'''
+ts_checkpoint
+
+Checkpoints of long integrations.  A checkpoint is a JSON file with the
+parameters that the integrator was created with, the number of steps taken,
+the state of the solver including the size of its next step (see
+ts_solvers), and the position in the output file.
+
+An integrator that is created with a checkpoint_filename writes a checkpoint
+every checkpoint_interval seconds and when it stops integrating.  The
+integration is continued with the resume method of the integrator (e.g.,
+Triple.resume), which carries on writing the output file from the position
+in the checkpoint, so that rows written after the checkpoint are not
+repeated.  The solver restarts from the saved state with the saved step
+size, so the resumed integration follows the original closely.  It is
+identical for RK45 and RK23, whose only memory is the size of the step.
+The multistep methods (VODE, LSODA, and BDF) start again from first order,
+so they take a few more steps after resuming.
+
+A checkpoint is written to a temporary file that is then renamed, so a job
+that is killed while writing a checkpoint leaves the previous one intact.
+'''
+
+# System modules
+import json
+import os
+import tempfile
+import time
+
+# Numerical modules
+import numpy as np
+
+# Triplesec modules
+import ts_output
+import ts_stats
+import ts_stopping
+import ts_summary
+
+def parameters(args):
+  '''Return the parameters of an integrator from the locals() of its
+  __init__.  Stopping conditions and reducers are saved by name (see
+  ts_stopping and ts_summary).'''
+  params = {}
+  for key, val in args.items():
+    if key == 'self':
+      continue
+    if isinstance(val, np.ndarray):
+      val = val.tolist()
+    elif key == 'stop_conditions' and val is not None:
+      val = ts_stopping.specs(val)
+    elif key == 'reducers' and val is not None:
+      val = ts_summary.specs(val)
+    params[key] = val
+  return params
+
+def defaults(cls):
+  '''Return the default parameters of an integrator class without creating
+  an integrator.'''
+  init = cls.__init__.__func__
+  names = init.__code__.co_varnames[:init.__code__.co_argcount]
+  return dict(zip(names[-len(init.__defaults__):], init.__defaults__))
+
+def save(triple, filename):
+  '''Write a checkpoint of an integrator.'''
+  data = {
+    'class': triple.__class__.__name__,
+    'params': triple._params,
+    'nstep': triple.nstep,
+    'solver': triple.solver.get_state(),
+    'outposition': triple.outfile.tell()}
+  if getattr(triple, 'stop_conditions', None):
+    data['stopping'] = ts_stopping.get_state(triple)
+  if getattr(triple, 'reducers', None):
+    data['summary'] = ts_summary.get_state(triple)
+
+  dirname = os.path.dirname(os.path.abspath(filename))
+  fd, tmpname = tempfile.mkstemp(dir=dirname, suffix='.json')
+  with os.fdopen(fd, 'w') as outfile:
+    json.dump(data, outfile, sort_keys=True, indent=2)
+  os.rename(tmpname, filename)
+  triple._tcheckpoint = time.time()
+
+def periodic(triple):
+  '''Write a checkpoint to the checkpoint_filename of an integrator if
+  checkpoint_interval seconds have passed since the last one.'''
+  if time.time() - triple._tcheckpoint > triple.checkpoint_interval:
+    save(triple, triple.checkpoint_filename)
+
+def load(cls, filename, **kwargs):
+  '''Create an integrator from a checkpoint.
+
+  Parameters:
+    cls: The class of the integrator, e.g., Triple
+    filename: The name of the checkpoint file
+    kwargs: Parameters of the integrator that override those in the
+      checkpoint, e.g., a later tstop or a new cputstop.  If outfilename is
+      given, the output is written to a new file.
+
+  Returns:
+    The integrator at the state of the checkpoint
+  '''
+
+  with open(filename) as infile:
+    data = json.load(infile)
+  if data['class'] != cls.__name__:
+    raise ValueError('%s is a checkpoint of %s, not %s' % (filename,
+      data['class'], cls.__name__))
+
+  # Create the integrator without output so that the output file is not
+  # started over, and then continue the output file
+  params = dict((str(key), val) for key, val in data['params'].items())
+  params.update(kwargs)
+  triple = cls(**dict(params, outfilename=os.devnull, outformat='text'))
+  triple.outfile.close()
+  triple.outfilename = params['outfilename']
+  triple.outformat = params['outformat']
+  position = None
+  if 'outfilename' not in kwargs and triple.outfilename != os.devnull:
+    position = data['outposition']
+  triple.outfile = ts_output.open_output(triple.outfilename, triple.columns,
+    triple.outformat, position)
+  ts_output.decimate(triple)
+  ts_stats.instrument_output(triple)
+  triple._params = params
+
+  if 'stopping' in data:
+    ts_stopping.set_state(triple, data['stopping'])
+  if 'summary' in data:
+    ts_summary.set_state(triple, data['summary'])
+  triple.solver.set_state(data['solver'])
+  triple.nstep = data['nstep']
+  triple._read_solver()
+  return triple
@@ -11,3 +11,4 @@ c = 299792458. # m / s
 yr2s = 3.15569e7 # s
 au = 149597870700. # m
 M_sun = 1.989e30 # kg
+R_sun = 6.957e8 # m
@@ -0,0 +1,313 @@
+#! /usr/bin/env python
+
+'''
+ts_ensemble
+
+Numerically integrate the dynamics of many hierarchical triples at once.
+The equations of motion of every triple in the ensemble are evaluated
+together as NumPy array operations and each triple is advanced with its own
+adaptive step size.  The equations of motion are the kernels of
+ts_kernels, the same as for Triple, evaluated on arrays.
+'''
+
+# System modules
+import time
+import types
+
+# Numerical modules
+import numpy as np
+from ts_constants import *
+import ts_kernels
+
+class Triple_ensemble:
+  '''Evolve an ensemble of hierarchical triples using the Hamiltonian
+  equations of motion.  These are the same equations of motion as are used
+  by the Triple class, but all triples are integrated simultaneously with an
+  explicit Dormand-Prince 5(4) integrator.  Each triple has its own step
+  size, stopping time, and collision check.
+
+  The orbital parameters may either be arrays (one entry per triple) or
+  scalars, in which case they are shared by all the triples.
+
+  Parameters:
+    a1: Semi-major axis of inner binary in AU
+    a2: Semi-major axis of outer binary in AU
+    e1: Eccentricity of inner binary
+    e2: Eccentricity of outer binary
+    inc: Inclination between inner and outer binaries in degrees
+    argperi1: Argument of periapsis of the inner binary in degrees
+    argperi2: Argument of periapsis of the outer binary in degrees
+    m1: Mass of component 1 of the inner binary in solar masses
+    m2: Mass of component 2 of the inner binary in solar masses
+    m3: Mass of the tertiary in solar masses
+    r1: Radius of component 1 of the inner binary in solar radii
+    r2: Radius of component 2 of the inner binary in solar radii
+    tstop: The time to integrate in years
+    cputstop: The maximum amount of CPU time to integrate the whole
+      ensemble in seconds
+    atol: Absolute tolerance of the integrator
+    rtol: Relative tolerance of the integrator
+    quadrupole: Include the quadrupole term of the Hamiltonian
+    octupole: Include the octupole term of the Hamiltonian
+    hexadecapole: Include the hexadecapole term of the Hamiltonian
+    gr: Include post-Newtonian terms in the equations of motion
+
+  After integration the termination attribute holds the reason each triple
+  stopped: 'tstop', 'collision', 'cputstop', or 'failure' (if the step size
+  underflowed).
+  '''
+
+  def __init__(self, a1=1, a2=20, e1=.1, e2=.3, inc=80, argperi1=0,
+    argperi2=0, m1=1., m2=1., m3=1., r1=0, r2=0, tstop=1e3, cputstop=300,
+    atol=1e-9, rtol=1e-9, quadrupole=True, octupole=True,
+    hexadecapole=False, gr=False):
+
+    a1, a2, e1, e2, inc, argperi1, argperi2, m1, m2, m3, r1, r2, tstop = (
+      np.broadcast_arrays(*[np.atleast_1d(np.asarray(x, dtype=float)) for x
+      in (a1, a2, e1, e2, inc, argperi1, argperi2, m1, m2, m3, r1, r2,
+      tstop)]))
+    self.n = len(a1)
+
+    self.a1 = a1.copy()
+    self.a2 = a2.copy()
+    self.e1 = e1.copy()
+    self.e2 = e2.copy()
+    self.inc = inc.copy()
+    self.g1 = argperi1 * np.pi / 180
+    self.g2 = argperi2 * np.pi / 180
+    self.m1 = m1.copy()
+    self.m2 = m2.copy()
+    self.m3 = m3.copy()
+    self.r1 = r1.copy()
+    self.r2 = r2.copy()
+    self.tstop = tstop.copy()
+    self.cputstop = cputstop
+    self.atol = atol
+    self.rtol = rtol
+
+    self.quadrupole = quadrupole
+    self.octupole = octupole
+    self.hexadecapole = hexadecapole
+    self.gr = gr
+
+    # As in the Triple class, the octupole term is switched off for triples
+    # with a circular outer orbit.
+    self._octupole = np.logical_and(octupole, self.e2 != 0)
+
+    # Unit conversions
+    self.t = np.zeros(self.n)
+    self._t = np.zeros(self.n)
+    self._tstop = self.tstop * yr2s
+    self._m1 = self.m1 * M_sun
+    self._m2 = self.m2 * M_sun
+    self._m3 = self.m3 * M_sun
+    self._a2 = self.a2 * au
+    # The periapsis in AU below which the triples collide, as in Triple
+    self._rp_min = (self.r1 + self.r2) * R_sun / au
+
+    # The kernels work in units of the total mass and the outer semi-major
+    # axis with G = 1, as in Triple._set_constants.  The octupole term
+    # may be on for some triples and off for others, so the constants are
+    # computed for both kernels.
+    Mu = self._m1 + self._m2 + self._m3
+    Lu = self._a2
+    Tu = np.sqrt(Lu**3 / (G * Mu))
+    Hu = Mu * Lu**2 / Tu
+    params = (self._m1 / Mu, self._m2 / Mu, self._m3 / Mu, np.ones(self.n),
+      c * Tu / Lu)
+    self._units = np.array([Lu, np.ones(self.n), np.ones(self.n),
+      np.ones(self.n), np.ones(self.n), Hu])
+    self._deriv_scale = self._units / Tu
+    self._kernels = {}
+    for octupole in set(self._octupole):
+      flags = (bool(quadrupole), bool(octupole), bool(hexadecapole),
+        bool(gr))
+      constants, kernel = _DERIVS[flags]
+      self._kernels[octupole] = (kernel, constants(*params))
+
+    th = np.cos(self.inc * np.pi / 180)
+    _a1 = self.a1 * au
+    G1 = (self._m1 * self._m2 * np.sqrt(G * _a1 * (1 - self.e1**2) /
+      (self._m1 + self._m2)))
+    G2 = ((self._m1 + self._m2) * self._m3 * np.sqrt(G * self._a2 * (1 -
+      self.e2**2) / (self._m1 + self._m2 + self._m3)))
+    _H = np.sqrt(2 * G1 * G2 * th + G1**2 + G2**2)
+
+    # The state of each triple is stored in a column of _y
+    self._y = np.array([_a1, self.e1, self.g1, self.e2, self.g2, _H])
+
+    # Integration parameters
+    self.nstep = np.zeros(self.n, dtype=int)
+    self.nreject = np.zeros(self.n, dtype=int)
+    self.collision = np.zeros(self.n, dtype=bool)
+    self.active = self._tstop > 0
+    self.termination = np.array(['tstop'] * self.n, dtype=object)
+    self._h = None
+
+    self.update()
+
+  def update(self):
+    '''Update the derived parameters of the triples from the state
+    vector.'''
+    _a1, self.e1, g1, self.e2, g2, _H = self._y
+    self.a1 = _a1 / au
+    self.g1 = g1 % (2 * np.pi)
+    self.g2 = g2 % (2 * np.pi)
+
+    G1 = (self._m1 * self._m2 * np.sqrt(G * _a1 * (1 - self.e1**2) /
+      (self._m1 + self._m2)))
+    G2 = ((self._m1 + self._m2) * self._m3 * np.sqrt(G * self._a2 * (1 -
+      self.e2**2) / (self._m1 + self._m2 + self._m3)))
+    self.th = np.clip((_H**2 - G1**2 - G2**2) / (2 * G1 * G2), -1, 1)
+    self.inc = np.arccos(self.th) * 180 / np.pi
+    self.t = self._t / yr2s
+
+  def _deriv(self, y, idx):
+    '''The EOMs of the triples with indices idx.  Each column of y is the
+    state of one triple.  See Triple._deriv_elements.'''
+    y = y / self._units[:, idx]
+    der = np.empty_like(y)
+    for octupole, (kernel, constants) in self._kernels.items():
+      sel = self._octupole[idx] == octupole
+      sub = idx[sel]
+      k = [val[sub] if np.ndim(val) else val for val in constants]
+      der[:, sel] = np.broadcast_arrays(*kernel(y[:, sel], k))
+    return der * self._deriv_scale[:, idx]
+
+  def _error_norm(self, err, y0, y1):
+    '''The RMS error of each triple, weighted by the tolerances.'''
+    scale = self.atol + self.rtol * np.maximum(np.fabs(y0), np.fabs(y1))
+    return np.sqrt(np.mean((err / scale)**2, axis=0))
+
+  def _initial_step(self, y, f, idx):
+    '''Choose the initial step size of each triple.  See Hairer, Norsett, &
+    Wanner (1993), Sec. II.4.'''
+    scale = self.atol + self.rtol * np.fabs(y)
+    d0 = np.sqrt(np.mean((y / scale)**2, axis=0))
+    d1 = np.sqrt(np.mean((f / scale)**2, axis=0))
+    h0 = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, .01 * d0 /
+      np.maximum(d1, 1e-300))
+
+    f1 = self._deriv(y + h0 * f, idx)
+    d2 = np.sqrt(np.mean(((f1 - f) / scale)**2, axis=0)) / h0
+    dmax = np.maximum(d1, d2)
+    h1 = np.where(dmax <= 1e-15, np.maximum(1e-6, h0 * 1e-3),
+      (.01 / np.maximum(dmax, 1e-300))**(1 / 5.))
+
+    return np.minimum(100 * h0, h1)
+
+  def integrate(self):
+    '''Integrate the triples in time.'''
+    self.tstart = time.time()
+
+    idx = np.nonzero(self.active)[0]
+    f = self._deriv(self._y[:, idx], idx)
+    if self._h is None:
+      self._h = np.zeros(self.n)
+      self._h[idx] = self._initial_step(self._y[:, idx], f, idx)
+    self._f = np.zeros_like(self._y)
+    self._f[:, idx] = f
+
+    while len(idx) > 0:
+      if time.time() - self.tstart > self.cputstop:
+        self.termination[idx] = 'cputstop'
+        break
+
+      y = self._y[:, idx]
+      t = self._t[idx]
+      f = self._f[:, idx]
+      h = np.minimum(self._h[idx], self._tstop[idx] - t)
+
+      # Take a Dormand-Prince step.  Trial steps may leave the physical
+      # region (e.g., e1 > 1), in which case the step is rejected.
+      with np.errstate(invalid='ignore', divide='ignore'):
+        k = [f]
+        for i in range(1, 7):
+          ytmp = y + h * sum(_A[i][j] * k[j] for j in range(i) if _A[i][j])
+          k.append(self._deriv(ytmp, idx))
+        ynew = ytmp
+        err = h * sum(_E[j] * k[j] for j in range(7) if _E[j])
+        errnorm = self._error_norm(err, y, ynew)
+      errnorm[~np.isfinite(errnorm)] = np.inf
+
+      # Adjust the step sizes
+      with np.errstate(divide='ignore'):
+        factor = np.where(errnorm == 0, _MAX_FACTOR, _SAFETY * errnorm**(-1
+          / 5.))
+      factor = np.clip(factor, _MIN_FACTOR, _MAX_FACTOR)
+      accept = errnorm <= 1
+      factor[~accept] = np.minimum(factor[~accept], 1)
+
+      acc = idx[accept]
+      self._y[:, acc] = ynew[:, accept]
+      self._f[:, acc] = k[6][:, accept]
+      self._t[acc] = t[accept] + h[accept]
+      self.nstep[acc] += 1
+      self.nreject[idx[~accept]] += 1
+      self._h[idx] = h * factor
+
+      # Check for the end of the integration
+      a1, e1 = self._y[0, idx], self._y[1, idx]
+      collided = accept & (a1 / au * (1 - e1) < self._rp_min[idx])
+      finished = accept & (self._t[idx] >= self._tstop[idx])
+      failed = (~accept) & (self._h[idx] < 1e-14 * np.maximum(np.fabs(t),
+        1.))
+
+      self.collision[idx[collided]] = True
+      self.termination[idx[finished]] = 'tstop'
+      self.termination[idx[collided]] = 'collision'
+      self.termination[idx[failed]] = 'failure'
+      self.active[idx[collided | finished | failed]] = False
+      idx = idx[~(collided | finished | failed)]
+
+    self.update()
+
+  def printout(self, outfilename=None):
+    '''Print out the final state of every triple in the format:
+
+      t  a1  e1  g1  e2  g2  inc (deg)  nstep  termination
+
+    '''
+    lines = []
+    for i in range(self.n):
+      lines.append(' '.join(map(str, [self.t[i], self.a1[i], self.e1[i],
+        self.g1[i], self.e2[i], self.g2[i], self.inc[i], self.nstep[i],
+        self.termination[i]])))
+
+    if outfilename is None:
+      print '\n'.join(lines)
+    else:
+      with open(outfilename, 'w') as outfile:
+        outfile.write('\n'.join(lines) + '\n')
+
+def _vectorize(func):
+  '''Return a kernel or constants function of ts_kernels that works on
+  NumPy arrays, one element per triple.  The generated code is only
+  arithmetic and sqrt, sin, and cos, so it is enough to rebind these to
+  their NumPy versions.'''
+  namespace = dict(vars(ts_kernels), sqrt=np.sqrt, sin=np.sin, cos=np.cos)
+  return types.FunctionType(func.__code__, namespace, func.__name__,
+    func.__defaults__)
+
+# The constants functions and kernels of ts_kernels for arrays, indexed by
+# (quadrupole, octupole, hexadecapole, gr)
+_DERIVS = dict((flags, (_vectorize(constants), _vectorize(kernel))) for
+  flags, (constants, kernel) in ts_kernels.DERIVS.items())
+
+# The Dormand-Prince 5(4) tableau.  See Dormand & Prince (1980).
+_A = [
+  [],
+  [1/5.],
+  [3/40., 9/40.],
+  [44/45., -56/15., 32/9.],
+  [19372/6561., -25360/2187., 64448/6561., -212/729.],
+  [9017/3168., -355/33., 46732/5247., 49/176., -5103/18656.],
+  [35/384., 0, 500/1113., 125/192., -2187/6784., 11/84.]]
+
+# The difference between the fifth and fourth order solutions
+_E = [71/57600., 0, -71/16695., 71/1920., -17253/339200., 22/525., -1/40.]
+
+# Step size control
+_SAFETY = .9
+_MIN_FACTOR = .2
+_MAX_FACTOR = 10.
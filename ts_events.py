@@ -0,0 +1,105 @@
+#! /usr/bin/env python
+
+'''
+ts_events
+
+Locate events, such as eccentricity maxima or flips, during the integration
+of a triple.  An event is a zero crossing of a function of the time and the
+state of the solver.  After each step the event functions are compared to
+their values at the end of the previous step, and if one has changed sign
+the time of the crossing is found by root finding on an interpolant of the
+step.  The times of events are therefore as accurate as the integration
+itself, however large the steps are.
+'''
+
+# Numerical modules
+import numpy as np
+
+class Event:
+  '''A zero crossing of a function of the state of an integration.
+
+  Parameters:
+    func: A function g(t, y) of the time and the state in the units of the
+      solver
+    direction: Only find crossings in this direction: 1 where g increases
+      through zero, -1 where it decreases, and 0 for both
+    terminal: Whether the integration should stop at this event.  The
+      EventFinder reports no events after a terminal event.
+  '''
+
+  def __init__(self, func, direction=0, terminal=False):
+    self.func = func
+    self.direction = direction
+    self.terminal = terminal
+
+  def crossed(self, g0, g1):
+    '''Whether the event occurred between values g0 and g1 of func.'''
+    return ((self.direction >= 0 and g0 < 0 <= g1) or
+      (self.direction <= 0 and g0 > 0 >= g1))
+
+class EventFinder:
+  '''Step a triple and find the events that occur during each step.
+
+  The state within a step is interpolated by the solver.  See ts_solvers.
+
+  Parameters:
+    triple: A Triple, Triple_vector, or Triple_octupole
+    events: A list of Events
+    xtol: The tolerance of the times of events as a fraction of the length
+      of the step
+  '''
+
+  def __init__(self, triple, events, xtol=1e-12):
+    self.triple = triple
+    self.events = list(events)
+    self.xtol = xtol
+    self._save()
+
+  def _save(self):
+    '''Save the current state of the solver and the event functions.'''
+    solver = self.triple.solver
+    self._t = solver.t
+    self._y = np.array(solver.y)
+    self._g = [event.func(self._t, self._y) for event in self.events]
+
+  def step(self):
+    '''Take a step of the triple.
+
+    Returns:
+      The events that occurred during the step as a list of (event, t, y)
+      in order of time, where t and y are the time and the state at the
+      event in the units of the solver.  The state of the triple at an
+      event can be set with its _set_state method.
+    '''
+
+    t0, g0 = self._t, self._g
+    self.triple._step()
+    self._save()
+    t1, g1 = self._t, self._g
+
+    found = []
+    interpolate = self.triple.solver.interpolate
+    for event, ga, gb in zip(self.events, g0, g1):
+      if not event.crossed(ga, gb):
+        continue
+      from scipy.optimize import brentq
+
+      def g(t):
+        # Use the known values at the ends of the step so that the
+        # interpolant cannot disagree about the bracket
+        if t == t0:
+          return ga
+        elif t == t1:
+          return gb
+        return event.func(t, interpolate(t))
+
+      t = brentq(g, t0, t1, xtol=self.xtol * abs(t1 - t0))
+      found.append((t, event, interpolate(t)))
+
+    found.sort(key=lambda item: item[0])
+    events = []
+    for t, event, y in found:
+      events.append((event, t, y))
+      if event.terminal:
+        break
+    return events
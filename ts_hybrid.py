@@ -0,0 +1,368 @@
+#! /usr/bin/env python
+
+'''
+ts_hybrid
+
+Integrate a triple in the test particle limit with the doubly averaged
+equations of motion of Katz et al. (2011) (ekm.Triple_octupole) wherever
+they are valid, and with the full secular equations of motion
+(ts_vector.Triple_vector) where they are not.
+
+The doubly averaged equations evolve only jz and Omega_e, the longitude of
+the eccentricity vector, over many KL cycles; CKL follows from the
+conservation of phiq = CKL + jz^2 / 2.  Averaging over the KL cycles fails
+in two places:
+
+  - Near a flip, where jz changes by about epsoct in each KL cycle, which
+    is no longer small compared to jz itself.  These are also the episodes
+    of the highest eccentricity.
+  - Near the separatrix between rotating and librating KL cycles (CKL = 0),
+    where the KL period diverges, and in the librating region (CKL < 0),
+    where the equations do not apply.
+
+The doubly averaged equations are therefore integrated only while |jz| >
+jz_switch * epsoct and CKL > ckl_switch.  When the triple leaves this region
+it is mapped to the eccentricity minimum of the KL cycle with the same jz,
+CKL, and Omega_e and integrated with the full equations.  At each
+eccentricity minimum of the full integration the triple is mapped back to
+(jz, Omega_e, CKL) if it is again well inside the region (by a factor of
+hysteresis), so that it does not switch back and forth at the boundary.
+
+The phase of the KL cycle is lost every time the triple is averaged, so the
+hybrid integration follows the secular evolution (flips, the envelope of
+the eccentricity) rather than the individual KL cycles.  The doubly
+averaged equations are themselves most accurate for small jz (Katz et al.
+2011), so the hybrid integration is closest to the full one for triples
+that flip.
+'''
+
+# Ignore DeprecationWarnings if called from command line
+if __name__ == '__main__':
+  import __init__
+
+# System packages
+import os
+import sys
+import time
+
+# Numerical packages
+import numpy as np
+
+# Triplesec packages
+from ekm import Triple_octupole
+from ts_vector import Triple_vector
+import ts_checkpoint
+import ts_events
+import ts_output
+import ts_solvers
+
+def averaged_elements(jvec, evec):
+  '''Return the variables of the doubly averaged equations of motion from
+  the angular momentum and eccentricity vectors.
+
+  Returns:
+    jz, Omega, CKL, where Omega is the longitude of the eccentricity vector
+    in radians
+  '''
+  e_sq = evec[0]**2 + evec[1]**2 + evec[2]**2
+  return (jvec[2], np.arctan2(evec[1], evec[0]), e_sq - 5/2. *
+    evec[2]**2)
+
+def cycle_elements(jz, Omega, CKL):
+  '''Return the orbital elements at the eccentricity minimum of a rotating
+  KL cycle (CKL > 0) with the given jz, Omega, and CKL.  There the argument
+  of periapsis is zero and e1^2 = CKL.
+
+  Returns:
+    e1, inc, longascnode, argperi, with the angles in degrees
+  '''
+  e1 = np.sqrt(CKL)
+  cosi = np.clip(jz / np.sqrt(1 - CKL), -1, 1)
+  return e1, np.degrees(np.arccos(cosi)), np.degrees(Omega), 0.
+
+def ecc_max(jz, CKL):
+  '''Return the maximum eccentricity of the quadrupole KL cycle with the
+  given jz and CKL.  This is reached where the argument of periapsis is
+  90 degrees.'''
+  b = 5/2. * jz**2 - 3/2. + CKL
+  return np.sqrt((np.sqrt(b**2 + 6 * CKL) - b) / 3.)
+
+class Triple_hybrid:
+  '''A triple in the test particle limit that is integrated with the doubly
+  averaged equations of motion where they are valid and with the full
+  secular equations elsewhere.  See the module docstring.
+
+  Parameters:
+    a1: Semi-major axis of inner binary in AU
+    a2: Semi-major axis of outer binary in AU
+    e1: Eccentricity of inner binary
+    e2: Eccentricity of outer binary
+    inc: Inclination between inner and outer binaries in degrees
+    longascnode: Longitude of ascending node in degrees
+    argperi: Argument of periapsis of the inner binary in degrees
+    m1: Mass of component 1 of the inner binary in solar masses
+    m3: Mass of the tertiary in solar masses
+    tstop: The time to integrate in years
+    cputstop: The maximum amount of CPU time to integrate in seconds
+    outfreq: Print output on every nth step
+    outfilename: Write output to this file.  If None, print to stdout.
+    outformat: The format of the output file, 'text', 'npy', or 'none'.  See
+      ts_output.
+    atol: Absolute tolerance of the integrator
+    rtol: Relative tolerance of the integrator
+    integration_algo: The integration algorithm.  See ts_solvers.
+    jz_switch: Use the full equations where |jz| < jz_switch * epsoct
+    ckl_switch: Use the full equations where CKL < ckl_switch
+    hysteresis: Return to the doubly averaged equations only where |jz| and
+      CKL exceed these limits by this factor
+
+  Attributes:
+    averaged: Whether the doubly averaged equations are being integrated
+    nswitch: The number of switches between the equations of motion
+    t_averaged: The time spent in the doubly averaged equations in years
+    e1max: The largest eccentricity reached.  In the doubly averaged
+      equations this is the maximum eccentricity of the KL cycle.
+  '''
+
+  # The columns of the output.  See printout.
+  columns = ['t', 'jz', 'Omega', 'CKL', 'averaged']
+
+  def __init__(self, a1=1., a2=20., e1=.1, e2=.3, inc=80., longascnode=180.,
+    argperi=0., m1=1, m3=1, tstop=1e3, cputstop=300, outfreq=1,
+    outfilename=None, outformat='text', atol=1e-9, rtol=1e-9,
+    integration_algo='vode', jz_switch=3., ckl_switch=.01, hysteresis=2.):
+
+    # Given parameters
+    self.a1 = float(a1)
+    self.a2 = float(a2)
+    self.e2 = e2
+    self.m1 = m1
+    self.m3 = m3
+    self.tstop = tstop
+    self.cputstop = cputstop
+    self.outfreq = outfreq
+    self.outfilename = outfilename
+    self.outformat = outformat
+    self.atol = atol
+    self.rtol = rtol
+    self.integration_algo = integration_algo
+    self.ckl_switch = ckl_switch
+    self.hysteresis = hysteresis
+
+    # Start with the full equations at the initial conditions
+    self.t = 0
+    self.nstep = 0
+    self.nswitch = 0
+    self.t_averaged = 0
+    self.e1max = e1
+    self._full(0, e1, inc, longascnode, argperi)
+    self.epsoct = self.triple.epsoct
+    self.tsec = self.triple.tsec
+    self.jz_switch = jz_switch * self.epsoct
+    self._read_model()
+
+    self.outfile = ts_output.open_output(self.outfilename, self.columns,
+      self.outformat)
+
+    if self._averageable(self.jz, self.CKL):
+      self._average(0, self.jz, self.Omega, self.CKL)
+
+  def _full(self, t, e1, inc, longascnode, argperi):
+    '''Continue with the full equations from time t in years.'''
+    self.averaged = False
+    self._t0 = t
+    self.triple = Triple_vector(a1=self.a1, a2=self.a2, e1=e1, e2=self.e2,
+      inc=inc, longascnode=longascnode, argperi=argperi, m1=self.m1,
+      m3=self.m3, tstop=self.tstop - t, outfilename=os.devnull,
+      atol=self.atol, rtol=self.rtol, integration_algo=self.integration_algo)
+    self._finder = ts_events.EventFinder(self.triple,
+      [self.triple.ecc_event(1), self.triple.ecc_event(-1)])
+
+  def _average(self, t, jz, Omega, CKL):
+    '''Continue with the doubly averaged equations from time t in years.'''
+    e1, inc, longascnode, argperi = cycle_elements(jz, Omega, CKL)
+    self.averaged = True
+    self._t0 = t
+    self.triple = Triple_octupole(e1=e1, inc=inc, longascnode=longascnode,
+      argperi=argperi, epsoct=self.epsoct, tstop=(self.tstop - t) /
+      self.tsec, outfilename=os.devnull, atol=self.atol, rtol=self.rtol,
+      integration_algo=self.integration_algo)
+
+    # Leave when |jz| or CKL = phiq - jz^2 / 2 cross their limits.  A flip
+    # may take jz across the whole band |jz| < jz_switch in one step, so
+    # flips are events as well.
+    jz_max_sq = 2 * (self.triple.phiq - self.ckl_switch)
+    self._finder = ts_events.EventFinder(self.triple, [
+      ts_events.Event(lambda t, y: (y[0]**2 - self.jz_switch**2) *
+        (jz_max_sq - y[0]**2), -1),
+      self.triple.flip_event()])
+
+  def _averageable(self, jz, CKL):
+    '''Whether the doubly averaged equations may be switched to.'''
+    return (abs(jz) > self.hysteresis * self.jz_switch and CKL >
+      self.hysteresis * self.ckl_switch)
+
+  def _read_model(self):
+    '''Set the state of the triple from the equations being integrated.'''
+    triple = self.triple
+    if self.averaged:
+      self.t = self._t0 + triple.t * self.tsec
+      self.jz = triple.jz
+      self.Omega = np.arctan2(np.sin(triple.Omega), np.cos(triple.Omega))
+      self.CKL = triple.CKL
+      self.e1max = max(self.e1max, ecc_max(self.jz, self.CKL))
+    else:
+      self.t = self._t0 + triple.t
+      self.jz, self.Omega, self.CKL = averaged_elements(triple.jvec,
+        triple.evec)
+
+  def _switch(self, t, y):
+    '''Switch the equations of motion at a time and state of the solver.'''
+    self.triple._set_state(t, y)
+    self._read_model()
+    if self.averaged:
+      self.t_averaged += self.triple.t * self.tsec
+      self._full(self.t, *cycle_elements(self.jz, self.Omega, self.CKL))
+    else:
+      self._average(self.t, self.jz, self.Omega, self.CKL)
+    self._read_model()
+    self.nswitch += 1
+    self.printout()
+
+  def _step(self):
+    '''Take a step of the equations being integrated, switching them at an
+    event if necessary.'''
+    for event, t, y in self._finder.step():
+      if self.averaged:
+        self._switch(t, y)
+        return
+      if event.direction < 0:
+        self.e1max = max(self.e1max, np.linalg.norm(y[3:]))
+      elif self._averageable(*averaged_elements(y[:3], y[3:])[::2]):
+        self._switch(t, y)
+        return
+    self._read_model()
+
+  def integrate(self):
+    '''Integrate the triple in time.'''
+    self.printout()
+    self.tstart = time.time()
+    while ((self.t < self.tstop) and
+      (time.time() - self.tstart < self.cputstop)):
+      self._step()
+      self.nstep += 1
+      if self.nstep % self.outfreq == 0:
+        self.printout()
+
+    if self.averaged:
+      self.t_averaged += self.triple.t * self.tsec
+    self.printout()
+    self.outfile.close()
+
+  def printout(self):
+    '''Print out the state of the system in the format:
+
+    time  jz  Omega  CKL  averaged
+
+    '''
+    self.outfile.write([self.t, self.jz, self.Omega, self.CKL,
+      int(self.averaged)])
+
+def process_command_line(argv):
+  '''Process the command line.'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  # Configure the command line options
+  import argparse
+  parser = argparse.ArgumentParser()
+
+  defaults = ts_checkpoint.defaults(Triple_hybrid)
+  parser.add_argument('-m', '--m1', dest='m1', type=float,
+    default=defaults['m1'], help =
+    'Mass of star 1 in inner binary in solar masses [%g]' % defaults['m1'],
+    metavar='\b')
+  parser.add_argument('-o', '--m3', dest='m3', type=float,
+    default=defaults['m3'], help =
+    'Mass of tertiary in solar masses [%g]' % defaults['m3'], metavar='\b')
+  parser.add_argument('-a', '--a1', dest='a1', type=float,
+    default=defaults['a1'], help =
+    'Inner semi-major axis in au [%g]' % defaults['a1'], metavar='\b')
+  parser.add_argument('-b', '--a2', dest='a2', type=float,
+    default=defaults['a2'], help =
+    'Outer semi-major axis in au [%g]' % defaults['a2'], metavar='\b')
+  parser.add_argument('-g', '--g1', dest='g1', type=float,
+    default=defaults['argperi'], help =
+    'Inner argument of periapsis in degrees [%g]' % defaults['argperi'],
+    metavar='\b')
+  parser.add_argument('-L', '--Omega', dest='Omega', type=float,
+    default=defaults['longascnode'], help =
+    'Longitude of ascending node in degrees [%g]' % defaults['longascnode'],
+    metavar='\b')
+  parser.add_argument('-e', '--e1', dest='e1', type=float,
+    default=defaults['e1'], help =
+    'Inner eccentricity [%g]' % defaults['e1'], metavar='\b')
+  parser.add_argument('-f', '--e2', dest='e2', type=float,
+    default=defaults['e2'], help =
+    'Outer eccentricity [%g]' % defaults['e2'], metavar='\b')
+  parser.add_argument('-i', '--inc', dest='inc', type=float,
+    default=defaults['inc'], help =
+    'Inclination of the third body in degrees [%g]' % defaults['inc'],
+    metavar='\b')
+  parser.add_argument('-t', '--end', dest='tstop', type=float,
+    default=defaults['tstop'], help =
+    'Total time of integration in years [%g]' % defaults['tstop'],
+    metavar='\b')
+  parser.add_argument('-C', '--cpu', dest='cputstop', type=float,
+    default=defaults['cputstop'], help =
+    'cpu time limit in seconds, if -1 then no limit [%g]' %
+    defaults['cputstop'], metavar='\b')
+  parser.add_argument('-F', '--freq', dest='outfreq', type=int,
+    default=defaults['outfreq'], help = 'Output frequency [%g]' %
+    defaults['outfreq'], metavar='\b')
+  parser.add_argument('-A', '--abstol', dest='atol', type=float,
+    default=defaults['atol'], help = 'Absolute accuracy [%g]' %
+    defaults['atol'], metavar='\b')
+  parser.add_argument('-R', '--reltol', dest='rtol', type=float,
+    default=defaults['rtol'], help = 'Relative accuracy [%g]' %
+    defaults['rtol'], metavar='\b')
+  parser.add_argument('--algorithm', dest='algo', type=str,
+    default=defaults['integration_algo'], choices=ts_solvers.SOLVERS, help =
+    'Integration algorithm [%s]' % defaults['integration_algo'])
+  parser.add_argument('--jz-switch', dest='jz_switch', type=float,
+    default=defaults['jz_switch'], help = 'Use the full equations where '
+    '|jz| is less than this times epsoct [%g]' % defaults['jz_switch'],
+    metavar='\b')
+  parser.add_argument('--ckl-switch', dest='ckl_switch', type=float,
+    default=defaults['ckl_switch'], help = 'Use the full equations where '
+    'CKL is less than this [%g]' % defaults['ckl_switch'], metavar='\b')
+  parser.add_argument('--hysteresis', dest='hysteresis', type=float,
+    default=defaults['hysteresis'], help = 'Return to the doubly averaged '
+    'equations only where |jz| and CKL exceed their limits by this factor '
+    '[%g]' % defaults['hysteresis'], metavar='\b')
+  parser.add_argument('-O', '--outfile', dest='outfilename', type=str, help =
+    'Write output to this file [stdout]', metavar='\b')
+  parser.add_argument('--format', dest='outformat', type=str,
+    default=defaults['outformat'], choices=ts_output.FORMATS, help =
+    'Format of the output file [%s]' % defaults['outformat'])
+
+  arguments = parser.parse_args(argv)
+  return arguments
+
+def main(argv=None):
+  args = process_command_line(argv)
+  th = Triple_hybrid(a1=args.a1, a2=args.a2, e1=args.e1, e2=args.e2,
+    inc=args.inc, longascnode=args.Omega, argperi=args.g1, m1=args.m1,
+    m3=args.m3, tstop=args.tstop, cputstop=args.cputstop,
+    outfreq=args.outfreq, atol=args.atol, rtol=args.rtol,
+    integration_algo=args.algo, jz_switch=args.jz_switch,
+    ckl_switch=args.ckl_switch, hysteresis=args.hysteresis,
+    outfilename=args.outfilename,
+    outformat=args.outformat)
+  th.integrate()
+  return 0
+
+if __name__=='__main__':
+  status = main()
+  sys.exit(status)
@@ -0,0 +1,2320 @@
+#! /usr/bin/env python
+
+'''
+ts_jacobian
+
+The Jacobian of the Hamiltonian equations of motion of a hierarchical
+triple, split up by term of the Hamiltonian.  Everything that depends only
+on the masses and the outer semi-major axis is computed once per triple by
+each Jacobian's _constants function.  The Jacobians are evaluated in units
+in which G = 1.
+
+This file is generated by make_kernels.py.  Do not edit it by hand.
+'''
+
+from __future__ import division
+from math import sqrt, sin, cos
+
+def jac_quadrupole_constants(m1, m2, m3, a2, c):
+  '''The constants used by jac_quadrupole.'''
+  x7 = m1**2
+  x8 = m2**2
+  x9 = 1/(x7*x8)
+  x16 = m1 + m2
+  x17 = 1/x16
+  x19 = x7*x8
+  x21 = m3**2
+  x22 = x16**2
+  x23 = m3 + x16
+  x24 = a2*x21*x22/x23
+  x27 = 1/x21
+  x28 = x23/a2
+  x29 = x17*x28
+  x30 = x27*x29
+  x36 = 1/m3
+  x37 = 2*x17
+  x42 = a2**(-3)
+  x43 = sqrt(x16)
+  x44 = 1/x43
+  x45 = 15*x42*x44/32
+  k0 = x17*x19
+  x64 = x17/4
+  x65 = x27*x28
+  x66 = m3*x42
+  x70 = 2*m1 + 2*m2
+  x72 = x16**(-3/2)
+  k1 = a2**(-4)
+  k2 = k1*x23*x36*x72
+  x79 = x65*x72
+  x90 = m1*m2
+  k3 = x16**(-5/2)
+  k4 = k3*x65
+  x95 = 1/(m1*m2)
+  x104 = x65/x22
+  x107 = x43/2
+  x109 = 15*x17/8
+  k5 = -x30
+  x120 = x17/2
+  x122 = sqrt(x23)
+  x123 = x122/a2**(7/2)
+  x131 = sqrt(a2)
+  x132 = x122*x36/x131
+  k6 = x29*x36
+  k7 = -x45
+  k8 = x28*x36*x37
+  k9 = -x64*x65
+  k10 = -15*x44/4
+  k11 = 30*x9
+  k12 = x44*x66/32
+  k13 = -15*x9/8
+  k14 = 4*x90
+  k15 = 8*x17
+  k16 = 2*x44*x65
+  k17 = x107*x95
+  k18 = x79*x95/2
+  k19 = -x90
+  k20 = x66/16
+  k21 = -x17
+  k22 = -5*x104/4
+  k23 = -x120
+  k24 = -x109
+  k25 = -10*x132*x17
+  k26 = 1/x122
+  k27 = 8*k26*m3*x131*x22
+  k28 = 3*x66
+  k29 = 9.0*x123
+  return ((m3, x9, x16, x17, x19, x24, x30, x37, x43, x45, k0, x64, x66, x70,
+    k2, x79, x90, k4, x95, x104, x107, x109, k5, x120, x123, x132, k6, k7, k8,
+    k9, k10, k11, k12, k13, k14, k15, k16, k17, k18, k19, k20, k21, k22, k23,
+    k24, k25, k27, k28, k29))
+
+def jac_quadrupole(y, k):
+  '''The Jacobian of the quadrupole terms of the EOMs.
+
+  k is returned by jac_quadrupole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m3, x9, x16, x17, x19, x24, x30, x37, x43, x45, k0, x64, x66, x70, k2,
+    x79, x90, k4, x95, x104, x107, x109, k5, x120, x123, x132, k6, k7, k8,
+    k9, k10, k11, k12, k13, k14, k15, k16, k17, k18, k19, k20, k21, k22,
+    k23, k24, k25, k27, k28, k29) = k
+  x0 = e2**2
+  x1 = 1 - x0
+  x2 = x1**(-1.5)
+  x3 = e1**2
+  x4 = x3 - 1
+  x5 = 1/x4
+  x6 = 1/a1
+  x10 = x6*x9
+  x11 = x10*x5
+  x12 = x0 - 1
+  x13 = 1/x12
+  x14 = H**2
+  x15 = 1 - x3
+  x18 = a1*x17
+  x20 = x15*x18*x19
+  x25 = x1*x24
+  x26 = -x14 + x20 + x25
+  x31 = x26**2*x30
+  x32 = x13*x31
+  x33 = x11*x32
+  x34 = 4 - x33
+  x35 = m3*x34
+  x38 = x26*x5
+  x39 = x10*x38
+  x40 = x37 + x39
+  x41 = x13*x26
+  x46 = a1*x4
+  x47 = 1/sqrt(-x46)
+  x48 = 2*g1
+  x49 = sin(x48)
+  x50 = e1*x47*x49
+  x51 = x46*x50
+  x52 = x2*x35
+  x53 = 1/x15
+  x54 = x14 - x20 - x25
+  x55 = x53*x54
+  x56 = x10*x55
+  x57 = x37 + x56
+  x58 = x1**(-2.5)
+  x59 = a1**2
+  x60 = x47*x59
+  x61 = x49*x60
+  x62 = cos(x48)
+  x63 = k0*x46 + x12*x24 + x14
+  x67 = x2*x66
+  x68 = 1/x1
+  x69 = x54*x68
+  x71 = x55*(x30*x69 + x70)
+  x73 = H*k2
+  x74 = 5*x62
+  x75 = x74 - 3
+  x76 = x3*x75
+  x77 = x76 - 2
+  x78 = x63*x77
+  x80 = x13*x78*x79
+  x81 = 4*x5
+  x82 = x10*x81
+  x83 = x32*x82
+  x84 = x74 - 1
+  x85 = x54**2
+  x86 = x10*x30*x68*x85
+  x87 = 4*x3 + x53*x86 - 4
+  x88 = x84*x87
+  x89 = x43*(-x83 + x88)
+  x91 = 2 - x76
+  x92 = x13*x91
+  x93 = k4*x92
+  x94 = 2*x92
+  x96 = x6*x95
+  x97 = x43*(x83 - x88)
+  x98 = a1*x90
+  x99 = 3*x67/8
+  x100 = x41*x79
+  x101 = x5*x95
+  x102 = x13*x38
+  x103 = 8*x102
+  x105 = x4**(-2)
+  x106 = x104*x68
+  x108 = e1*x17
+  x110 = x12**(-2)
+  x111 = 2*x26
+  x112 = e2*x17
+  x113 = 5*x68
+  x114 = x3*(3 - x74) + 2
+  x115 = x5*x91
+  x116 = x10*x111
+  x117 = -x3*x74 + 3*x3 + 2
+  x118 = k5*x10*x113*x53*x85 + 12
+  x119 = 24*x3 + 16
+  x121 = x1**(-2.0)
+  x124 = x121*x123
+  x125 = 3*x124/16
+  x126 = x125*x18
+  x127 = 5*x117
+  x128 = x59*x90
+  x129 = x78*x82
+  x130 = x17*(-x117*(12 - 5*x33) + x119)
+  x133 = x132*x68
+  return ([[0, 0, 0, 0, 0, 0], [k7*x2*x51*(k6*x40*x41 + 3*x35/2),
+    x45*x61*(k8*x3*x4*x55*x57*x58 - x3*x52 - x4*x52),
+    e1*k10*x4*x60*x62*x67*(k9*x11*x13*x63**2 + 1), e2*k12*x51*x58*(-45.0*a1*x34
+    + k11*x71), 0, a1*k13*x50*x58*x63*x73], [x18*x47*x99*(x80 - x89/2 -
+    x98*(k14*x4*x93 + k16*x69*x96*(k15 + 4*x56 - x57*x84) + x26*x79*x94*x96 +
+    x96*x97)/8), k19*x108*x60*x99*(k17*(4*x10*x105*x32 + x103*x104 +
+    x84*(2*x106*x55 + 4 + x86/x15**2)) + k18*x38*x92 + x100*x75*x95 +
+    x101*x97/4 + x93*x98), x109*x61*x67*(x100*x3 + x107*x87),
+    k20*x112*x60*(-3*x2*(x10*x43*(x103*x16 + x110*x31*x81 + x68*x71*x84) +
+    x110*x111*x79*x91 + x43*x94) + 4.5*x58*(2*x80 - x89)), 0,
+    -3*x2*x60*x73*(x113*x56*(x62 - 1) + x17*x92)/8], [0, 0, 0, 0, 0, 0],
+    [x126*x90*(k21*x114 + k22*x117*x57*x69 - x114*x56 + x115*x116 +
+    x120*(-x117*x118 + x119)), -x108*x125*x128*(k23*(k5*x102*x127*x40 +
+    x118*x75 + 24) + x105*x116*x91 + x115*x37 + 2*x39*x75),
+    k24*x124*x128*x3*x49*(x118*x64 - x39),
+    x112*x128*(k28*x121*(k25*x117*x13*x39*(x30*x41 + x70) + k27*x11*x77 +
+    x129*x133 + x130*x133) + k29*x1**(-3.0)*(x129 + x130))/64, 0,
+    -H*x101*x126*(-x106*x127*x26 - 2*x76 + 4)], [0, 0, 0, 0, 0, 0]])
+
+def jac_octupole_constants(m1, m2, m3, a2, c):
+  '''The constants used by jac_octupole.'''
+  x2 = m1 + m2
+  x3 = 1/x2
+  x4 = m1**2
+  x5 = m2**2
+  x6 = 1/(x4*x5)
+  x13 = x3*x4*x5
+  x17 = m3**2
+  x18 = x2**2
+  x19 = m3 + x2
+  x20 = a2*x17*x18/x19
+  x25 = 1/x17
+  x26 = x19/a2
+  x27 = x25*x26
+  x33 = 1/(m1*m2)
+  x35 = sqrt(x2)
+  x36 = 1/x35
+  x37 = sqrt(a2)
+  x38 = sqrt(x19)
+  x39 = x38/x37
+  x40 = x36*x39
+  x48 = 1/m3
+  x87 = x27*x3
+  x93 = x2**(3/2)
+  x94 = 1/x93
+  x99 = m1*m2
+  x103 = 2*x3
+  x109 = a2**(-3/2)
+  x110 = x19**(3/2)
+  k0 = x109*x110
+  x119 = x103*x99
+  x131 = x26*x3
+  x132 = x33*x48
+  x139 = 1.25*x3
+  x147 = m1 - m2
+  x153 = a2**(-4)
+  x164 = x39*x48
+  x175 = m3**(-3)
+  x183 = 2.5*x3
+  k1 = x4*x5
+  x204 = 1/x38
+  x205 = x204*x37*x93
+  k2 = m3*x205
+  x210 = 2*m1
+  k3 = 2*m2
+  k4 = k3 + x210
+  x217 = 2*m3
+  k5 = x205*x217
+  x224 = 2.5*m1 + 2.5*m2
+  x229 = m3*x153
+  x251 = x26*x48
+  k6 = x139*x251
+  x254 = 1/x18
+  x265 = x38/a2**(9/2)
+  x269 = m2*x210
+  x275 = 10*x94
+  k7 = -x87
+  x289 = 10*m1
+  x290 = m2*x289
+  x310 = 3.75*x3
+  k8 = x109*x110*x175*x275
+  k9 = 75.0*x99
+  x344 = 30*m3
+  k10 = 15*x229
+  k11 = 30*m1
+  k12 = 30*m2
+  k13 = k11 + k12
+  k14 = 10*x205
+  x356 = 5*x48
+  x358 = 2*x33
+  x368 = x2**(-3)
+  x383 = a2**(-5)
+  k15 = x19*x383
+  x388 = 2*x35
+  x392 = 5*x36
+  x396 = x2**(-5/2)
+  x412 = x33*x388
+  x413 = x269*x396
+  k16 = x290*x396
+  k17 = 10*x396
+  k18 = x19**2
+  k19 = a2**(-2)
+  k20 = m3**(-4)
+  k21 = k18*k19*k20
+  x427 = x27*x413
+  x439 = x164*x3
+  x445 = x27*x275
+  k22 = 5*m3
+  k23 = -35*x48
+  k24 = 4*x48
+  k25 = x175*x33
+  k26 = -20*x48
+  k27 = -35*x48/2
+  k28 = -x275
+  k29 = 7.5*x3
+  k30 = -x48
+  k31 = -x344
+  k32 = -x18*x204*x217*x37
+  k33 = -x265
+  k34 = 10*m2
+  k35 = 7.5*m1
+  k36 = 7.5*m2
+  k37 = k35 + k36
+  k38 = k34 + x289
+  k39 = -x358
+  k40 = -x356
+  k41 = x103*x251
+  k42 = x368*x48
+  k43 = -3*x254
+  k44 = -x427
+  k45 = -x103
+  k46 = -x99/2
+  k47 = -x254
+  k48 = -x99/4
+  k49 = 5*x33
+  k50 = -x392
+  k51 = -10*x36
+  k52 = -x19*x383*x48*x99
+  k53 = -10*x35
+  k54 = -x445
+  k55 = 32*x439
+  k56 = -x439
+  k57 = -m3*x205
+  k58 = -4*x439
+  k59 = -150.0*x229
+  k60 = -x94
+  return ((m3, x3, x6, x13, x20, x25, x26, x27, x33, x35, x39, x40, x48, x87,
+    x94, x99, x103, k0, x119, x131, x132, x139, x147, x153, x164, x183, k1, k2,
+    k4, x217, k5, x224, x229, k6, x254, x265, x269, x275, k7, x290, x310, k8,
+    k9, k10, k13, k14, x356, x358, x368, k15, x388, x392, x396, x412, x413,
+    k16, k17, k21, x427, x445, k22, k23, k24, k25, k26, k27, k28, k29, k30,
+    k31, k32, k33, k37, k38, k39, k40, k41, k42, k43, k44, k45, k46, k47, k48,
+    k49, k50, k51, k52, k53, k54, k55, k56, k57, k58, k59, k60))
+
+def jac_octupole(y, k):
+  '''The Jacobian of the octupole terms of the EOMs.
+
+  k is returned by jac_octupole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m3, x3, x6, x13, x20, x25, x26, x27, x33, x35, x39, x40, x48, x87, x94,
+    x99, x103, k0, x119, x131, x132, x139, x147, x153, x164, x183, k1, k2,
+    k4, x217, k5, x224, x229, k6, x254, x265, x269, x275, k7, x290, x310,
+    k8, k9, k10, k13, k14, x356, x358, x368, k15, x388, x392, x396, x412,
+    x413, k16, k17, k21, x427, x445, k22, k23, k24, k25, k26, k27, k28,
+    k29, k30, k31, k32, k33, k37, k38, k39, k40, k41, k42, k43, k44, k45,
+    k46, k47, k48, k49, k50, k51, k52, k53, k54, k55, k56, k57, k58, k59,
+    k60) = k
+  x0 = e1**2
+  x1 = 1 - x0
+  x7 = 1/x1
+  x8 = 1/a1
+  x9 = x7*x8
+  x10 = x6*x9
+  x11 = H**2
+  x12 = a1*x1
+  x14 = x12*x13
+  x15 = e2**2
+  x16 = 1 - x15
+  x21 = x16*x20
+  x22 = x11 - x14 - x21
+  x23 = x22**2
+  x24 = 1/x16
+  x28 = x24*x27
+  x29 = x23*x28
+  x30 = x10*x29*x3
+  x31 = 4 - x30
+  x32 = x1*x31
+  x34 = 1/sqrt(x16)
+  x41 = x34*x40
+  x42 = 1/sqrt(x12)
+  x43 = cos(g1)
+  x44 = sin(g2)
+  x45 = x43*x44
+  x46 = x42*x45
+  x47 = x41*x46
+  x49 = x22*x48
+  x50 = x33*x47*x49
+  x51 = cos(g2)
+  x52 = 2*x51
+  x53 = x43*x52
+  x54 = sin(g1)
+  x55 = x44*x54
+  x56 = x42*x55
+  x57 = x41*x48
+  x58 = x56*x57
+  x59 = x22*x33
+  x60 = x53 - x58*x59
+  x61 = 2*g1
+  x62 = sin(x61)
+  x63 = x0*x62
+  x64 = 35*x63
+  x65 = x31*x64
+  x66 = x52*x54
+  x67 = -x50 + x66
+  x68 = cos(x61)
+  x69 = 7*x68
+  x70 = -x0*x69 + 5*x0 + 2
+  x71 = 0.625*x30
+  x72 = 2.5 - x71
+  x73 = x70*x72
+  x74 = 3*x0
+  x75 = x74 + 4
+  x76 = -4*x73 + 4*x75
+  x77 = 10*x32*x50 - x60*x65 + x67*x76
+  x78 = -x11 + x14 + x21
+  x79 = x78**2
+  x80 = x15 - 1
+  x81 = 1/x80
+  x82 = x0 - 1
+  x83 = 1/x82
+  x84 = x6*x83
+  x85 = x8*x84
+  x86 = x81*x85
+  x88 = x86*x87
+  x89 = x79*x88
+  x90 = 4 - x89
+  x91 = x34*x39
+  x92 = x82**2
+  x95 = a1*x82
+  x96 = 1/sqrt(-x95)
+  x97 = x94*x96
+  x98 = x92*x97
+  x100 = 20*x45
+  x101 = x100*x99
+  x102 = x82*x97
+  x104 = x78*x8
+  x105 = x104*x84
+  x106 = x103 + x105
+  x107 = x106*x34
+  x108 = x100*x107
+  x111 = k0*x79
+  x112 = x33*x8
+  x113 = x112*x25*x81
+  x114 = x104*x33
+  x115 = x82*x90
+  x116 = x41*x96
+  x117 = x116*x45
+  x118 = 10*x117
+  x120 = x114 + x119*x82
+  x121 = x64*x90
+  x122 = x116*x55
+  x123 = x22*x7
+  x124 = x123*x33
+  x125 = x124*x8
+  x126 = x125*x82
+  x127 = 2.5 - 0.625*x89
+  x128 = x127*x70
+  x129 = -x128 + x75
+  x130 = 4*x129
+  x133 = x132*x78
+  x134 = x122*x133
+  x135 = x134 + x53
+  x136 = x135*x63
+  x137 = 70*x136
+  x138 = x48*x81
+  x140 = x10*(0.625*x11 - 0.625*x14 - 0.625*x21) + x139
+  x141 = 8*x140
+  x142 = x22*x24
+  x143 = x142*x48
+  x144 = x26*x8
+  x145 = x143*x144*x3
+  x146 = x145*x70
+  x148 = a1**2
+  x149 = x147*x148
+  x150 = e2*x149
+  x151 = 15*x150/1024
+  x152 = x16**(-2.5)
+  x154 = x152*x153
+  x155 = x154*x82
+  x156 = x155*x97
+  x157 = x117*x133
+  x158 = 10*x115
+  x159 = x157 + x66
+  x160 = 4*x159
+  x161 = x11 + x13*x95 + x20*x80
+  x162 = x161**2*x88
+  x163 = 4 - x162
+  x165 = x164*x34*x95*x97
+  x166 = x132*x161
+  x167 = x163*x62
+  x168 = x122*x166
+  x169 = -x168 + x53
+  x170 = 70*x169
+  x171 = a1*x119
+  x172 = x33*x83
+  x173 = x172*x78
+  x174 = x0*x167
+  x176 = x78*x81
+  x177 = k0*x97
+  x178 = -x70*(2.5 - 0.625*x162) + x75
+  x179 = x176*x27
+  x180 = x179*x3
+  x181 = x69 - 5
+  x182 = 2*x181
+  x184 = 1.25*x11
+  x185 = k1*x12
+  x186 = x139*x185
+  x187 = 1.25*x21
+  x188 = x70*x83
+  x189 = x180*x188
+  x190 = -x189*(x183 + x85*(-x184 + x186 + x187)) + 6
+  x191 = a1**3*x147
+  x192 = 15*x191/512
+  x193 = e2*x192
+  x194 = m3*x154
+  x195 = x163*x168
+  x196 = x0*x68
+  x197 = 7*x63
+  x198 = m3*x156
+  x199 = 15*x191/64
+  x200 = e2*x199
+  x201 = 15*x152
+  x202 = x16**(-3.5)
+  x203 = x15*x202
+  x206 = k2*x34
+  x207 = x32*x46
+  x208 = x16**(-3/2)
+  x209 = x208*x40
+  x211 = x142*x27
+  x212 = x211*x3
+  x213 = k4 + x212
+  x214 = x6*x8
+  x215 = x213*x214
+  x216 = 10*x209
+  x218 = x143*x40
+  x219 = k5 + x218
+  x220 = x219*x34
+  x221 = x220*x56
+  x222 = x220*x42
+  x223 = x125*x24
+  x225 = x7*x70
+  x226 = x225*(x139*x211 + x224)
+  x227 = x15*x33
+  x228 = x191/512
+  x230 = x102*x229
+  x231 = x43*x51
+  x232 = x116*x133
+  x233 = x231*x232
+  x234 = 2*x44
+  x235 = x234*x43
+  x236 = x51*x54
+  x237 = x42*x57
+  x238 = x237*x59
+  x239 = x235 + x236*x238
+  x240 = x234*x54
+  x241 = 5*x79
+  x242 = x208*x25
+  x243 = x177*x214*x241*x242
+  x244 = 5*x115/2
+  x245 = x55*x63
+  x246 = x116*x129
+  x247 = x114*x81
+  x248 = x247*x83
+  x249 = x131*x248
+  x250 = x188*x247
+  x252 = k6*x250
+  x253 = x123*x214
+  x255 = e1*x254
+  x256 = x135*x48
+  x257 = 5*x116
+  x258 = x257*x70
+  x259 = 3*x30
+  x260 = 5*x82
+  x261 = 6*x0 + 8
+  x262 = -2*x128 + x260*(4 - x259) + x261
+  x263 = x240*x262 + x256*x258*x33*x78
+  x264 = x16**(-3.0)
+  x266 = x264*x265
+  x267 = x263*x266
+  x268 = x255*x267
+  x270 = x264*x99
+  x271 = x265*x270
+  x272 = x106*x271
+  x273 = x255*x272
+  x274 = x263*x273
+  x276 = 1/e1
+  x277 = x74 - 1
+  x278 = x277*x90
+  x279 = x278*x55
+  x280 = x257*x279
+  x281 = x241*x86
+  x282 = k7*x281 + 18*x0 - 6*x128 + 28
+  x283 = x133*x280 + x135*x282
+  x284 = x154*x283
+  x285 = x276*x284
+  x286 = m3*x96
+  x287 = x286*x82
+  x288 = x135*x70
+  x291 = x290*x91
+  x292 = x102*x291
+  x293 = x131*x55
+  x294 = 5*x24
+  x295 = x294*x48
+  x296 = x257*x288
+  x297 = x103 + x253
+  x298 = 15*x297
+  x299 = 2*x70
+  x300 = x140*x299
+  x301 = 4*x55
+  x302 = a1*x48
+  x303 = x111*x275
+  x304 = x55*x96
+  x305 = x277*x304
+  x306 = x303*x305
+  x307 = x107*x113
+  x308 = x122*x282
+  x309 = 10*x176
+  x311 = x276*x97
+  x312 = x154*x311*x95
+  x313 = x217*x97
+  x314 = x284*x313
+  x315 = x254*x272
+  x316 = x254*x83
+  x317 = x0*x269
+  x318 = x42*x60
+  x319 = x318*x70
+  x320 = x291*x302
+  x321 = x124 + x171
+  x322 = 5*x212
+  x323 = x112*x55
+  x324 = 5 - x69
+  x325 = x318*x57*x59
+  x326 = 5*x225
+  x327 = (x212*x225*(x10*(x184 - x186 - x187) + x183) + x212*x298 - 15*x30 +
+    2*x324*(x71 - 2.5) + 26)
+  x328 = k8*x124*x208*x297*x78
+  x329 = x27*x316
+  x330 = 1/x92
+  x331 = x214*x3
+  x332 = x27*x81
+  x333 = 7.5 - 1.875*x30
+  x334 = 2*x135
+  x335 = x155*x313
+  x336 = x133*x257
+  x337 = x278*x336
+  x338 = x50 + x66
+  x339 = x276*x335
+  x340 = x133*x258
+  x341 = k9*x16**(-4.0)
+  x342 = x15*x255
+  x343 = x263*x342
+  x345 = x164*x24
+  x346 = k10*x270
+  x347 = 10*x70
+  x348 = 5*x209
+  x349 = x142*(k13 + 15*x212 + x226)
+  x350 = x106*x266
+  x351 = k14*x34
+  x352 = x48*x96
+  x353 = x352*x55
+  x354 = x104*x6
+  x355 = x123*x213*x216*x354
+  x357 = 12.5*x0 - 17.5*x196 + 5.0
+  x359 = x116*x236
+  x360 = x133*x359
+  x361 = x235 + x360
+  x362 = x129*x361
+  x363 = x236*x90
+  x364 = x236*x82
+  x365 = x364*x96
+  x366 = x260*x90
+  x367 = x129*x66
+  x369 = x16**(-2.0)
+  x370 = x265*x369
+  x371 = x370*x99
+  x372 = x368*x371
+  x373 = e1*x372
+  x374 = x166*x359
+  x375 = 2*x178
+  x376 = x182*x72 + x190
+  x377 = x191*x368
+  x378 = x197*x72
+  x379 = x139*x179 + x224
+  x380 = e2*x265
+  x381 = 15*e1/256
+  x382 = x191*x381
+  x384 = k15*x202
+  x385 = 4*x15 + 1
+  x386 = x385/e2
+  x387 = x3*x386
+  x389 = x179*x94
+  x390 = x388 + x389
+  x391 = e2*x390
+  x393 = x391*x392
+  x394 = x105*x393
+  x395 = x130*x387 + x394*x70
+  x397 = x395*x396
+  x398 = x384*x397
+  x399 = x271*x395
+  x400 = x135*x254
+  x401 = x399*x400
+  x402 = x211*x94
+  x403 = 5*x1
+  x404 = x31*x386
+  x405 = x403*x404
+  x406 = x388 + x402
+  x407 = x261 + x403*(x259 - 4) - 2*x73
+  x408 = x406*x407
+  x409 = e2*x408 - x402*x405
+  x410 = x194*x409
+  x411 = x391*x8
+  x414 = x332*x413
+  x415 = x332*x94
+  x416 = x392*x83
+  x417 = e2*x114
+  x418 = x254*x288
+  x419 = k16*x28*x404
+  x420 = x16**(-2)
+  x421 = x1*x420
+  x422 = k17*x386
+  x423 = k21*x297*x422
+  x424 = x402*x404
+  x425 = e2*x406
+  x426 = x1*x24
+  x428 = x28*x94
+  x429 = e2*x407
+  x430 = x194*x56
+  x431 = x254*x430
+  x432 = x202*x56
+  x433 = x410*x42
+  x434 = x240*x254
+  x435 = 4*x387
+  x436 = x23*x420
+  x437 = x380*x395
+  x438 = x15*x347
+  x440 = 1/x15
+  x441 = x130*x385
+  x442 = x105*x40
+  x443 = x390*x442*x70
+  x444 = x31*x385
+  x446 = 2*x15
+  x447 = x104*x329
+  return ([[0, 0, 0, 0, 0, 0], [x151*x156*(-a1*(x101*x90*x91*x98 -
+    x102*x108*x111*x113 + x104*x106*x131*x137*x138 + x114*x115*x118 -
+    x120*x121*x122 - x130*x47*(x1*x119 - x126) + x141*x146*x67) + k22*x77),
+    e1*x193*x194*x97*(-x121*x135 + x129*x160 + x157*x158 -
+    x82*(k23*x122*x174*(x171 + x173) + k24*x117*x178*(-x161*x172 + x171) +
+    k25*x108*x161*x176*x177 + x101*x163*x165 + x106*x170*x180*x63*x83 +
+    x118*x163*x166 - x160*(x127*x182 + x190) + x167*x170)),
+    -x198*x200*(x127*x159*x197 + 35*x163*x169*x196/4 - 35*x174*(-x157 + x66)/8
+    - x178*(-x134 + x53)/2 - 5*x195*x82/4),
+    x228*x230*(x201*x227*(k26*x209*x215*x23*x46 - 4*x112*x142*x226*(x50 - x66)
+    + 20*x206*x207 + x207*x216*x49 + 70*x213*x223*x60*x63 + x221*x65 -
+    x222*x45*x76) + x201*x77 + 75.0*x203*x77), x193*x198*(x121*x239 -
+    x130*(-x233 + x240) + x158*x233), H*x156*x200*x33*(k27*x136*x249 +
+    35*x116*x245*x90/4 - x117*x244 - x243*x45 - x246*x45 - x252*x67)],
+    [x151*(k28*x285*x287 + x268*x269*(x253 + x3) -
+    x273*x302*(x114*x120*x188*x293*x295 - x114*x296 + x145*x301*(x298*x82 -
+    x300) - x288*x292) - 6*x274 -
+    2*x312*(x103*x144*x256*(-x142*x299*(x10*(1.875*x11 - 1.875*x14 - 1.875*x21)
+    + x310) + x281 + x3*x309) - x114*x280 - x120*x308 - x279*x292 +
+    x306*x307)), x193*(x0*x315*(-x225*x321*x322*x323 - x301*x327 +
+    x319*x320*x94 + 10*x324*x325 + x325*x326) - x263*x315 +
+    x267*x316*x317*(x105 + x3) - x314 - x335*(k30*x173*x280 + 30*x134*x90 -
+    x279*x320*x97 - x282*x321*x58 - x305*x328 + x334*(x182*x333 - x189*(k29 +
+    x85*(-3.75*x11 + x185*x310 + 3.75*x21)) + x241*x330*x331*x332 + x309*x329 +
+    18)) + x314*x82/x0), -x193*(x273*(x137*x232 + x235*x262 - 56*x245*x72 -
+    x338*x340) + x339*(-28*x136*x333 - x282*x338 + x337*x45)),
+    x228*(k31*x102*x285 + k31*x155*x227*x311*(-x221*x282 - x223*x334*(k38 +
+    x322 - x70*(k37 + x211*x310)) - x277*x353*x355 + x278*x348*x353*x78 -
+    x279*x286*x351) + k33*x106*x341*x343 - 150.0*x203*x230*x276*x283 - 15*x274
+    + 15*x342*x350*(-x112*x301*x349 + x206*x318*x347 - x218*x219*x323*x326 +
+    x319*x348*x49) - x343*x346*(k32*x85 + x103*x345 + x105*x345)),
+    -x193*(x273*(-x239*x340 + x262*x66) + x339*(x236*x337 - x239*x282)),
+    15*H*x150*(k39*x312*(-x242*x306*x85 + x249*x256*(-37.5*x0 + 52.5*x196 -
+    5.0) - x280 - x308) + x172*x268 - x255*x302*x350*(k40*x250*x293 +
+    k41*x247*x55*(-x357*x83 + 30) - x296))/256], [-15*x149*x373*(30*x115*x360 +
+    x302*(-x114*x359*x366 - x116*x120*x367 - 4*x140*x146*x361 - x291*x363*x98 +
+    x303*x307*x365) + 12*x362)/512, 15*x371*x377*(x0*(x165*x290*x363 +
+    x237*x321*x367 + x328*x365 - x336*x363 - 2*x361*x376) + x163*x260*x374 -
+    x375*(x235 - x374))/256, x199*x373*(-5*x115*x233/4 + x129*(x231*x238 +
+    x240)/2 + x361*x378), -e1*x377*x380*(60.0*x270*(x360*x366 + 2*x362) +
+    15*x369*(x209*x260*x352*x363*x78 - x222*x367 - x248*x299*x361*x379 -
+    x287*x351*x363 - x352*x355*x364))/256, -x372*x382*(x195*x260 + x375*(x168 +
+    x53)), H*e1*k42*x199*x370*(x236*x243 + x236*x246 + x244*x359 + x252*x361)],
+    [x149*x381*(a1*k46*x431*(k45*x112*x211*x425*(x1*x298 + x300) + x1**2*x419 -
+    x112*x23*x421*x423 - x112*x260*x424 + x429*(k44*x426 + x126*x428 +
+    x412*x82*x9)) + a1*x271*x418*(k28*x411 + k47*x141*x211*x386*x8 -
+    x416*x417*(x114*x415 + x412*x8 + x414*x82) - x393*x78*x84/x148)/4 +
+    k43*x410*x56 + k48*x120*x302*x304*x398 + 3*x401/2),
+    x192*(k52*x0*x321*x397*x432 + x0*x271*x400*(k28*x188*x391 +
+    k50*x188*x417*(a1*x414 + x172*x388 + x173*x415) + k51*x105*x181*x391 -
+    x330*x354*x393*x70 + x376*x435) - x317*x431*(k49*x424 - x12*x419 +
+    x327*x358*x425 + x33*x423*x436 + x429*(a1*x24*x427 + x124*x428 + x412*x7))
+    + x401 - x433*x434), x199*x255*(-7*x136*x271*(-x394 + x435*x72)/4 +
+    x194*x304*x378*x391 - x338*x399/8 - x410*x46/4),
+    x228*x255*(e2*k59*x409*x432 + x135*x341*x437 + x135*x346*(k55*x129 +
+    k56*x440*x441 + k57*x390*x438*x85 + k58*x105*x379*x385*x70*x81 -
+    x138*x438*x442*(x35 + x389) + x15*x295*x443 + x3*x345*x441 + x356*x443) -
+    15*x219*x432*x437 - 30*x430*(k53*x426*x444 + k54*x22*x421*x444 +
+    x214*x349*x406*x446 + x215*x385*x436*x445 + x24*x407*x446*(x35 + x402) -
+    40*x32*x402 + x402*x403*x440*x444 + x408)), -x192*x255*(x239*x399 +
+    x433*x66), H*x382*(k30*x384*x42*x434*(k60*x405 + x214*x29*x422 +
+    x22*x331*x425*(x357*x7 + 30) + x429*x94) + x266*x33*x418*(e2*x294*x447 +
+    5.0*x24*x386*x447 - x411*x416) - x353*x398)], [0, 0, 0, 0, 0, 0]])
+
+def jac_hexadecapole_constants(m1, m2, m3, a2, c):
+  '''The constants used by jac_hexadecapole.'''
+  x7 = m1**2
+  x8 = m2**2
+  x9 = 1/(x7*x8)
+  x12 = m3**2
+  x13 = 1/x12
+  x14 = m1 + m2
+  x15 = 1/x14
+  x16 = 1/a2
+  x17 = m3 + x14
+  x18 = x16*x17
+  x19 = x15*x18
+  x20 = x13*x19
+  x26 = x7*x8
+  x27 = x15*x26
+  x29 = x14**2
+  x30 = x12*x29
+  x31 = a2*x30/x17
+  x55 = 32*x15
+  x56 = x13*x18*x55
+  x57 = 1/x29
+  x58 = x17**2*x57/(a2**2*m3**4)
+  x59 = 7*x58
+  x64 = 1/(m1**4*m2**4)
+  k0 = -x56
+  x76 = 1/m3
+  x78 = 1/m2
+  x79 = 1/m1
+  x80 = x78*x79
+  x85 = sqrt(x14)
+  x86 = 1/x85
+  x87 = sqrt(x17)
+  x88 = sqrt(a2)
+  x89 = 1/x88
+  x90 = x87*x89
+  x91 = x86*x90
+  x103 = 14*x76
+  x127 = 2*x15
+  x146 = x18*x57
+  x147 = 14*x13
+  x152 = m1*m2
+  x153 = x127*x152
+  x170 = 2*x152
+  x171 = x14**(3/2)
+  x172 = 1/x171
+  x173 = x172*x90
+  x174 = x170*x173
+  x181 = x19*x76
+  x198 = a2**(-5)
+  x200 = -x152 + x7 + x8
+  x201 = x14**(-5/2)
+  x202 = x200*x201
+  k1 = 7*x20*x64
+  x226 = x146*x76
+  x263 = 2*m1
+  x264 = 2*m2
+  x265 = x263 + x264
+  x270 = 32*m1
+  x271 = 32*m2
+  k2 = x270 + x271
+  x281 = m3*x88
+  x282 = 1/x87
+  x283 = x171*x282
+  x284 = x281*x283
+  x285 = 2*x284
+  x286 = x76*x91
+  x347 = 35*x58
+  x370 = m1**3
+  x371 = m2**3
+  x372 = x370 + x371
+  x373 = x14*x372
+  x378 = x200*x89
+  x380 = m2*x79
+  x381 = x17*x86
+  x382 = x380*x381
+  x388 = x381*x80
+  k3 = -x388
+  k4 = -x382
+  x401 = m3**(-3)
+  x402 = x17**(3/2)/a2**(3/2)
+  x403 = x172*x402
+  x404 = x401*x403
+  x405 = 112*x404
+  x407 = 1/(x370*x371)
+  x488 = 28*x76
+  x510 = 24*x15
+  x520 = 56*x76
+  x532 = 2*x373
+  x534 = x17*x172
+  x535 = x263*x371*x534
+  x538 = x170*x534
+  k5 = -x538
+  x577 = x152*x173
+  x599 = x201*x402
+  x600 = x599*x80
+  x621 = x13*x403
+  k6 = x14**(-9/2)
+  k7 = 2*x226
+  x723 = x13*x146
+  k8 = -x488
+  k9 = m1*x78 + x380 + 2
+  k10 = k9*x200
+  x816 = 24*m1
+  x817 = 24*m2
+  x830 = x76*x85*x90
+  x833 = 192*x80
+  k11 = x404*x407
+  x914 = x76*x80
+  k12 = -x103
+  x948 = x146*x520
+  x949 = x19*x488
+  x950 = 21*x621
+  x953 = a2**(-11/2)
+  x954 = x200*x87
+  k13 = x14**(-4)
+  k14 = k13*x953*x954
+  x994 = x152*x17*x372
+  x1013 = a2*x954
+  k15 = x127*x8
+  x1021 = m1*x76
+  k16 = x14**(-5)
+  x1058 = x88*x954
+  k17 = 2*a2
+  k18 = -x510
+  k19 = -x55
+  k20 = a2**(-13/2)
+  x1088 = x281*x87
+  x1089 = 2*x1088
+  k21 = x281*x29
+  k22 = -x816
+  k23 = -x817
+  k24 = k22 + k23
+  k25 = -x270
+  k26 = -x271
+  k27 = k25 + k26
+  x1105 = x284*x80
+  k28 = -x146*x147
+  k29 = -315*x202/65536
+  k30 = -x535
+  k31 = -x532
+  k32 = -x264
+  k33 = -x170
+  k34 = x816 + x817
+  k35 = -x833
+  k36 = -294*x76
+  k37 = -x282*x378
+  k38 = x12*x283*x88/4
+  k39 = -x949
+  k40 = -x948
+  k41 = -8*x577
+  k42 = -x76
+  k43 = 42*x830
+  k44 = -x404*x9
+  k45 = 45*x76/4096
+  k46 = -a2
+  k47 = -5*x994
+  k48 = a2*x76
+  k49 = -m1
+  k50 = -x153
+  k51 = -x1021
+  k52 = m1*x88
+  k53 = m2*x76 + x1021 + 1
+  k54 = 4*k53*x1058*x26*x86
+  k55 = -x80
+  k56 = -4*x1088
+  k57 = x30*x88
+  k58 = -x1089
+  k59 = -x1089*x8
+  k60 = -x200
+  k61 = x17*x372
+  k62 = m2*(x76 + x78) + x1021
+  k63 = 2*k62*x1058
+  return ((m2, m3, a2, x7, x8, x9, x13, x14, x16, x18, x19, x20, x27, x31, x55,
+    x59, x64, k0, x76, x79, x80, x85, x89, x90, x91, x103, x127, x146, x147,
+    x152, x153, x170, x174, x181, x198, x202, k1, x226, x264, x265, k2, x281,
+    x282, x284, x285, x286, x347, x373, x378, x381, x382, x388, k3, k4, x401,
+    x403, x404, x405, x407, x488, x510, x520, x532, x535, x538, k5, x577, x599,
+    x600, x621, k6, k7, x723, k8, k10, x830, x833, k11, x914, k12, x949, x950,
+    x953, x954, k14, x994, x1013, k15, x1021, k16, k17, k18, k19, k20, k21,
+    k24, k27, x1105, k28, k29, k30, k31, k32, k33, k34, k35, k36, k37, k38,
+    k39, k40, k41, k42, k43, k44, k45, k46, k47, k48, k49, k50, k51, k52, k54,
+    k55, k56, k57, k58, k59, k60, k61, k63))
+
+def jac_hexadecapole(y, k):
+  '''The Jacobian of the hexadecapole terms of the EOMs.
+
+  k is returned by jac_hexadecapole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, a2, x7, x8, x9, x13, x14, x16, x18, x19, x20, x27, x31, x55,
+    x59, x64, k0, x76, x79, x80, x85, x89, x90, x91, x103, x127, x146,
+    x147, x152, x153, x170, x174, x181, x198, x202, k1, x226, x264, x265,
+    k2, x281, x282, x284, x285, x286, x347, x373, x378, x381, x382, x388,
+    k3, k4, x401, x403, x404, x405, x407, x488, x510, x520, x532, x535,
+    x538, k5, x577, x599, x600, x621, k6, k7, x723, k8, k10, x830, x833,
+    k11, x914, k12, x949, x950, x953, x954, k14, x994, x1013, k15, x1021,
+    k16, k17, k18, k19, k20, k21, k24, k27, x1105, k28, k29, k30, k31, k32,
+    k33, k34, k35, k36, k37, k38, k39, k40, k41, k42, k43, k44, k45, k46,
+    k47, k48, k49, k50, k51, k52, k54, k55, k56, k57, k58, k59, k60, k61,
+    k63) = k
+  x0 = e2**2
+  x1 = x0 - 1
+  x2 = 1/sqrt(-x1**7)
+  x3 = 3*x0 + 2
+  x4 = 1 - x0
+  x5 = 1/x4
+  x6 = 1/a1
+  x10 = x6*x9
+  x11 = x10*x5
+  x21 = e1**2
+  x22 = 1 - x21
+  x23 = 1/x22
+  x24 = H**2
+  x25 = a1*x22
+  x28 = x25*x27
+  x32 = x31*x4
+  x33 = x24 - x28 - x32
+  x34 = x33**2
+  x35 = x23*x34
+  x36 = x20*x35
+  x37 = x11*x36
+  x38 = 4 - x37
+  x39 = x38**2
+  x40 = 4*g1
+  x41 = sin(x40)
+  x42 = x39*x41
+  x43 = x3*x42
+  x44 = 21*x21
+  x45 = 2*g1
+  x46 = sin(x45)
+  x47 = x21 - 1
+  x48 = 1/x47
+  x49 = 1/x1
+  x50 = -x24 + x28 + x32
+  x51 = x50**2
+  x52 = x10*x51
+  x53 = x49*x52
+  x54 = x48*x53
+  x60 = x1**(-2)
+  x61 = x47**(-2)
+  x62 = a1**2
+  x63 = 1/x62
+  x65 = x63*x64
+  x66 = x61*x65
+  x67 = x50**4*x60*x66
+  x68 = k0*x54 + x59*x67 + 16
+  x69 = x3*x68
+  x70 = x46*x69
+  x71 = x21 + 2
+  x72 = 2*x71
+  x73 = -g2
+  x74 = 2*x45 + 2*x73
+  x75 = sin(x74)
+  x77 = x33*x76
+  x81 = sqrt(x4)
+  x82 = 1/x81
+  x83 = 1/sqrt(x25)
+  x84 = x82*x83
+  x92 = x84*x91
+  x93 = x80*x92
+  x94 = x77*x93
+  x95 = x94 - 2
+  x96 = x94 + 2
+  x97 = x96**3
+  x98 = x95*x97
+  x99 = x75*x98
+  x100 = 2*g1 + 2*x73
+  x101 = sin(x100)
+  x102 = x96**2
+  x104 = x103*x33*x93
+  x105 = 7*x37
+  x106 = x105 + 4
+  x107 = -x104 + x106
+  x108 = x102*x107
+  x109 = x101*x108
+  x110 = x95**2
+  x111 = 2*g2 + 2*x45
+  x112 = sin(x111)
+  x113 = x37 - 4
+  x114 = 21*x113
+  x115 = x112*x114
+  x116 = x115*x21
+  x117 = -x116
+  x118 = x104 + x106
+  x119 = 2*g1 + 2*g2
+  x120 = sin(x119)
+  x121 = x118*x120
+  x122 = 2*x121
+  x123 = x117 + x122*x71
+  x124 = x110*x123
+  x125 = -x0*(x109*x72 + x124 - x44*x99) - x43*x44 + x70*x72
+  x126 = 7*x125
+  x128 = x23*x33
+  x129 = x128*x6
+  x130 = x129*x9
+  x131 = x127 + x130
+  x132 = x33*x5
+  x133 = x132*x76
+  x134 = x19*x6
+  x135 = x133*x134
+  x136 = x131*x135
+  x137 = x21*x3
+  x138 = x137*x38
+  x139 = 84*x41
+  x140 = x138*x139
+  x141 = x48*x50
+  x142 = x10*x141
+  x143 = x50**3
+  x144 = x20*x49
+  x145 = 7*x144
+  x148 = x50*x76
+  x149 = x46*x71
+  x150 = x149*x3
+  x151 = 8*x150
+  x154 = x153*x22
+  x155 = x128*x80
+  x156 = x155*x6
+  x157 = x156*x47
+  x158 = -x154 + x157
+  x159 = x44*x75*x97
+  x160 = x159*x92
+  x161 = x102*x75
+  x162 = 63*x161*x21
+  x163 = x92*x95
+  x164 = x162*x163
+  x165 = x101*x71
+  x166 = 4*x165
+  x167 = x107*x96
+  x168 = x167*x92
+  x169 = x166*x168
+  x175 = x174*x84
+  x176 = x175*x22
+  x177 = x157*x92
+  x178 = 2*x6
+  x179 = x133*x146
+  x180 = x178*x179
+  x182 = x5*x63
+  x183 = x182*x35*x9
+  x184 = x181*x183
+  x185 = -x180 - x184
+  x186 = x102*(x176 - x177 + x185)
+  x187 = 28*x165
+  x188 = 2*x123
+  x189 = x163*x188
+  x190 = 3*x21
+  x191 = x112*x190
+  x192 = x136*x191
+  x193 = -x176 + x177
+  x194 = x185 + x193
+  x195 = x120*x71
+  x196 = 2*x195
+  x197 = 14*x110
+  x199 = a1**(5/2)*x198
+  x203 = sqrt(x22)
+  x204 = e1*x203
+  x205 = 1/x203
+  x206 = x127 + x142
+  x207 = x141*x144*x206
+  x208 = 16*x130
+  x209 = x11*x147*x35
+  x210 = x146*x209
+  x211 = x22**(-2)
+  x212 = x33**3
+  x213 = k1*x182*x211*x212
+  x214 = -x210 - x213
+  x215 = x208 + x214 + x55
+  x216 = x128*x20*x5
+  x217 = x215*x216
+  x218 = 42*x99
+  x219 = a1*x153
+  x220 = x155 + x219
+  x221 = x220*x76
+  x222 = 4*x109
+  x223 = a1*x175
+  x224 = x155*x92
+  x225 = 2*x5
+  x227 = x128*x225*x226
+  x228 = x11*x181*x211*x34
+  x229 = x227 + x228
+  x230 = -x223 - x224 + x229
+  x231 = x102*x187
+  x232 = x131*x216
+  x233 = x112*x232*x44
+  x234 = x223 + x224
+  x235 = x229 + x234
+  x236 = x195*x235
+  x237 = m3*x2
+  x238 = a1**(7/2)*x198
+  x239 = x202*x238
+  x240 = 315*x239/32768
+  x241 = cos(x40)
+  x242 = x241*x39
+  x243 = x137*x242
+  x244 = cos(x45)
+  x245 = x244*x69
+  x246 = cos(x74)
+  x247 = x21*x246
+  x248 = 21*x247
+  x249 = cos(x100)
+  x250 = x108*x249
+  x251 = cos(x111)
+  x252 = x21*x251
+  x253 = x114*x252
+  x254 = -x253
+  x255 = cos(x119)
+  x256 = x118*x255
+  x257 = x256*x71
+  x258 = e1*x237
+  x259 = x203*x258
+  x260 = x239*x259
+  x261 = 126*x21
+  x262 = 12*x149
+  x266 = x144*x50 + x265
+  x267 = x142*x49
+  x268 = x266*x267
+  x269 = x138*x268
+  x272 = x132*x20
+  x273 = 16*x272
+  x274 = x18*x209
+  x275 = x4**(-2)
+  x276 = x275*x59
+  x277 = x10*x212*x23*x276
+  x278 = -x274 - x277
+  x279 = x130*x5
+  x280 = x279*(k2 + x273 + x278)
+  x287 = x132*x286 + x285
+  x288 = x287*x84
+  x289 = x288*x95
+  x290 = x285*x84
+  x291 = x33*x83
+  x292 = x4**(-3/2)
+  x293 = x286*x292
+  x294 = x291*x293
+  x295 = x14*x156*x225
+  x296 = x275*x36
+  x297 = x6*x80
+  x298 = x296*x297
+  x299 = x295 + x298
+  x300 = -x290 - x294 + x299
+  x301 = x167*x288
+  x302 = x265 + x272
+  x303 = x156*x5
+  x304 = x191*x303
+  x305 = x302*x304
+  x306 = x290 + x294
+  x307 = x299 + x306
+  x308 = x0*x80
+  x309 = 2 - x94
+  x310 = a1*x47
+  x311 = -x310
+  x312 = 1/sqrt(x311)
+  x313 = x312*x82
+  x314 = x313*x91
+  x315 = x314*x80
+  x316 = x148*x315
+  x317 = 2 - x316
+  x318 = x317**3
+  x319 = x309*x318
+  x320 = x315*x50
+  x321 = x103*x320
+  x322 = x48*x52
+  x323 = x145*x322 + 4
+  x324 = x321 + x323
+  x325 = x317**2
+  x326 = x249*x325
+  x327 = x324*x326
+  x328 = x309**2
+  x329 = (315*x248*x319/16384 + 315*x327*x72/16384 + 315*x328*(x253 -
+    2*x257)/16384)
+  x330 = x48*x80
+  x331 = x330*x50
+  x332 = x331*x49
+  x333 = x332*x6
+  x334 = x181*x333
+  x335 = x138*x334
+  x336 = -x105
+  x337 = x336 + 16
+  x338 = x181*x303
+  x339 = x337*x338
+  x340 = x338 - x92
+  x341 = x181*x304
+  x342 = x338 + x92
+  x343 = x2*x80
+  x344 = x113**2
+  x345 = x241*x344
+  x346 = x137*x345
+  x348 = x211*x33**4*x65
+  x349 = x275*x347*x348 - 120*x37 + 48
+  x350 = x190 + 4
+  x351 = x3*x350
+  x352 = x349*x351
+  x353 = k0*x11*x35 + x276*x348 + 16
+  x354 = 2*g2
+  x355 = cos(x354)
+  x356 = 10*x355
+  x357 = x353*x356
+  x358 = x0*x350
+  x359 = x21 + 1
+  x360 = 28*x359
+  x361 = x3*x353
+  x362 = x244*x361
+  x363 = x102*x246 + x110*x251
+  x364 = x113*x363
+  x365 = x0*x21
+  x366 = 147*x365
+  x367 = x110*x256 + x250
+  x368 = x0*x360
+  x369 = -147*x346 - x352 + x357*x358 + x360*x362 + x364*x366 - x367*x368
+  x374 = x237*x373*x47
+  x375 = x369*x374
+  x376 = x1**(-4)
+  x377 = x282*x376
+  x379 = x377*x378
+  x383 = x312*x50
+  x384 = sqrt(a1)
+  x385 = x203*x85
+  x386 = x384*x385
+  x387 = x264*x386
+  x389 = k3*x383
+  x390 = m2*x386 + m3*x386
+  x391 = k4*x383 + x170*(x389 + x390) + x7*(x387 + x389)
+  x392 = x21*x314
+  x393 = 672*x392
+  x394 = e2**3
+  x395 = x249*x394
+  x396 = x393*x395
+  x397 = x148*x80
+  x398 = x396*x397
+  x399 = 192*x314
+  x400 = x397*x399
+  x406 = x311**(-3/2)
+  x408 = x292*x407
+  x409 = x406*x408
+  x410 = x143*x409
+  x411 = x405*x410
+  x412 = 960*x392
+  x413 = x397*x412
+  x414 = e1**4
+  x415 = x314*x414
+  x416 = 360*x415
+  x417 = x397*x416
+  x418 = 288*x308
+  x419 = x148*x314
+  x420 = x418*x419
+  x421 = x404*x410
+  x422 = 168*x0
+  x423 = x421*x422
+  x424 = 210*x414
+  x425 = x421*x424
+  x426 = 560*x21
+  x427 = x421*x426
+  x428 = x148*x308
+  x429 = x392*x428
+  x430 = 1440*x429
+  x431 = x415*x428
+  x432 = 540*x431
+  x433 = x0*x355
+  x434 = x411*x433
+  x435 = x308*x419
+  x436 = 256*x355
+  x437 = x435*x436
+  x438 = x0*x414
+  x439 = 315*x438
+  x440 = x421*x439
+  x441 = 840*x365
+  x442 = x421*x441
+  x443 = x255*x428
+  x444 = x393*x443
+  x445 = x427*x433
+  x446 = 336*x415
+  x447 = x443*x446
+  x448 = x249*x428
+  x449 = x446*x448
+  x450 = x425*x433
+  x451 = 147*x414
+  x452 = x421*x451
+  x453 = x0*x251*x452
+  x454 = x246*x451
+  x455 = x0*x421
+  x456 = x454*x455
+  x457 = x0*x255
+  x458 = 196*x414
+  x459 = x421*x458
+  x460 = x457*x459
+  x461 = x0*x249
+  x462 = x459*x461
+  x463 = 392*x421
+  x464 = x21*x463
+  x465 = x457*x464
+  x466 = x461*x464
+  x467 = 480*x355
+  x468 = x431*x467
+  x469 = 1280*x355
+  x470 = x429*x469
+  x471 = 588*x21
+  x472 = x144*x322
+  x473 = x471*x472
+  x474 = x461*x473
+  x475 = 441*x438
+  x476 = x472*x475
+  x477 = x251*x476
+  x478 = 294*x414
+  x479 = x472*x478
+  x480 = x461*x479
+  x481 = x241*x3
+  x482 = x451*x481
+  x483 = x38*x482
+  x484 = x316*x483
+  x485 = x457*x479
+  x486 = x246*x476
+  x487 = x457*x473
+  x489 = x137*x244
+  x490 = x71*x80
+  x491 = x314*x337
+  x492 = x490*x491*x50
+  x493 = x488*x489*x492
+  x494 = 588*x414
+  x495 = x0*x494
+  x496 = x246*x495
+  x497 = x426*x457
+  x498 = 280*x414
+  x499 = x457*x498
+  x500 = x461*x498
+  x501 = x426*x461
+  x502 = x251*x495
+  x503 = -x496 - x497 - x499 + x500 + x501 + x502
+  x504 = (-x400 + x411 - x413 - x417 - x420 + x423 + x425 + x427 - x430 - x432
+    - x434 + x437 + x440 + x442 - x444 - x445 - x447 - x449 - x450 - x453 -
+    x456 + x460 + x462 + x465 + x466 + x468 + x470 - x474 - x477 - x480 - x484
+    + x485 + x486 + x487 + x493 + x503)
+  x505 = -x398 + x504
+  x506 = x391*x505
+  x507 = 294*x241
+  x508 = x113*x136
+  x509 = 10*x351
+  x511 = 12*x130
+  x512 = x214 + x510 + x511
+  x513 = x135*x512
+  x514 = x355*x358
+  x515 = 20*x514
+  x516 = x135*x215
+  x517 = x132*x6
+  x518 = x19*x517
+  x519 = x215*x518
+  x521 = x244*x359
+  x522 = x3*x521
+  x523 = x520*x522
+  x524 = x246*x96 + x251*x95
+  x525 = x113*x366
+  x526 = x158*x92
+  x527 = x163*x256
+  x528 = x168*x249
+  x529 = 7*x110*x255
+  x530 = 7*x249
+  x531 = x158*x527 + x158*x528 + x186*x530 + x194*x529
+  x533 = x22*x83
+  x536 = 1/x384
+  x537 = x385*x536
+  x539 = x381*x83
+  x540 = k5*x533 + x157*x539
+  x541 = x21*x94
+  x542 = 672*x395
+  x543 = x25**(-3/2)
+  x544 = x408*x543
+  x545 = x212*x544
+  x546 = x405*x545
+  x547 = x404*x545
+  x548 = x426*x547
+  x549 = x424*x547
+  x550 = x77*x92
+  x551 = 360*x414
+  x552 = 960*x21
+  x553 = x308*x550
+  x554 = 540*x414
+  x555 = x21*x308
+  x556 = 1440*x555
+  x557 = x550*x555
+  x558 = 480*x414
+  x559 = x355*x558
+  x560 = x21*x547
+  x561 = 392*x560
+  x562 = x458*x547
+  x563 = x0*x547
+  x564 = x255*x414
+  x565 = 336*x553
+  x566 = x249*x414
+  x567 = 672*x255
+  x568 = x37*x461
+  x569 = x37*x475
+  x570 = x113*x94
+  x571 = x37*x457
+  x572 = x105 - 16
+  x573 = x489*x490
+  x574 = x488*x572*x573
+  x575 = (x246*x569 + x251*x451*x563 - x251*x569 + x33*x574*x92 + x418*x550 -
+    x422*x547 + x433*x546 + x433*x548 + x433*x549 - x436*x553 - x439*x547 -
+    x441*x547 + x454*x563 - x457*x561 - x457*x562 - x461*x561 - x461*x562 -
+    x469*x557 - x471*x568 + x471*x571 - x478*x568 + x478*x571 - x482*x570 +
+    x503 - x546 - x548 - x549 + x550*x556 + x551*x94 + x552*x94 + x553*x554 -
+    x553*x559 + x557*x567 + x564*x565 + x565*x566 + 192*x94)
+  x576 = x291*x388
+  x578 = x22*x577
+  x579 = x578*x84
+  x580 = 1344*x21
+  x581 = x395*x580
+  x582 = x21*x542
+  x583 = 384*x84
+  x584 = 1920*x21
+  x585 = 720*x414
+  x586 = x0*x579
+  x587 = 2880*x365
+  x588 = 2352*x21
+  x589 = x179*x6
+  x590 = x457*x589
+  x591 = 1764*x414
+  x592 = x246*x591
+  x593 = x0*x589
+  x594 = 1176*x414
+  x595 = 1080*x414
+  x596 = 512*x355
+  x597 = 672*x34
+  x598 = x13*x292
+  x601 = x598*x600
+  x602 = x22*x543
+  x603 = x601*x602
+  x604 = x461*x589
+  x605 = x251*x591
+  x606 = x457*x579
+  x607 = 672*x414
+  x608 = x461*x579
+  x609 = x355*x414
+  x610 = 960*x609
+  x611 = x308*x599
+  x612 = 1008*x611
+  x613 = x598*x602
+  x614 = x34*x613
+  x615 = 1260*x414
+  x616 = x34*x603
+  x617 = x355*x365
+  x618 = 2560*x617
+  x619 = 3360*x21
+  x620 = x355*x611
+  x622 = x23*x47*x545*x6
+  x623 = x621*x622
+  x624 = 336*x623
+  x625 = x0*x177
+  x626 = x113*x481
+  x627 = x478*x626
+  x628 = x611*x614
+  x629 = 1890*x414
+  x630 = x555*x599
+  x631 = 5040*x630
+  x632 = x614*x630
+  x633 = 3360*x355
+  x634 = 1680*x21
+  x635 = x615*x620
+  x636 = 1176*x21
+  x637 = x184*x636
+  x638 = 882*x246
+  x639 = x184*x438
+  x640 = 882*x251
+  x641 = x414*x628
+  x642 = 630*x414
+  x643 = x623*x642
+  x644 = x184*x495
+  x645 = 504*x0
+  x646 = x489*x71
+  x647 = 56*x572
+  x648 = x594*x628
+  x649 = 1440*x365
+  x650 = 2352*x632
+  x651 = 2520*x365
+  x652 = 1280*x617
+  x653 = 945*x438
+  x654 = x403*x598
+  x655 = x478*x481*x654
+  x656 = x131*x34*x83
+  x657 = x177*x457
+  x658 = 336*x414
+  x659 = x177*x461
+  x660 = 672*x21
+  x661 = x457*x636
+  x662 = x461*x636
+  x663 = x255*x495
+  x664 = x249*x495
+  x665 = 392*x489
+  x666 = x475*x623
+  x667 = 1680*x617
+  x668 = 28*x646
+  x669 = (-x113*x177*x482 - x177*x433*x558 + x177*x551 + x177*x552 +
+    x177*x572*x668 + x177*x649 - x177*x652 + 192*x177 + x246*x666 + x249*x644 +
+    x249*x648 + x249*x650 + x251*x666 - x255*x644 + x255*x648 + x255*x650 +
+    x297*x655*x656 + x433*x624 + x433*x643 - x436*x625 - x457*x637 + x461*x637
+    - x490*x6*x654*x656*x665 + x554*x625 - x578*x583 - x579*x584 - x579*x585 -
+    x579*x587 + x579*x618 + x579*x627 - x579*x646*x647 - x580*x606 - x586*x595
+    + x586*x596 + x586*x610 - 576*x586 - x588*x590 + x588*x604 - x590*x594 -
+    x592*x593 + x593*x605 + x594*x604 + x597*x603 - x597*x613*x620 - x606*x607
+    - x607*x608 + x612*x614 + x614*x631 - x614*x635 + x615*x616 + x616*x619 -
+    x623*x634 - x623*x645 - x623*x651 - x623*x653 - x623*x661 - x623*x662 -
+    x623*x663 - x623*x664 + x623*x667 - x624 + 288*x625 + x628*x629 - x632*x633
+    - x638*x639 - x638*x641 + x639*x640 - x640*x641 - x643 + x657*x658 +
+    x657*x660 + x658*x659)
+  x670 = k6*x205
+  x671 = 1/e1
+  x672 = x205*x85
+  x673 = x384*x672
+  x674 = a1*x538
+  x675 = 441*x242
+  x676 = x347*x67 - 120*x472 + 48
+  x677 = x351*x676
+  x678 = x350*x68
+  x679 = x356*x678
+  x680 = x0*x679
+  x681 = 28*x190 + 28
+  x682 = x38*x481
+  x683 = x246*x325 + x251*x328
+  x684 = x38*x683
+  x685 = x21*x216
+  x686 = 40*x21
+  x687 = x144*x438
+  x688 = 294*x206
+  x689 = x246*x317 - x251*x309
+  x690 = x0*x314
+  x691 = x219 + x331
+  x692 = x691*x76
+  x693 = x38*x478
+  x694 = -x321 + x323
+  x695 = x255*x328
+  x696 = x327 + x694*x695
+  x697 = x255*x309*x694
+  x698 = x314*x697
+  x699 = x317*x324
+  x700 = x249*x699
+  x701 = x314*x700
+  x702 = x141*x49
+  x703 = k7*x702
+  x704 = x53*x61
+  x705 = x181*x704
+  x706 = a1*x313
+  x707 = x314*x331
+  x708 = x174*x706 + x707
+  x709 = 7*x695
+  x710 = 7*x326
+  x711 = x360*x696
+  x712 = x1*x31 + x24 + x27*x310
+  x713 = x312*x712
+  x714 = x388*x713
+  x715 = a1*x76
+  x716 = x313*x577*x715
+  x717 = x331*x76
+  x718 = 1120*x0
+  x719 = x255*x718
+  x720 = x249*x718
+  x721 = 2352*x0
+  x722 = x457*x588
+  x724 = x702*x723
+  x725 = x0*x49
+  x726 = x592*x725
+  x727 = x141*x723
+  x728 = x392*x397
+  x729 = x594*x724
+  x730 = 672*x51
+  x731 = x292*x406
+  x732 = a1*x401*x731
+  x733 = x600*x732
+  x734 = 336*x421
+  x735 = x48*x734
+  x736 = x0*x716
+  x737 = 840*x21
+  x738 = 1680*x421
+  x739 = x605*x725
+  x740 = x461*x588
+  x741 = x51*x733
+  x742 = x21*x738
+  x743 = 1344*x255
+  x744 = x355*x421
+  x745 = x51*x732
+  x746 = x421*x642
+  x747 = x48*x746
+  x748 = x421*x48
+  x749 = x141*x76
+  x750 = x314*x749
+  x751 = 784*x421
+  x752 = x457*x751
+  x753 = x461*x751
+  x754 = 2560*x355
+  x755 = x611*x745
+  x756 = 1344*x249
+  x757 = 1176*x472
+  x758 = x461*x757
+  x759 = 588*x455
+  x760 = x308*x749
+  x761 = x415*x760
+  x762 = x607*x716
+  x763 = x457*x757
+  x764 = x580*x716
+  x765 = x392*x760
+  x766 = x630*x745
+  x767 = 2352*x766
+  x768 = 1764*x0*x472
+  x769 = x594*x755
+  x770 = x52*x61
+  x771 = x144*x770
+  x772 = x687*x770
+  x773 = x337*x489
+  x774 = x481*x693
+  x775 = x446*x760
+  x776 = x475*x748
+  x777 = x393*x760
+  x778 = x414*x755
+  x779 = x337*x646
+  x780 = x414*x481
+  x781 = x330*x51
+  x782 = x313*x404*x49*x781
+  x783 = 392*x646
+  x784 = (k8*x707*x779 + x0*x738 - 588*x138*x241*x316 + x206*x782*x783 -
+    x21*x719 + x21*x720 + x21*x752 + x21*x753 - x21*x758 + x21*x763 +
+    x244*x3*x492*x520 + x246*x776 - x247*x721 - x247*x759 + x247*x768 -
+    x249*x767 - x249*x769 + x249*x775 + x251*x776 + x252*x721 - x252*x759 -
+    x252*x768 - x255*x767 - x255*x769 + x255*x775 + x255*x777 - x308*x436*x750
+    - 1920*x316 + x320*x520*x773 + 1920*x355*x429 + 1260*x365*x421 + x399*x717
+    + x412*x717 + x416*x717 + x418*x750 - 840*x421*x617 + x421*x737 + 1120*x421
+    - x429*x743 - x429*x756 - 2160*x429 + x433*x735 + x433*x747 - x435*x743 +
+    x435*x754 - 2880*x435 - x457*x729 + x457*x762 + x457*x764 + x461*x729 +
+    x461*x762 - x467*x761 - x469*x765 + x48*x617*x738 - x48*x742 +
+    x483*x707*x76 + x584*x716 + x585*x716 + x587*x716 + x595*x736 - x596*x736 -
+    x610*x736 - x612*x745 - x615*x741 - x618*x716 - x619*x741 + x620*x730*x732
+    - x629*x755 - x631*x745 + x633*x766 + x635*x745 - x638*x772 + x638*x778 +
+    x640*x772 + x640*x778 - x645*x748 - x651*x748 - x653*x748 - x661*x748 -
+    x661*x771 - x662*x748 + x662*x771 - x663*x748 - x663*x771 - x664*x748 +
+    x664*x771 - x688*x780*x782 + x716*x774 - 56*x716*x779 + 384*x716 -
+    x718*x744 - x719 + x720 - x722*x724 + x724*x740 - x726*x727 + x727*x739 -
+    1440*x728 - x730*x733 - x735 + 576*x736 - x747 + x752 + x753 - x758 +
+    540*x761 + x763 + 1440*x765)
+  x785 = x379*x391
+  x786 = x238*x670
+  x787 = x344*x41
+  x788 = x137*x787
+  x789 = 2*x359
+  x790 = x110*x112
+  x791 = x161 + x790
+  x792 = x110*x121
+  x793 = x109 + x792
+  x794 = x0*x793
+  x795 = 40*x0
+  x796 = 84*x365
+  x797 = 20*x365
+  x798 = 28*x0
+  x799 = x120*x547
+  x800 = x101*x547
+  x801 = 48*x553
+  x802 = x101*x37
+  x803 = 42*x0
+  x804 = 14*x365
+  x805 = x112*x365
+  x806 = 21*x547
+  x807 = x365*x75
+  x808 = x101*x21
+  x809 = x120*x37
+  x810 = 63*x37
+  x811 = 21*x365
+  x812 = x572*x94
+  x813 = (x101*x795 + x101*x797 + x112*x796 - x114*x137*x41*x94 + 24*x120*x557
+    - x120*x795 - x120*x797 + x120*x801 + 2*x150*x812 + 24*x553*x808 - x75*x796
+    - x798*x799 - x798*x800 - x799*x804 - x800*x804 - x802*x803 - x802*x811 +
+    x803*x809 + x805*x806 - x805*x810 + x806*x807 + x807*x810 + x809*x811)
+  x814 = k10*x312*x376*x505
+  x815 = 147*x21
+  x818 = 12*x272
+  x819 = x38*x815
+  x820 = x286*x5
+  x821 = x313*(x285 - x50*x820)
+  x822 = x14*x332
+  x823 = x178*x822
+  x824 = x20*x60
+  x825 = x6*x781*x824
+  x826 = x293*x383
+  x827 = x285*x313 - x826
+  x828 = x284*x313
+  x829 = x80*x828
+  x831 = x409*x830
+  x832 = x730*x831
+  x834 = 336*x406
+  x835 = x4**(-5/2)
+  x836 = k11*x835
+  x837 = x143*x836
+  x838 = x834*x837
+  x839 = 576*x308
+  x840 = x51*x831
+  x841 = x14*x267
+  x842 = x14*x142
+  x843 = x615*x840
+  x844 = x594*x841
+  x845 = x397*x415
+  x846 = 1008*x0
+  x847 = x80*x826
+  x848 = x308*x828
+  x849 = 224*x355
+  x850 = x406*x837
+  x851 = x642*x850
+  x852 = 2880*x555
+  x853 = 5040*x365
+  x854 = x555*x828
+  x855 = 1890*x438
+  x856 = 1120*x21
+  x857 = 672*x845
+  x858 = x308*x826
+  x859 = 420*x609
+  x860 = x421*x478
+  x861 = x607*x848
+  x862 = x21*x751
+  x863 = x21*x757
+  x864 = x594*x840
+  x865 = x414*x472
+  x866 = 882*x241
+  x867 = x555*x826
+  x868 = x472*x494
+  x869 = x475*x850
+  x870 = 336*x858
+  x871 = x495*x850
+  x872 = x438*x840
+  x873 = x636*x850
+  x874 = 3360*x617
+  x875 = x322*x824
+  x876 = x438*x875
+  x877 = x451*x80
+  x878 = x490*x773
+  x879 = x21*x71
+  x880 = 168*x244*x879
+  x881 = x292*x91
+  x882 = x407*x6
+  x883 = x481*x882
+  x884 = x266*x48*x49*x51
+  x885 = x71*x76
+  x886 = x665*x885
+  x887 = 560*x414
+  x888 = -x246*x594 + x249*x856 + x249*x887 + x251*x594 - x255*x856 - x255*x887
+  x889 = sin(x354)
+  x890 = 672*x316*x808
+  x891 = x397*x446
+  x892 = x414*x75
+  x893 = x120*x472
+  x894 = (x101*x426 + x101*x459 - x101*x479 + x101*x498 - x101*x891 + x112*x452
+    - x112*x494 + 441*x112*x865 + x120*x393*x397 + x120*x426 - x120*x459 -
+    x120*x464 + x120*x498 + x120*x891 - 256*x316*x889 + x411*x889 -
+    147*x421*x892 + x425*x889 + x427*x889 + x463*x808 - x471*x893 -
+    588*x472*x808 + 441*x472*x892 - x478*x893 - x494*x75 - 1280*x728*x889 -
+    480*x845*x889)
+  x895 = 0.00274658203125*x786
+  x896 = x19*x303
+  x897 = x181*x6*x702
+  x898 = x308*x897
+  x899 = x314*x38
+  x900 = x355*x690
+  x901 = x51*x9
+  x902 = x654*x901
+  x903 = x834*x902
+  x904 = x406*x902
+  x905 = x642*x904
+  x906 = x636*x904
+  x907 = x495*x904
+  x908 = x475*x904
+  x909 = 1176*x555*x897
+  x910 = x414*x898
+  x911 = x494*x898
+  x912 = x312*x322
+  x913 = (x246*x908 - x249*x907 + x249*x909 + x249*x911 + x251*x908 - x255*x907
+    - x255*x909 - x255*x911 + x314*x649 - x314*x652 + x393*x457 + x399 + x412 +
+    x416 + x433*x903 + x433*x905 + x446*x457 + x446*x461 - x457*x906 -
+    x461*x906 + x482*x899 - x491*x668 + x554*x690 - x558*x900 - x634*x904 -
+    x638*x910 + x640*x910 - x645*x904 - x651*x904 - x653*x904 - x654*x783*x912
+    + x655*x912 + x667*x904 + 288*x690 - 256*x900 - x903 - x905)
+  x915 = a1**3
+  x916 = x316 + 2
+  x917 = x315*x712
+  x918 = x76*x917 + 2
+  x919 = x918**3
+  x920 = x916*x919
+  x921 = x892*x920
+  x922 = x918**2
+  x923 = k12*x917 + x10*x145*x48*x712**2 + 4
+  x924 = x922*x923
+  x925 = 7*x21
+  x926 = x165*x925
+  x927 = 4*x94
+  x928 = 14*x37
+  x929 = 7*x547
+  x930 = x889*(x927 - x928 - x929 + 8)
+  x931 = 15*x414 + x686 + 8
+  x932 = 2*x931
+  x933 = 4*x121
+  x934 = x71*x933
+  x935 = x116 - x934
+  x936 = x309*x935
+  x937 = x925*x936 + x930*x932
+  x938 = x916*x937
+  x939 = x92*(x154 - x157)
+  x940 = x892*x939
+  x941 = x165*x21
+  x942 = 56*x941
+  x943 = 392*x941
+  x944 = -x927 + x928 + x929 - 8
+  x945 = x889*x932
+  x946 = x117 + x934
+  x947 = x925*x95
+  x951 = 4*x195
+  x952 = 98*x21
+  x955 = k14/x1**3
+  x956 = e2*x152
+  x957 = 147*x919
+  x958 = x219 - x330*x712
+  x959 = x76*x958
+  x960 = x314*x892
+  x961 = x959*x960
+  x962 = 56*x924
+  x963 = x916*x922
+  x964 = 441*x963
+  x965 = x918*x923
+  x966 = x314*x965
+  x967 = x922*x943
+  x968 = x314*x937
+  x969 = 40*x350
+  x970 = x925*x935
+  x971 = x314*x970
+  x972 = 4*x314
+  x973 = a1**4*x955
+  x974 = 45*x973/65536
+  x975 = x956*x973
+  x976 = x152*(x187*x21*x924 + 147*x921 + x938)
+  x977 = x313*(x285 + x712*x820)
+  x978 = x892*x977
+  x979 = 21*x406
+  x980 = x309*x952
+  x981 = x345*x414
+  x982 = x349*x931
+  x983 = x1*x71
+  x984 = x244*x353
+  x985 = x353*x355
+  x986 = x931*x985
+  x987 = x137*x984
+  x988 = x364*x414
+  x989 = x95*x96
+  x990 = x363*x414
+  x991 = x989*x990
+  x992 = x367*x71
+  x993 = x21*x367
+  x995 = (x994*(-70*x0*x986 - 5145*x0*x988 - 4410*x1*x981 - 6*x1*x982 +
+    20*x1*x986 + 5145*x3*x981 + 7*x3*x982 + 980*x365*x992 - 1470*x4*x991 -
+    980*x71*x987 + x737*x983*x984 - 280*x983*x993))
+  x996 = a1*x995
+  x997 = 672*x249
+  x998 = x557*x997 + x575
+  x999 = x281*x81
+  x1000 = 2*x999
+  x1001 = x1000*x8
+  x1002 = x203*x79
+  x1003 = x384*x89
+  x1004 = x1003*x84
+  x1005 = x1002*x1004*x77
+  x1006 = 4*x999
+  x1007 = x203*x80
+  x1008 = x1001 + x152*(x1004*x1007*x33 + x1005 + x1006) + x7*(x1000 + x1005)
+  x1009 = x673*x954
+  x1010 = x1008*x1009
+  x1011 = x1010*x998
+  x1012 = 10*x998
+  x1014 = x22**(3/2)
+  x1015 = x1014*x384
+  x1016 = k15*x1015
+  x1017 = x33*x536
+  x1018 = x1002*x1017
+  x1019 = x205*x47
+  x1020 = x1017*x1019*x79
+  x1022 = x1017*x80
+  x1023 = x1*x241*x591
+  x1024 = 2058*x780
+  x1025 = 12*x1
+  x1026 = x1025*x931
+  x1027 = 336*x244*x983
+  x1028 = x1027*x21
+  x1029 = x3*x931
+  x1030 = x1029*x103
+  x1031 = x355*x931
+  x1032 = x0*x1031*x949
+  x1033 = 8*x1
+  x1034 = x1031*x1033
+  x1035 = 1029*x0
+  x1036 = x1035*x990
+  x1037 = x81*x83
+  x1038 = x1037*x363
+  x1039 = x1038*x95
+  x1040 = x451*x91
+  x1041 = x1039*x1040
+  x1042 = x1038*x96
+  x1043 = x1040*x1042
+  x1044 = x1035*x113
+  x1045 = x414*x524
+  x1046 = x1044*x1045
+  x1047 = 294*x1037*x1045*x989
+  x1048 = x1047*x91
+  x1049 = x531*x71
+  x1050 = 196*x365
+  x1051 = 56*x1
+  x1052 = x1051*x21
+  x1053 = a2*x715
+  x1054 = 10*x1010
+  x1055 = k16*x377
+  x1056 = x1055*x953
+  x1057 = -x393*x448 + x504
+  x1059 = x1003*x313
+  x1060 = -x1002*x1059*x148
+  x1061 = x1001 + x152*(x1006 - x1007*x1059*x50 + x1060) + x7*(x1000 + x1060)
+  x1062 = 2*x384
+  x1063 = x1057*x85
+  x1064 = x1009*x1061
+  x1065 = k17*x1064
+  x1066 = x1*x21
+  x1067 = 168*x984
+  x1068 = 196*x71
+  x1069 = x113*x232
+  x1070 = x210 + x213
+  x1071 = x216*(k18 + x1070 - x511)
+  x1072 = k19 + x1070 - x208
+  x1073 = 14*x1029
+  x1074 = x1072*x216
+  x1075 = x4*x989
+  x1076 = x220*x286
+  x1077 = x1076*x451
+  x1078 = x1046*x92
+  x1079 = 196*x367
+  x1080 = x102*x530
+  x1081 = x885*(x1080*x230 + x220*x527 + x220*x528 + x235*x529)
+  x1082 = a1*x994
+  x1083 = 45*x915/65536
+  x1084 = k20*x1055
+  x1085 = 4*x1064
+  x1086 = x1*x353
+  x1087 = x1056*x915
+  x1090 = x1002*x83
+  x1091 = x1062*x282
+  x1092 = x384*x90
+  x1093 = k21*x1090*x1091 + x1090*x1092*x133
+  x1094 = x1007*x83
+  x1095 = x279*x302
+  x1096 = x1095*x113
+  x1097 = x274 + x277
+  x1098 = x279*(k24 + x1097 - x818)
+  x1099 = k27 + x1097 - x273
+  x1100 = x1099*x279
+  x1101 = x0*x279
+  x1102 = x1031*x1099
+  x1103 = x287*x877
+  x1104 = x1080*x300 + x249*x301 + x256*x289 + x307*x529
+  x1106 = x544*x830
+  x1107 = x1106*x597
+  x1108 = x212*x543*x836
+  x1109 = 336*x1108
+  x1110 = x284*x84
+  x1111 = x1105*x84
+  x1112 = x1106*x34
+  x1113 = x14*x279
+  x1114 = x1101*x14
+  x1115 = x1112*x615
+  x1116 = x1113*x594
+  x1117 = x1108*x642
+  x1118 = x1110*x308
+  x1119 = x294*x80
+  x1120 = x1110*x555
+  x1121 = 784*x560
+  x1122 = 392*x547
+  x1123 = x294*x308
+  x1124 = x478*x547
+  x1125 = x1118*x607
+  x1126 = x607*x94
+  x1127 = x294*x555
+  x1128 = x249*x37
+  x1129 = x1108*x636
+  x1130 = x1112*x594
+  x1131 = x37*x414
+  x1132 = x1108*x495
+  x1133 = 336*x1123
+  x1134 = x1108*x475
+  x1135 = x255*x37
+  x1136 = x1112*x438
+  x1137 = x10*x296
+  x1138 = x1137*x438
+  x1139 = x293*x302*x35*x83
+  x1140 = x889*x931
+  x1141 = x414*(x161 - x790)
+  x1142 = x71*(x109 - x792)
+  x1143 = x113*x338
+  x1144 = x105 - 12
+  x1145 = x338*x572
+  x1146 = x71*(x1080*x340 + x342*x529 + x527 + x528)
+  return ([[0, 0, 0, 0, 0, 0], [k29*x199*x2*x204*(a1*(-x0*(-x158*x160 -
+    x158*x164 + x158*x169 + x158*x189 + x186*x187 + x197*(x192 + x194*x196)) +
+    x134*x148*x151*x49*(k28*x54 + 16*x142 - x143*x145*x66 + x55) - x136*x140) +
+    m3*x126), x237*x240*(-x125*x203 + x125*x205*x21 -
+    x203*x21*(-x0*(2*x110*(x103*x236 - x115 + x122 - x233) - x160*x221 -
+    x164*x221 + x169*x221 + x189*x221 - x218 + x222 + x230*x231*x76) -
+    x140*x207 - x151*x217 - 42*x43 + 4*x70)), 315*x260*(x0*(x110*(x254 + x257)
+    - x248*x98 + x250*x71) + 21*x243 - x245*x71)/8192, e2*x240*x259*(2*x124 +
+    x126*x49 + x139*x269 + x151*x280 - x21*x218 + x222*x71 + x261*x42 -
+    x262*x68 + x308*(-x159*x288 - x162*x289 + x166*x301 + x188*x289 +
+    x197*(x196*x307 - x305) + x231*x300)), -x0*x260*x329,
+    315*H*x204*x239*x343*(x0*(-x160 - x164 + x169 + x189 + x197*(x196*x342 -
+    x341) + x231*x340)/8 + x150*x339 + 21*x335*x41/2)/2048],
+    [x199*x670*(-0.0006866455078125*a1*(k31*x22*(x136*x363*x366 -
+    x137*x507*x508 + x368*x531 + x509*x513 - x515*x516 - x519*x523 -
+    x524*x525*x526)/sqrt(x4**7) + x379*x76*(x170*(x390 + x576) + x291*x382 +
+    x7*(x387 + x576))*(x177*x582 - x579*x581 + x669) + x379*(x541*x542 +
+    x575)*(k30*x533 + x129*x382*x47*x83 + x170*(m2*x537 + m3*x537 + x540) +
+    x7*(x264*x537 + x540))) + 0.0048065185546875*x375 -
+    0.0048065185546875*x379*x506),
+    0.001373291015625*x786*(e1*x23*(x374*(-x0*x711 - 147*x243 + x245*x360 -
+    x366*x684 - x677 + x680) + x379*(x170*(x390 + x714) + x382*x713 + x7*(x387
+    + x714))*(x398 + x400 - x411 + x413 + x417 + x420 - x423 - x425 - x427 +
+    x430 + x432 + x434 - x437 - x440 - x442 + x444 + x445 + x447 + x449 + x450
+    + x453 + x456 - x460 - x462 - x465 - x466 - x468 - x470 + x474 + x477 +
+    x480 + x484 - x485 - x486 - x487 - x493 + x496 + x497 + x499 - x500 - x501
+    - x502)) - e1*x379*x505*(a1*x312*x535 + k33*(m2*x673 + m3*x673 - x155*x539
+    - x674*x83) + x141*x312*x382 + x7*(k32*x673 + x312*x331*x381 + x312*x674))
+    - e1*x785*(-1344*x316*x395 + x396*x717 + x581*x716 + x784) + x258*x369*x532
+    - x374*x671*(x0*x681*x696 + 112*x137*x217*x521 + x137*x675 + 6*x137*x676 +
+    x141*x683*x687*x688 + x207*x494*x682 + x217*x514*x686 - x245*x681 -
+    20*x351*x512*x685 + x359*x365*x520*(-x691*x698 + x691*x701 + x709*(-x703 -
+    x705 + x708) - x710*(-x227 - x228 + x234)) + 441*x365*x684 - 60*x617*x68 +
+    x677 - x680 + x689*x690*x692*x693) - x375*x671),
+    0.0384521484375*x786*(x21*x785*(48*x101*x394*x94 + x813) +
+    x374*(-x114*x365*x791 - x361*x46*x789 + 21*x788 + x789*x794)),
+    -0.010986328125*e2*x786*(k37*x506/x1**5 + k38*x814 + x374*(x21*x675 +
+    x268*x366*x683 + x269*x507 - x279*x509*(k34 + x278 + x818) + x280*x515 +
+    56*x280*x522 + x308*x360*(-x697*x821 + x700*x821 + x709*(-x823 - x825 +
+    x827) - x710*(-x295 - x298 + x306)) + x308*x689*x819*x821 + 3*x350*x676 -
+    84*x521*x68 - x679 + x684*x815 + x711)/4 + 7*x375*x49/8 +
+    x785*(-2016*e2*x249*x728 + k35*x826 + k36*x415*x883*x884 - x246*x860 -
+    x246*x869 - x249*x857 + x249*x861 + x249*x862 - x249*x863 - x249*x868 +
+    x249*x871 - x251*x860 - x251*x869 - x255*x857 + x255*x861 + x255*x862 +
+    x255*x863 + x255*x868 + x255*x871 + x314*x882*x884*x886 + x316*x337*x880 +
+    x316*x596 - 576*x316 + 960*x355*x845 - x38*x845*x866 + x383*x488*x878*x881
+    - x418*x826 - x421*x849 - x421*x859 + x433*x832 - x433*x838 + x433*x843 -
+    x433*x851 + x436*x858 - x457*x844 - x457*x864 + x457*x873 + x461*x844 -
+    x461*x864 + x461*x873 + x463*x564 + x463*x566 + x469*x867 - x551*x847 -
+    x552*x847 - x554*x858 - x556*x826 + x559*x858 - x564*x870 - x566*x870 -
+    x567*x867 + x581*x829 - x582*x847 + x584*x829 + x585*x829 + x595*x848 -
+    x596*x848 - x610*x848 - x619*x840 + x634*x850 + x638*x865 + x638*x872 -
+    x638*x876 - x640*x865 + x640*x872 + x640*x876 + x645*x850 + x651*x850 +
+    x653*x850 - x661*x875 + x662*x875 - x663*x875 + x664*x875 - x667*x850 -
+    x682*x826*x877 - x722*x840 - x722*x841 - x726*x842 - x728*x743 + x728*x754
+    - 2880*x728 + x734 + x739*x842 - x740*x840 + x740*x841 + x742 + x743*x854 -
+    x744*x856 + x746 - x754*x854 + x774*x829 + x828*x839 + x828*x852 -
+    56*x828*x878 + 384*x829 - x832 + x838 - x840*x846 - x840*x853 - x840*x855 +
+    x840*x874 - x843 - 1080*x845 + x851 + x888)/8),
+    -x0*x895*(x374*(-x360*(-x109 + x792) + 10*x678*x889 - x819*(-x161 + x790))
+    + x785*(-e2*x890 + x894)), -H*x895*(x343*x47*x532*(x335*x507 +
+    x337*x523*x896 - x338*x509*(x336 + 12) + x339*x515 + x366*x689*x899 +
+    x368*(-x698 + x701 + x709*(x314 - x334) - x710*(-x338 + x92)) +
+    x683*x815*x898) + x785*x914*(x396 + x913) + x814*x91)],
+    [45*x915*x955*x956*(-x715*(441*x309*x325*x940 - x309*(x526*x925*x946 -
+    x945*(k39*x183 + k40*x517 - 4*x177 + 8*x579 - 42*x616 + x622*x950) +
+    x95*x952*(x192 + x194*x951)) - 147*x318*x940 + x325*x943*(x180 + x184 +
+    x193) + x699*x939*x942 - x939*(-x944*x945 + x946*x947))/32 + 147*x921/4 +
+    x924*x926 + x938/4)/4096, e1*x956*x974*(k42*x967*(x703 + x705 + x708) +
+    x165*x962 + x471*x75*x920 + x520*x941*x958*x966 + x808*x962 +
+    x916*(k42*x945*(42*a1*x406*x51*x601 + k39*x704 + k40*x702 + k41*x706 -
+    x331*x972 + x410*x48*x950) + 14*x21*x309*(k8*x236 + x115 + x233 - x933) -
+    x692*x971 + x930*x969 + 14*x936) - x957*x961 - x959*x968 + x961*x964),
+    x21*x329*x975, x974*(x0*(x916*(-x821*x970 - x945*(k43*x731*x901 +
+    k44*x143*x835*x979 - 56*x6*x822 - 28*x825 + 4*x826 - 8*x828) + x980*(x305 -
+    x307*x951)) - x937*x977 + x942*x965*x977 - x957*x978 + x964*x978 -
+    x967*(x823 + x825 + x827)) - 6*x725*x976 + x976),
+    -45*x975*(-x309*(-x355*x932*x944 + x947*(x254 + 4*x257)) + x319*x454 +
+    28*x327*x879)/32768, H*e2*k45*x973*(x916*(-x945*(k39*x333 + x902*x979 -
+    x972) - x971 + x980*(x341 - x342*x951))/8 - 147*x919*x960/8 -
+    49*x922*x941*(x314 + x334) + x926*x966 + 441*x960*x963/8 - x968/8)],
+    [-9*x1056*x62*(a1*x16*(k46*x995 + k47*x1053*(x1023*x508 - x1024*x508 -
+    x1026*x513 + x1028*x516 + x1030*x512*x518 - x1032*x215*x517 + x1034*x516 +
+    x1036*x136 - x1041*x158 - x1043*x158 - x1046*x526 - x1048*x158 +
+    x1049*x1050 - x1049*x1052 - x519*x886) + k48*x1054*(-x580*x608 + x659*x660
+    + x669) + k52*x1009*x1012*x84*(m2*(k50*x1015 + k51*x1016 + x1018*x76 +
+    x1019*x1022 + x1020*x76 + x1022*x203) + x1021*(k49*x1016 + x1018 + x1020))
+    + x1008*x1012*x1013*x536*x672) + 60*x1011 - 3*x996)/131072,
+    -e1*x1083*x1084*(a2*x1082*(-x0*x1079*x71 - x1*x969*x985 + x1023*x1069 -
+    x1024*x1069 + x1025*x349*x350 + x1026*x1071 - x1027*x1072*x685 +
+    x1031*x1074*x798 - x1034*x1074 + x1036*x232 + x1039*x1077 + x1042*x1077 +
+    x1047*x1076 - x1050*x1081 + x1051*x992 + x1051*x993 + x1052*x1081 -
+    x1066*x1067 + 1764*x1066*x345 - x1067*x983 + x1068*x362 - x1071*x1073 +
+    x1074*x783 + x1075*x363*x471 + x1078*x221 - x1079*x365 - 2058*x346 -
+    14*x352 + 140*x358*x985 + 2058*x364*x365 + 196*x987) + k54*x1057*x313*x62 +
+    x1013*x1061*x1062*x1063/x1014 + x1065*(x249*x777 - x435*x756 + x461*x764 +
+    x784)), -315*x1087*x21*(x1082*(-x1*x261*x787 - 42*x1075*x21*x791 +
+    x1086*x262 - 14*x149*x361 - x525*x791 + 14*x71*x794 + 147*x788 -
+    4*x793*x983) - x1085*(x101*x801 + x813))/32768,
+    9*e2*x1087*(k60*x1012*x673*x82*(k59 + x152*(k56 + k57*x1091*x1094 +
+    x1092*x1094*x132 + x1093) + x7*(k58 + x1093)) - x1054*(x1105*x583 +
+    x1107*x433 - x1107 - x1108*x634 - x1108*x645 - x1108*x651 - x1108*x653 +
+    x1108*x667 + x1109*x433 - x1109 + x1110*x573*x647 + x1110*x839 + x1110*x852
+    + x1111*x584 + x1111*x585 - x1111*x627 - x1112*x619 - x1112*x722 -
+    x1112*x740 - x1112*x846 - x1112*x853 - x1112*x855 + x1112*x874 + x1113*x722
+    - x1113*x740 + x1114*x592 - x1114*x605 + x1115*x433 - x1115 + x1116*x457 -
+    x1116*x461 + x1117*x433 - x1117 + x1118*x595 - x1118*x596 - x1118*x610 +
+    x1119*x551 + x1119*x552 + x1120*x743 - x1120*x754 + x1120*x756 - x1121*x249
+    - x1121*x255 - x1122*x564 - x1122*x566 - x1123*x436 + x1123*x554 -
+    x1123*x559 + x1124*x246 + x1124*x251 + x1125*x249 + x1125*x255 + x1126*x249
+    + x1126*x255 - x1127*x469 + x1127*x567 + x1127*x997 - x1128*x494 -
+    x1128*x636 - x1129*x457 - x1129*x461 - x1130*x457 - x1130*x461 + x1131*x638
+    - x1131*x640 - x1132*x249 - x1132*x255 + x1133*x564 + x1133*x566 +
+    x1134*x246 + x1134*x251 + x1135*x494 + x1135*x636 + x1136*x638 + x1136*x640
+    + x1137*x661 - x1137*x662 + x1137*x663 - x1137*x664 + x1138*x638 -
+    x1138*x640 - x1139*x478*x883 + x1139*x783*x882 + x291*x574*x881 + x294*x418
+    + x294*x556 - x294*x626*x877 + x294*x833 + x355*x547*x856 - x414*x570*x866
+    + x541*x743 - x541*x754 + x541*x756 + 2880*x541 - x547*x634 - x547*x642 +
+    x547*x849 + x547*x859 - 336*x547 + x595*x94 - x596*x94 - x610*x94 +
+    x812*x880 + x888 + 576*x94) + 5*x1082*(k55*x1047*x287 - x1023*x1096 +
+    x1024*x1096 - x1026*x1098 + x1028*x1100 + x1033*x1102*x279 - x1036*x1095 -
+    x1039*x1103 - x1042*x1103 - 1029*x1045*x113*x288*x308 - x1052*x1104*x490 +
+    x1068*x1104*x555 + x1073*x1098 - x1100*x783 - 28*x1101*x1102 - x357*x931 +
+    140*x71*x993 - 420*x879*x984 + 2205*x981 + 3*x982 - 1029*x988 + 294*x991) +
+    4*x49*(20*x1011 - x996))/65536, -x1056*x1083*(x0*x1085*(-x890 + x894) +
+    x1082*(-14*x0*x1140*x353 + x1044*x1141 - x1050*x1142 + x1052*x1142 +
+    294*x1075*x1141 + 4*x1086*x1140)), -45*H*x1084*x915*(k61*x1053*(x1023*x1143
+    - x1024*x1143 + x1026*x1144*x338 - x1028*x1145 - x1030*x1144*x896 +
+    x1032*x303*x572 - x1034*x1145 + x1036*x338 + x1041 + x1043 + x1048 -
+    x1050*x1146 + x1052*x1146 + x1078 + x572*x886*x896) + k63*x1063*x706 +
+    x1065*x914*(x393*x461 + x913))/32768], [0, 0, 0, 0, 0, 0]])
+
+def jac_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by jac_gr.'''
+  x4 = m1 + m2
+  x5 = c**(-5)
+  x6 = m1*m2
+  x7 = x5*x6
+  x8 = x4*x7
+  k0 = x4**(3/2)
+  k1 = c**(-2)
+  k2 = k0*k1
+  x20 = sqrt(x4)
+  x21 = 1/x20
+  k3 = x21*x6
+  k4 = 2*x21
+  x28 = m1**2*m2**2
+  x29 = a2*m3**2/(m3 + x4)
+  k5 = 1/m1
+  k6 = 1/m2
+  k7 = x4**2
+  k8 = k7*x29
+  k9 = 1/x4
+  k10 = k9*x28
+  k11 = k5*k6*x20
+  k12 = x20*x28
+  k13 = x4**3
+  k14 = -k13*x29
+  k15 = -x4
+  k16 = x20*x6/2
+  return (x5, x6, x7, x8, k2, k3, k4, k8, k10, k11, k12, k14, k15, k16)
+
+def jac_gr(y, k):
+  '''The Jacobian of the gr terms of the EOMs.
+
+  k is returned by jac_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x5, x6, x7, x8, k2, k3, k4, k8, k10, k11, k12, k14, k15, k16) = k
+  x0 = e1**2
+  x1 = 0.3854166666666667*e1**4 + 3.0416666666666665*x0 + 1
+  x2 = x0 - 1
+  x3 = 1/sqrt(-x2**7)
+  x9 = x8/a1**4
+  x10 = a1**(-3)
+  x11 = 1/x2
+  x12 = e1*x8
+  x13 = 0.3980263157894737*x0 + 1
+  x14 = 1/sqrt(-x2**5)
+  x15 = k2*sqrt(x10)
+  x16 = 1/a1
+  x17 = x2**(-2)
+  x18 = e1*x17
+  x19 = sqrt(-a1*x2)
+  x22 = k3*x19
+  x23 = 2*x22
+  x24 = 1/x19
+  x25 = x24*x6
+  x26 = k4*x25
+  x27 = H**2
+  x30 = k11*x24*(a1*k10*(1 - x0) + k8*(1 - e2**2) - x27)
+  x31 = x23 - x30
+  x32 = 0.875*x0 + 1
+  x33 = x10*sqrt(x16)
+  x34 = x17*x32*x33
+  x35 = x5/H
+  x36 = k12*x35
+  x37 = 32*x34/5
+  return ([[192*x1*x3*x9/5, 64*x10*x12*x3*(-1.5416666666666667*x0 + 7*x1*x11 -
+    6.083333333333333)/5, 0, 0, 0, 0], [1216*x12*x13*x14/(15*a1**5),
+    x14*x9*(1520*x0*x11*x13 - 363.0*x0 - 304)/15, 0, 0, 0, 0],
+    [15*x11*x15/(2*a1**2), 6*x15*x16*x18, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0], [0,
+    0, 0, 0, 0, 0], [8*x34*x36*(-x16*x23 - x16*x30 + 7*x16*x31 - x2*x26)/5,
+    x18*x33*x36*(64*x11*x31*x32 - 56.00000000000001*x22 +
+    28.000000000000004*x30 - 16*x32*(a1*x26 + x11*x23 + x11*x30))/5, 0,
+    e2*k14*x25*x35*x37, 0, x37*x7*(k15*x24 + k16*x31/x27)]])
+
+# The constants functions and Jacobians of each term, in the
+# order (quadrupole, octupole, hexadecapole, gr)
+JACOBIANS = [
+  (jac_quadrupole_constants, jac_quadrupole),
+  (jac_octupole_constants, jac_octupole),
+  (jac_hexadecapole_constants, jac_hexadecapole),
+  (jac_gr_constants, jac_gr)]
@@ -0,0 +1,3448 @@
+#! /usr/bin/env python
+
+'''
+ts_kernels
+
+The Hamiltonian equations of motion of a hierarchical triple.  There is one
+kernel for each combination of terms of the Hamiltonian, and each kernel
+computes every common subexpression only once.  Everything that depends only
+on the masses and the outer semi-major axis is computed once per triple by
+the kernel's _constants function.  The kernels are evaluated in units in
+which G = 1.
+
+This file is generated by make_kernels.py.  Do not edit it by hand.
+'''
+
+from __future__ import division
+from math import sqrt, sin, cos
+
+def deriv_quadrupole_octupole_hexadecapole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_octupole_hexadecapole_gr.'''
+  x5 = c**(-5)
+  x7 = m1 + m2
+  x8 = m1*m2
+  x9 = x7*x8
+  x16 = 1/x7
+  x17 = m1**2
+  x18 = m2**2
+  x19 = x17*x18
+  x20 = x16*x19
+  x24 = m3**2
+  x25 = x7**2
+  x26 = m3 + x7
+  x27 = a2*x24*x25/x26
+  x35 = 1/(x17*x18)
+  x37 = 1/x24
+  x38 = 1/a2
+  x39 = x16*x38
+  x40 = x37*x39
+  k0 = x26*x40
+  x44 = sqrt(x7)
+  x45 = 1/x44
+  k1 = a2**(-3)
+  k2 = x35*x40
+  x59 = 1/m1
+  x60 = x59/m2
+  x61 = sqrt(x26)
+  x62 = sqrt(a2)
+  x63 = 1/x62
+  k3 = 1/m3
+  k4 = k3*x63
+  k5 = x45*x60
+  x82 = m1 - m2
+  x83 = x7**(3/2)
+  x84 = 1/x83
+  k6 = a2**(-4)
+  k7 = x82*x84
+  x89 = x17 + x18 - x8
+  x94 = 1/x25
+  k8 = x26**2
+  k9 = a2**(-2)
+  k10 = m1**(-4)
+  k11 = m2**(-4)
+  k12 = m3**(-4)
+  k13 = k10*k11*k12*k8*k9*x94
+  k14 = a2**(-5)
+  x123 = x37*x38*x84
+  x125 = 4*x16
+  x142 = a2**(-9/2)
+  x143 = x61*x8
+  k15 = x142*x143
+  x146 = m1**3
+  x147 = m2**3
+  x148 = x146 + x147
+  x171 = 2*x44
+  k16 = 1/x146
+  k17 = 1/x147
+  k18 = x26**(3/2)
+  k19 = a2**(-3/2)
+  k20 = m3**(-3)
+  k21 = k16*k17*k18*k19*k20*x84
+  k22 = 1/x61
+  k23 = m3*x62
+  k24 = -64*x9/5
+  k25 = -304*x5*x9/15
+  k26 = x7**(-5/2)
+  k27 = -315*k26*x89/32768
+  k28 = -15*m3/32
+  k29 = c**(-2)
+  k30 = -3*k29*x83
+  k31 = x125*x26*x37*x38
+  k32 = x7**(-9/2)
+  k33 = x148*x7
+  k34 = m2*x171
+  k35 = 2*x8
+  k36 = -m2*x59
+  k37 = -x63*x89
+  k38 = 0.001373291015625*k32
+  k39 = 2*x16
+  k40 = -15*x94/512
+  k41 = x7**(-3)
+  k42 = x39*x89
+  k43 = 15*k41/4096
+  k44 = a2**(-7/2)
+  k45 = 128*k44*x143
+  k46 = x7**(-4)
+  k47 = a2**(-11/2)
+  k48 = -x148*x26
+  k49 = x60*x63
+  k50 = 20*x44*x61*x89
+  k51 = -k46*k47
+  k52 = -160*m3
+  k53 = 80*x142*x61
+  k54 = x45*x8
+  k55 = x44*x60/2
+  k56 = -32*x19*x44/5
+  return ((m2, m3, x5, x8, x16, x17, x18, x20, x26, x27, x35, k0, x44, x45, k1,
+    k2, x59, x60, x61, k4, k5, x82, k6, k7, k13, k14, x123, x125, k15, x171,
+    k21, k22, k23, k24, k25, k27, k28, k30, k31, k33, k34, k35, k36, k37, k38,
+    k39, k40, k42, k43, k45, k48, k49, k50, k51, k52, k53, k54, k55, k56))
+
+def deriv_quadrupole_octupole_hexadecapole_gr(y, k):
+  '''The EOMs with the quadrupole, octupole, hexadecapole, gr terms.
+
+  k is returned by deriv_quadrupole_octupole_hexadecapole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x5, x8, x16, x17, x18, x20, x26, x27, x35, k0, x44, x45, k1, k2,
+    x59, x60, x61, k4, k5, x82, k6, k7, k13, k14, x123, x125, k15, x171,
+    k21, k22, k23, k24, k25, k27, k28, k30, k31, k33, k34, k35, k36, k37,
+    k38, k39, k40, k42, k43, k45, k48, k49, k50, k51, k52, k53, k54, k55,
+    k56) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = e1**4
+  x3 = a1**3
+  x4 = 1/x3
+  x6 = x4*x5
+  x10 = a1**2
+  x11 = 2*g1
+  x12 = sin(x11)
+  x13 = H**2
+  x14 = 1 - x0
+  x15 = a1*x14
+  x21 = x15*x20
+  x22 = e2**2
+  x23 = 1 - x22
+  x28 = x23*x27
+  x29 = -x13 + x21 + x28
+  x30 = x29**2
+  x31 = x22 - 1
+  x32 = 1/x31
+  x33 = 1/a1
+  x34 = x33/x1
+  x36 = x34*x35
+  x41 = k0*x32*x36
+  x42 = x30*x41
+  x43 = 4 - x42
+  x46 = a1*x1
+  x47 = -x46
+  x48 = sqrt(x47)
+  x49 = 1/x48
+  x50 = x45*x49
+  x51 = k1*x23**(-1.5)
+  x52 = x13 - x21 - x28
+  x53 = x26/x23
+  x54 = k2*x33*x52**2*x53/x14
+  x55 = 4 - x54
+  x56 = cos(g1)
+  x57 = sin(g2)
+  x58 = 1/sqrt(x15)
+  x64 = sqrt(x23)
+  x65 = 1/x64
+  x66 = k4*x65
+  x67 = x61*x66
+  x68 = k5*x52*x58*x67
+  x69 = x57*x68
+  x70 = x56*x69
+  x71 = cos(g2)
+  x72 = 2*x71
+  x73 = x56*x72
+  x74 = sin(g1)
+  x75 = 5*x0
+  x76 = cos(x11)
+  x77 = 7*x0
+  x78 = x75 - x76*x77 + 2
+  x79 = x78*(2.5 - 0.625*x54)
+  x80 = 3*x0
+  x81 = x80 + 4
+  x85 = m3*x49
+  x86 = k6*x23**(-2.5)
+  x87 = e2*k7*x1*x3*x85*x86
+  x88 = sqrt(x14)
+  x90 = 3*x22 + 2
+  x91 = 4*g1
+  x92 = 21*x0
+  x93 = x1**(-2)
+  x95 = k13/x10
+  x96 = 7*x95
+  x97 = x0 + 2
+  x98 = 2*x97
+  x99 = x68 + 2
+  x100 = x68 - 2
+  x101 = -g2
+  x102 = 2*x101 + 2*x11
+  x103 = sin(x102)
+  x104 = 2*g1 + 2*x101
+  x105 = sin(x104)
+  x106 = x99**2
+  x107 = 14*x68
+  x108 = 7*x54
+  x109 = x108 + 4
+  x110 = x106*(-x107 + x109)
+  x111 = x100**2
+  x112 = x54 - 4
+  x113 = 2*g2 + 2*x11
+  x114 = x112*x92*sin(x113)
+  x115 = x107 + x109
+  x116 = 2*g1 + 2*g2
+  x117 = x115*sin(x116)
+  x118 = m3/sqrt(-x31**7)
+  x119 = a1**(7/2)*k14
+  x120 = 5*x76
+  x121 = -x0*(x120 - 3) + 2
+  x122 = x26*x29
+  x124 = x122*x123*x32
+  x126 = x10*x16
+  x127 = x23**(-3.0)
+  x128 = x29*x36
+  x129 = x50*x60
+  x130 = x129*x67
+  x131 = x130*x29
+  x132 = x57*x74
+  x133 = x131*x132
+  x134 = x133 + x73
+  x135 = 5*x78
+  x136 = x78*(2.5 - 0.625*x42)
+  x137 = 3*x54
+  x138 = 5*x1
+  x139 = 6*x0 + 8
+  x140 = 2*x57
+  x141 = e1*x82
+  x144 = k15*x3
+  x145 = 1/x88
+  x149 = cos(x91)
+  x150 = x112**2*x149
+  x151 = x0*x90
+  x152 = x52**4/(x14**2*x23**2)
+  x153 = 35*x152*x95 - 120*x54 + 48
+  x154 = x153*x90
+  x155 = x152*x96 - 32*x54 + 16
+  x156 = 2*g2
+  x157 = cos(x156)
+  x158 = x155*x157
+  x159 = x158*x22
+  x160 = 28*x0 + 28
+  x161 = x155*x76
+  x162 = x0*x22
+  x163 = cos(x113)
+  x164 = cos(x102)
+  x165 = x106*x164 + x111*x163
+  x166 = x112*x165
+  x167 = cos(x116)
+  x168 = cos(x104)
+  x169 = x110*x168 + x111*x115*x167
+  x170 = x169*x22
+  x172 = sqrt(a1)
+  x173 = x172*x88
+  x174 = -x122*x129
+  x175 = x173*x44
+  x176 = k21/x23**(3/2)
+  x177 = 112*x176
+  x178 = x29**3/x47**(3/2)
+  x179 = x177*x178
+  x180 = 960*x0
+  x181 = 360*x2
+  x182 = 288*x22
+  x183 = x176*x178
+  x184 = 168*x22
+  x185 = 210*x2
+  x186 = 560*x0
+  x187 = 1440*x162
+  x188 = x2*x22
+  x189 = 540*x188
+  x190 = x157*x22
+  x191 = 256*x190
+  x192 = 315*x188
+  x193 = 840*x162
+  x194 = 672*x131
+  x195 = x162*x167
+  x196 = 560*x162
+  x197 = x157*x183
+  x198 = x167*x188
+  x199 = 336*x131
+  x200 = x168*x188
+  x201 = 210*x188
+  x202 = 147*x188
+  x203 = x183*x202
+  x204 = 196*x183
+  x205 = 392*x183
+  x206 = x162*x168
+  x207 = x131*x157
+  x208 = 480*x188
+  x209 = 1280*x162
+  x210 = 588*x42
+  x211 = 441*x188
+  x212 = x211*x42
+  x213 = 294*x42
+  x214 = 147*x2
+  x215 = x149*x214*x90
+  x216 = x151*x97
+  x217 = 28*x216*x76
+  x218 = 588*x188
+  x219 = 280*x188
+  x220 = x163*x218 - x164*x218 - x167*x196 - x167*x219 + x168*x196 + x168*x219
+  x221 = k22/x31**4
+  x222 = x23**(-2.0)
+  x223 = x13 + x20*x46 + x27*x31
+  x224 = x223**2*x41
+  x225 = x130*x223
+  x226 = x225*x71*x74
+  x227 = x131 + 2
+  x228 = x225 + 2
+  x229 = x0*x97
+  x230 = 40*x0 + 15*x2 + 8
+  x231 = x52**3/x15**(3/2)
+  x232 = x176*x231
+  x233 = 3*a1/16
+  x234 = (4*x22 + 1)/e2
+  x235 = a1*x8
+  x236 = x141*x16
+  x237 = 5*x14
+  x238 = x123*x52*x53
+  x239 = x150*x2
+  x240 = x230*x31
+  x241 = x229*x31
+  x242 = k23*x64
+  x243 = 2*x242
+  x244 = x173*x52*x58
+  x245 = x244*x59*x66
+  x246 = x177*x231
+  x247 = x157*x68
+  x248 = 392*x232
+  x249 = 196*x232
+  x250 = x202*x232
+  x251 = x157*x232
+  x252 = 336*x68
+  x253 = 672*x68
+  x254 = 588*x54
+  x255 = x211*x54
+  x256 = 294*x54
+  return ([k24*x6*(3.0416666666666665*x0 + 0.3854166666666667*x2 +
+    1)/sqrt(-x1**7), e1*k27*x118*x119*x88*(x12*x90*x98*(x29**4*x93*x96/x31**2 -
+    32*x42 + 16) - x22*(-x100*x103*x92*x99**3 + x105*x110*x98 + x111*(-x114 +
+    x117*x98)) - x55**2*x90*x92*sin(x91)) + e1*k28*x1*x10*x12*x43*x50*x51 +
+    15*x87*(-35*x0*x12*x55*(-x69*x74 + x73) + 10*x14*x55*x70 + 4*(-x70 +
+    x72*x74)*(-x79 + x81))/512 + e1*k25*(0.3980263157894737*x0 +
+    1)/(a1**4*sqrt(-x1**5)), e2*k40*x127*x141*x144*(k39 + x128)*(x131*x134*x135
+    + x140*x74*(-2*x136 + x138*(4 - x137) + x139)) + k30*x34*sqrt(x4) +
+    k38*x119*x145*(k33*x1*x118*(-147*x150*x151 - x154*x81 + 10*x159*x81 +
+    x160*x161*x90 - x160*x170 + 147*x162*x166) + k37*x221*(k35*(m2*x175 +
+    m3*x175 + x174) + k36*x122*x50 + x17*(k34*x173 +
+    x174))*(-e2**3*x0*x168*x194 - x131*x180 - x131*x181 - x131*x182 - x131*x187
+    - x131*x189 + x131*x191 - x131*x215*x55 + x131*x217*(16 - x108) - 192*x131
+    - x163*x203 - x163*x212 - x164*x203 + x164*x212 - x179*x190 + x179 +
+    x183*x184 + x183*x185 + x183*x186 + x183*x192 + x183*x193 - x194*x195 +
+    x195*x205 + x195*x210 - x196*x197 - x197*x201 - x198*x199 + x198*x204 +
+    x198*x213 - x199*x200 + x200*x204 - x200*x213 + x205*x206 - x206*x210 +
+    x207*x208 + x207*x209 + x220)) + 3*x126*x51*x85*(2*x121*x124 +
+    x44*(k31*x30*x32*x36 - (4*x0 + x112)*(x120 - 1)))/32 -
+    15*x87*(5*x133*x43*(x80 - 1) + x134*(18*x0 - 6*x136 - 5*x42 +
+    28))/(256*e1), k43*x144*(e2*k42*x233*(x103*x214*x227*x228**3 +
+    28*x105*x228**2*x229*(7*x224 - 14*x225 + 4) + x227*(2*x230*(-7*x232 -
+    14*x54 + 4*x68 + 8)*sin(x156) + x77*(2 - x68)*(x114 - 4*x117*x97)))/x31**3
+    - 16*x141*x222*(-x138*x226*(4 - x224) + 2*(x140*x56 - x226)*(-x78*(2.5 -
+    0.625*x224) + x81))), 3*x126*(a1*k52*x132*x236*x58*x86*(e2*(x171 +
+    x238)*(x139 + x237*(x137 - 4) - 2*x79) - x234*x237*x238*x55) +
+    k45*x222*(4*x121*x128 + x16*(24*x0 - (12 - 5*x54)*(-x75*x76 + x80 + 2) +
+    16)) + k51*x221*x233*(k48*x235*(-1470*x100*x165*x2*x23*x99 - 6*x153*x240 +
+    7*x154*x230 + 20*x158*x240 - 70*x159*x230 - 980*x161*x216 + 840*x161*x241 -
+    5145*x166*x188 - 280*x169*x241 + 980*x170*x229 - 4410*x239*x31 +
+    5145*x239*x90) + k50*x145*x172*(x17*(x243 + x245) + x18*x243 +
+    x8*(k49*x244*x65 + 4*x242 + x245))*(-x112*x215*x68 + x163*x250 - x163*x255
+    + x164*x250 + x164*x255 + x180*x68 + x181*x68 + x182*x68 - x184*x232 -
+    x185*x232 - x186*x232 + x187*x68 + x189*x68 + x190*x246 - x191*x68 -
+    x192*x232 - x193*x232 - x195*x248 + x195*x253 + x195*x254 + x196*x251 -
+    x198*x249 + x198*x252 + x198*x256 - x200*x249 + x200*x252 - x200*x256 +
+    x201*x251 - x206*x248 + x206*x253 - x206*x254 - x208*x247 - x209*x247 +
+    x217*x68*(x108 - 16) + x220 - x246 + 192*x68)) +
+    k53*x127*x134*x235*x236*(e2*x128*x135*x45*(x124 + x171) + x125*x234*(-x136
+    + x81)))/8192, k56*sqrt(x33)*x6*x93*(0.875*x0 + 1)*(k54*x48 +
+    k55*x223*x49)/H])
+
+def deriv_quadrupole_octupole_hexadecapole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_octupole_hexadecapole.'''
+  x0 = m1 + m2
+  x1 = sqrt(x0)
+  x2 = 1/x1
+  x11 = m1**2
+  x12 = 1/x0
+  x13 = m2**2
+  x14 = x11*x12*x13
+  x18 = m3**2
+  x19 = x0**2
+  x20 = m3 + x0
+  x21 = a2*x18*x19/x20
+  k0 = 1/x11
+  k1 = 1/x13
+  k2 = k0*k1
+  x29 = 1/x18
+  x30 = 1/a2
+  x31 = x12*x30
+  x32 = x20*x29*x31
+  x46 = 1/m1
+  x47 = x46/m2
+  x48 = x2*x47
+  x49 = sqrt(x20)
+  x50 = sqrt(a2)
+  x51 = 1/x50
+  k3 = 1/m3
+  k4 = k3*x51
+  x70 = 4*x12
+  x71 = x30*x70
+  x72 = m1 - m2
+  x78 = m1*m2
+  x79 = x11 + x13 - x78
+  x87 = 1/x19
+  x88 = x87/a2**2
+  k5 = x20**2
+  k6 = m1**(-4)
+  k7 = m2**(-4)
+  k8 = m3**(-4)
+  k9 = k5*k6*k7*k8*x88
+  x113 = m3/a2**3
+  x118 = x0**(-3/2)
+  x119 = x118*x29*x30
+  x135 = a2**(-9/2)
+  x136 = x49*x78
+  k10 = x135*x136
+  x138 = a2**(-4)
+  x142 = m1**3
+  x143 = m2**3
+  x144 = x142 + x143
+  x164 = 2*x1
+  k11 = 1/x142
+  k12 = 1/x143
+  k13 = x20**(3/2)
+  k14 = a2**(-3/2)
+  k15 = m3**(-3)
+  k16 = k11*k12*k13*k14*k15*x118
+  k17 = 1/x49
+  x234 = x119*x20
+  k18 = m3*x50
+  k19 = -21*x79*x88/16
+  k20 = 15*x113*x2/2048
+  k21 = -x20*x29*x71
+  k22 = -x1
+  k23 = 2*x119
+  k24 = 3*x113/32
+  k25 = x0**(-9/2)
+  k26 = a2**(-5)
+  k27 = x0*x144
+  k28 = m2*x164
+  k29 = 2*x78
+  k30 = m2*x2*x46
+  k31 = x51*x79
+  k32 = 0.001373291015625*k25*k26
+  k33 = -15*x118*x138/256
+  k34 = 2*x12
+  k35 = -15*x87/512
+  k36 = x0**(-3)
+  k37 = x31*x79
+  k38 = 15*k36/4096
+  k39 = a2**(-7/2)
+  k40 = 128*k39*x136
+  k41 = x0**(-4)
+  k42 = a2**(-11/2)
+  k43 = -x144*x20
+  k44 = x47*x51
+  k45 = 20*x1*x49*x79
+  k46 = -k41*k42
+  k47 = 80*x135*x49
+  k48 = -160*m3*x138
+  return ((m2, m3, x1, x2, x11, x12, x13, x14, x20, x21, k2, x32, x46, x48,
+    x49, k4, x70, x71, x72, x78, k9, k10, x164, k16, k17, x234, k18, k19, k20,
+    k21, k22, k23, k24, k27, k28, k29, k30, k31, k32, k33, k34, k35, k37, k38,
+    k40, k43, k44, k45, k46, k47, k48))
+
+def deriv_quadrupole_octupole_hexadecapole(y, k):
+  '''The EOMs with the quadrupole, octupole, hexadecapole terms.
+
+  k is returned by deriv_quadrupole_octupole_hexadecapole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x1, x2, x11, x12, x13, x14, x20, x21, k2, x32, x46, x48, x49,
+    k4, x70, x71, x72, x78, k9, k10, x164, k16, k17, x234, k18, k19, k20,
+    k21, k22, k23, k24, k27, k28, k29, k30, k31, k32, k33, k34, k35, k37,
+    k38, k40, k43, k44, k45, k46, k47, k48) = k
+  x3 = e1**2
+  x4 = x3 - 1
+  x5 = a1**2
+  x6 = 2*g1
+  x7 = sin(x6)
+  x8 = H**2
+  x9 = 1 - x3
+  x10 = a1*x9
+  x15 = x10*x14
+  x16 = e2**2
+  x17 = 1 - x16
+  x22 = x17*x21
+  x23 = x15 + x22 - x8
+  x24 = x23**2
+  x25 = x16 - 1
+  x26 = 1/x25
+  x27 = k2/a1
+  x28 = x27/x4
+  x33 = x26*x28*x32
+  x34 = x24*x33
+  x35 = a1*x4
+  x36 = -x35
+  x37 = 1/sqrt(x36)
+  x38 = x17**(-1.5)*x37
+  x39 = 1/x17
+  x40 = -x15 - x22 + x8
+  x41 = x27*x32*x39*x40**2/x9
+  x42 = 4 - x41
+  x43 = cos(g1)
+  x44 = sin(g2)
+  x45 = 1/sqrt(x10)
+  x52 = sqrt(x17)
+  x53 = 1/x52
+  x54 = k4*x53
+  x55 = x49*x54
+  x56 = x40*x45*x48*x55
+  x57 = x44*x56
+  x58 = x43*x57
+  x59 = cos(g2)
+  x60 = 2*x59
+  x61 = x43*x60
+  x62 = sin(g1)
+  x63 = 5*x3
+  x64 = cos(x6)
+  x65 = 7*x3
+  x66 = x63 - x64*x65 + 2
+  x67 = x66*(2.5 - 0.625*x41)
+  x68 = 3*x3
+  x69 = x68 + 4
+  x73 = a1**3
+  x74 = x17**(-2.5)
+  x75 = e2*x37*x72*x73*x74
+  x76 = sqrt(x9)
+  x77 = 1/sqrt(-x25**7)
+  x80 = a1**(7/2)
+  x81 = 4*g1
+  x82 = 21*x3
+  x83 = 3*x16 + 2
+  x84 = x42**2*x83
+  x85 = x3 + 2
+  x86 = 2*x85
+  x89 = k9/x5
+  x90 = 7*x89
+  x91 = x23**4/(x25**2*x4**2)
+  x92 = -32*x34 + x90*x91 + 16
+  x93 = x83*x92
+  x94 = x56 + 2
+  x95 = x56 - 2
+  x96 = -g2
+  x97 = 2*x6 + 2*x96
+  x98 = sin(x97)
+  x99 = 2*g1 + 2*x96
+  x100 = sin(x99)
+  x101 = x94**2
+  x102 = 14*x56
+  x103 = 7*x41
+  x104 = x103 + 4
+  x105 = x101*(-x102 + x104)
+  x106 = x95**2
+  x107 = x41 - 4
+  x108 = 2*g2 + 2*x6
+  x109 = x107*x82*sin(x108)
+  x110 = x102 + x104
+  x111 = 2*g1 + 2*g2
+  x112 = x110*sin(x111)
+  x114 = 5*x64
+  x115 = x3*(x114 - 3)
+  x116 = x14*x35 + x21*x25 + x8
+  x117 = x116*x20
+  x120 = x12*x5
+  x121 = x17**(-3.0)
+  x122 = x37*x48
+  x123 = x122*x55
+  x124 = x116*x123
+  x125 = x124*x62
+  x126 = x125*x44
+  x127 = -x126 + x61
+  x128 = 5*x66
+  x129 = x116**2*x33
+  x130 = x66*(2.5 - 0.625*x129)
+  x131 = 5*x4
+  x132 = 6*x3 + 8
+  x133 = 2*x44
+  x134 = e1*x72
+  x137 = k10*x73
+  x139 = 4 - x129
+  x140 = m3*x4
+  x141 = 1/x76
+  x145 = cos(x81)
+  x146 = 147*x145
+  x147 = 35*x89
+  x148 = 2*g2
+  x149 = cos(x148)
+  x150 = x149*x16
+  x151 = 28*x3 + 28
+  x152 = cos(x108)
+  x153 = 2 - x56
+  x154 = x153**2
+  x155 = cos(x97)
+  x156 = x123*x23
+  x157 = (2 - x156)**2
+  x158 = x16*x3
+  x159 = 147*x42
+  x160 = cos(x111)
+  x161 = 14*x156
+  x162 = 7*x34 + 4
+  x163 = cos(x99)
+  x165 = sqrt(a1)
+  x166 = x165*x76
+  x167 = x117*x122
+  x168 = x1*x166
+  x169 = 560*x158
+  x170 = x160*x169
+  x171 = e1**4
+  x172 = x16*x171
+  x173 = 280*x172
+  x174 = x160*x173
+  x175 = x163*x169
+  x176 = x163*x173
+  x177 = 588*x172
+  x178 = x152*x177
+  x179 = x155*x177
+  x180 = k16/x17**(3/2)
+  x181 = 112*x180
+  x182 = x23**3/x36**(3/2)
+  x183 = x181*x182
+  x184 = 960*x3
+  x185 = 360*x171
+  x186 = 288*x16
+  x187 = x180*x182
+  x188 = 560*x3
+  x189 = 210*x171
+  x190 = 168*x16
+  x191 = 1440*x158
+  x192 = 540*x172
+  x193 = 256*x150
+  x194 = 840*x158
+  x195 = 315*x172
+  x196 = x149*x156
+  x197 = 1280*x158
+  x198 = 480*x172
+  x199 = x160*x34
+  x200 = 588*x158
+  x201 = 294*x172
+  x202 = x149*x169
+  x203 = x172*x187
+  x204 = 210*x149
+  x205 = x156*x160
+  x206 = 672*x158
+  x207 = 336*x172
+  x208 = x163*x200
+  x209 = x172*x34
+  x210 = 441*x209
+  x211 = x160*x187
+  x212 = 392*x158
+  x213 = 196*x172
+  x214 = x156*x163
+  x215 = x163*x187
+  x216 = 147*x203
+  x217 = x145*x171
+  x218 = x156*x83
+  x219 = x3*x85
+  x220 = 28*x219
+  x221 = x220*x64
+  x222 = k17/x25**4
+  x223 = x17**(-2.0)
+  x224 = x125*x59
+  x225 = x124 + 2
+  x226 = x156 + 2
+  x227 = 15*x171 + 40*x3 + 8
+  x228 = x40**3/x10**(3/2)
+  x229 = x180*x228
+  x230 = 3*a1/16
+  x231 = x23*x28
+  x232 = x44*x62
+  x233 = (4*x16 + 1)/e2
+  x235 = a1*x78
+  x236 = x12*x134
+  x237 = 5*x9
+  x238 = x234*x39*x40
+  x239 = x107**2*x217
+  x240 = x40**4/(x17**2*x9**2)
+  x241 = x227*(x147*x240 - 120*x41 + 48)
+  x242 = x25*x3
+  x243 = x240*x90 - 32*x41 + 16
+  x244 = x243*x64
+  x245 = x227*x243
+  x246 = x101*x155 + x106*x152
+  x247 = x85*(x105*x163 + x106*x110*x160)
+  x248 = k18*x52
+  x249 = 2*x248
+  x250 = x166*x40*x45
+  x251 = x250*x46*x54
+  x252 = x181*x228
+  x253 = x149*x56
+  x254 = x172*x229
+  x255 = x206*x56
+  x256 = x207*x56
+  x257 = x201*x41
+  x258 = x212*x229
+  x259 = x213*x229
+  x260 = 441*x172*x41
+  x261 = 147*x254
+  x262 = x56*x83
+  return ([0, k20*(e1*k19*x76*x77*x80*(-x16*(x100*x105*x86 + x106*(-x109 +
+    x112*x86) - x82*x94**3*x95*x98) + x7*x86*x93 - x82*x84*sin(x81)) -
+    64*e1*x38*x4*x5*x7*(4 - x34) + x4*x71*x75*(-35*x3*x42*x7*(-x57*x62 + x61) +
+    10*x42*x58*x9 + 4*(-x58 + x60*x62)*(-x67 + x69))),
+    e2*k35*x121*x134*x137*(k34 - x116*x28)*(-x124*x127*x128 + x133*x62*(-2*x130
+    + x131*(4 - 3*x34) + x132)) + k24*x120*x38*(k22*(k21*x24*x26*x28 + (x107 +
+    4*x3)*(x114 - 1)) + k23*x117*x26*(x115 - 2)) +
+    k32*x141*x80*(k27*x140*x77*(-x146*x3*x84 + 10*x150*x69*x92 -
+    x151*x16*(x154*x160*(-x161 + x162) + x157*x163*(x161 + x162)) +
+    x151*x64*x93 - x158*x159*(x152*x154 + x155*x157) - x69*x83*(x147*x91 -
+    120*x34 + 48)) + k31*x222*(k29*(m2*x168 + m3*x168 + x167) + k30*x117*x37 +
+    x11*(k28*x166 + x167))*(672*e2**3*x214*x3 + x150*x183 + x152*x210 +
+    x152*x216 - x155*x210 + x155*x216 + x156*x184 + x156*x185 + x156*x186 +
+    x156*x191 + x156*x192 - x156*x193 + 192*x156 + x159*x217*x218 +
+    294*x163*x209 + x170 + x174 - x175 - x176 - x178 + x179 - x183 - x187*x188
+    - x187*x189 - x187*x190 - x187*x194 - x187*x195 + x187*x202 - x196*x197 -
+    x196*x198 - x199*x200 - x199*x201 + x203*x204 + x205*x206 + x205*x207 +
+    x207*x214 + x208*x34 - x211*x212 - x211*x213 - x212*x215 - x213*x215 -
+    x218*x221*(16 - x103))) + k33*x140*x75*(-5*x126*x139*(x68 - 1) +
+    x127*(-5*x129 - 6*x130 + 18*x3 + 28))/e1,
+    k38*x137*(e2*k37*x230*(x100*x220*x225**2*(-14*x124 + 7*x129 + 4) +
+    147*x171*x225**3*x226*x98 + x226*(x153*x65*(x109 - 4*x112*x85) +
+    2*x227*(-7*x229 - 14*x41 + 4*x56 + 8)*sin(x148)))/x25**3 -
+    16*x134*x223*(-x131*x139*x224 + 2*(-x130 + x69)*(x133*x43 - x224))),
+    3*x120*(a1*k48*x232*x236*x45*x74*(e2*(x164 + x238)*(x132 + x237*(3*x41 - 4)
+    - 2*x67) - x233*x237*x238*x42) + k40*x223*(x12*(24*x3 - (12 -
+    5*x41)*(-x63*x64 + x68 + 2) + 16) + 4*x231*(2 - x115)) +
+    k46*x222*x230*(k43*x235*(-5145*x107*x172*x246 + 20*x149*x245*x25 -
+    70*x150*x245 + 980*x158*x247 - 1470*x17*x171*x246*x94*x95 -
+    980*x219*x244*x83 - 4410*x239*x25 + 5145*x239*x83 - 6*x241*x25 + 7*x241*x83
+    + 840*x242*x244*x85 - 280*x242*x247) + k45*x141*x165*(x11*(x249 + x251) +
+    x13*x249 + x78*(k44*x250*x53 + 4*x248 + x251))*(-x107*x146*x171*x262 +
+    x150*x252 - x152*x260 + x152*x261 + x155*x260 + x155*x261 + x160*x200*x41 +
+    x160*x255 + x160*x256 + x160*x257 - x160*x258 - x160*x259 + x163*x255 +
+    x163*x256 - x163*x257 - x163*x258 - x163*x259 - x170 - x174 + x175 + x176 +
+    x178 - x179 + x184*x56 + x185*x56 + x186*x56 - x188*x229 - x189*x229 -
+    x190*x229 + x191*x56 + x192*x56 - x193*x56 - x194*x229 - x195*x229 -
+    x197*x253 - x198*x253 + x202*x229 + x204*x254 - x208*x41 + x221*x262*(x103
+    - 16) - x252 + 192*x56)) + k47*x121*x235*x236*(x156*x232 +
+    x61)*(e2*x128*x2*x231*(x164 + x23*x234*x26) + x233*x70*(-x66*(2.5 -
+    0.625*x34) + x69)))/8192, 0])
+
+def deriv_quadrupole_octupole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_octupole_gr.'''
+  x4 = c**(-5)
+  x6 = m1 + m2
+  x7 = m1*m2
+  x8 = x6*x7
+  x10 = sqrt(x6)
+  x11 = 1/x10
+  x17 = 1/x6
+  x18 = m1**2
+  x19 = m2**2
+  x20 = x18*x19
+  x21 = x17*x20
+  x25 = m3**2
+  x26 = x6**2
+  x27 = m3 + x6
+  x28 = a2*x25*x26/x27
+  x36 = 1/(x18*x19)
+  x38 = x27/(a2*x25)
+  x39 = x17*x38
+  k0 = a2**(-3)
+  k1 = x36*x39
+  x53 = 1/(m1*m2)
+  x56 = sqrt(x27)
+  k2 = 1/sqrt(a2)
+  k3 = 1/m3
+  k4 = k2*k3*x56
+  x71 = x6**(3/2)
+  x72 = 1/x71
+  k5 = a2**(-4)
+  x74 = m1 - m2
+  x80 = x38*x72
+  x82 = 4*x17
+  x90 = 5*x11
+  x97 = x56*x7
+  k6 = a2**(-9/2)
+  x106 = 2*x10
+  k7 = x17*x74
+  k8 = -64*x8/5
+  k9 = -304*x4*x8/15
+  k10 = -15*x11/32
+  k11 = x38*x82
+  k12 = c**(-2)
+  k13 = -3*k12*x71
+  k14 = 1/x26
+  k15 = 2*x17
+  k16 = -15*k14/512
+  k17 = x6**(-3)
+  k18 = -15*k17/256
+  k19 = a2**(-7/2)
+  k20 = -5*m3/4
+  k21 = x10/2
+  k22 = x11*x7
+  k23 = -32*x10*x20/5
+  return ((m3, x4, x10, x11, x17, x21, x28, x36, x39, k0, k1, x53, k4, x72, k5,
+    x74, x80, x82, x90, x97, k6, x106, k7, k8, k9, k10, k11, k13, k15, k16,
+    k18, k19, k20, k21, k22, k23))
+
+def deriv_quadrupole_octupole_gr(y, k):
+  '''The EOMs with the quadrupole, octupole, gr terms.
+
+  k is returned by deriv_quadrupole_octupole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m3, x4, x10, x11, x17, x21, x28, x36, x39, k0, k1, x53, k4, x72, k5,
+    x74, x80, x82, x90, x97, k6, x106, k7, k8, k9, k10, k11, k13, k15, k16,
+    k18, k19, k20, k21, k22, k23) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**3
+  x3 = 1/x2
+  x5 = x3*x4
+  x9 = a1**2
+  x12 = 2*g1
+  x13 = sin(x12)
+  x14 = H**2
+  x15 = 1 - x0
+  x16 = a1*x15
+  x22 = x16*x21
+  x23 = e2**2
+  x24 = 1 - x23
+  x29 = x24*x28
+  x30 = -x14 + x22 + x29
+  x31 = x30**2
+  x32 = x23 - 1
+  x33 = 1/x32
+  x34 = 1/a1
+  x35 = x34/x1
+  x37 = x35*x36
+  x40 = x33*x37*x39
+  x41 = x31*x40
+  x42 = 4 - x41
+  x43 = a1*x1
+  x44 = sqrt(-x43)
+  x45 = 1/x44
+  x46 = m3*x45
+  x47 = k0*x24**(-1.5)*x46
+  x48 = 1/x24
+  x49 = x14 - x22 - x29
+  x50 = k1*x34*x48*x49**2/x15
+  x51 = 4 - x50
+  x52 = cos(g1)
+  x54 = sin(g2)
+  x55 = x54/sqrt(x16)
+  x57 = k4/sqrt(x24)
+  x58 = x11*x57
+  x59 = x49*x53*x55*x58
+  x60 = x52*x59
+  x61 = cos(g2)
+  x62 = 2*x61
+  x63 = x52*x62
+  x64 = sin(g1)
+  x65 = 5*x0
+  x66 = cos(x12)
+  x67 = -7*x0*x66 + x65 + 2
+  x68 = x67*(2.5 - 0.625*x50)
+  x69 = 3*x0
+  x70 = x69 + 4
+  x73 = k5*x24**(-2.5)
+  x75 = x2*x74
+  x76 = e2*x75
+  x77 = x1*x46*x72*x73*x76
+  x78 = 5*x66
+  x79 = -x0*(x78 - 3) + 2
+  x81 = x30*x33*x80
+  x83 = x17*x9
+  x84 = x30*x37
+  x85 = x58*x64
+  x86 = x45*x53
+  x87 = x30*x86
+  x88 = x54*x87
+  x89 = x63 + x85*x88
+  x91 = x67*x90
+  x92 = x67*(2.5 - 0.625*x41)
+  x93 = 3*x50
+  x94 = 5*x1
+  x95 = 6*x0 + 8
+  x96 = 2*x54
+  x98 = e1*k6
+  x99 = x24**(-3.0)*x97*x98
+  x100 = x14 + x21*x43 + x28*x32
+  x101 = x100**2*x40
+  x102 = x100*x86
+  x103 = x102*x61*x85
+  x104 = x24**(-2.0)*x97
+  x105 = (4*x23 + 1)/e2
+  x107 = a1*k7
+  x108 = 5*x15
+  x109 = x48*x49*x80
+  return ([k8*x5*(0.3854166666666667*e1**4 + 3.0416666666666665*x0 +
+    1)/sqrt(-x1**7), e1*k10*x1*x13*x42*x47*x9 +
+    15*x77*(-35*x0*x13*x51*(-x59*x64 + x63) + 10*x15*x51*x60 + 4*(-x60 +
+    x62*x64)*(-x68 + x70))/512 + e1*k9*(0.3980263157894737*x0 +
+    1)/(a1**4*sqrt(-x1**5)), k13*sqrt(x3)*x35 + k16*x76*x99*(k15 +
+    x84)*(x57*x87*x89*x91 + x64*x96*(-2*x92 + x94*(4 - x93) + x95)) +
+    3*x47*x83*(x10*(k11*x31*x33*x37 - (x78 - 1)*(4*x0 + x50 - 4)) +
+    2*x79*x81)/32 - 15*x77*(x42*x57*x64*x88*x90*(x69 - 1) + x89*(18*x0 - 5*x41
+    - 6*x92 + 28))/(256*e1), k18*x104*x75*x98*(-x103*x94*(4 - x101) + 2*(-x103
+    + x52*x96)*(-x67*(2.5 - 0.625*x101) + x70)),
+    3*x83*(e1*k20*x107*x55*x64*x73*(e2*(x106 + x109)*(x108*(x93 - 4) - 2*x68 +
+    x95) - x105*x108*x109*x51) + k19*x104*(x17*(24*x0 - (12 - 5*x50)*(-x65*x66
+    + x69 + 2) + 16) + 4*x79*x84) + 5*x107*x89*x99*(e2*x84*x91*(x106 + x81) +
+    x105*x82*(x70 - x92))/8)/64, k23*sqrt(x34)*x5*(0.875*x0 + 1)*(k21*x102 +
+    k22*x44)/(H*x1**2)])
+
+def deriv_quadrupole_octupole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_octupole.'''
+  x3 = m1 + m2
+  x4 = sqrt(x3)
+  x5 = 1/x4
+  x14 = 1/x3
+  x15 = m1**2
+  x16 = m2**2
+  x17 = x14*x15*x16
+  x19 = m3**2
+  x20 = x3**2
+  x21 = m3 + x3
+  x22 = a2*x19*x20/x21
+  k0 = 1/x15
+  k1 = 1/x16
+  k2 = k0*k1
+  x30 = 1/a2
+  x31 = x21*x30/x19
+  x32 = x14*x31
+  x43 = sqrt(x21)
+  k3 = 1/sqrt(a2)
+  k4 = 1/m1
+  k5 = 1/m2
+  k6 = 1/m3
+  k7 = k3*k4*k5*k6*x43
+  x59 = m1 - m2
+  k8 = a2**(-3)
+  x68 = x3**(-3/2)
+  x69 = x31*x68
+  x71 = 4*x14
+  x72 = 2*x14
+  x78 = 5*x5
+  x85 = m1*m2*x43
+  k9 = a2**(-9/2)
+  k10 = 5*x85/8
+  x89 = 5/(4*a2**4)
+  x96 = 2*x4
+  k11 = x30/8
+  k12 = 15*x5/64
+  k13 = x31*x71
+  k14 = 1/x20
+  k15 = -k14
+  k16 = -x68*x89
+  k17 = x3**(-3)
+  k18 = -15*k17/256
+  k19 = a2**(-7/2)
+  k20 = -m3*x89
+  return ((m3, x4, x5, x14, x17, x22, k2, x32, k7, x59, k8, x69, x71, x72, x78,
+    x85, k9, k10, x96, k11, k12, k13, k15, k16, k18, k19, k20))
+
+def deriv_quadrupole_octupole(y, k):
+  '''The EOMs with the quadrupole, octupole terms.
+
+  k is returned by deriv_quadrupole_octupole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m3, x4, x5, x14, x17, x22, k2, x32, k7, x59, k8, x69, x71, x72, x78,
+    x85, k9, k10, x96, k11, k12, k13, k15, k16, k18, k19, k20) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**2
+  x6 = 2*g1
+  x7 = sin(x6)
+  x8 = e2**2
+  x9 = 1 - x8
+  x10 = x9**(-1.5)
+  x11 = H**2
+  x12 = 1 - x0
+  x13 = a1*x12
+  x18 = x13*x17
+  x23 = x22*x9
+  x24 = -x11 + x18 + x23
+  x25 = x24**2
+  x26 = x8 - 1
+  x27 = 1/x26
+  x28 = k2/a1
+  x29 = x28/x1
+  x33 = x27*x29*x32
+  x34 = x25*x33
+  x35 = 4 - x34
+  x36 = 1/x9
+  x37 = x11 - x18 - x23
+  x38 = x28*x32*x36*x37**2/x12
+  x39 = 4 - x38
+  x40 = cos(g1)
+  x41 = sin(g2)
+  x42 = x41/sqrt(x13)
+  x44 = k7/sqrt(x9)
+  x45 = x44*x5
+  x46 = x37*x42*x45
+  x47 = x40*x46
+  x48 = cos(g2)
+  x49 = 2*x48
+  x50 = x40*x49
+  x51 = sin(g1)
+  x52 = 5*x0
+  x53 = cos(x6)
+  x54 = -7*x0*x53 + x52 + 2
+  x55 = x54*(2.5 - 0.625*x38)
+  x56 = 3*x0
+  x57 = x56 + 4
+  x58 = x9**(-2.5)
+  x60 = e2*x58*x59
+  x61 = a1*x14
+  x62 = a1*x1
+  x63 = 1/sqrt(-x62)
+  x64 = m3*x63
+  x65 = k8*x64
+  x66 = 5*x53
+  x67 = -x0*(x66 - 3) + 2
+  x70 = x24*x27*x69
+  x73 = x24*x29
+  x74 = x45*x51
+  x75 = x24*x63
+  x76 = x41*x75
+  x77 = x50 + x74*x76
+  x79 = x54*x78
+  x80 = x54*(2.5 - 0.625*x34)
+  x81 = 3*x38
+  x82 = 5*x1
+  x83 = 6*x0 + 8
+  x84 = 2*x41
+  x86 = e1*x59
+  x87 = k9*x86
+  x88 = k10*x87*x9**(-3.0)
+  x90 = 3*x2/64
+  x91 = x11 + x17*x62 + x22*x26
+  x92 = x33*x91**2
+  x93 = x48*x63*x74*x91
+  x94 = x85*x9**(-2.0)
+  x95 = (4*x8 + 1)/e2
+  x97 = 5*x12
+  x98 = x36*x37*x69
+  return ([0, k12*x1*x2*x65*(-2*e1*x10*x35*x7 +
+    k11*x60*x61*(-35*x0*x39*x7*(-x46*x51 + x50) + 10*x12*x39*x47 + 4*(-x47 +
+    x49*x51)*(-x55 + x57))), x90*(a1*e2*k15*x88*(x72 + x73)*(x44*x75*x77*x79 +
+    x51*x84*(-2*x80 + x82*(4 - x81) + x83)) + x10*x65*x72*(x4*(k13*x25*x27*x29
+    - (x66 - 1)*(4*x0 + x38 - 4)) + 2*x67*x70) +
+    k16*x60*x62*x64*(x35*x44*x51*x76*x78*(x56 - 1) + x77*(18*x0 - 5*x34 - 6*x80
+    + 28))/e1), a1**3*k18*x87*x94*(-x82*x93*(4 - x92) + 2*(x40*x84 -
+    x93)*(-x54*(2.5 - 0.625*x92) + x57)), x14*x90*(k19*x94*(x14*(24*x0 - (12 -
+    5*x38)*(-x52*x53 + x56 + 2) + 16) + 4*x67*x73) +
+    k20*x42*x51*x58*x61*x86*(e2*(x96 + x98)*(-2*x55 + x83 + x97*(x81 - 4)) -
+    x39*x95*x97*x98) + x61*x77*x88*(e2*x73*x79*(x70 + x96) + x71*x95*(x57 -
+    x80))), 0])
+
+def deriv_quadrupole_hexadecapole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_hexadecapole_gr.'''
+  x4 = c**(-5)
+  x6 = m1 + m2
+  x7 = m1*m2
+  x8 = x6*x7
+  x15 = m1**2
+  x16 = m2**2
+  x17 = 1/(x15*x16)
+  x22 = 1/x6
+  x23 = x15*x16
+  x24 = x22*x23
+  x28 = m3**2
+  x29 = x6**2
+  x30 = m3 + x6
+  x31 = a2*x28*x29/x30
+  x35 = 1/(a2*x28)
+  x37 = x22*x30
+  x40 = sqrt(x6)
+  x41 = 1/x40
+  k0 = a2**(-3)
+  k1 = k0*m3
+  x49 = x15 + x16 - x7
+  k2 = x17*x35*x37
+  x59 = a2**(-2)
+  k3 = 1/x29
+  k4 = x30**2
+  k5 = m1**(-4)
+  k6 = m2**(-4)
+  k7 = m3**(-4)
+  k8 = k3*k4*k5*k6*k7*x59
+  x67 = 1/m1
+  x68 = x67/m2
+  x69 = sqrt(x30)
+  x70 = sqrt(a2)
+  x71 = 1/x70
+  k9 = 1/m3
+  k10 = k9*x71
+  k11 = x41*x68
+  k12 = a2**(-5)
+  x98 = x6**(3/2)
+  x99 = 1/x98
+  x108 = m1**3
+  x109 = m2**3
+  x110 = x108 + x109
+  k13 = 1/x108
+  k14 = 1/x109
+  k15 = x30**(3/2)
+  k16 = a2**(-3/2)
+  k17 = m3**(-3)
+  k18 = k13*k14*k15*k16*k17*x99
+  k19 = 1/x69
+  x192 = x6**(-4)
+  x199 = x69*x7
+  k20 = m3*x70
+  k21 = -64*x8/5
+  k22 = 622592*x4*x8
+  k23 = x6**(-5/2)
+  k24 = 4725*k23*x49/16
+  k25 = c**(-2)
+  k26 = -3*k25*x98
+  k27 = -x40
+  k28 = 2*x99
+  k29 = x6**(-9/2)
+  k30 = x110*x6
+  k31 = 2*x7
+  k32 = m2*x67
+  k33 = x49*x71
+  k34 = 0.001373291015625*k29
+  k35 = a2**(-11/2)
+  k36 = 7*x37
+  k37 = 45*k35*x192*x199*x49/65536
+  k38 = a2**(-7/2)
+  k39 = 128*x199
+  k40 = -x110*x30*x7
+  k41 = x68*x71
+  k42 = 20*x40*x49*x69
+  k43 = -3*x192*x59/16
+  k44 = 3*k38/8192
+  k45 = x41*x7
+  k46 = x40*x68/2
+  k47 = -32*x23*x40/5
+  return ((m2, m3, x4, x7, x15, x16, x17, x22, x24, x30, x31, x35, x37, x40,
+    x41, k1, k2, k8, x67, x68, x69, k10, k11, k12, k18, k19, k20, k21, k22,
+    k24, k26, k27, k28, k30, k31, k32, k33, k34, k36, k37, k39, k40, k41, k42,
+    k43, k44, k45, k46, k47))
+
+def deriv_quadrupole_hexadecapole_gr(y, k):
+  '''The EOMs with the quadrupole, hexadecapole, gr terms.
+
+  k is returned by deriv_quadrupole_hexadecapole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x4, x7, x15, x16, x17, x22, x24, x30, x31, x35, x37, x40, x41,
+    k1, k2, k8, x67, x68, x69, k10, k11, k12, k18, k19, k20, k21, k22, k24,
+    k26, k27, k28, k30, k31, k32, k33, k34, k36, k37, k39, k40, k41, k42,
+    k43, k44, k45, k46, k47) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = e1**4
+  x3 = a1**(-3)
+  x5 = x3*x4
+  x9 = a1**4
+  x10 = 2*g1
+  x11 = sin(x10)
+  x12 = a1**2
+  x13 = 1/a1
+  x14 = x13/x1
+  x18 = x14*x17
+  x19 = H**2
+  x20 = 1 - x0
+  x21 = a1*x20
+  x25 = x21*x24
+  x26 = e2**2
+  x27 = 1 - x26
+  x32 = x27*x31
+  x33 = -x19 + x25 + x32
+  x34 = x26 - 1
+  x36 = x35/x34
+  x38 = x33**2*x36*x37
+  x39 = x18*x38
+  x42 = a1*x1
+  x43 = -x42
+  x44 = sqrt(x43)
+  x45 = 1/x44
+  x46 = x41*x45
+  x47 = k1*x27**(-1.5)
+  x48 = sqrt(x20)
+  x50 = 4*g1
+  x51 = 21*x0
+  x52 = 3*x26 + 2
+  x53 = x19 - x25 - x32
+  x54 = k2*x13*x53**2/(x20*x27)
+  x55 = 4 - x54
+  x56 = x52*x55**2
+  x57 = x0 + 2
+  x58 = 2*x57
+  x60 = k8/x12
+  x61 = 7*x60
+  x62 = x1**(-2)
+  x63 = x33**4*x62/x34**2
+  x64 = -32*x39 + x61*x63 + 16
+  x65 = x52*x64
+  x66 = 1/sqrt(x21)
+  x72 = sqrt(x27)
+  x73 = 1/x72
+  x74 = k10*x73
+  x75 = x69*x74
+  x76 = k11*x53*x66*x75
+  x77 = x76 + 2
+  x78 = x76 - 2
+  x79 = -g2
+  x80 = 2*x10 + 2*x79
+  x81 = sin(x80)
+  x82 = 2*g1 + 2*x79
+  x83 = sin(x82)
+  x84 = x77**2
+  x85 = 14*x76
+  x86 = 7*x54
+  x87 = x86 + 4
+  x88 = x84*(-x85 + x87)
+  x89 = x78**2
+  x90 = x54 - 4
+  x91 = 2*g2 + 2*x10
+  x92 = x51*x90*sin(x91)
+  x93 = x85 + x87
+  x94 = 2*g1 + 2*g2
+  x95 = x93*sin(x94)
+  x96 = m3/sqrt(-x34**7)
+  x97 = a1**(7/2)*k12
+  x100 = cos(x10)
+  x101 = 5*x100
+  x102 = x0*(x101 - 3)
+  x103 = x19 + x24*x42 + x31*x34
+  x104 = x103*x30
+  x105 = 4*x18
+  x106 = x12*x22
+  x107 = 1/x48
+  x111 = cos(x50)
+  x112 = 147*x111
+  x113 = 3*x0
+  x114 = x113 + 4
+  x115 = 35*x60
+  x116 = 2*g2
+  x117 = cos(x116)
+  x118 = x117*x26
+  x119 = 28*x0 + 28
+  x120 = cos(x91)
+  x121 = 2 - x76
+  x122 = x121**2
+  x123 = cos(x80)
+  x124 = x46*x68
+  x125 = x124*x75
+  x126 = x125*x33
+  x127 = (2 - x126)**2
+  x128 = x0*x26
+  x129 = 147*x55
+  x130 = cos(x94)
+  x131 = 14*x126
+  x132 = 7*x39 + 4
+  x133 = cos(x82)
+  x134 = sqrt(a1)
+  x135 = x134*x48
+  x136 = x135*x40
+  x137 = m2*x136
+  x138 = x104*x124
+  x139 = 560*x128
+  x140 = x130*x139
+  x141 = x2*x26
+  x142 = 280*x141
+  x143 = x130*x142
+  x144 = x133*x139
+  x145 = x133*x142
+  x146 = 588*x141
+  x147 = x120*x146
+  x148 = x123*x146
+  x149 = k18/x27**(3/2)
+  x150 = 112*x149
+  x151 = x33**3/x43**(3/2)
+  x152 = x150*x151
+  x153 = 960*x0
+  x154 = 360*x2
+  x155 = 288*x26
+  x156 = x149*x151
+  x157 = 560*x0
+  x158 = 210*x2
+  x159 = 168*x26
+  x160 = 1440*x128
+  x161 = 540*x141
+  x162 = 256*x118
+  x163 = 840*x128
+  x164 = 315*x141
+  x165 = x117*x126
+  x166 = 1280*x128
+  x167 = 480*x141
+  x168 = x130*x39
+  x169 = 588*x128
+  x170 = 294*x141
+  x171 = x117*x139
+  x172 = x141*x156
+  x173 = 210*x117
+  x174 = x126*x130
+  x175 = 672*x128
+  x176 = 336*x141
+  x177 = x133*x169
+  x178 = x141*x39
+  x179 = 441*x178
+  x180 = x130*x156
+  x181 = 392*x128
+  x182 = 196*x141
+  x183 = x126*x133
+  x184 = x133*x156
+  x185 = 147*x172
+  x186 = x111*x2
+  x187 = x126*x52
+  x188 = x0*x57
+  x189 = 28*x188
+  x190 = x100*x189
+  x191 = k19/x34**4
+  x193 = x103*x125
+  x194 = x193 + 2
+  x195 = x126 + 2
+  x196 = 40*x0 + 15*x2 + 8
+  x197 = x53**3/x21**(3/2)
+  x198 = x149*x197
+  x200 = x186*x90**2
+  x201 = x53**4/(x20**2*x27**2)
+  x202 = x196*(x115*x201 - 120*x54 + 48)
+  x203 = x0*x34
+  x204 = x201*x61 - 32*x54 + 16
+  x205 = x100*x204
+  x206 = x196*x204
+  x207 = x120*x89 + x123*x84
+  x208 = x57*(x130*x89*x93 + x133*x88)
+  x209 = k20*x72
+  x210 = 2*x209
+  x211 = x135*x53*x66
+  x212 = x211*x67*x74
+  x213 = x150*x197
+  x214 = x117*x76
+  x215 = x141*x198
+  x216 = x175*x76
+  x217 = x176*x76
+  x218 = x170*x54
+  x219 = x181*x198
+  x220 = x182*x198
+  x221 = 441*x141*x54
+  x222 = 147*x215
+  x223 = x52*x76
+  return ([k21*x5*(3.0416666666666665*x0 + 0.3854166666666667*x2 +
+    1)/sqrt(-x1**7), -e1*(k22*(0.3980263157894737*x0 + 1)/(x9*sqrt(-x1**5)) +
+    k24*x48*x96*x97*(x11*x58*x65 - x26*(-x51*x77**3*x78*x81 + x58*x83*x88 +
+    x89*(x58*x95 - x92)) - x51*x56*sin(x50)) + 14400*x1*x11*x12*x46*x47*(4 -
+    x39))/30720, k26*x14*sqrt(x3) + k34*x107*x97*(k30*x1*x96*(-x0*x112*x56 +
+    x100*x119*x65 + 10*x114*x118*x64 - x114*x52*(x115*x63 - 120*x39 + 48) -
+    x119*x26*(x122*x130*(-x131 + x132) + x127*x133*(x131 + x132)) -
+    x128*x129*(x120*x122 + x123*x127)) + k33*x191*(k31*(m3*x136 + x137 + x138)
+    + k32*x104*x46 + x15*(2*x137 + x138))*(672*e2**3*x0*x183 + x118*x152 +
+    x120*x179 + x120*x185 - x123*x179 + x123*x185 + x126*x153 + x126*x154 +
+    x126*x155 + x126*x160 + x126*x161 - x126*x162 + 192*x126 + x129*x186*x187 +
+    294*x133*x178 + x140 + x143 - x144 - x145 - x147 + x148 - x152 - x156*x157
+    - x156*x158 - x156*x159 - x156*x163 - x156*x164 + x156*x171 - x165*x166 -
+    x165*x167 - x168*x169 - x168*x170 + x172*x173 + x174*x175 + x174*x176 +
+    x176*x183 + x177*x39 - x180*x181 - x180*x182 - x181*x184 - x182*x184 -
+    x187*x190*(16 - x86))) + 3*x106*x45*x47*(k27*(-x105*x38 + (4*x0 +
+    x90)*(x101 - 1)) + k28*x104*x36*(x102 - 2))/32,
+    e2*k37*x9*(x189*x194**2*x83*(k36*x103**2*x18*x36 - 14*x193 + 4) +
+    147*x194**3*x195*x2*x81 + x195*(7*x0*x121*(-4*x57*x95 + x92) +
+    2*x196*(-7*x198 - 14*x54 + 4*x76 + 8)*sin(x116)))/x34**3,
+    k44*x106*(a1*k43*x191*(a1*k40*(20*x117*x206*x34 - 70*x118*x206 +
+    980*x128*x208 - 5145*x141*x207*x90 - 980*x188*x205*x52 -
+    1470*x2*x207*x27*x77*x78 - 4410*x200*x34 + 5145*x200*x52 - 6*x202*x34 +
+    7*x202*x52 + 840*x203*x205*x57 - 280*x203*x208) + k42*x107*x134*(x15*(x210
+    + x212) + x16*x210 + x7*(k41*x211*x73 + 4*x209 + x212))*(-x112*x2*x223*x90
+    + x118*x213 - x120*x221 + x120*x222 + x123*x221 + x123*x222 + x130*x169*x54
+    + x130*x216 + x130*x217 + x130*x218 - x130*x219 - x130*x220 + x133*x216 +
+    x133*x217 - x133*x218 - x133*x219 - x133*x220 - x140 - x143 + x144 + x145 +
+    x147 - x148 + x153*x76 + x154*x76 + x155*x76 - x157*x198 - x158*x198 -
+    x159*x198 + x160*x76 + x161*x76 - x162*x76 - x163*x198 - x164*x198 -
+    x166*x214 - x167*x214 + x171*x198 + x173*x215 - x177*x54 + x190*x223*(x86 -
+    16) - x213 + 192*x76)) + k39*x27**(-2.0)*(x105*x33*(2 - x102) + x22*(24*x0
+    - (12 - 5*x54)*(-x0*x101 + x113 + 2) + 16))),
+    k47*sqrt(x13)*x5*x62*(0.875*x0 + 1)*(k45*x44 + k46*x103*x45)/H])
+
+def deriv_quadrupole_hexadecapole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_hexadecapole.'''
+  x0 = a2**(-3)
+  x1 = m1 + m2
+  x2 = sqrt(x1)
+  x3 = 1/x2
+  x9 = m1**2
+  x10 = m2**2
+  k0 = 1/x10
+  k1 = 1/x9
+  k2 = k0*k1
+  x16 = 1/x1
+  x17 = x10*x16*x9
+  x21 = m3**2
+  x22 = x1**2
+  x23 = m3 + x1
+  x24 = a2*x21*x22/x23
+  x28 = 1/(a2*x21)
+  x30 = x16*x23
+  x39 = m1*m2
+  x40 = x10 - x39 + x9
+  x41 = 1/x22
+  k3 = x28*x30
+  x51 = a2**(-2)
+  k4 = x23**2
+  k5 = m1**(-4)
+  k6 = m2**(-4)
+  k7 = m3**(-4)
+  k8 = k4*k5*k6*k7*x41*x51
+  x58 = 1/m1
+  x59 = x58/m2
+  x60 = x3*x59
+  x61 = sqrt(x23)
+  x62 = sqrt(a2)
+  x63 = 1/x62
+  k9 = 1/m3
+  k10 = k9*x63
+  x89 = x1**(-3/2)
+  x98 = m1**3
+  x99 = m2**3
+  x100 = x98 + x99
+  k11 = x23**(3/2)
+  k12 = 1/x98
+  k13 = 1/x99
+  k14 = a2**(-3/2)
+  k15 = m3**(-3)
+  k16 = k11*k12*k13*k14*k15*x89
+  k17 = 1/x61
+  x183 = x1**(-4)
+  x190 = x39*x61
+  k18 = m3*x62
+  k19 = 21*x40*x41/16
+  k20 = -15*m3*x0*x3/2048
+  k21 = -x2
+  k22 = 2*x89
+  k23 = 3*m3
+  k24 = x1**(-9/2)
+  k25 = 2*x39
+  k26 = m2*x3*x58
+  k27 = x40*x63
+  k28 = m3*x1*x100
+  k29 = 0.0439453125*k24
+  k30 = x0/32
+  k31 = a2**(-11/2)
+  k32 = 7*x30
+  k33 = 45*k31*x183*x190*x40/65536
+  k34 = a2**(-7/2)
+  k35 = 128*x190
+  k36 = -x100*x23*x39
+  k37 = x59*x63
+  k38 = 20*x2*x40*x61
+  k39 = -3*x183*x51/16
+  k40 = 3*k34/8192
+  return ((m2, m3, x2, x9, x10, k2, x16, x17, x23, x24, x28, x30, x39, k3, x51,
+    k8, x58, x60, x61, k10, k16, k17, k18, k19, k20, k21, k22, k23, k25, k26,
+    k27, k28, k29, k30, k32, k33, k35, k36, k37, k38, k39, k40))
+
+def deriv_quadrupole_hexadecapole(y, k):
+  '''The EOMs with the quadrupole, hexadecapole terms.
+
+  k is returned by deriv_quadrupole_hexadecapole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x2, x9, x10, k2, x16, x17, x23, x24, x28, x30, x39, k3, x51, k8,
+    x58, x60, x61, k10, k16, k17, k18, k19, k20, k21, k22, k23, k25, k26,
+    k27, k28, k29, k30, k32, k33, k35, k36, k37, k38, k39, k40) = k
+  x4 = e1**2
+  x5 = x4 - 1
+  x6 = 2*g1
+  x7 = sin(x6)
+  x8 = a1**2
+  x11 = k2/a1
+  x12 = x11/x5
+  x13 = H**2
+  x14 = 1 - x4
+  x15 = a1*x14
+  x18 = x15*x17
+  x19 = e2**2
+  x20 = 1 - x19
+  x25 = x20*x24
+  x26 = -x13 + x18 + x25
+  x27 = x19 - 1
+  x29 = x28/x27
+  x31 = x26**2*x29*x30
+  x32 = x12*x31
+  x33 = a1*x5
+  x34 = -x33
+  x35 = 1/sqrt(x34)
+  x36 = x20**(-1.5)*x35
+  x37 = sqrt(x14)
+  x38 = 1/sqrt(-x27**7)
+  x42 = 4*g1
+  x43 = 21*x4
+  x44 = 3*x19 + 2
+  x45 = x13 - x18 - x25
+  x46 = k3*x11*x45**2/(x14*x20)
+  x47 = 4 - x46
+  x48 = x44*x47**2
+  x49 = x4 + 2
+  x50 = 2*x49
+  x52 = k8/x8
+  x53 = 7*x52
+  x54 = x26**4/(x27**2*x5**2)
+  x55 = -32*x32 + x53*x54 + 16
+  x56 = x44*x55
+  x57 = 1/sqrt(x15)
+  x64 = sqrt(x20)
+  x65 = 1/x64
+  x66 = k10*x65
+  x67 = x61*x66
+  x68 = x45*x57*x60*x67
+  x69 = x68 + 2
+  x70 = x68 - 2
+  x71 = -g2
+  x72 = 2*x6 + 2*x71
+  x73 = sin(x72)
+  x74 = 2*g1 + 2*x71
+  x75 = sin(x74)
+  x76 = x69**2
+  x77 = 14*x68
+  x78 = 7*x46
+  x79 = x78 + 4
+  x80 = x76*(-x77 + x79)
+  x81 = x70**2
+  x82 = x46 - 4
+  x83 = 2*g2 + 2*x6
+  x84 = x43*x82*sin(x83)
+  x85 = x77 + x79
+  x86 = 2*g1 + 2*g2
+  x87 = x85*sin(x86)
+  x88 = a1**(7/2)*x51
+  x90 = cos(x6)
+  x91 = 5*x90
+  x92 = x4*(x91 - 3)
+  x93 = x13 + x17*x33 + x24*x27
+  x94 = x23*x93
+  x95 = 4*x12
+  x96 = x16*x8
+  x97 = 1/x37
+  x101 = cos(x42)
+  x102 = 147*x101
+  x103 = 3*x4
+  x104 = x103 + 4
+  x105 = 35*x52
+  x106 = 2*g2
+  x107 = cos(x106)
+  x108 = x107*x19
+  x109 = 28*x4 + 28
+  x110 = cos(x83)
+  x111 = 2 - x68
+  x112 = x111**2
+  x113 = cos(x72)
+  x114 = x35*x60
+  x115 = x114*x67
+  x116 = x115*x26
+  x117 = (2 - x116)**2
+  x118 = x19*x4
+  x119 = 147*x47
+  x120 = cos(x86)
+  x121 = 14*x116
+  x122 = 7*x32 + 4
+  x123 = cos(x74)
+  x124 = sqrt(a1)
+  x125 = x124*x37
+  x126 = x125*x2
+  x127 = m2*x126
+  x128 = x114*x94
+  x129 = 560*x118
+  x130 = x120*x129
+  x131 = e1**4
+  x132 = x131*x19
+  x133 = 280*x132
+  x134 = x120*x133
+  x135 = x123*x129
+  x136 = x123*x133
+  x137 = 588*x132
+  x138 = x110*x137
+  x139 = x113*x137
+  x140 = k16/x20**(3/2)
+  x141 = 112*x140
+  x142 = x26**3/x34**(3/2)
+  x143 = x141*x142
+  x144 = 960*x4
+  x145 = 360*x131
+  x146 = 288*x19
+  x147 = x140*x142
+  x148 = 560*x4
+  x149 = 210*x131
+  x150 = 168*x19
+  x151 = 1440*x118
+  x152 = 540*x132
+  x153 = 256*x108
+  x154 = 840*x118
+  x155 = 315*x132
+  x156 = x107*x116
+  x157 = 1280*x118
+  x158 = 480*x132
+  x159 = x120*x32
+  x160 = 588*x118
+  x161 = 294*x132
+  x162 = x107*x129
+  x163 = x132*x147
+  x164 = 210*x107
+  x165 = x116*x120
+  x166 = 672*x118
+  x167 = 336*x132
+  x168 = x123*x160
+  x169 = x132*x32
+  x170 = 441*x169
+  x171 = x120*x147
+  x172 = 392*x118
+  x173 = 196*x132
+  x174 = x116*x123
+  x175 = x123*x147
+  x176 = 147*x163
+  x177 = x101*x131
+  x178 = x116*x44
+  x179 = x4*x49
+  x180 = 28*x179
+  x181 = x180*x90
+  x182 = k17/x27**4
+  x184 = x115*x93
+  x185 = x184 + 2
+  x186 = x116 + 2
+  x187 = 15*x131 + 40*x4 + 8
+  x188 = x45**3/x15**(3/2)
+  x189 = x140*x188
+  x191 = x177*x82**2
+  x192 = x45**4/(x14**2*x20**2)
+  x193 = x187*(x105*x192 - 120*x46 + 48)
+  x194 = x27*x4
+  x195 = x192*x53 - 32*x46 + 16
+  x196 = x195*x90
+  x197 = x187*x195
+  x198 = x110*x81 + x113*x76
+  x199 = x49*(x120*x81*x85 + x123*x80)
+  x200 = k18*x64
+  x201 = 2*x200
+  x202 = x125*x45*x57
+  x203 = x202*x58*x66
+  x204 = x141*x188
+  x205 = x107*x68
+  x206 = x132*x189
+  x207 = x166*x68
+  x208 = x167*x68
+  x209 = x161*x46
+  x210 = x172*x189
+  x211 = x173*x189
+  x212 = 441*x132*x46
+  x213 = 147*x206
+  x214 = x44*x68
+  return ([0, e1*k20*(k19*x37*x38*x88*(-x19*(-x43*x69**3*x70*x73 + x50*x75*x80
+    + x81*(x50*x87 - x84)) - x43*x48*sin(x42) + x50*x56*x7) +
+    64*x36*x5*x7*x8*(4 - x32)), k30*(k23*x36*x96*(k21*(-x31*x95 + (4*x4 +
+    x82)*(x91 - 1)) + k22*x29*x94*(x92 - 2)) +
+    k29*x88*x97*(k27*x182*(k25*(m3*x126 + x127 + x128) + k26*x35*x94 +
+    x9*(2*x127 + x128))*(672*e2**3*x174*x4 + x108*x143 + x110*x170 + x110*x176
+    - x113*x170 + x113*x176 + x116*x144 + x116*x145 + x116*x146 + x116*x151 +
+    x116*x152 - x116*x153 + 192*x116 + x119*x177*x178 + 294*x123*x169 + x130 +
+    x134 - x135 - x136 - x138 + x139 - x143 - x147*x148 - x147*x149 - x147*x150
+    - x147*x154 - x147*x155 + x147*x162 - x156*x157 - x156*x158 - x159*x160 -
+    x159*x161 + x163*x164 + x165*x166 + x165*x167 + x167*x174 + x168*x32 -
+    x171*x172 - x171*x173 - x172*x175 - x173*x175 - x178*x181*(16 - x78)) +
+    k28*x38*x5*(-x102*x4*x48 + 10*x104*x108*x55 - x104*x44*(x105*x54 - 120*x32
+    + 48) - x109*x19*(x112*x120*(-x121 + x122) + x117*x123*(x121 + x122)) +
+    x109*x56*x90 - x118*x119*(x110*x112 + x113*x117)))),
+    a1**4*e2*k33*(147*x131*x185**3*x186*x73 +
+    x180*x185**2*x75*(k32*x12*x29*x93**2 - 14*x184 + 4) +
+    x186*(7*x111*x4*(-4*x49*x87 + x84) + 2*x187*(-7*x189 - 14*x46 + 4*x68 +
+    8)*sin(x106)))/x27**3, k40*x96*(a1*k39*x182*(a1*k36*(20*x107*x197*x27 -
+    70*x108*x197 + 980*x118*x199 - 1470*x131*x198*x20*x69*x70 -
+    5145*x132*x198*x82 - 980*x179*x196*x44 - 4410*x191*x27 + 5145*x191*x44 -
+    6*x193*x27 + 7*x193*x44 + 840*x194*x196*x49 - 280*x194*x199) +
+    k38*x124*x97*(x10*x201 + x39*(k37*x202*x65 + 4*x200 + x203) + x9*(x201 +
+    x203))*(-x102*x131*x214*x82 + x108*x204 - x110*x212 + x110*x213 + x113*x212
+    + x113*x213 + x120*x160*x46 + x120*x207 + x120*x208 + x120*x209 - x120*x210
+    - x120*x211 + x123*x207 + x123*x208 - x123*x209 - x123*x210 - x123*x211 -
+    x130 - x134 + x135 + x136 + x138 - x139 + x144*x68 + x145*x68 + x146*x68 -
+    x148*x189 - x149*x189 - x150*x189 + x151*x68 + x152*x68 - x153*x68 -
+    x154*x189 - x155*x189 - x157*x205 - x158*x205 + x162*x189 + x164*x206 -
+    x168*x46 + x181*x214*(x78 - 16) - x204 + 192*x68)) +
+    k35*x20**(-2.0)*(x16*(24*x4 - (12 - 5*x46)*(x103 - x4*x91 + 2) + 16) +
+    x26*x95*(2 - x92))), 0])
+
+def deriv_quadrupole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole_gr.'''
+  x3 = c**(-5)
+  x5 = m1 + m2
+  x6 = m1*m2
+  x7 = x5*x6
+  x8 = sqrt(x5)
+  x9 = 1/x8
+  x11 = 1/x5
+  x14 = m1**2
+  x15 = m2**2
+  x16 = x14*x15
+  x17 = x11*x16
+  x21 = m3**2
+  x22 = m3 + x5
+  x23 = a2*x21*x5**2/x22
+  x27 = 1/(x14*x15)
+  x30 = x22/(a2*x21)
+  k0 = a2**(-3)
+  k1 = k0*m3
+  x38 = x5**(3/2)
+  k2 = -64*x7/5
+  k3 = 2432*x3*x7
+  k4 = 225*x9/4
+  k5 = x11*x27*x30
+  k6 = -x8
+  k7 = 1/x38
+  k8 = 2*k7
+  k9 = c**(-2)
+  k10 = -3*k9*x38
+  k11 = sqrt(x22)
+  k12 = a2**(-7/2)
+  k13 = x11/4
+  k14 = 3*k11*k12*x6/16
+  k15 = x6*x9
+  k16 = 1/m1
+  k17 = 1/m2
+  k18 = k16*k17*x8/2
+  k19 = -32*x16*x8/5
+  return ((x3, x11, x17, x23, x27, x30, k1, k2, k3, k4, k5, k6, k8, k10, k13,
+    k14, k15, k18, k19))
+
+def deriv_quadrupole_gr(y, k):
+  '''The EOMs with the quadrupole, gr terms.
+
+  k is returned by deriv_quadrupole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x3, x11, x17, x23, x27, x30, k1, k2, k3, k4, k5, k6, k8, k10, k13, k14,
+    k15, k18, k19) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**(-3)
+  x4 = x2*x3
+  x10 = a1**2
+  x12 = H**2
+  x13 = 1 - x0
+  x18 = a1*x13*x17
+  x19 = e2**2
+  x20 = 1 - x19
+  x24 = x20*x23
+  x25 = 1/a1
+  x26 = x25/x1
+  x28 = x26*x27
+  x29 = x19 - 1
+  x31 = x30/x29
+  x32 = x11*x28*x31*(-x12 + x18 + x24)**2
+  x33 = 2*g1
+  x34 = a1*x1
+  x35 = sqrt(-x34)
+  x36 = 1/x35
+  x37 = k1*x20**(-1.5)*x36
+  x39 = 5*cos(x33)
+  x40 = x12 + x17*x34 + x23*x29
+  x41 = x40*(x0*(x39 - 3) - 2)
+  x42 = x10*x11
+  return ([k2*x4*(0.3854166666666667*e1**4 + 3.0416666666666665*x0 +
+    1)/sqrt(-x1**7), -e1*(k4*x1*x10*x37*(4 - x32)*sin(x33) +
+    k3*(0.3980263157894737*x0 + 1)/(a1**4*sqrt(-x1**5)))/120, k10*sqrt(x2)*x26
+    + 3*x37*x42*(k6*(-4*x32 + (x39 - 1)*(k5*x25*(x12 - x18 - x24)**2/(x13*x20)
+    + 4*x0 - 4)) + k8*x31*x41)/32, 0, k14*x20**(-2.0)*x42*(k13*(24*x0 - (12 -
+    5*x32)*(-x0*x39 + 3*x0 + 2) + 16) + x28*x41), k19*sqrt(x25)*x4*(0.875*x0 +
+    1)*(k15*x35 + k18*x36*x40)/(H*x1**2)])
+
+def deriv_quadrupole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_quadrupole.'''
+  x3 = m1 + m2
+  x4 = sqrt(x3)
+  x7 = 1/x3
+  x8 = m1**2
+  x9 = m2**2
+  x10 = x7*x8*x9
+  x13 = m3**2
+  x14 = m3 + x3
+  x15 = a2*x13*x3**2/x14
+  x17 = x7/4
+  k0 = 1/x8
+  k1 = 1/x9
+  k2 = k0*k1
+  x20 = x14/(a2*x13)
+  k3 = a2**(-3)
+  k4 = k3*m3
+  k5 = 1/x4
+  k6 = -x17
+  k7 = -15*k5/8
+  k8 = x20*x7
+  k9 = -x4
+  k10 = x3**(-3/2)
+  k11 = 2*k10
+  k12 = sqrt(x14)
+  k13 = a2**(-7/2)
+  k14 = 3*k12*k13*m1*m2/16
+  return (x7, x10, x15, x17, k2, x20, k4, k6, k7, k8, k9, k11, k14)
+
+def deriv_quadrupole(y, k):
+  '''The EOMs with the quadrupole terms.
+
+  k is returned by deriv_quadrupole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x7, x10, x15, x17, k2, x20, k4, k6, k7, k8, k9, k11, k14) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**2
+  x5 = H**2
+  x6 = a1*x1
+  x11 = e2**2
+  x12 = x11 - 1
+  x16 = x10*x6 + x12*x15 + x5
+  x18 = k2/a1
+  x19 = x18/x1
+  x21 = x20/x12
+  x22 = x19*x21
+  x23 = 2*g1
+  x24 = 1 - x11
+  x25 = k4*x24**(-1.5)/sqrt(-x6)
+  x26 = 5*cos(x23)
+  x27 = x16*(x0*(x26 - 3) - 2)
+  x28 = 1 - x0
+  x29 = a1*x10*x28
+  x30 = x15*x24
+  x31 = x22*x7*(x29 + x30 - x5)**2
+  x32 = x2*x7
+  return ([0, e1*k7*x1*x2*x25*(k6*x16**2*x22 + 1)*sin(x23),
+    3*x25*x32*(k11*x21*x27 + k9*(-4*x31 + (x26 - 1)*(k8*x18*(-x29 - x30 +
+    x5)**2/(x24*x28) + 4*x0 - 4)))/32, 0, k14*x24**(-2.0)*x32*(x17*(24*x0 - (12
+    - 5*x31)*(-x0*x26 + 3*x0 + 2) + 16) + x19*x27), 0])
+
+def deriv_octupole_hexadecapole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_octupole_hexadecapole_gr.'''
+  x5 = c**(-5)
+  x7 = m1 + m2
+  x8 = m1*m2
+  x9 = x7*x8
+  x14 = 1/x7
+  x15 = m1**2
+  x16 = m2**2
+  x17 = x15*x16
+  x18 = x14*x17
+  x22 = m3**2
+  x23 = x7**2
+  x24 = m3 + x7
+  x25 = a2*x22*x23/x24
+  x28 = 1/(x15*x16)
+  x30 = 1/x22
+  x31 = 1/a2
+  x32 = x14*x31
+  x33 = x30*x32
+  k0 = x28*x33
+  x38 = sqrt(x7)
+  x39 = 1/x38
+  x41 = 1/m1
+  x42 = x41/m2
+  x43 = sqrt(x24)
+  x44 = sqrt(a2)
+  x45 = 1/x44
+  k1 = 1/m3
+  k2 = k1*x45
+  k3 = x39*x42
+  x65 = m1 - m2
+  x70 = x7**(3/2)
+  x71 = 1/x70
+  k4 = a2**(-4)
+  k5 = k4*m3
+  k6 = x65*x71
+  x75 = x15 + x16 - x8
+  k7 = x24*x33
+  x87 = 1/x23
+  k8 = x24**2
+  k9 = a2**(-2)
+  k10 = m1**(-4)
+  k11 = m2**(-4)
+  k12 = m3**(-4)
+  k13 = k10*k11*k12*k8*k9*x87
+  k14 = a2**(-5)
+  x128 = x43*x8/a2**(9/2)
+  x131 = m1**3
+  x132 = m2**3
+  x133 = x131 + x132
+  x157 = 2*x38
+  k15 = 1/x131
+  k16 = 1/x132
+  k17 = x24**(3/2)
+  k18 = a2**(-3/2)
+  k19 = m3**(-3)
+  k20 = k15*k16*k17*k18*k19*x71
+  k21 = 1/x43
+  x208 = x7**(-3)
+  x220 = x30*x31*x71
+  k22 = m3*x44
+  k23 = -64*x9/5
+  k24 = -304*x5*x9/15
+  k25 = x7**(-5/2)
+  k26 = -315*k25*x75/32768
+  k27 = c**(-2)
+  k28 = -3*k27*x70
+  k29 = x7**(-9/2)
+  k30 = x133*x7
+  k31 = m2*x157
+  k32 = 2*x8
+  k33 = -m2*x39*x41
+  k34 = -x45*x75
+  k35 = 0.001373291015625*k29
+  k36 = 2*x14
+  k37 = 3*x32*x75/16
+  k38 = 15*x128*x208/4096
+  k39 = 4*x14
+  k40 = a2**(-11/2)
+  k41 = -x133*x24*x8
+  k42 = x42*x45
+  k43 = 20*x38*x43*x75
+  k44 = -3*k40*x208/16
+  k45 = x39*x8
+  k46 = x38/2
+  k47 = -32*x17*x38/5
+  return ((m2, m3, x5, x8, x15, x16, x18, x24, x25, x28, k0, x38, x39, x41,
+    x42, x43, k2, k3, x65, k5, k6, k7, x87, k13, k14, x128, x157, k20, k21,
+    x220, k22, k23, k24, k26, k28, k30, k31, k32, k33, k34, k35, k36, k37, k38,
+    k39, k41, k42, k43, k44, k45, k46, k47))
+
+def deriv_octupole_hexadecapole_gr(y, k):
+  '''The EOMs with the octupole, hexadecapole, gr terms.
+
+  k is returned by deriv_octupole_hexadecapole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x5, x8, x15, x16, x18, x24, x25, x28, k0, x38, x39, x41, x42,
+    x43, k2, k3, x65, k5, k6, k7, x87, k13, k14, x128, x157, k20, k21,
+    x220, k22, k23, k24, k26, k28, k30, k31, k32, k33, k34, k35, k36, k37,
+    k38, k39, k41, k42, k43, k44, k45, k46, k47) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = e1**4
+  x3 = a1**3
+  x4 = 1/x3
+  x6 = x4*x5
+  x10 = 1 - x0
+  x11 = 1/a1
+  x12 = H**2
+  x13 = a1*x10
+  x19 = x13*x18
+  x20 = e2**2
+  x21 = 1 - x20
+  x26 = x21*x25
+  x27 = x12 - x19 - x26
+  x29 = x24/x21
+  x34 = k0*x11*x27**2*x29/x10
+  x35 = 4 - x34
+  x36 = cos(g1)
+  x37 = sin(g2)
+  x40 = 1/sqrt(x13)
+  x46 = sqrt(x21)
+  x47 = 1/x46
+  x48 = k2*x47
+  x49 = x43*x48
+  x50 = k3*x27*x40*x49
+  x51 = x36*x37*x50
+  x52 = 2*g1
+  x53 = sin(x52)
+  x54 = cos(g2)
+  x55 = 2*x54
+  x56 = x36*x55
+  x57 = sin(g1)
+  x58 = x37*x57
+  x59 = cos(x52)
+  x60 = 7*x0
+  x61 = 5*x0 - x59*x60 + 2
+  x62 = x61*(2.5 - 0.625*x34)
+  x63 = 3*x0
+  x64 = x63 + 4
+  x66 = a1*x1
+  x67 = -x66
+  x68 = sqrt(x67)
+  x69 = 1/x68
+  x72 = k5*x21**(-2.5)
+  x73 = e2*k6*x1*x3*x69*x72
+  x74 = sqrt(x10)
+  x76 = 3*x20 + 2
+  x77 = 4*g1
+  x78 = 21*x0
+  x79 = -x12 + x19 + x26
+  x80 = x20 - 1
+  x81 = 1/x80
+  x82 = x11/x1
+  x83 = x28*x82
+  x84 = k7*x81*x83
+  x85 = x79**2*x84
+  x86 = x1**(-2)
+  x88 = k13/a1**2
+  x89 = 7*x88
+  x90 = x0 + 2
+  x91 = 2*x90
+  x92 = x50 + 2
+  x93 = x50 - 2
+  x94 = -g2
+  x95 = 2*x52 + 2*x94
+  x96 = sin(x95)
+  x97 = 2*g1 + 2*x94
+  x98 = sin(x97)
+  x99 = x92**2
+  x100 = 14*x50
+  x101 = 7*x34
+  x102 = x101 + 4
+  x103 = x99*(-x100 + x102)
+  x104 = x93**2
+  x105 = x34 - 4
+  x106 = 2*g2 + 2*x52
+  x107 = x105*x78*sin(x106)
+  x108 = x100 + x102
+  x109 = 2*g1 + 2*g2
+  x110 = x108*sin(x109)
+  x111 = m3/sqrt(-x80**7)
+  x112 = a1**(7/2)*k14
+  x113 = x79*x83
+  x114 = x42*x69
+  x115 = x114*x39
+  x116 = x115*x49
+  x117 = x116*x79
+  x118 = x117*x58
+  x119 = x118 + x56
+  x120 = 5*x61
+  x121 = x61*(2.5 - 0.625*x85)
+  x122 = 3*x34
+  x123 = 5*x1
+  x124 = 6*x0 + 8
+  x125 = 2*x37
+  x126 = x3*x87
+  x127 = e1*x65
+  x129 = x127*x128*x21**(-3.0)
+  x130 = 1/x74
+  x134 = cos(x77)
+  x135 = x105**2*x134
+  x136 = x0*x76
+  x137 = x27**4/(x10**2*x21**2)
+  x138 = 35*x137*x88 - 120*x34 + 48
+  x139 = x138*x76
+  x140 = x137*x89 - 32*x34 + 16
+  x141 = 2*g2
+  x142 = cos(x141)
+  x143 = x140*x142
+  x144 = x143*x20
+  x145 = 28*x0 + 28
+  x146 = x140*x59
+  x147 = x0*x20
+  x148 = cos(x106)
+  x149 = cos(x95)
+  x150 = x104*x148 + x149*x99
+  x151 = x105*x150
+  x152 = cos(x109)
+  x153 = cos(x97)
+  x154 = x103*x153 + x104*x108*x152
+  x155 = x154*x20
+  x156 = x24*x79
+  x158 = sqrt(a1)
+  x159 = x158*x74
+  x160 = -x115*x156
+  x161 = x159*x38
+  x162 = k20/x21**(3/2)
+  x163 = 112*x162
+  x164 = x79**3/x67**(3/2)
+  x165 = x163*x164
+  x166 = 960*x0
+  x167 = 360*x2
+  x168 = 288*x20
+  x169 = x162*x164
+  x170 = 168*x20
+  x171 = 210*x2
+  x172 = 560*x0
+  x173 = 1440*x147
+  x174 = x2*x20
+  x175 = 540*x174
+  x176 = x142*x20
+  x177 = 256*x176
+  x178 = 315*x174
+  x179 = 840*x147
+  x180 = 672*x117
+  x181 = x147*x152
+  x182 = 560*x147
+  x183 = x142*x169
+  x184 = x152*x174
+  x185 = 336*x117
+  x186 = x153*x174
+  x187 = 210*x174
+  x188 = 147*x174
+  x189 = x169*x188
+  x190 = 196*x169
+  x191 = 392*x169
+  x192 = x147*x153
+  x193 = x117*x142
+  x194 = 480*x174
+  x195 = 1280*x147
+  x196 = 588*x85
+  x197 = 441*x174
+  x198 = x197*x85
+  x199 = 294*x85
+  x200 = 147*x2
+  x201 = x134*x200*x76
+  x202 = x136*x90
+  x203 = 28*x202*x59
+  x204 = 588*x174
+  x205 = 280*x174
+  x206 = x148*x204 - x149*x204 - x152*x182 - x152*x205 + x153*x182 + x153*x205
+  x207 = k21/x80**4
+  x209 = x12 + x18*x66 + x25*x80
+  x210 = x209**2*x84
+  x211 = x116*x209
+  x212 = x211*x54*x57
+  x213 = x117 + 2
+  x214 = x211 + 2
+  x215 = x0*x90
+  x216 = 40*x0 + 15*x2 + 8
+  x217 = x27**3/x13**(3/2)
+  x218 = x162*x217
+  x219 = (4*x20 + 1)/e2
+  x221 = 5*x10
+  x222 = x220*x27*x29
+  x223 = x135*x2
+  x224 = x216*x80
+  x225 = x215*x80
+  x226 = k22*x46
+  x227 = 2*x226
+  x228 = x159*x27*x40
+  x229 = x228*x41*x48
+  x230 = x163*x217
+  x231 = x142*x50
+  x232 = 392*x218
+  x233 = 196*x218
+  x234 = x188*x218
+  x235 = x142*x218
+  x236 = 336*x50
+  x237 = 672*x50
+  x238 = 588*x34
+  x239 = x197*x34
+  x240 = 294*x34
+  return ([k23*x6*(3.0416666666666665*x0 + 0.3854166666666667*x2 +
+    1)/sqrt(-x1**7), e1*k26*x111*x112*x74*(-x20*(x103*x91*x98 + x104*(-x107 +
+    x110*x91) - x78*x92**3*x93*x96) - x35**2*x76*x78*sin(x77) +
+    x53*x76*x91*(x79**4*x86*x89/x80**2 - 32*x85 + 16)) +
+    15*x73*(-35*x0*x35*x53*(-x50*x58 + x56) + 10*x10*x35*x51 + 4*(-x51 +
+    x55*x57)*(-x62 + x64))/512 + e1*k24*(0.3980263157894737*x0 +
+    1)/(a1**4*sqrt(-x1**5)), -15*e2*x126*x129*(k36 + x113)*(x117*x119*x120 +
+    x125*x57*(-2*x121 + x123*(4 - x122) + x124))/512 + k28*sqrt(x4)*x82 +
+    k35*x112*x130*(k30*x1*x111*(-147*x135*x136 - x139*x64 + 10*x144*x64 +
+    x145*x146*x76 - x145*x155 + 147*x147*x151) + k34*x207*(k32*(m2*x161 +
+    m3*x161 + x160) + k33*x156*x69 + x15*(k31*x159 +
+    x160))*(-e2**3*x0*x153*x180 - x117*x166 - x117*x167 - x117*x168 - x117*x173
+    - x117*x175 + x117*x177 - x117*x201*x35 + x117*x203*(16 - x101) - 192*x117
+    - x148*x189 - x148*x198 - x149*x189 + x149*x198 - x165*x176 + x165 +
+    x169*x170 + x169*x171 + x169*x172 + x169*x178 + x169*x179 - x180*x181 +
+    x181*x191 + x181*x196 - x182*x183 - x183*x187 - x184*x185 + x184*x190 +
+    x184*x199 - x185*x186 + x186*x190 - x186*x199 + x191*x192 - x192*x196 +
+    x193*x194 + x193*x195 + x206)) - 15*x73*(5*x118*(4 - x85)*(x63 - 1) +
+    x119*(18*x0 - 6*x121 - 5*x85 + 28))/(256*e1),
+    k38*x3*(a1*e2*k37*(x200*x213*x214**3*x96 + x213*(2*x216*(-7*x218 - 14*x34 +
+    4*x50 + 8)*sin(x141) + x60*(2 - x50)*(x107 - 4*x110*x90)) +
+    28*x214**2*x215*x98*(7*x210 - 14*x211 + 4))/x80**3 -
+    16*x127*x21**(-2.0)*(-x123*x212*(4 - x210) + 2*(x125*x36 - x212)*(-x61*(2.5
+    - 0.625*x210) + x64))), 3*x126*(k44*x207*(a1*k41*(-6*x138*x224 +
+    7*x139*x216 + 20*x143*x224 - 70*x144*x216 - 980*x146*x202 + 840*x146*x225 -
+    1470*x150*x2*x21*x92*x93 - 5145*x151*x174 - 280*x154*x225 + 980*x155*x215 +
+    5145*x223*x76 - 4410*x223*x80) + k43*x130*x158*(x15*(x227 + x229) +
+    x16*x227 + x8*(k42*x228*x47 + 4*x226 + x229))*(-x105*x201*x50 + x148*x234 -
+    x148*x239 + x149*x234 + x149*x239 + x166*x50 + x167*x50 + x168*x50 -
+    x170*x218 - x171*x218 - x172*x218 + x173*x50 + x175*x50 + x176*x230 -
+    x177*x50 - x178*x218 - x179*x218 - x181*x232 + x181*x237 + x181*x238 +
+    x182*x235 - x184*x233 + x184*x236 + x184*x240 - x186*x233 + x186*x236 -
+    x186*x240 + x187*x235 - x192*x232 + x192*x237 - x192*x238 - x194*x231 -
+    x195*x231 + x203*x50*(x101 - 16) + x206 - x230 + 192*x50)) +
+    80*x119*x129*(e2*x113*x120*x39*(x156*x220*x81 + x157) + k39*x219*(-x121 +
+    x64)) - 160*x127*x40*x58*x72*(e2*(x157 + x222)*(x124 + x221*(x122 - 4) -
+    2*x62) - x219*x221*x222*x35))/8192, k47*sqrt(x11)*x6*x86*(0.875*x0 +
+    1)*(k45*x68 + k46*x114*x209)/H])
+
+def deriv_octupole_hexadecapole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_octupole_hexadecapole.'''
+  x4 = m1**2
+  x5 = m1 + m2
+  x6 = 1/x5
+  x7 = m2**2
+  x8 = x4*x6*x7
+  x12 = m3**2
+  x13 = x5**2
+  x14 = m3 + x5
+  x15 = a2*x12*x13/x14
+  k0 = 1/x4
+  k1 = 1/x7
+  k2 = k0*k1
+  x20 = 1/x12
+  x21 = 1/a2
+  x22 = x21*x6
+  x23 = x20*x22
+  x29 = sqrt(x5)
+  x30 = 1/x29
+  x31 = 1/m1
+  x32 = x31/m2
+  x33 = x30*x32
+  x34 = sqrt(x14)
+  x35 = sqrt(a2)
+  x36 = 1/x35
+  k3 = 1/m3
+  k4 = k3*x36
+  x58 = m1 - m2
+  k5 = x14*x23
+  x76 = 1/x13
+  k6 = x14**2
+  k7 = a2**(-2)
+  k8 = m1**(-4)
+  k9 = m2**(-4)
+  k10 = m3**(-4)
+  k11 = k10*k6*k7*k8*k9*x76
+  x100 = m1*m2
+  x101 = -x100 + x4 + x7
+  x102 = x101*x22
+  x103 = x5**(-3/2)
+  x104 = m3/a2**4
+  x105 = x103*x104
+  x120 = x100*x34/a2**(9/2)
+  x123 = m1**3
+  x124 = m2**3
+  x125 = x123 + x124
+  x149 = 2*x29
+  k12 = 1/x123
+  k13 = 1/x124
+  k14 = x14**(3/2)
+  k15 = a2**(-3/2)
+  k16 = m3**(-3)
+  k17 = k12*k13*k14*k15*k16*x103
+  k18 = 1/x34
+  x201 = x5**(-3)
+  x213 = x103*x20*x21
+  k19 = m3*x35
+  k20 = -21*x102/16
+  k21 = 15*x105/2048
+  k22 = -15*x105/256
+  k23 = 2*x6
+  k24 = x5**(-9/2)
+  k25 = a2**(-5)
+  k26 = m2*x149
+  k27 = 2*x100
+  k28 = -m2*x30*x31
+  k29 = -x101*x36
+  k30 = m3*x125*x5
+  k31 = 0.001373291015625*k24*k25
+  k32 = 3*x102/16
+  k33 = 15*x120*x201/4096
+  k34 = 4*x6
+  k35 = a2**(-11/2)
+  k36 = -x100*x125*x14
+  k37 = x32*x36
+  k38 = 20*x101*x29*x34
+  k39 = -3*k35*x201/16
+  k40 = -160*x104
+  return ((m2, m3, x4, x7, x8, x14, x15, k2, x23, x29, x30, x31, x33, x34, k4,
+    x58, k5, x76, k11, x100, x120, x149, k17, k18, x213, k19, k20, k21, k22,
+    k23, k26, k27, k28, k29, k30, k31, k32, k33, k34, k36, k37, k38, k39, k40))
+
+def deriv_octupole_hexadecapole(y, k):
+  '''The EOMs with the octupole, hexadecapole terms.
+
+  k is returned by deriv_octupole_hexadecapole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x4, x7, x8, x14, x15, k2, x23, x29, x30, x31, x33, x34, k4, x58,
+    k5, x76, k11, x100, x120, x149, k17, k18, x213, k19, k20, k21, k22,
+    k23, k26, k27, k28, k29, k30, k31, k32, k33, k34, k36, k37, k38, k39,
+    k40) = k
+  x0 = e1**2
+  x1 = 1 - x0
+  x2 = H**2
+  x3 = a1*x1
+  x9 = x3*x8
+  x10 = e2**2
+  x11 = 1 - x10
+  x16 = x11*x15
+  x17 = -x16 + x2 - x9
+  x18 = k2/a1
+  x19 = x14/x11
+  x24 = x17**2*x18*x19*x23/x1
+  x25 = 4 - x24
+  x26 = cos(g1)
+  x27 = sin(g2)
+  x28 = 1/sqrt(x3)
+  x37 = sqrt(x11)
+  x38 = 1/x37
+  x39 = k4*x38
+  x40 = x34*x39
+  x41 = x17*x28*x33*x40
+  x42 = x26*x27*x41
+  x43 = 2*g1
+  x44 = sin(x43)
+  x45 = cos(g2)
+  x46 = 2*x45
+  x47 = x26*x46
+  x48 = sin(g1)
+  x49 = x27*x48
+  x50 = cos(x43)
+  x51 = 7*x0
+  x52 = 5*x0 - x50*x51 + 2
+  x53 = x52*(2.5 - 0.625*x24)
+  x54 = 3*x0
+  x55 = x54 + 4
+  x56 = x0 - 1
+  x57 = a1**3
+  x59 = a1*x56
+  x60 = -x59
+  x61 = 1/sqrt(x60)
+  x62 = x11**(-2.5)
+  x63 = e2*x56*x57*x58*x61*x62
+  x64 = sqrt(x1)
+  x65 = x10 - 1
+  x66 = 1/sqrt(-x65**7)
+  x67 = a1**(7/2)
+  x68 = 3*x10 + 2
+  x69 = 4*g1
+  x70 = 21*x0
+  x71 = x16 - x2 + x9
+  x72 = 1/x65
+  x73 = x18/x56
+  x74 = k5*x72*x73
+  x75 = x71**2*x74
+  x77 = k11/a1**2
+  x78 = 7*x77
+  x79 = x0 + 2
+  x80 = 2*x79
+  x81 = x41 + 2
+  x82 = x41 - 2
+  x83 = -g2
+  x84 = 2*x43 + 2*x83
+  x85 = sin(x84)
+  x86 = 2*g1 + 2*x83
+  x87 = sin(x86)
+  x88 = x81**2
+  x89 = 14*x41
+  x90 = 7*x24
+  x91 = x90 + 4
+  x92 = x88*(-x89 + x91)
+  x93 = x82**2
+  x94 = x24 - 4
+  x95 = 2*g2 + 2*x43
+  x96 = x70*x94*sin(x95)
+  x97 = x89 + x91
+  x98 = 2*g1 + 2*g2
+  x99 = x97*sin(x98)
+  x106 = x71*x73
+  x107 = x33*x61
+  x108 = x107*x40
+  x109 = x108*x71
+  x110 = x109*x49
+  x111 = x110 + x47
+  x112 = 5*x52
+  x113 = x52*(2.5 - 0.625*x75)
+  x114 = 3*x24
+  x115 = 5*x56
+  x116 = 6*x0 + 8
+  x117 = 2*x27
+  x118 = x57*x76
+  x119 = e1*x58
+  x121 = x11**(-3.0)*x119*x120
+  x122 = 1/x64
+  x126 = cos(x69)
+  x127 = x126*x94**2
+  x128 = x0*x68
+  x129 = x17**4/(x1**2*x11**2)
+  x130 = 35*x129*x77 - 120*x24 + 48
+  x131 = x130*x68
+  x132 = x129*x78 - 32*x24 + 16
+  x133 = 2*g2
+  x134 = cos(x133)
+  x135 = x132*x134
+  x136 = x10*x135
+  x137 = 28*x0 + 28
+  x138 = x132*x50
+  x139 = x0*x10
+  x140 = cos(x95)
+  x141 = cos(x84)
+  x142 = x140*x93 + x141*x88
+  x143 = x142*x94
+  x144 = cos(x98)
+  x145 = cos(x86)
+  x146 = x144*x93*x97 + x145*x92
+  x147 = x10*x146
+  x148 = x14*x71
+  x150 = sqrt(a1)
+  x151 = x150*x64
+  x152 = -x107*x148
+  x153 = x151*x29
+  x154 = k17/x11**(3/2)
+  x155 = 112*x154
+  x156 = x71**3/x60**(3/2)
+  x157 = x155*x156
+  x158 = 960*x0
+  x159 = e1**4
+  x160 = 360*x159
+  x161 = 288*x10
+  x162 = x154*x156
+  x163 = 168*x10
+  x164 = 210*x159
+  x165 = 560*x0
+  x166 = 1440*x139
+  x167 = x10*x159
+  x168 = 540*x167
+  x169 = x10*x134
+  x170 = 256*x169
+  x171 = 315*x167
+  x172 = 840*x139
+  x173 = 672*x109
+  x174 = x139*x144
+  x175 = 560*x139
+  x176 = x134*x162
+  x177 = x144*x167
+  x178 = 336*x109
+  x179 = x145*x167
+  x180 = 210*x167
+  x181 = 147*x167
+  x182 = x162*x181
+  x183 = 196*x162
+  x184 = 392*x162
+  x185 = x139*x145
+  x186 = x109*x134
+  x187 = 480*x167
+  x188 = 1280*x139
+  x189 = 588*x75
+  x190 = 441*x167
+  x191 = x190*x75
+  x192 = 294*x75
+  x193 = 147*x159
+  x194 = x126*x193*x68
+  x195 = x128*x79
+  x196 = 28*x195*x50
+  x197 = 588*x167
+  x198 = 280*x167
+  x199 = x140*x197 - x141*x197 - x144*x175 - x144*x198 + x145*x175 + x145*x198
+  x200 = k18/x65**4
+  x202 = x15*x65 + x2 + x59*x8
+  x203 = x202**2*x74
+  x204 = x108*x202
+  x205 = x204*x45*x48
+  x206 = x109 + 2
+  x207 = x204 + 2
+  x208 = x0*x79
+  x209 = 40*x0 + 15*x159 + 8
+  x210 = x17**3/x3**(3/2)
+  x211 = x154*x210
+  x212 = (4*x10 + 1)/e2
+  x214 = 5*x1
+  x215 = x17*x19*x213
+  x216 = x127*x159
+  x217 = x209*x65
+  x218 = x208*x65
+  x219 = k19*x37
+  x220 = 2*x219
+  x221 = x151*x17*x28
+  x222 = x221*x31*x39
+  x223 = x155*x210
+  x224 = x134*x41
+  x225 = 392*x211
+  x226 = 196*x211
+  x227 = x181*x211
+  x228 = x134*x211
+  x229 = 336*x41
+  x230 = 672*x41
+  x231 = 588*x24
+  x232 = x190*x24
+  x233 = 294*x24
+  return ([0, k21*(e1*k20*x64*x66*x67*(-x10*(-x70*x81**3*x82*x85 + x80*x87*x92
+    + x93*(x80*x99 - x96)) - x25**2*x68*x70*sin(x69) + x44*x68*x80*(-32*x75 +
+    16 + x71**4*x78/(x56**2*x65**2))) + 4*x63*(-35*x0*x25*x44*(-x41*x49 + x47)
+    + 10*x1*x25*x42 + 4*(-x42 + x46*x48)*(-x53 + x55))), -15*e2*x118*x121*(k23
+    + x106)*(x109*x111*x112 + x117*x48*(-2*x113 + x115*(4 - x114) + x116))/512
+    + k31*x122*x67*(k29*x200*(k27*(m2*x153 + m3*x153 + x152) + k28*x148*x61 +
+    x4*(k26*x151 + x152))*(-e2**3*x0*x145*x173 - x109*x158 - x109*x160 -
+    x109*x161 - x109*x166 - x109*x168 + x109*x170 - x109*x194*x25 +
+    x109*x196*(16 - x90) - 192*x109 - x140*x182 - x140*x191 - x141*x182 +
+    x141*x191 - x157*x169 + x157 + x162*x163 + x162*x164 + x162*x165 +
+    x162*x171 + x162*x172 - x173*x174 + x174*x184 + x174*x189 - x175*x176 -
+    x176*x180 - x177*x178 + x177*x183 + x177*x192 - x178*x179 + x179*x183 -
+    x179*x192 + x184*x185 - x185*x189 + x186*x187 + x186*x188 + x199) +
+    k30*x56*x66*(-147*x127*x128 - x131*x55 + 10*x136*x55 + x137*x138*x68 -
+    x137*x147 + 147*x139*x143)) + k22*x63*(5*x110*(4 - x75)*(x54 - 1) +
+    x111*(18*x0 - 6*x113 - 5*x75 + 28))/e1,
+    k33*x57*(a1*e2*k32*(x193*x206*x207**3*x85 + x206*(2*x209*(-7*x211 - 14*x24
+    + 4*x41 + 8)*sin(x133) + x51*(2 - x41)*(-4*x79*x99 + x96)) +
+    28*x207**2*x208*x87*(7*x203 - 14*x204 + 4))/x65**3 -
+    16*x11**(-2.0)*x119*(-x115*x205*(4 - x203) + 2*(x117*x26 - x205)*(-x52*(2.5
+    - 0.625*x203) + x55))),
+    3*x118*(k39*x200*(a1*k36*(-1470*x11*x142*x159*x81*x82 - 6*x130*x217 +
+    7*x131*x209 + 20*x135*x217 - 70*x136*x209 - 980*x138*x195 + 840*x138*x218 -
+    5145*x143*x167 - 280*x146*x218 + 980*x147*x208 - 4410*x216*x65 +
+    5145*x216*x68) + k38*x122*x150*(x100*(k37*x221*x38 + 4*x219 + x222) +
+    x220*x7 + x4*(x220 + x222))*(x140*x227 - x140*x232 + x141*x227 + x141*x232
+    + x158*x41 + x160*x41 + x161*x41 - x163*x211 - x164*x211 - x165*x211 +
+    x166*x41 + x168*x41 + x169*x223 - x170*x41 - x171*x211 - x172*x211 -
+    x174*x225 + x174*x230 + x174*x231 + x175*x228 - x177*x226 + x177*x229 +
+    x177*x233 - x179*x226 + x179*x229 - x179*x233 + x180*x228 - x185*x225 +
+    x185*x230 - x185*x231 - x187*x224 - x188*x224 - x194*x41*x94 +
+    x196*x41*(x90 - 16) + x199 - x223 + 192*x41)) +
+    k40*x119*x28*x49*x62*(e2*(x149 + x215)*(x116 + x214*(x114 - 4) - 2*x53) -
+    x212*x214*x215*x25) + 80*x111*x121*(e2*x106*x112*x30*(x148*x213*x72 + x149)
+    + k34*x212*(-x113 + x55)))/8192, 0])
+
+def deriv_octupole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_octupole_gr.'''
+  x4 = c**(-5)
+  x6 = m1 + m2
+  x7 = m1*m2
+  x8 = x6*x7
+  x16 = 1/x6
+  x17 = m1**2
+  x18 = m2**2
+  x19 = x17*x18
+  x20 = x16*x19
+  x22 = m3**2
+  x23 = x6**2
+  x24 = m3 + x6
+  x25 = a2*x22*x23/x24
+  x28 = 1/(x17*x18)
+  x29 = x24/(a2*x22)
+  x30 = x16*x29
+  k0 = x28*x30
+  x35 = 1/(m1*m2)
+  x37 = sqrt(x6)
+  x38 = 1/x37
+  x39 = sqrt(x24)
+  k1 = 1/sqrt(a2)
+  k2 = 1/m3
+  k3 = k1*k2
+  k4 = x38*x39
+  x54 = x6**(3/2)
+  x55 = 1/x54
+  k5 = m1 - m2
+  k6 = a2**(-4)
+  k7 = k6*m3
+  x71 = 5*x38
+  k8 = 1/x23
+  x85 = x7/a2**(9/2)
+  x92 = 2*x37
+  x93 = x29*x55
+  k9 = -64*x8/5
+  k10 = -304*x4*x8/15
+  k11 = x39*x71
+  k12 = c**(-2)
+  k13 = -3*k12*x54
+  k14 = 2*x16
+  k15 = -15*x39/512
+  k16 = x6**(-3)
+  k17 = -15*k16*x39*x85/256
+  k18 = 4*x16
+  k19 = x37/2
+  k20 = x38*x7
+  k21 = -32*x19*x37/5
+  return ((x4, x20, x25, x28, x30, k0, x35, x39, k3, k4, x55, k5, k7, x71, k8,
+    x85, x92, x93, k9, k10, k11, k13, k14, k15, k17, k18, k19, k20, k21))
+
+def deriv_octupole_gr(y, k):
+  '''The EOMs with the octupole, gr terms.
+
+  k is returned by deriv_octupole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x4, x20, x25, x28, x30, k0, x35, x39, k3, k4, x55, k5, k7, x71, k8, x85,
+    x92, x93, k9, k10, k11, k13, k14, k15, k17, k18, k19, k20, k21) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**3
+  x3 = 1/x2
+  x5 = x3*x4
+  x9 = 1 - x0
+  x10 = 1/a1
+  x11 = e2**2
+  x12 = 1 - x11
+  x13 = 1/x12
+  x14 = H**2
+  x15 = a1*x9
+  x21 = x15*x20
+  x26 = x12*x25
+  x27 = x14 - x21 - x26
+  x31 = k0*x10*x13*x27**2/x9
+  x32 = 4 - x31
+  x33 = cos(g1)
+  x34 = 1/sqrt(x15)
+  x36 = sin(g2)
+  x40 = k3/sqrt(x12)
+  x41 = k4*x40
+  x42 = x36*x41
+  x43 = x27*x34*x35*x42
+  x44 = x33*x43
+  x45 = 2*g1
+  x46 = cos(g2)
+  x47 = 2*x46
+  x48 = x33*x47
+  x49 = sin(g1)
+  x50 = -7*x0*cos(x45) + 5*x0 + 2
+  x51 = x50*(2.5 - 0.625*x31)
+  x52 = 3*x0
+  x53 = x52 + 4
+  x56 = a1*x1
+  x57 = sqrt(-x56)
+  x58 = 1/x57
+  x59 = k5*x2
+  x60 = k7*x12**(-2.5)
+  x61 = e2*x1*x55*x58*x59*x60
+  x62 = x10/x1
+  x63 = -x14 + x21 + x26
+  x64 = x28*x62
+  x65 = x63*x64
+  x66 = x35*x58
+  x67 = x63*x66
+  x68 = x49*x67
+  x69 = x42*x68 + x48
+  x70 = x39*x69
+  x72 = x50*x71
+  x73 = x11 - 1
+  x74 = 1/x73
+  x75 = x30*x64*x74
+  x76 = x63**2*x75
+  x77 = x50*(2.5 - 0.625*x76)
+  x78 = 3*x31
+  x79 = 5*x1
+  x80 = 6*x0 + 8
+  x81 = 2*x36
+  x82 = x49*x81
+  x83 = e1*x59
+  x84 = k8*x83
+  x86 = x12**(-3.0)*x85
+  x87 = x14 + x20*x56 + x25*x73
+  x88 = x75*x87**2
+  x89 = x66*x87
+  x90 = x41*x46*x49*x89
+  x91 = (4*x11 + 1)/e2
+  x94 = 5*x9
+  x95 = x13*x27*x93
+  return ([k9*x5*(0.3854166666666667*e1**4 + 3.0416666666666665*x0 +
+    1)/sqrt(-x1**7), 15*x61*(-35*x0*x32*(-x43*x49 + x48)*sin(x45) +
+    10*x32*x44*x9 + 4*(-x44 + x47*x49)*(-x51 + x53))/512 +
+    e1*k10*(0.3980263157894737*x0 + 1)/(a1**4*sqrt(-x1**5)),
+    e2*k15*x84*x86*(k14 + x65)*(x40*x67*x70*x72 + x82*(-2*x77 + x79*(4 - x78) +
+    x80)) + k13*sqrt(x3)*x62 - 15*x61*(k11*x36*x40*x68*(4 - x76)*(x52 - 1) +
+    x69*(18*x0 - 5*x76 - 6*x77 + 28))/(256*e1),
+    k17*x12**(-2.0)*x83*(-x79*x90*(4 - x88) + 2*(x33*x81 - x90)*(-x50*(2.5 -
+    0.625*x88) + x53)), 15*x84*(-x34*x60*x82*(e2*(x92 + x95)*(-2*x51 + x80 +
+    x94*(x78 - 4)) - x32*x91*x94*x95) + x70*x86*(e2*x65*x72*(x63*x74*x93 + x92)
+    + k18*x91*(x53 - x77)))/512, k21*sqrt(x10)*x5*(0.875*x0 + 1)*(k19*x89 +
+    k20*x57)/(H*x1**2)])
+
+def deriv_octupole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_octupole.'''
+  x6 = m1 + m2
+  x7 = 1/x6
+  x8 = m1**2
+  x9 = m2**2
+  x10 = x7*x8*x9
+  x14 = m3**2
+  x15 = x6**2
+  x16 = m3 + x6
+  x17 = a2*x14*x15/x16
+  k0 = 1/x8
+  k1 = 1/x9
+  k2 = k0*k1
+  x25 = x16/(a2*x14)
+  x26 = x25*x7
+  x33 = 1/sqrt(a2)
+  x34 = 1/m1
+  x35 = 1/m2
+  x36 = 1/m3
+  x38 = sqrt(x16)
+  x39 = sqrt(x6)
+  x40 = 1/x39
+  x41 = x38*x40
+  k3 = x33*x34*x35*x36*x41
+  k4 = x33*x34*x35*x36
+  k5 = m1 - m2
+  x59 = x6**(-3/2)
+  k6 = a2**(-4)
+  k7 = k6*m3
+  x64 = 5*x40
+  k8 = 1/x15
+  x75 = m1*m2/a2**(9/2)
+  x81 = 2*x39
+  x82 = x25*x59
+  k9 = x38*x64
+  k10 = 2*x7
+  k11 = x6**(-3)
+  k12 = -15*k11*x38*x75/256
+  return ((x7, x10, x17, k2, x26, x38, x41, k3, k4, k5, x59, k7, x64, k8, x75,
+    x81, x82, k9, k10, k12))
+
+def deriv_octupole(y, k):
+  '''The EOMs with the octupole terms.
+
+  k is returned by deriv_octupole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x7, x10, x17, k2, x26, x38, x41, k3, k4, k5, x59, k7, x64, k8, x75, x81,
+    x82, k9, k10, k12) = k
+  x0 = cos(g1)
+  x1 = sin(g2)
+  x2 = H**2
+  x3 = e1**2
+  x4 = 1 - x3
+  x5 = a1*x4
+  x11 = x10*x5
+  x12 = e2**2
+  x13 = 1 - x12
+  x18 = x13*x17
+  x19 = x11 + x18 - x2
+  x20 = x12 - 1
+  x21 = 1/x20
+  x22 = x3 - 1
+  x23 = k2/a1
+  x24 = x23/x22
+  x27 = x21*x24*x26
+  x28 = x19**2*x27
+  x29 = 4 - x28
+  x30 = a1*x22
+  x31 = 1/sqrt(-x30)
+  x32 = x22*x31
+  x37 = 1/sqrt(x13)
+  x42 = k3*x37
+  x43 = 2*g1
+  x44 = cos(g2)
+  x45 = 2*x44
+  x46 = sin(g1)
+  x47 = k4*x19*x31*x37
+  x48 = x1*x47
+  x49 = x41*x48
+  x50 = x0*x45 + x46*x49
+  x51 = -7*x3*cos(x43) + 5*x3 + 2
+  x52 = x51*(2.5 - 0.625*x28)
+  x53 = 3*x3
+  x54 = x53 + 4
+  x55 = -4*x52 + 4*x54
+  x56 = a1**3*k5
+  x57 = 15*x56/512
+  x58 = e2*x57
+  x60 = k7*x13**(-2.5)
+  x61 = x32*x59*x60
+  x62 = x19*x24
+  x63 = x38*x50
+  x65 = x51*x64
+  x66 = 1/x13
+  x67 = -x11 - x18 + x2
+  x68 = x23*x26*x66*x67**2/x4
+  x69 = 3*x68
+  x70 = 5*x22
+  x71 = 6*x3 + 8
+  x72 = 2*x1
+  x73 = x46*x72
+  x74 = e1*k8
+  x76 = x13**(-3.0)*x75
+  x77 = x10*x30 + x17*x20 + x2
+  x78 = x27*x77**2
+  x79 = x31*x42*x44*x46*x77
+  x80 = (4*x12 + 1)/e2
+  x83 = 5*x4
+  x84 = x66*x67*x82
+  return ([0, x58*x61*(10*x0*x1*x19*x29*x32*x42 - 35*x29*x3*x50*sin(x43) +
+    x55*(x0*x49 + x45*x46)), -x58*(x38*x74*x76*(k10 + x62)*(x47*x63*x65 +
+    x73*(-2*x52 + x70*(4 - x69) + x71)) + 2*x61*(k9*x29*x46*x48*(x53 - 1) +
+    x50*(-5*x28 + 18*x3 - 6*x52 + 28))/e1), e1*k12*x13**(-2.0)*x56*(-x70*x79*(4
+    - x78) + 2*(x0*x72 - x79)*(-x51*(2.5 - 0.625*x78) + x54)),
+    x57*x74*(x63*x76*(e2*x62*x65*(x19*x21*x82 + x81) + x55*x7*x80) -
+    x60*x73*(e2*(x81 + x84)*(-2*x51*(2.5 - 0.625*x68) + x71 + x83*(x69 - 4)) -
+    x80*x83*x84*(4 - x68))/sqrt(x5)), 0])
+
+def deriv_hexadecapole_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_hexadecapole_gr.'''
+  x5 = c**(-5)
+  x7 = m1 + m2
+  x8 = m1*m2
+  x9 = x7*x8
+  x13 = m1**2
+  x14 = m2**2
+  x15 = x13 + x14 - x8
+  x24 = 1/x7
+  x25 = x13*x14
+  x26 = x24*x25
+  x28 = m3**2
+  x29 = x7**2
+  x30 = m3 + x7
+  x31 = a2*x28*x29/x30
+  x34 = x24*x30/(a2*x13*x14*x28)
+  k0 = 1/x29
+  k1 = x30**2
+  k2 = a2**(-2)
+  k3 = m1**(-4)
+  k4 = m2**(-4)
+  k5 = m3**(-4)
+  k6 = k0*k1*k2*k3*k4*k5
+  x52 = 1/m1
+  x53 = 1/m2
+  x54 = sqrt(x7)
+  x55 = 1/x54
+  x56 = sqrt(x30)
+  x57 = sqrt(a2)
+  x58 = 1/x57
+  k7 = 1/m3
+  k8 = k7*x58
+  k9 = x55*x56
+  k10 = x52*x53
+  k11 = a2**(-5)
+  x85 = x7**(3/2)
+  x87 = m1**3
+  x88 = m2**3
+  x89 = x87 + x88
+  x116 = x30*x55
+  k12 = x30**(3/2)
+  k13 = 1/x85
+  k14 = 1/x87
+  k15 = 1/x88
+  k16 = a2**(-3/2)
+  k17 = m3**(-3)
+  k18 = k12*k13*k14*k15*k16*k17
+  k19 = 1/x56
+  x189 = a2**(-11/2)
+  x194 = x15*x56
+  k20 = m3*x57
+  k21 = -64*x9/5
+  k22 = 622592*x5*x9
+  k23 = x7**(-5/2)
+  k24 = 4725*k23*x15/16
+  k25 = c**(-2)
+  k26 = -3*k25*x85
+  k27 = x7**(-9/2)
+  k28 = x7*x89
+  k29 = 2*x8
+  k30 = m2*x116
+  k31 = x15*x58
+  k32 = 0.001373291015625*k27
+  k33 = x7**(-4)
+  k34 = 45*k33*x189*x194*x8/65536
+  k35 = x7**(-5)
+  k36 = x30*x8*x89
+  k37 = -x58
+  k38 = 20*x194*x54
+  k39 = -9*k35*x189/131072
+  k40 = x54/2
+  k41 = x55*x8
+  k42 = -32*x25*x54/5
+  return ((m2, m3, x5, x8, x13, x14, x26, x31, x34, k6, x52, x53, x54, k8, k9,
+    k10, k11, x116, k18, k19, k20, k21, k22, k24, k26, k28, k29, k30, k31, k32,
+    k34, k36, k37, k38, k39, k40, k41, k42))
+
+def deriv_hexadecapole_gr(y, k):
+  '''The EOMs with the hexadecapole, gr terms.
+
+  k is returned by deriv_hexadecapole_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x5, x8, x13, x14, x26, x31, x34, k6, x52, x53, x54, k8, k9, k10,
+    k11, x116, k18, k19, k20, k21, k22, k24, k26, k28, k29, k30, k31, k32,
+    k34, k36, k37, k38, k39, k40, k41, k42) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = e1**4
+  x3 = a1**3
+  x4 = 1/x3
+  x6 = x4*x5
+  x10 = a1**4
+  x11 = 1 - x0
+  x12 = sqrt(x11)
+  x16 = 4*g1
+  x17 = 21*x0
+  x18 = e2**2
+  x19 = 3*x18 + 2
+  x20 = 1/a1
+  x21 = 1 - x18
+  x22 = H**2
+  x23 = a1*x11
+  x27 = x23*x26
+  x32 = x21*x31
+  x33 = x22 - x27 - x32
+  x35 = x20*x33**2*x34/(x11*x21)
+  x36 = 4 - x35
+  x37 = x19*x36**2
+  x38 = 2*g1
+  x39 = x0 + 2
+  x40 = 2*x39
+  x41 = -x22 + x27 + x32
+  x42 = x18 - 1
+  x43 = x20/x1
+  x44 = x34*x43/x42
+  x45 = x41**2*x44
+  x46 = k6/a1**2
+  x47 = 7*x46
+  x48 = x1**(-2)
+  x49 = x41**4*x48/x42**2
+  x50 = -32*x45 + x47*x49 + 16
+  x51 = x19*x50
+  x59 = sqrt(x21)
+  x60 = 1/x59
+  x61 = k8*x60
+  x62 = k9*x61
+  x63 = k10*x33*x62/sqrt(x23)
+  x64 = x63 + 2
+  x65 = x63 - 2
+  x66 = -g2
+  x67 = 2*x38 + 2*x66
+  x68 = sin(x67)
+  x69 = 2*g1 + 2*x66
+  x70 = sin(x69)
+  x71 = x64**2
+  x72 = 14*x63
+  x73 = 7*x35
+  x74 = x73 + 4
+  x75 = x71*(-x72 + x74)
+  x76 = x65**2
+  x77 = x35 - 4
+  x78 = 2*g2 + 2*x38
+  x79 = x17*x77*sin(x78)
+  x80 = x72 + x74
+  x81 = 2*g1 + 2*g2
+  x82 = x80*sin(x81)
+  x83 = m3/sqrt(-x42**7)
+  x84 = a1**(7/2)*k11
+  x86 = 1/x12
+  x90 = cos(x16)
+  x91 = 3*x0 + 4
+  x92 = 35*x46
+  x93 = 2*g2
+  x94 = cos(x93)
+  x95 = x18*x94
+  x96 = cos(x38)
+  x97 = 28*x0 + 28
+  x98 = cos(x78)
+  x99 = 2 - x63
+  x100 = x99**2
+  x101 = cos(x67)
+  x102 = a1*x1
+  x103 = -x102
+  x104 = sqrt(x103)
+  x105 = x52/x104
+  x106 = x105*x53
+  x107 = x106*x41*x62
+  x108 = (2 - x107)**2
+  x109 = x0*x18
+  x110 = 147*x36
+  x111 = cos(x81)
+  x112 = 14*x107
+  x113 = 7*x45 + 4
+  x114 = cos(x69)
+  x115 = x102*x26 + x22 + x31*x42
+  x117 = sqrt(a1)
+  x118 = x117*x12
+  x119 = x118*x54
+  x120 = m2*x119
+  x121 = x106*x115
+  x122 = x116*x121
+  x123 = 560*x109
+  x124 = x111*x123
+  x125 = x18*x2
+  x126 = 280*x125
+  x127 = x111*x126
+  x128 = x114*x123
+  x129 = x114*x126
+  x130 = 588*x125
+  x131 = x130*x98
+  x132 = x101*x130
+  x133 = 192*x107
+  x134 = k18/x21**(3/2)
+  x135 = x134*x41**3/x103**(3/2)
+  x136 = 112*x135
+  x137 = x0*x107
+  x138 = 960*x137
+  x139 = x107*x2
+  x140 = 360*x139
+  x141 = 288*x107*x18
+  x142 = 560*x0*x135
+  x143 = 210*x135
+  x144 = x143*x2
+  x145 = 168*x135*x18
+  x146 = x107*x109
+  x147 = 1440*x146
+  x148 = x107*x125
+  x149 = 540*x148
+  x150 = 256*x107*x95
+  x151 = x109*x135
+  x152 = 840*x151
+  x153 = x125*x135
+  x154 = 315*x153
+  x155 = x136*x95
+  x156 = 1280*x146*x94
+  x157 = 480*x148*x94
+  x158 = x111*x45
+  x159 = 588*x109
+  x160 = x158*x159
+  x161 = 294*x125*x158
+  x162 = x123*x135*x94
+  x163 = x125*x143*x94
+  x164 = 672*x146
+  x165 = x111*x164
+  x166 = 336*x148
+  x167 = x111*x166
+  x168 = x114*x159*x45
+  x169 = x125*x45
+  x170 = 294*x114*x169
+  x171 = 441*x169
+  x172 = x171*x98
+  x173 = 392*x151
+  x174 = x111*x173
+  x175 = 196*x153
+  x176 = x111*x175
+  x177 = x114*x166
+  x178 = x101*x171
+  x179 = x114*x173
+  x180 = x114*x175
+  x181 = 147*x153
+  x182 = x181*x98
+  x183 = x101*x181
+  x184 = x110*x139*x19*x90
+  x185 = x0*x39
+  x186 = 28*x185
+  x187 = x107*x186*x19*x96*(16 - x73)
+  x188 = k19/x42**4
+  x190 = x121*x62
+  x191 = x190 + 2
+  x192 = x107 + 2
+  x193 = 40*x0 + 15*x2 + 8
+  x195 = x2*x77**2*x90
+  x196 = x33**4/(x11**2*x21**2)
+  x197 = x193*(x196*x92 - 120*x35 + 48)
+  x198 = x0*x42
+  x199 = x196*x47 - 32*x35 + 16
+  x200 = x199*x96
+  x201 = x193*x199
+  x202 = x101*x71 + x76*x98
+  x203 = x39*(x111*x76*x80 + x114*x75)
+  x204 = k20*x59
+  x205 = 2*x204
+  x206 = x118*x41
+  x207 = -x105*x206*x61
+  return ([k21*x6*(3.0416666666666665*x0 + 0.3854166666666667*x2 +
+    1)/sqrt(-x1**7), -e1*(k22*(0.3980263157894737*x0 + 1)/(x10*sqrt(-x1**5)) +
+    k24*x12*x83*x84*(-x17*x37*sin(x16) - x18*(-x17*x64**3*x65*x68 + x40*x70*x75
+    + x76*(x40*x82 - x79)) + x40*x51*sin(x38)))/30720, k26*sqrt(x4)*x43 +
+    k32*x84*x86*(k28*x1*x83*(-147*x0*x37*x90 - x109*x110*(x100*x98 + x101*x108)
+    - x18*x97*(x100*x111*(-x112 + x113) + x108*x114*(x112 + x113)) -
+    x19*x91*(-120*x45 + x49*x92 + 48) + 10*x50*x91*x95 + x51*x96*x97) +
+    k31*x188*(k29*(m3*x119 + x120 + x122) + k30*x105*x115 + x13*(2*x120 +
+    x122))*(672*e2**3*x114*x137 + x124 + x127 - x128 - x129 - x131 + x132 +
+    x133 - x136 + x138 + x140 + x141 - x142 - x144 - x145 + x147 + x149 - x150
+    - x152 - x154 + x155 - x156 - x157 - x160 - x161 + x162 + x163 + x165 +
+    x167 + x168 + x170 + x172 - x174 - x176 + x177 - x178 - x179 - x180 + x182
+    + x183 + x184 - x187)), e2*k34*x10*(x186*x191**2*x70*(7*x115**2*x44 -
+    14*x190 + 4) + 147*x191**3*x192*x2*x68 + x192*(7*x0*x99*(-4*x39*x82 + x79)
+    + 2*x193*(-7*x134*x33**3/x23**(3/2) - 14*x35 + 4*x63 +
+    8)*sin(x93)))/x42**3, k39*x188*x3*(a1*k36*(-980*x109*x203 +
+    5145*x125*x202*x77 + 980*x185*x19*x200 - 5145*x19*x195 - 7*x19*x197 +
+    4410*x195*x42 + 6*x197*x42 - 840*x198*x200*x39 + 280*x198*x203 +
+    1470*x2*x202*x21*x64*x65 - 20*x201*x42*x94 + 70*x201*x95) +
+    k38*x117*x86*(x13*(x205 + x207) + x14*x205 + x8*(k37*x106*x206*x60 + 4*x204
+    + x207))*(-x114*x164 - x124 - x127 + x128 + x129 + x131 - x132 - x133 +
+    x136 - x138 - x140 - x141 + x142 + x144 + x145 - x147 - x149 + x150 + x152
+    + x154 - x155 + x156 + x157 + x160 + x161 - x162 - x163 - x165 - x167 -
+    x168 - x170 - x172 + x174 + x176 - x177 + x178 + x179 + x180 - x182 - x183
+    - x184 + x187)), k42*sqrt(x20)*x48*x6*(0.875*x0 + 1)*(k40*x121 +
+    k41*x104)/H])
+
+def deriv_hexadecapole_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_hexadecapole.'''
+  x3 = m1**2
+  x4 = m2**2
+  x5 = m1*m2
+  x6 = x3 + x4 - x5
+  x7 = m1 + m2
+  x15 = 1/x7
+  x16 = x15*x3*x4
+  x18 = m3**2
+  x19 = x7**2
+  x20 = m3 + x7
+  x21 = a2*x18*x19/x20
+  k0 = 1/x18
+  k1 = 1/x3
+  k2 = 1/x4
+  k3 = 1/a2
+  k4 = k0*k1*k2*k3*x15*x20
+  k5 = 1/x19
+  k6 = x20**2
+  k7 = a2**(-2)
+  k8 = m1**(-4)
+  k9 = m2**(-4)
+  k10 = m3**(-4)
+  k11 = k10*k5*k6*k7*k8*k9
+  x41 = 1/m1
+  x42 = 1/m2
+  x43 = sqrt(x7)
+  x44 = 1/x43
+  x45 = sqrt(x20)
+  x46 = sqrt(a2)
+  x47 = 1/x46
+  k12 = 1/m3
+  k13 = k12*x47
+  k14 = x41*x42*x44
+  k15 = a2**(-5)
+  x75 = m1**3
+  x76 = m2**3
+  x77 = x75 + x76
+  k16 = x20**(3/2)
+  k17 = x7**(-3/2)
+  k18 = 1/x75
+  k19 = 1/x76
+  k20 = a2**(-3/2)
+  k21 = m3**(-3)
+  k22 = k16*k17*k18*k19*k20*k21
+  k23 = 1/x45
+  x178 = a2**(-11/2)
+  x183 = x45*x6
+  k24 = m3*x46
+  k25 = x7**(-5/2)
+  k26 = 315*k25*x6/32768
+  k27 = x7**(-9/2)
+  k28 = 2*x5
+  k29 = m2*x44
+  k30 = x47*x6
+  k31 = x7*x77
+  k32 = 0.001373291015625*k27
+  k33 = x7**(-4)
+  k34 = 45*k33*x178*x183*x5/65536
+  k35 = x7**(-5)
+  k36 = x20*x5*x77
+  k37 = -x47
+  k38 = 20*x183*x43
+  k39 = -9*k35*x178/131072
+  return ((m2, m3, x3, x4, x5, x16, x20, x21, k4, k11, x41, x42, x43, x44, x45,
+    k13, k14, k15, k22, k23, k24, k26, k28, k29, k30, k31, k32, k34, k36, k37,
+    k38, k39))
+
+def deriv_hexadecapole(y, k):
+  '''The EOMs with the hexadecapole terms.
+
+  k is returned by deriv_hexadecapole_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (m2, m3, x3, x4, x5, x16, x20, x21, k4, k11, x41, x42, x43, x44, x45,
+    k13, k14, k15, k22, k23, k24, k26, k28, k29, k30, k31, k32, k34, k36,
+    k37, k38, k39) = k
+  x0 = e1**2
+  x1 = 1 - x0
+  x2 = sqrt(x1)
+  x8 = 4*g1
+  x9 = 21*x0
+  x10 = e2**2
+  x11 = 3*x10 + 2
+  x12 = 1 - x10
+  x13 = H**2
+  x14 = a1*x1
+  x17 = x14*x16
+  x22 = x12*x21
+  x23 = x13 - x17 - x22
+  x24 = k4/a1
+  x25 = x23**2*x24/(x1*x12)
+  x26 = 4 - x25
+  x27 = x11*x26**2
+  x28 = 2*g1
+  x29 = x0 + 2
+  x30 = 2*x29
+  x31 = -x13 + x17 + x22
+  x32 = x0 - 1
+  x33 = x10 - 1
+  x34 = x24/(x32*x33)
+  x35 = x31**2*x34
+  x36 = k11/a1**2
+  x37 = 7*x36
+  x38 = x31**4/(x32**2*x33**2)
+  x39 = -32*x35 + x37*x38 + 16
+  x40 = x11*x39
+  x48 = sqrt(x12)
+  x49 = 1/x48
+  x50 = k13*x49
+  x51 = x45*x50
+  x52 = k14*x23*x51/sqrt(x14)
+  x53 = x52 + 2
+  x54 = x52 - 2
+  x55 = -g2
+  x56 = 2*x28 + 2*x55
+  x57 = sin(x56)
+  x58 = 2*g1 + 2*x55
+  x59 = sin(x58)
+  x60 = x53**2
+  x61 = 14*x52
+  x62 = 7*x25
+  x63 = x62 + 4
+  x64 = x60*(-x61 + x63)
+  x65 = x54**2
+  x66 = x25 - 4
+  x67 = 2*g2 + 2*x28
+  x68 = x66*x9*sin(x67)
+  x69 = x61 + x63
+  x70 = 2*g1 + 2*g2
+  x71 = x69*sin(x70)
+  x72 = m3/sqrt(-x33**7)
+  x73 = a1**(7/2)*k15
+  x74 = 1/x2
+  x78 = cos(x8)
+  x79 = 3*x0 + 4
+  x80 = 35*x36
+  x81 = 2*g2
+  x82 = cos(x81)
+  x83 = x10*x82
+  x84 = cos(x28)
+  x85 = 28*x0 + 28
+  x86 = cos(x67)
+  x87 = 2 - x52
+  x88 = x87**2
+  x89 = cos(x56)
+  x90 = a1*x32
+  x91 = -x90
+  x92 = x41/sqrt(x91)
+  x93 = x42*x92
+  x94 = x44*x93
+  x95 = x51*x94
+  x96 = x31*x95
+  x97 = (2 - x96)**2
+  x98 = x0*x10
+  x99 = 147*x26
+  x100 = cos(x70)
+  x101 = 14*x96
+  x102 = 7*x35 + 4
+  x103 = cos(x58)
+  x104 = x13 + x16*x90 + x21*x33
+  x105 = x104*x20
+  x106 = sqrt(a1)
+  x107 = x106*x2
+  x108 = x107*x43
+  x109 = m2*x108
+  x110 = x105*x94
+  x111 = 560*x98
+  x112 = x100*x111
+  x113 = e1**4
+  x114 = x10*x113
+  x115 = 280*x114
+  x116 = x100*x115
+  x117 = x103*x111
+  x118 = x103*x115
+  x119 = 588*x114
+  x120 = x119*x86
+  x121 = x119*x89
+  x122 = 192*x96
+  x123 = k22/x12**(3/2)
+  x124 = x123*x31**3/x91**(3/2)
+  x125 = 112*x124
+  x126 = x0*x96
+  x127 = 960*x126
+  x128 = x113*x96
+  x129 = 360*x128
+  x130 = 288*x10*x96
+  x131 = 560*x0*x124
+  x132 = 210*x124
+  x133 = x113*x132
+  x134 = 168*x10*x124
+  x135 = x96*x98
+  x136 = 1440*x135
+  x137 = x114*x96
+  x138 = 540*x137
+  x139 = 256*x83*x96
+  x140 = x124*x98
+  x141 = 840*x140
+  x142 = x114*x124
+  x143 = 315*x142
+  x144 = x125*x83
+  x145 = 1280*x135*x82
+  x146 = 480*x137*x82
+  x147 = x100*x35
+  x148 = 588*x98
+  x149 = x147*x148
+  x150 = 294*x114*x147
+  x151 = x111*x124*x82
+  x152 = x114*x132*x82
+  x153 = 672*x135
+  x154 = x100*x153
+  x155 = 336*x137
+  x156 = x100*x155
+  x157 = x103*x148*x35
+  x158 = x114*x35
+  x159 = 294*x103*x158
+  x160 = 441*x158
+  x161 = x160*x86
+  x162 = 392*x140
+  x163 = x100*x162
+  x164 = 196*x142
+  x165 = x100*x164
+  x166 = x103*x155
+  x167 = x160*x89
+  x168 = x103*x162
+  x169 = x103*x164
+  x170 = 147*x142
+  x171 = x170*x86
+  x172 = x170*x89
+  x173 = x11*x128*x78*x99
+  x174 = x0*x29
+  x175 = 28*x174
+  x176 = x11*x175*x84*x96*(16 - x62)
+  x177 = k23/x33**4
+  x179 = x104*x95
+  x180 = x179 + 2
+  x181 = x96 + 2
+  x182 = 40*x0 + 15*x113 + 8
+  x184 = x113*x66**2*x78
+  x185 = x23**4/(x1**2*x12**2)
+  x186 = x182*(x185*x80 - 120*x25 + 48)
+  x187 = x0*x33
+  x188 = x185*x37 - 32*x25 + 16
+  x189 = x188*x84
+  x190 = x182*x188
+  x191 = x60*x89 + x65*x86
+  x192 = x29*(x100*x65*x69 + x103*x64)
+  x193 = k24*x48
+  x194 = 2*x193
+  x195 = x107*x31
+  x196 = -x195*x50*x92
+  return ([0, e1*k26*x2*x72*x73*(x10*(x30*x59*x64 - x53**3*x54*x57*x9 +
+    x65*(x30*x71 - x68)) + x27*x9*sin(x8) - x30*x40*sin(x28)),
+    k32*x73*x74*(k30*x177*(k28*(m3*x108 + x109 + x110) + k29*x105*x92 +
+    x3*(2*x109 + x110))*(672*e2**3*x103*x126 + x112 + x116 - x117 - x118 - x120
+    + x121 + x122 - x125 + x127 + x129 + x130 - x131 - x133 - x134 + x136 +
+    x138 - x139 - x141 - x143 + x144 - x145 - x146 - x149 - x150 + x151 + x152
+    + x154 + x156 + x157 + x159 + x161 - x163 - x165 + x166 - x167 - x168 -
+    x169 + x171 + x172 + x173 - x176) + k31*x32*x72*(-147*x0*x27*x78 -
+    x10*x85*(x100*x88*(-x101 + x102) + x103*x97*(x101 + x102)) -
+    x11*x79*(-120*x35 + x38*x80 + 48) + 10*x39*x79*x83 + x40*x84*x85 -
+    x98*x99*(x86*x88 + x89*x97))), a1**4*e2*k34*(147*x113*x180**3*x181*x57 +
+    x175*x180**2*x59*(7*x104**2*x34 - 14*x179 + 4) + x181*(7*x0*x87*(-4*x29*x71
+    + x68) + 2*x182*(-7*x123*x23**3/x14**(3/2) - 14*x25 + 4*x52 +
+    8)*sin(x81)))/x33**3, a1**3*k39*x177*(a1*k36*(980*x11*x174*x189 -
+    5145*x11*x184 - 7*x11*x186 + 1470*x113*x12*x191*x53*x54 +
+    5145*x114*x191*x66 + 4410*x184*x33 + 6*x186*x33 - 840*x187*x189*x29 +
+    280*x187*x192 - 20*x190*x33*x82 + 70*x190*x83 - 980*x192*x98) +
+    k38*x106*x74*(x194*x4 + x3*(x194 + x196) + x5*(k37*x195*x49*x93 + 4*x193 +
+    x196))*(-x103*x153 - x112 - x116 + x117 + x118 + x120 - x121 - x122 + x125
+    - x127 - x129 - x130 + x131 + x133 + x134 - x136 - x138 + x139 + x141 +
+    x143 - x144 + x145 + x146 + x149 + x150 - x151 - x152 - x154 - x156 - x157
+    - x159 - x161 + x163 + x165 - x166 + x167 + x168 + x169 - x171 - x172 -
+    x173 + x176)), 0])
+
+def deriv_gr_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_gr.'''
+  x3 = c**(-5)
+  x5 = m1 + m2
+  x6 = m1*m2
+  x7 = x5*x6
+  x9 = sqrt(x5)
+  x12 = m1**2*m2**2
+  k0 = -64*x7/5
+  k1 = -304*x3*x7/15
+  k2 = x5**(3/2)
+  k3 = c**(-2)
+  k4 = -3*k2*k3
+  k5 = 1/x9
+  k6 = k5*x6
+  k7 = 1/m1
+  k8 = 1/m2
+  k9 = 1/x5
+  k10 = k9*x12
+  k11 = x5**2
+  k12 = m3**2
+  k13 = 1/(m3 + x5)
+  k14 = a2*k11*k12*k13
+  k15 = k7*k8*x9/2
+  k16 = -32*x12*x9/5
+  return (x3, k0, k1, k4, k6, k10, k14, k15, k16)
+
+def deriv_gr(y, k):
+  '''The EOMs with the gr terms.
+
+  k is returned by deriv_gr_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  (x3, k0, k1, k4, k6, k10, k14, k15, k16) = k
+  x0 = e1**2
+  x1 = x0 - 1
+  x2 = a1**(-3)
+  x4 = x2*x3
+  x8 = 1/a1
+  x10 = a1*x1
+  x11 = sqrt(-x10)
+  return ([k0*x4*(0.3854166666666667*e1**4 + 3.0416666666666665*x0 +
+    1)/sqrt(-x1**7), e1*k1*(0.3980263157894737*x0 + 1)/(a1**4*sqrt(-x1**5)),
+    k4*sqrt(x2)*x8/x1, 0, 0, k16*x4*sqrt(x8)*(0.875*x0 + 1)*(k15*(H**2 +
+    k10*x10 + k14*(e2**2 - 1))/x11 + k6*x11)/(H*x1**2)])
+
+def deriv_none_constants(m1, m2, m3, a2, c):
+  '''The constants used by deriv_none.'''
+  return ()
+
+def deriv_none(y, k):
+  '''The EOMs with every term turned off.
+
+  k is returned by deriv_none_constants.'''
+  a1, e1, g1, e2, g2, H = y
+  return [0, 0, 0, 0, 0, 0]
+
+# The constants functions and kernels, indexed by
+# (quadrupole, octupole, hexadecapole, gr)
+DERIVS = {
+  (True, True, True, True):
+    (deriv_quadrupole_octupole_hexadecapole_gr_constants,
+     deriv_quadrupole_octupole_hexadecapole_gr),
+  (True, True, True, False):
+    (deriv_quadrupole_octupole_hexadecapole_constants,
+     deriv_quadrupole_octupole_hexadecapole),
+  (True, True, False, True):
+    (deriv_quadrupole_octupole_gr_constants,
+     deriv_quadrupole_octupole_gr),
+  (True, True, False, False):
+    (deriv_quadrupole_octupole_constants,
+     deriv_quadrupole_octupole),
+  (True, False, True, True):
+    (deriv_quadrupole_hexadecapole_gr_constants,
+     deriv_quadrupole_hexadecapole_gr),
+  (True, False, True, False):
+    (deriv_quadrupole_hexadecapole_constants,
+     deriv_quadrupole_hexadecapole),
+  (True, False, False, True):
+    (deriv_quadrupole_gr_constants,
+     deriv_quadrupole_gr),
+  (True, False, False, False):
+    (deriv_quadrupole_constants,
+     deriv_quadrupole),
+  (False, True, True, True):
+    (deriv_octupole_hexadecapole_gr_constants,
+     deriv_octupole_hexadecapole_gr),
+  (False, True, True, False):
+    (deriv_octupole_hexadecapole_constants,
+     deriv_octupole_hexadecapole),
+  (False, True, False, True):
+    (deriv_octupole_gr_constants,
+     deriv_octupole_gr),
+  (False, True, False, False):
+    (deriv_octupole_constants,
+     deriv_octupole),
+  (False, False, True, True):
+    (deriv_hexadecapole_gr_constants,
+     deriv_hexadecapole_gr),
+  (False, False, True, False):
+    (deriv_hexadecapole_constants,
+     deriv_hexadecapole),
+  (False, False, False, True):
+    (deriv_gr_constants,
+     deriv_gr),
+  (False, False, False, False):
+    (deriv_none_constants,
+     deriv_none)}
@@ -0,0 +1,317 @@
+#! /usr/bin/env python
+
+'''
+ts_output
+
+Write the trajectory of an integration to a file.  Two formats are
+supported:
+
+  text: One line of space-separated values per output step.  This is the
+    original output format of triplesec.
+  npy: A NumPy .npy file containing a structured array with one float64
+    field per column.  Rows are collected in a preallocated buffer and
+    written to disk in blocks, so no string formatting is done during the
+    integration and the values are stored at full precision.  The header is
+    rewritten after every block, so the file can be read while the
+    integration is still running.
+  none: Nothing is written, e.g., for an integration of which only the
+    summary is needed (see ts_summary).  No file is opened.
+
+Trajectories in the npy format can be loaded with read_output, which maps
+the file into memory rather than reading it.
+
+Both formats can be continued from a position returned by tell, so that an
+integration that is resumed from a checkpoint carries on writing the same
+file.  See ts_checkpoint.
+
+The output of an integration is written every outfreq steps, so its density
+follows the step size.  Output that is evenly spaced in time is given by
+the outtimes parameter of the integrators, for which uniform_times and
+log_times (and kl_period.kl_times) make schedules.  Alternatively the
+output of every step can be decimated (see DecimatedOutput), which keeps
+only the rows at the extrema of e1 and the inclination in each interval of
+time.
+'''
+
+# System modules
+import sys
+
+# Numerical modules
+from math import floor
+import numpy as np
+
+FORMATS = ['text', 'npy', 'none']
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+class TextOutput:
+  '''Write rows of output as lines of text.
+
+  Parameters:
+    filename: Write output to this file.  If None, print to stdout.
+    position: Continue the file from this position (see tell) rather than
+      starting a new file
+  '''
+
+  def __init__(self, filename=None, position=None):
+    self.filename = filename
+    if self.filename is not None:
+      if position is None:
+        self.outfile = open(self.filename, 'w')
+      else:
+        self.outfile = open(self.filename, 'r+')
+        self.outfile.seek(position)
+        self.outfile.truncate()
+
+  def write(self, row):
+    '''Write a row of output.'''
+    outstring = ' '.join(map(str, row))
+    if self.filename is None:
+      print outstring
+    else:
+      self.outfile.write(outstring + '\n')
+
+  def flush(self):
+    if self.filename is not None:
+      self.outfile.flush()
+
+  def tell(self):
+    '''Flush the output and return the position in the file, or None if
+    printing to stdout.'''
+    if self.filename is None:
+      return None
+    self.flush()
+    return self.outfile.tell()
+
+  def close(self):
+    if self.filename is not None:
+      self.outfile.close()
+
+class NpyOutput:
+  '''Write rows of output to a .npy file in blocks.
+
+  Parameters:
+    filename: The name of the file
+    columns: The names of the columns
+    bufsize: The number of rows to collect before writing them to disk
+    position: Continue the file from this position (see tell) rather than
+      starting a new file
+  '''
+
+  def __init__(self, filename, columns, bufsize=4096, position=None):
+    self.filename = filename
+    self.columns = list(columns)
+    self.dtype = np.dtype([(name, '<f8') for name in self.columns])
+    self.nrows = 0
+
+    # Rows are stored in the buffer until it is full
+    self._buffer = np.empty((bufsize, len(self.columns)), dtype='<f8')
+    self._nbuffer = 0
+
+    # Leave enough room in the header for any number of rows so that it
+    # can be rewritten in place
+    self._header_len = len(self._header(2**64 - 1))
+    if position is None:
+      self.outfile = open(self.filename, 'wb')
+    else:
+      # Drop any rows written after the position
+      self.nrows = position
+      self.outfile = open(self.filename, 'r+b')
+      self.outfile.seek(self._header_len + self.nrows * self.dtype.itemsize)
+      self.outfile.truncate()
+    self._write_header()
+
+  def _header(self, nrows):
+    '''Return the header of the .npy file (version 1.0) padded so that the
+    data is aligned to 64 bytes.'''
+    header = ("{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" %
+      (self.dtype.descr, nrows))
+    length = len(_NPY_MAGIC) + 2 + len(header) + 1
+    if hasattr(self, '_header_len'):
+      padding = self._header_len - length
+    else:
+      padding = -length % 64
+    header += ' ' * padding + '\n'
+    return (_NPY_MAGIC + np.array(len(header), dtype='<u2').tostring() +
+      header.encode('latin1'))
+
+  def _write_header(self):
+    position = self.outfile.tell()
+    self.outfile.seek(0)
+    self.outfile.write(self._header(self.nrows))
+    self.outfile.seek(max(position, self._header_len))
+
+  def write(self, row):
+    '''Write a row of output.'''
+    self._buffer[self._nbuffer] = row
+    self._nbuffer += 1
+    if self._nbuffer == len(self._buffer):
+      self.flush()
+
+  def flush(self):
+    '''Write the buffered rows to disk.'''
+    if self._nbuffer == 0:
+      return
+    self.outfile.write(self._buffer[:self._nbuffer].tostring())
+    self.nrows += self._nbuffer
+    self._nbuffer = 0
+    self._write_header()
+    self.outfile.flush()
+
+  def tell(self):
+    '''Flush the output and return the number of rows written.'''
+    self.flush()
+    return self.nrows
+
+  def close(self):
+    self.flush()
+    self.outfile.close()
+
+class NullOutput:
+  '''Discard rows of output.'''
+
+  def write(self, row):
+    pass
+
+  def flush(self):
+    pass
+
+  def tell(self):
+    return 0
+
+  def close(self):
+    pass
+
+def open_output(filename, columns, outformat='text', position=None):
+  '''Open a file to write the trajectory of an integration to.
+
+  Parameters:
+    filename: The name of the file.  If None, print text to stdout.
+    columns: The names of the columns
+    outformat: The format of the file, 'text', 'npy', or 'none'
+    position: Continue an existing file from this position, as returned by
+      the tell method of its output.  If None, start a new file.
+
+  Returns:
+    An object with write, flush, tell, and close methods.  write takes a
+    sequence of numbers, one for each column.
+  '''
+
+  if outformat == 'text':
+    return TextOutput(filename, position)
+  elif outformat == 'npy':
+    if filename is None:
+      raise ValueError('The npy format requires an output file')
+    return NpyOutput(filename, columns, position=position)
+  elif outformat == 'none':
+    return NullOutput()
+  else:
+    raise ValueError('Unknown output format %s' % outformat)
+
+class DecimatedOutput:
+  '''Decimate rows of output before writing them to another output.  Time
+  (the first column) is divided into buckets of length dt, and of the rows
+  in each bucket only those at which one of the keys is largest or smallest
+  are written, in order.  The first and last rows are always written.  The
+  extrema of the keys in the output are therefore those of the full output,
+  and the number of rows is at most twice the number of keys per bucket.
+
+  Parameters:
+    output: The output to write the decimated rows to
+    dt: The length of a bucket in the units of the first column
+    keys: Functions of a row whose extrema are kept, e.g., e1 and the
+      inclination.  See the decimation_keys of each integrator.
+  '''
+
+  def __init__(self, output, dt, keys):
+    self._output = output
+    self.dt = dt
+    self.keys = keys
+    self._bucket = None
+    self._extrema = []
+    self._last = None
+    self._written = None
+
+  def write(self, row):
+    '''Add a row of output to its bucket.'''
+    row = list(row)
+    bucket = floor(row[0] / self.dt)
+    if bucket != self._bucket:
+      self._write_bucket()
+      self._bucket = bucket
+      self._extrema = [[key(row), row, key(row), row] for key in self.keys]
+    else:
+      for extrema, key in zip(self._extrema, self.keys):
+        value = key(row)
+        if value < extrema[0]:
+          extrema[0:2] = value, row
+        if value > extrema[2]:
+          extrema[2:4] = value, row
+    if self._written is None:
+      self._write_row(row)
+    self._last = row
+
+  def _write_row(self, row):
+    self._output.write(row)
+    self._written = row
+
+  def _write_bucket(self):
+    '''Write the extreme rows of the current bucket.'''
+    rows = []
+    for extrema in self._extrema:
+      for row in extrema[1], extrema[3]:
+        if row is not self._written and all(row is not r for r in rows):
+          rows.append(row)
+    for row in sorted(rows, key=lambda row: row[0]):
+      self._write_row(row)
+    self._bucket = None
+    self._extrema = []
+
+  def flush(self):
+    self._output.flush()
+
+  def tell(self):
+    '''Write the current bucket and return the position of the output.  The
+    rows that follow start a new bucket.'''
+    self._write_bucket()
+    return self._output.tell()
+
+  def close(self):
+    '''Write the current bucket and the last row and close the output.'''
+    self._write_bucket()
+    if self._last is not None and self._last is not self._written:
+      self._write_row(self._last)
+    self._output.close()
+
+def decimate(triple):
+  '''Decimate the output of an integrator if its decimate parameter is set.
+  This must be called whenever the output file is opened.'''
+  if getattr(triple, 'decimate', None) is not None:
+    triple.outfile = DecimatedOutput(triple.outfile, triple.decimate,
+      triple.decimation_keys)
+
+def uniform_times(tstop, dt):
+  '''Return output times from 0 to tstop spaced by dt.'''
+  return np.arange(0, tstop, dt)
+
+def log_times(tstop, n, tmin):
+  '''Return the output time 0 and n output times from tmin to tstop spaced
+  evenly in log.'''
+  return np.concatenate(([0.], np.logspace(np.log10(tmin), np.log10(tstop),
+    n)))
+
+def read_output(filename):
+  '''Read a trajectory written in the npy format.  The file is mapped into
+  memory, so no data is read until it is used.
+
+  Parameters:
+    filename: The name of the file
+
+  Returns:
+    A structured array with one field for each column.  A column can be
+    selected by name (e.g., data['e1']) and a plain two-dimensional array
+    of all the columns is given by data.view('<f8').reshape(len(data), -1),
+    neither of which copies the data.
+  '''
+
+  return np.load(filename, mmap_mode='r')
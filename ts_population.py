@@ -0,0 +1,312 @@
+#! /usr/bin/env python
+
+'''
+ts_population
+
+Integrate a population of hierarchical triples in parallel.  Initial
+conditions are read from a table with one triple per row (or drawn by
+ts_sampling), and the triples are distributed over a pool of worker
+processes.  Each completed triple is
+recorded in a journal so that an interrupted run can be resumed.
+
+Each worker should use a single BLAS thread, since the pool already uses
+every core.  When run from the command line, ts_population sets the
+environment variables that limit the BLAS threads before NumPy is imported.
+As a library it leaves the environment alone, and the workers are limited
+with threadpoolctl if it is installed, which is the supported way to do
+this once NumPy has been imported.
+'''
+
+# Ignore DeprecationWarnings if called from command line
+if __name__ == '__main__':
+  import __init__
+
+# System modules
+import argparse
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+# The environment variables that limit the number of BLAS threads.  These
+# only have an effect if they are set before NumPy is first imported, so
+# they are only set when run from the command line.
+_BLAS_THREAD_VARS = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+  'MKL_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+if __name__ == '__main__':
+  for _var in _BLAS_THREAD_VARS:
+    os.environ.setdefault(_var, '1')
+
+# Numerical modules
+import numpy as np
+
+# Triplesec modules
+from ekm import Triple_octupole
+from triplesec import Triple
+from ts_vector import Triple_vector
+import ts_solvers
+import ts_summary
+
+# The integrator classes.  The columns of the final states are the same as
+# the columns of the output of each class.
+MODELS = {
+  'triple': Triple,
+  'vector': Triple_vector,
+  'octupole': Triple_octupole}
+
+def iter_table(filename):
+  '''Read a table of initial conditions one row at a time.  The first
+  non-comment line gives the names of the columns, which must be parameters
+  of the integrator class.  Lines beginning with # are ignored.
+
+  Parameters:
+    filename: The name of the file containing the table
+
+  Yields:
+    A dictionary for each row of the table
+  '''
+
+  names = None
+  with open(filename) as infile:
+    for line in infile:
+      line = line.strip()
+      if not line or line.startswith('#'):
+        continue
+      if names is None:
+        names = line.split()
+      else:
+        yield dict(zip(names, map(float, line.split())))
+
+def read_table(filename):
+  '''Read a whole table of initial conditions.  See iter_table.
+
+  Returns:
+    A list of dictionaries, one for each row of the table.
+  '''
+  return list(iter_table(filename))
+
+def final_state(triple):
+  '''Return the final state of an integrated triple as a list in the same
+  format as the class's own output.'''
+
+  if isinstance(triple, Triple):
+    return [triple.t, triple.a1, triple.e1, triple.g1, triple.e2, triple.g2,
+      triple.inc]
+  elif isinstance(triple, Triple_vector):
+    return [triple.t] + list(triple.jvec) + list(triple.evec)
+  else:
+    return [triple.t, triple.jz, triple.Omega, triple.fj, triple.fOmega,
+      triple.x, triple.CKL]
+
+def termination_reason(triple):
+  '''Determine why the integration of a triple stopped.  This is the name
+  of the stopping condition if one was met.  See ts_stopping.'''
+  if getattr(triple, 'collision', False):
+    return 'collision'
+  elif getattr(triple, 'stop_reason', None) is not None:
+    return triple.stop_reason
+  elif triple.t >= triple.tstop:
+    return 'tstop'
+  else:
+    return 'cputstop'
+
+def _init_worker():
+  '''Pin each worker process to a single BLAS thread.  The BLAS library is
+  already loaded, so this needs threadpoolctl.'''
+  try:
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(1)
+  except ImportError:
+    pass
+
+def _run_system(job):
+  '''Integrate a single triple.  This is run in a worker process.'''
+  index, model, params = job
+  cls = MODELS[model]
+
+  tstart = time.time()
+  triple = cls(outfilename=os.devnull, outformat='none', **params)
+  triple.integrate()
+  cputime = time.time() - tstart
+
+  return ([index] + final_state(triple) + [triple.nstep, cputime,
+    int(getattr(triple, 'collision', False)), termination_reason(triple)] +
+    [reducer.value for reducer in getattr(triple, 'reducers', [])])
+
+def read_journal(journalname):
+  '''Return the set of indices of the completed triples.'''
+  if not os.path.exists(journalname):
+    return set()
+  with open(journalname) as journal:
+    return set(int(line) for line in journal if line.strip())
+
+def _clean_output(outfilename, completed, header):
+  '''Remove rows of an interrupted run that were not recorded in the
+  journal, as well as blank lines and a last line that was cut short.  The
+  header of the file must be the same as that of the run being resumed.'''
+  with open(outfilename) as outfile:
+    lines = outfile.readlines()
+  if lines and not lines[-1].endswith('\n'):
+    lines.pop()
+  headers = [line for line in lines if line.startswith('#')]
+  if headers and headers[0] != header:
+    raise ValueError('The columns of %s are\n  %s\nnot\n  %s' %
+      (outfilename, headers[0][2:].strip(), header[2:].strip()))
+  with open(outfilename, 'w') as outfile:
+    for line in lines:
+      if line.startswith('#') or (line.strip() and int(line.split()[0]) in
+        completed):
+        outfile.write(line)
+
+def run_population(infilename, outfilename, model='triple', processes=None,
+  journalname=None, batchsize=10000, **kwargs):
+  '''Integrate every triple in a table of initial conditions.
+
+  One row is written to the output file for each triple in the format:
+
+    index  <final state>  nstep  cputime  collision  termination  <summary>
+
+  where the final state is in the format of the model's output and the
+  summary has a column for each of the reducers, if any (see ts_summary).
+  Only the final state and the summary of each triple are kept, so nothing
+  is written during its integration.  Completed
+  triples are recorded in the journal, and triples that already appear in
+  the journal are skipped, so an interrupted run will pick up where it left
+  off.
+
+  The initial conditions are read and the triples are handed to the workers
+  batchsize at a time, so the memory needed does not depend on the size of
+  the population.
+
+  Parameters:
+    infilename: The table of initial conditions (see iter_table), or an
+      iterable of dictionaries of initial conditions, e.g., ts_sampling.rows
+      of a sample.  The order of the rows must be the same on resuming.
+    outfilename: The file to write the results to
+    model: The integrator to use ('triple', 'vector', or 'octupole')
+    processes: The number of worker processes.  If None, use every core.
+    journalname: The journal file.  If None, append '.journal' to
+      outfilename.
+    batchsize: The number of triples to hand to the workers at a time
+    kwargs: Parameters passed to every triple.  Columns of the table
+      override these.  Stopping conditions (stop_conditions) must be given
+      by name so that they can be passed to the workers, and are only
+      supported by the triple and vector models.  See ts_stopping.
+      The same is true of reducers.  See ts_summary.
+
+  Returns:
+    The number of triples integrated during this call.
+  '''
+
+  if model not in MODELS:
+    raise ValueError('Unknown model %s' % model)
+  if processes is None:
+    processes = multiprocessing.cpu_count()
+  if journalname is None:
+    journalname = outfilename + '.journal'
+
+  if isinstance(infilename, basestring):
+    rows = iter_table(infilename)
+  else:
+    rows = infilename
+  completed = read_journal(journalname)
+  header = ('# ' + ' '.join(['index'] + MODELS[model].columns + ['nstep',
+    'cputime', 'collision', 'termination'] +
+    ts_summary.names(kwargs.get('reducers'))) + '\n')
+  if os.path.exists(outfilename):
+    _clean_output(outfilename, completed, header)
+  else:
+    with open(outfilename, 'w') as outfile:
+      outfile.write(header)
+
+  # The pool would read every job into its queue at once, so the jobs are
+  # handed to it in batches
+  jobs = ((i, model, dict(kwargs, **row)) for i, row in enumerate(rows) if i
+    not in completed)
+  njobs = 0
+
+  pool = multiprocessing.Pool(processes, initializer=_init_worker)
+  try:
+    with open(outfilename, 'a') as outfile, \
+         open(journalname, 'a') as journal:
+      while True:
+        batch = list(itertools.islice(jobs, batchsize))
+        if not batch:
+          break
+        for result in pool.imap_unordered(_run_system, batch):
+          outfile.write(' '.join(map(str, result)) + '\n')
+          outfile.flush()
+          os.fsync(outfile.fileno())
+          journal.write('%d\n' % result[0])
+          journal.flush()
+          os.fsync(journal.fileno())
+        njobs += len(batch)
+    pool.close()
+  except:
+    pool.terminate()
+    raise
+  finally:
+    pool.join()
+
+  return njobs
+
+def process_command_line(argv):
+  '''Process the command line.'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  # Configure the command line options
+  parser = argparse.ArgumentParser()
+
+  parser.add_argument('infile', help =
+    'Table of initial conditions, one triple per row')
+  parser.add_argument('outfile', help = 'File to write the results to')
+  parser.add_argument('-M', '--model', dest='model', type=str,
+    default='triple', choices=sorted(MODELS.keys()), help =
+    'Integrator to use [triple]')
+  parser.add_argument('-p', '--processes', dest='processes', type=int,
+    default=multiprocessing.cpu_count(), help =
+    'Number of worker processes [%d]' % multiprocessing.cpu_count(),
+    metavar='\b')
+  parser.add_argument('-j', '--journal', dest='journal', type=str, help =
+    'Journal of completed triples [<outfile>.journal]', metavar='\b')
+  parser.add_argument('-t', '--tstop', dest='tstop', type=float, help =
+    'Total time of integration for each triple', metavar='\b')
+  parser.add_argument('-C', '--cpu', dest='cputstop', type=float, help =
+    'cpu time limit in seconds for each triple', metavar='\b')
+  parser.add_argument('--algorithm', dest='algo', type=str,
+    choices=ts_solvers.SOLVERS, help = 'Integration algorithm [vode]')
+  parser.add_argument('--stop', dest='stop_conditions', action='append',
+    help = 'Stop each triple early on this condition, e.g., gr_quenched or '
+    'merger_time=1e8 (may be repeated).  See ts_stopping.', metavar='\b')
+  parser.add_argument('--summary', dest='reducers', action='append',
+    help = 'Add a column with this summary statistic of each triple, e.g., '
+    'e1_max or time_above=0.99 (may be repeated; default for all of them).  '
+    'See ts_summary.', metavar='\b')
+
+  arguments = parser.parse_args(argv)
+  return arguments
+
+def main(argv=None):
+  args = process_command_line(argv)
+  kwargs = {}
+  if args.tstop is not None:
+    kwargs['tstop'] = args.tstop
+  if args.cputstop is not None:
+    kwargs['cputstop'] = args.cputstop
+  if args.algo is not None:
+    kwargs['integration_algo'] = args.algo
+  if args.stop_conditions is not None:
+    kwargs['stop_conditions'] = args.stop_conditions
+  if args.reducers is not None:
+    kwargs['reducers'] = args.reducers
+
+  run_population(args.infile, args.outfile, model=args.model,
+    processes=args.processes, journalname=args.journal, **kwargs)
+  return 0
+
+if __name__=='__main__':
+  status = main()
+  sys.exit(status)
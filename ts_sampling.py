@@ -0,0 +1,224 @@
+#! /usr/bin/env python
+
+'''
+ts_sampling
+
+Draw the initial conditions of a population of hierarchical triples by Monte
+Carlo.  sample is a generator that yields the triples in chunks.  Each chunk
+is a NumPy structured array with a field for each of the parameters a1, a2,
+e1, e2, inc, argperi1, argperi2, m1, m2, and m3 of Triple (in its units),
+and an index that counts the triples of the population from zero.
+
+Candidates are drawn chunksize at a time and those that are dynamically
+unstable or not hierarchical are rejected (see stable and hierarchical), so
+a chunk may have fewer than chunksize triples.  Chunk k is drawn from its
+own random state seeded with (seed, k), so the population is the same
+whatever the chunk is used for, and the memory needed does not depend on the
+size of the population.
+
+A chunk can be integrated all at once by Triple_ensemble (see params), or
+one triple at a time by Triple or ts_population (see rows).  From the
+command line the population is written as a table for ts_population:
+
+    python ts_sampling.py -n 1e6 --seed 1 -O ics.dat
+'''
+
+# Ignore DeprecationWarnings if called from command line
+if __name__ == '__main__':
+  import __init__
+
+# System modules
+import sys
+
+# Numerical modules
+import numpy as np
+
+# The fields of a chunk.  All but the index are parameters of Triple.
+PARAMS = ['a1', 'a2', 'e1', 'e2', 'inc', 'argperi1', 'argperi2', 'm1', 'm2',
+  'm3']
+FIELDS = ['index'] + PARAMS
+
+def log_uniform(rng, n, low, high):
+  '''Draw n values uniformly distributed in log between low and high.'''
+  return np.exp(rng.uniform(np.log(low), np.log(high), n))
+
+def power_law(rng, n, low, high, alpha):
+  '''Draw n values between low and high from dN/dm ~ m^-alpha.'''
+  if alpha == 1:
+    return log_uniform(rng, n, low, high)
+  k = 1 - alpha
+  return (low**k + rng.uniform(size=n) * (high**k - low**k))**(1. / k)
+
+def thermal(rng, n):
+  '''Draw n eccentricities from the thermal distribution, dN/de = 2e.'''
+  return np.sqrt(rng.uniform(size=n))
+
+def uniform(rng, n):
+  '''Draw n eccentricities uniformly between 0 and 1.'''
+  return rng.uniform(size=n)
+
+# The eccentricity distributions by name
+ECCENTRICITIES = {
+  'thermal': thermal,
+  'uniform': uniform}
+
+def draw(rng, n, a1=(1, 100), a2=(100, 1e4), e1='thermal', e2='thermal',
+  m1=(.1, 10), alpha=2.35, q=(.1, 1), q3=(.1, 1)):
+  '''Draw n candidate triples without any cuts.  The inclination is
+  isotropic, and the arguments of periapsis are uniform.
+
+  Parameters:
+    rng: A numpy.random.RandomState
+    n: The number of triples
+    a1: The range of the inner semi-major axis in AU (log-uniform)
+    a2: The range of the outer semi-major axis in AU (log-uniform)
+    e1: The distribution of the inner eccentricity.  See ECCENTRICITIES.
+    e2: The distribution of the outer eccentricity.  See ECCENTRICITIES.
+    m1: The range of the mass of the primary in solar masses
+    alpha: The power law index of the mass of the primary, dN/dm ~
+      m^-alpha.  The default is Salpeter's.
+    q: The range of the inner mass ratio, m2 / m1 (uniform)
+    q3: The range of the outer mass ratio, m3 / (m1 + m2) (uniform)
+
+  Returns:
+    A structured array with the fields FIELDS.  The index is zero.
+  '''
+
+  chunk = np.zeros(n, dtype=[('index', int)] + [(name, float) for name in
+    PARAMS])
+  chunk['a1'] = log_uniform(rng, n, *a1)
+  chunk['a2'] = log_uniform(rng, n, *a2)
+  chunk['e1'] = ECCENTRICITIES[e1](rng, n)
+  chunk['e2'] = ECCENTRICITIES[e2](rng, n)
+  chunk['inc'] = np.degrees(np.arccos(rng.uniform(-1, 1, n)))
+  chunk['argperi1'] = rng.uniform(0, 360, n)
+  chunk['argperi2'] = rng.uniform(0, 360, n)
+  chunk['m1'] = power_law(rng, n, m1[0], m1[1], alpha)
+  chunk['m2'] = chunk['m1'] * rng.uniform(q[0], q[1], n)
+  chunk['m3'] = (chunk['m1'] + chunk['m2']) * rng.uniform(q3[0], q3[1], n)
+  return chunk
+
+def stable(chunk):
+  '''Return whether each triple of a chunk is dynamically stable by the
+  criterion of Mardling & Aarseth (2001), with their correction for the
+  inclination.'''
+  qout = chunk['m3'] / (chunk['m1'] + chunk['m2'])
+  e2 = chunk['e2']
+  ratio = (2.8 * (1 + qout)**(2/5.) * (1 + e2)**(2/5.) / (1 - e2)**(1/5.) *
+    (1 - .3 * chunk['inc'] / 180))
+  return chunk['a2'] * (1 - e2) > ratio * chunk['a1']
+
+def hierarchical(chunk, epsoct_max=.1):
+  '''Return whether each triple of a chunk is hierarchical enough for the
+  secular approximation, i.e., whether its epsilon_octupole (without the
+  mass term, as in Triple) is less than epsoct_max.'''
+  epsoct = (chunk['e2'] / (1 - chunk['e2']**2) * chunk['a1'] /
+    chunk['a2'])
+  return epsoct < epsoct_max
+
+def sample(n, chunksize=100000, seed=0, epsoct_max=.1, max_empty=10,
+  **kwargs):
+  '''Draw a population of stable, hierarchical triples in chunks.
+
+  Parameters:
+    n: The number of triples in the population
+    chunksize: The number of candidates to draw for each chunk
+    seed: The seed of the population.  Chunk k is drawn with the seed
+      (seed, k).
+    epsoct_max: The largest epsilon_octupole to accept.  See hierarchical.
+    max_empty: The number of chunks in a row in which no candidate passes
+      the cuts after which to give up
+    kwargs: The distributions of the parameters.  See draw.
+
+  Yields:
+    Structured arrays with the fields FIELDS, the last of which is cut
+    short so that there are n triples in all
+
+  Raises:
+    ValueError: If max_empty chunks in a row are empty, i.e., the cuts
+      reject (nearly) every triple of the distributions
+  '''
+
+  n = int(n)
+  index = 0
+  k = 0
+  nempty = 0
+  while index < n:
+    chunk = draw(np.random.RandomState([seed, k]), chunksize, **kwargs)
+    chunk = chunk[stable(chunk) & hierarchical(chunk, epsoct_max)]
+    nempty = 0 if len(chunk) else nempty + 1
+    if nempty == max_empty:
+      raise ValueError('No triple of %d chunks in a row of %d candidates '
+        'passed the cuts with epsoct_max=%g%s' % (max_empty, chunksize,
+        epsoct_max, ''.join(', %s=%r' % item for item in sorted(kwargs.items()))))
+    chunk = chunk[:n - index]
+    chunk['index'] = np.arange(index, index + len(chunk))
+    index += len(chunk)
+    k += 1
+    yield chunk
+
+def params(chunk):
+  '''Return the parameters of Triple_ensemble for a chunk.'''
+  return dict((name, chunk[name]) for name in PARAMS)
+
+def rows(chunks):
+  '''Yield the parameters of Triple for each triple of a sequence of
+  chunks, e.g., for ts_population.run_population.'''
+  for chunk in chunks:
+    for triple in chunk:
+      yield dict((name, float(triple[name])) for name in PARAMS)
+
+def write_table(chunks, outfile):
+  '''Write a sequence of chunks to an open file as a table of initial
+  conditions for ts_population.  See ts_population.read_table.'''
+  outfile.write(' '.join(PARAMS) + '\n')
+  for chunk in chunks:
+    np.savetxt(outfile, np.column_stack([chunk[name] for name in PARAMS]),
+      fmt='%.17g')
+
+def process_command_line(argv):
+  '''Process the command line.'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  # Configure the command line options
+  import argparse
+  parser = argparse.ArgumentParser()
+
+  parser.add_argument('-n', '--number', dest='n', type=float, required=True,
+    help = 'Number of triples', metavar='\b')
+  parser.add_argument('-s', '--seed', dest='seed', type=int, default=0,
+    help = 'Seed of the population [0]', metavar='\b')
+  parser.add_argument('--chunksize', dest='chunksize', type=int,
+    default=100000, help = 'Number of candidates to draw at a time '
+    '[100000]', metavar='\b')
+  parser.add_argument('--epsoct-max', dest='epsoct_max', type=float,
+    default=.1, help = 'Largest epsilon_octupole to accept [0.1]',
+    metavar='\b')
+  parser.add_argument('--e1', dest='e1', type=str, default='thermal',
+    choices=sorted(ECCENTRICITIES), help =
+    'Distribution of the inner eccentricity [thermal]')
+  parser.add_argument('--e2', dest='e2', type=str, default='thermal',
+    choices=sorted(ECCENTRICITIES), help =
+    'Distribution of the outer eccentricity [thermal]')
+  parser.add_argument('-O', '--outfile', dest='outfilename', type=str, help =
+    'Write the table to this file [stdout]', metavar='\b')
+
+  arguments = parser.parse_args(argv)
+  return arguments
+
+def main(argv=None):
+  args = process_command_line(argv)
+  chunks = sample(args.n, args.chunksize, args.seed, args.epsoct_max,
+    e1=args.e1, e2=args.e2)
+  if args.outfilename is None:
+    write_table(chunks, sys.stdout)
+  else:
+    with open(args.outfilename, 'w') as outfile:
+      write_table(chunks, outfile)
+  return 0
+
+if __name__=='__main__':
+  status = main()
+  sys.exit(status)
@@ -0,0 +1,452 @@
+#! /usr/bin/env python
+
+'''
+ts_solvers
+
+Interchangeable ODE solvers for the equations of motion of a triple.  Every
+solver has the same interface (see Solver), so the integrators only need to
+know the name of the solver.  The solvers are:
+
+  vode: VODE from scipy.integrate.ode.  This uses the Adams method, or the
+    BDF method if stiff is set.
+  lsoda: LSODA, which switches automatically between the Adams and BDF
+    methods as the problem becomes stiff or non-stiff.
+  RK45, RK23, Radau, BDF (and DOP853 with SciPy >= 1.4): The methods of
+    scipy.integrate.solve_ivp.  These all have dense output.
+  dop853, dopri5: The explicit Runge-Kutta methods of Dormand & Prince of
+    order 8 and 5 from scipy.integrate.ode.
+
+The solvers that use a Jacobian (vode with stiff set, lsoda, Radau, and
+BDF) are given the analytic Jacobian if there is one.
+
+The state of a solver, including the size of its next step, can be saved
+with get_state and restored with set_state, so that an integration can be
+checkpointed and resumed.  See ts_checkpoint.
+
+If make_solver is given a Stats object, the derivatives, the Jacobian, and
+the steps of the solver are counted and timed.  See ts_stats.
+
+scipy.integrate is only imported when the first solver is created, since
+importing it takes longer than short integrations.
+'''
+
+# System modules
+import collections
+import warnings
+
+# Numerical modules
+import numpy as np
+import scipy
+
+# The methods of solve_ivp that are available in this version of SciPy, and
+# the versions in which they were added
+_SCIPY_VERSION = tuple(int(part) for part in
+  scipy.__version__.split('.')[:2])
+_IVP_METHODS = [name for name, version in [('RK45', (1, 0)), ('RK23', (1,
+  0)), ('Radau', (1, 0)), ('BDF', (1, 0)), ('DOP853', (1, 4))] if
+  _SCIPY_VERSION >= version]
+
+# The names of all the solvers
+SOLVERS = ['vode', 'lsoda', 'dop853', 'dopri5'] + _IVP_METHODS
+
+class Solver:
+  '''The interface of all the solvers.
+
+  Parameters:
+    f: The derivatives, f(t, y)
+    y0: The initial state
+    t0: The initial time
+    tbound: The time at which the integration is expected to end.  Some
+      solvers use it to choose their first step.  The solvers may step past
+      it.
+    atol: Absolute tolerance
+    rtol: Relative tolerance
+    jac: The Jacobian, jac(t, y), or None
+
+  Attributes:
+    t: The current time
+    y: The current state
+    nsteps: The number of steps taken so far
+    nrejected: The number of steps rejected so far, or None if the solver
+      does not report it
+  '''
+
+  # The number of steps after which advance returns
+  chunk = 500
+
+  def __init__(self, f, y0, t0, tbound, atol, rtol, jac=None):
+    self.f = f
+    self.jac = jac
+    self.t = t0
+    self.tbound = tbound
+    self.y = np.array(y0, dtype=float)
+    self.atol = atol
+    self.rtol = rtol
+    self.nsteps = 0
+    self.nrejected = None
+    self._success = True
+
+  def step(self):
+    '''Take a single step.  The size of the step is chosen by the solver.'''
+    raise NotImplementedError
+
+  def advance(self, tout):
+    '''Integrate towards tout.  Return after chunk steps even if tout has
+    not been reached, so that the caller can check the CPU time.  Return
+    False if the integration failed.'''
+    raise NotImplementedError
+
+  def integrate(self, tout):
+    '''Integrate to tout.  Return False if the integration failed.'''
+    while self.t < tout:
+      if not self.advance(tout):
+        return False
+    return True
+
+  def interpolate(self, t):
+    '''Return the state at a time within the last step.  This does not
+    change the state of the solver.'''
+    raise NotImplementedError
+
+  def successful(self):
+    '''Whether the integration has succeeded so far.'''
+    return self._success
+
+  def get_state(self):
+    '''Return the state of the solver as a dictionary of numbers and lists
+    that can be written to JSON.  h is the size of the next step, or None
+    if it is not known.'''
+    return {
+      't': float(self.t),
+      'y': self.y.tolist(),
+      'nsteps': int(self.nsteps),
+      'nrejected': None if self.nrejected is None else int(self.nrejected),
+      'h': None}
+
+  def set_state(self, state):
+    '''Restart the solver from a state returned by get_state.  The solver
+    starts again from t and y with a step of h, so the integration
+    continues as it would have, except that any other history of the
+    solver (e.g., the order of a multistep method) is rebuilt.'''
+    self.t = state['t']
+    self.y = np.array(state['y'], dtype=float)
+    self.nsteps = state['nsteps']
+    self.nrejected = state['nrejected']
+
+class VodeSolver(Solver):
+  '''VODE from scipy.integrate.ode.  The state within the last step is
+  interpolated by VODE to the order of the method.
+
+  Parameters:
+    stiff: Use the BDF method (with the Jacobian) rather than the Adams
+      method
+  '''
+
+  def __init__(self, f, y0, t0, tbound, atol, rtol, jac=None, stiff=False):
+    from scipy.integrate import ode
+    Solver.__init__(self, f, y0, t0, tbound, atol, rtol, jac)
+
+    # The Adams method uses functional iteration, so there is no Jacobian to
+    # supply.
+    if stiff and jac is not None:
+      self._ode = ode(f, jac)
+    else:
+      self._ode = ode(f)
+    if stiff:
+      self._ode.set_integrator('vode', method='bdf', with_jacobian=True,
+        nsteps=self.chunk, atol=atol, rtol=rtol)
+    else:
+      self._ode.set_integrator('vode', nsteps=self.chunk, atol=atol,
+        rtol=rtol)
+    self._start()
+
+    # The counts of steps before the solver was last restarted
+    self._nsteps0 = 0
+    self._nrejected0 = 0
+
+  def _start(self):
+    '''Start VODE from the current state.'''
+    self._ode.set_initial_value(self.y, self.t)
+    self._ode._integrator.iwork[2] = -1 # Don't print FORTRAN errors
+
+  def _read(self):
+    self.t = self._ode.t
+    self.y = np.array(self._ode.y)
+    self.nsteps = self._nsteps0 + self._ode._integrator.iwork[10]
+    # Error test and convergence failures
+    self.nrejected = self._nrejected0 + (self._ode._integrator.iwork[20] +
+      self._ode._integrator.iwork[21])
+    self._success = self._ode.successful()
+
+  def step(self):
+    self._ode.integrate(self.tbound, step=True)
+    self._read()
+
+  def advance(self, tout):
+    integrator = self._ode._integrator
+    with warnings.catch_warnings():
+      warnings.filterwarnings('ignore', message='.*Excess work done')
+      self._ode.integrate(tout)
+    if integrator.istate == -1:
+      # The solver took nsteps steps.  Pick up where it left off.
+      integrator.call_args[3] = 2
+      integrator.success = 1
+    self._read()
+    return self._success
+
+  def interpolate(self, t):
+    t_end, y_end = self._ode.t, self._ode._y
+    y = np.array(self._ode.integrate(t))
+    self._ode.t = t_end
+    self._ode._y = y_end
+    return y
+
+  def get_state(self):
+    state = Solver.get_state(self)
+    # The step size to be attempted next
+    if self.nsteps > self._nsteps0:
+      state['h'] = float(self._ode._integrator.rwork[11])
+    return state
+
+  def set_state(self, state):
+    Solver.set_state(self, state)
+    self._nsteps0 = self.nsteps
+    self._nrejected0 = self.nrejected
+    self._ode._integrator.first_step = state['h'] or 0.
+    self._start()
+
+class IvpSolver(Solver):
+  '''A method of scipy.integrate.solve_ivp.  The state within the last step
+  is given by the method's dense output.
+
+  Parameters:
+    method: The name of the method, e.g., 'RK45' or 'LSODA'
+  '''
+
+  # The methods that use the Jacobian
+  implicit = ['Radau', 'BDF', 'LSODA']
+
+  def __init__(self, f, y0, t0, tbound, atol, rtol, jac=None,
+    method='RK45'):
+    Solver.__init__(self, f, y0, t0, tbound, atol, rtol, jac)
+    self.method = method
+    self._start()
+
+  def _start(self, first_step=None):
+    '''Start the method from the current state.'''
+    import scipy.integrate
+    kwargs = {}
+    if self.method in self.implicit and self.jac is not None:
+      kwargs['jac'] = self.jac
+    if first_step is not None:
+      kwargs['first_step'] = first_step
+
+    # The methods keep the derivatives they are given between calls, so
+    # they are given a copy in case f writes them into a buffer that it
+    # reuses (as Triple_vector._deriv does).  The solver is not bounded, so
+    # that like VODE it may step past the stopping time of the triple.
+    f = self.f
+    self._solver = getattr(scipy.integrate, self.method)(lambda t, y:
+      np.array(f(t, y)), self.t, self.y, np.inf, rtol=self.rtol,
+      atol=self.atol, **kwargs)
+
+  def _step(self):
+    '''Take a step of the underlying solver.'''
+    self._solver.step()
+    self.nsteps += 1
+    if self._solver.status == 'failed':
+      self._success = False
+    return self._success
+
+  def step(self):
+    # If the state was interpolated, the rest of the last step is the step
+    if self.t == self._solver.t and not self._step():
+      return
+    self.t = self._solver.t
+    self.y = self._solver.y.copy()
+
+  def advance(self, tout):
+    for i in range(self.chunk):
+      if self._solver.t >= tout:
+        break
+      if not self._step():
+        return False
+    if self._solver.t >= tout:
+      self.t = tout
+      self.y = self.interpolate(tout)
+    else:
+      self.t = self._solver.t
+      self.y = self._solver.y.copy()
+    return True
+
+  def interpolate(self, t):
+    if t == self._solver.t or self._solver.t_old is None:
+      return self._solver.y.copy()
+    return self._solver.dense_output()(t)
+
+  def get_state(self):
+    state = Solver.get_state(self)
+    if self._solver.t_old is not None:
+      if self.method == 'LSODA':
+        # The step size to be attempted next
+        state['h'] = float(self._solver._lsoda_solver._integrator.rwork[11])
+      else:
+        state['h'] = float(self._solver.h_abs)
+    return state
+
+  def set_state(self, state):
+    Solver.set_state(self, state)
+    self._start(state['h'])
+
+class DopSolver(Solver):
+  '''The explicit Runge-Kutta methods of Dormand & Prince from
+  scipy.integrate.ode.  These can only integrate to a given time, so the
+  steps are collected chunk at a time and handed out one at a time by step.
+  Each chunk starts with the size of the last step of the previous chunk, so
+  the step size control carries over from one chunk to the next.  The state
+  within the last step is found by integrating again from the start of the
+  step, since no interpolant of these methods is available from SciPy.
+
+  Parameters:
+    method: 'dop853' or 'dopri5'
+  '''
+
+  def __init__(self, f, y0, t0, tbound, atol, rtol, jac=None,
+    method='dop853'):
+    from scipy.integrate import ode
+    Solver.__init__(self, f, y0, t0, tbound, atol, rtol, jac)
+    self._ode = ode(f)
+    self._ode.set_integrator(method, nsteps=2 * self.chunk, atol=atol,
+      rtol=rtol)
+    self._ode.set_solout(self._solout)
+    self._steps = collections.deque()
+
+    # A second solver for the integrations within a step
+    self._substep = ode(f)
+    self._substep.set_integrator(method, atol=atol, rtol=rtol)
+    self._last = None
+    self._h = 0.
+    self.nrejected = 0
+
+  def _solout(self, t, y):
+    '''Collect each step, and stop after chunk steps.'''
+    if t == self._tstart:
+      return 0
+    self._steps.append((t, np.array(y)))
+    if len(self._steps) >= self.chunk:
+      return -1
+    return 0
+
+  def _run(self, tout):
+    '''Collect up to chunk steps towards tout.'''
+    self._steps.clear()
+    self._tstart = self.t
+    self._ode._integrator.first_step = self._h
+    self._ode.set_initial_value(self.y, self.t)
+    with warnings.catch_warnings():
+      warnings.simplefilter('ignore', UserWarning)
+      self._ode.integrate(tout)
+    self._success = self._ode.successful()
+    # The counters of the solver restart with each integration
+    iwork = self._ode._integrator.iwork
+    self.nrejected += iwork[17] - iwork[18]
+    if len(self._steps) > 1:
+      self._h = self._steps[-1][0] - self._steps[-2][0]
+
+  def _take(self, t, y):
+    '''Move to the end of a step.'''
+    self._last = (self.t, self.y, t, y)
+    self.t = t
+    self.y = y
+    self.nsteps += 1
+
+  def get_state(self):
+    state = Solver.get_state(self)
+    if self._steps:
+      # The next step that has already been taken
+      state['h'] = float(self._steps[0][0] - self.t)
+    elif self._h:
+      state['h'] = float(self._h)
+    return state
+
+  def set_state(self, state):
+    Solver.set_state(self, state)
+    self._steps.clear()
+    self._last = None
+    self._h = state['h'] or 0.
+
+  def step(self):
+    if not self._steps:
+      self._run(np.inf)
+      if not self._success:
+        return
+    self._take(*self._steps.popleft())
+
+  def advance(self, tout):
+    self._run(tout)
+    steps = list(self._steps)
+    self._steps.clear()
+    if steps:
+      self.nsteps += len(steps) - 1
+      self._take(*steps[-1])
+      if len(steps) > 1:
+        self._last = (steps[-2] + steps[-1])
+    return self._success
+
+  def interpolate(self, t):
+    t0, y0, t1, y1 = self._last
+    if t == t1:
+      return y1.copy()
+    self._substep._integrator.first_step = t - t0
+    self._substep.set_initial_value(y0, t0)
+    return np.array(self._substep.integrate(t))
+
+def make_solver(name, f, y0, t0, tbound, atol, rtol, jac=None, args=(),
+  stiff=False, stats=None):
+  '''Create a solver.
+
+  Parameters:
+    name: The name of the solver.  See SOLVERS.
+    f: The derivatives, f(t, y, *args)
+    y0: The initial state
+    t0: The initial time
+    tbound: The time at which the integration is expected to end.  See
+      Solver.
+    atol: Absolute tolerance
+    rtol: Relative tolerance
+    jac: The Jacobian, jac(t, y, *args), or None
+    args: Extra arguments of f and jac
+    stiff: Use the BDF method of VODE.  Only used by vode.
+    stats: A ts_stats.Stats object in which to count and time the solver,
+      or None
+
+  Returns:
+    A Solver
+  '''
+
+  if args:
+    f_args = f
+    f = lambda t, y: f_args(t, y, *args)
+    if jac is not None:
+      jac_args = jac
+      jac = lambda t, y: jac_args(t, y, *args)
+
+  if stats is not None:
+    f = stats.timed_rhs('deriv', f)
+    if jac is not None:
+      jac = stats.timed_rhs('jac', jac)
+
+  if name == 'vode':
+    solver = VodeSolver(f, y0, t0, tbound, atol, rtol, jac, stiff=stiff)
+  elif name == 'lsoda':
+    solver = IvpSolver(f, y0, t0, tbound, atol, rtol, jac, method='LSODA')
+  elif name in ['dop853', 'dopri5']:
+    solver = DopSolver(f, y0, t0, tbound, atol, rtol, jac, method=name)
+  elif name in _IVP_METHODS:
+    solver = IvpSolver(f, y0, t0, tbound, atol, rtol, jac, method=name)
+  else:
+    raise ValueError('Unknown solver %s' % name)
+
+  if stats is not None:
+    stats.instrument_solver(solver)
+  return solver
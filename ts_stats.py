@@ -0,0 +1,165 @@
+#! /usr/bin/env python
+
+'''
+ts_stats
+
+Optional instrumentation of the integrators.  If an integrator is created
+with stats=True, it keeps a Stats object that counts the evaluations of the
+equations of motion and the Jacobian, the accepted and rejected steps and a
+histogram of the step sizes, and the time spent in each part of the
+integration:
+
+  deriv: Evaluating the equations of motion
+  jac: Evaluating the Jacobian
+  solver: The solver itself, not counting deriv and jac
+  update: Calculating the orbital elements from the state of the solver
+  output: Writing output
+  other: Everything else, e.g., the integration loop and events
+
+Nothing is wrapped or timed if stats is not set.  The stats can be read
+with Stats.as_dict, or written to a JSON file (the stats_outfilename option
+of the integrators).
+'''
+
+# System modules
+import functools
+import json
+import sys
+import time
+from collections import Counter
+from math import floor, log10
+
+class Stats:
+  '''Counters and timers of an integration.
+
+  Attributes:
+    calls: The number of calls of each timed part of the integration
+    times: The time spent in each timed part of the integration in seconds
+    step_sizes: A histogram of the sizes of the steps taken one at a time,
+      in the time units of the solver.  The keys are floor(log10(step)).
+  '''
+
+  def __init__(self):
+    self.calls = Counter()
+    self.times = Counter()
+    self.step_sizes = Counter()
+    self.solver = None
+    self._depth = 0
+
+  def timed(self, name, func):
+    '''Wrap a function so that its calls are counted and timed under
+    name.'''
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+      tstart = time.time()
+      try:
+        return func(*args, **kwargs)
+      finally:
+        self.times[name] += time.time() - tstart
+        self.calls[name] += 1
+    return wrapper
+
+  def timed_rhs(self, name, func):
+    '''Like timed, but for a function of (t, y) that is called by a
+    Fortran solver.  The arguments are spelled out, since the solvers count
+    them to decide how to call the function.'''
+    def wrapper(t, y):
+      tstart = time.time()
+      try:
+        return func(t, y)
+      finally:
+        self.times[name] += time.time() - tstart
+        self.calls[name] += 1
+    return wrapper
+
+  def instrument_solver(self, solver):
+    '''Time the steps of a solver and record their sizes.  See ts_solvers.
+    '''
+    self.solver = solver
+    step = self.timed('solver', solver.step)
+    def counted_step():
+      t0 = solver.t
+      step()
+      if solver.t > t0:
+        self.step_sizes[int(floor(log10(solver.t - t0)))] += 1
+    solver.step = counted_step
+    solver.advance = self.timed('solver', solver.advance)
+    solver.interpolate = self.timed('solver', solver.interpolate)
+
+  def as_dict(self):
+    '''Return the stats as a dictionary.'''
+    times = dict((name, self.times[name]) for name in ['deriv', 'jac',
+      'update', 'output', 'total'])
+    times['solver'] = (self.times['solver'] - self.times['deriv'] -
+      self.times['jac'])
+    times['other'] = self.times['total'] - sum(self.times[name] for name in
+      ['solver', 'update', 'output'])
+    stats = {
+      'deriv_calls': self.calls['deriv'],
+      'jac_calls': self.calls['jac'],
+      'times': times,
+      'step_sizes': dict((str(key), val) for key, val in
+        sorted(self.step_sizes.items()))}
+    if self.solver is not None:
+      stats['steps'] = int(self.solver.nsteps)
+      if self.solver.nrejected is not None:
+        stats['rejected_steps'] = int(self.solver.nrejected)
+    return stats
+
+  def write(self, filename):
+    '''Write the stats in JSON format to a file, or to stderr if filename
+    is 'stderr'.'''
+    outstring = json.dumps(self.as_dict(), sort_keys=True, indent=2)
+    if filename == 'stderr':
+      print >> sys.stderr, outstring
+    else:
+      with open(filename, 'w') as outfile:
+        outfile.write(outstring)
+
+class _TimedOutput:
+  '''An output file whose writes are timed.  See ts_output.'''
+
+  def __init__(self, outfile, stats):
+    self._outfile = outfile
+    self.write = stats.timed('output', outfile.write)
+
+  def __getattr__(self, name):
+    return getattr(self._outfile, name)
+
+def instrument(triple):
+  '''Time the update (if the integrator has one) and the output of an
+  integrator if it keeps stats.'''
+  if triple.stats is None:
+    return
+  if hasattr(triple, 'update'):
+    triple.update = triple.stats.timed('update', triple.update)
+  instrument_output(triple)
+
+def instrument_output(triple):
+  '''Time the writes to the output file of an integrator if it keeps stats.
+  This must be called whenever the output file is opened.'''
+  if triple.stats is not None:
+    triple.outfile = _TimedOutput(triple.outfile, triple.stats)
+
+def measured(method):
+  '''Decorate an integration method of an integrator so that, if the
+  integrator keeps stats, the method is timed as a whole and the stats are
+  written to stats_outfilename when it returns.'''
+  @functools.wraps(method)
+  def wrapper(self, *args, **kwargs):
+    stats = self.stats
+    if stats is None:
+      return method(self, *args, **kwargs)
+
+    # Only the outermost call is timed if one method calls another
+    stats._depth += 1
+    tstart = time.time()
+    try:
+      return method(self, *args, **kwargs)
+    finally:
+      stats._depth -= 1
+      if stats._depth == 0:
+        stats.times['total'] += time.time() - tstart
+        if self.stats_outfilename is not None:
+          stats.write(self.stats_outfilename)
+  return wrapper
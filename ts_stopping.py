@@ -0,0 +1,224 @@
+#! /usr/bin/env python
+
+'''
+ts_stopping
+
+Conditions on which to stop the integration of a triple before tstop, once
+its outcome is already decided.  The conditions are checked after every
+step of Triple.integrate and Triple_vector.integrate (at every output time
+if outtimes is set), and the name of the first one that is met is recorded
+as the stop_reason of the triple.
+
+The built-in conditions are:
+
+  gr_quenched: Relativistic precession of the inner binary is fast enough
+    to quench KL oscillations, i.e., epsilon_GR > factor * 9/4 (Liu et al.
+    2015).  Only checked if the GR terms are turned on.
+  merger_time: The gravitational wave merger time of the inner binary
+    (Peters 1964; Mandel 2021) is less than tmax years (1e8 by default).
+  kozai_window: The inclination has been outside the Kozai window
+    (cos^2 i < 3/5) for ncycles KL timescales.
+
+Any other condition can be given as a Condition with a function of the
+triple.  Conditions may also be given by name as strings of the form
+'name' or 'name=value', e.g., 'merger_time=1e8', which is how they are
+saved in checkpoints and given on the command line.  Custom conditions have
+no name of this form, so they are not saved in checkpoints and must be
+given again to resume.  The state of a built-in condition (e.g., how long
+the triple has been outside the Kozai window) is saved in checkpoints too,
+so a resumed integration stops when an uninterrupted one would.
+'''
+
+# Numerical modules
+from math import sqrt
+import numpy as np
+
+# Triplesec modules
+from ts_constants import *
+
+class Condition:
+  '''A condition on which to stop an integration.
+
+  Parameters:
+    name: The name of the condition, which is reported as the stop_reason
+      of the triple
+    func: A function of the triple that returns True if the integration
+      should stop
+  '''
+
+  # The string that creates the condition (see make_conditions), if any
+  spec = None
+
+  def __init__(self, name, func):
+    self.name = name
+    self.func = func
+
+  def __call__(self, triple):
+    return self.func(triple)
+
+  def get_state(self):
+    '''Return the state of a built-in condition for a checkpoint.'''
+    return dict((key, val) for key, val in vars(self).items() if key !=
+      'spec')
+
+  def set_state(self, state):
+    '''Restore the state of a built-in condition from a checkpoint.'''
+    vars(self).update((str(key), val) for key, val in state.items())
+
+def kl_timescale(triple):
+  '''Return the quadrupole KL timescale of a Triple or Triple_vector in
+  years.  For a Triple_vector this is its tsec.  A triple that only has an
+  epsoct (and no semi-major axes) has no timescale in years, unless it has
+  a tsec.'''
+  if triple.a1 is None or triple.a2 is None:
+    if getattr(triple, 'tsec', None) is not None:
+      return triple.tsec
+    raise ValueError('The KL timescale requires a1 and a2, not epsoct')
+  m12 = triple.m1 + triple.m2
+  n1 = 2 * np.pi * sqrt(m12 / triple.a1**3)
+  return (m12 / triple.m3 * (triple.a2 / triple.a1)**3 * (1 -
+    triple.e2**2)**(3/2.) / n1)
+
+def _cosi(triple):
+  '''Return the cosine of the inclination of a Triple or Triple_vector.'''
+  if hasattr(triple, 'jvec'):
+    return triple.jvec[2] / np.linalg.norm(triple.jvec)
+  return np.cos(triple.inc * np.pi / 180)
+
+class GRQuenched(Condition):
+  '''Stop once relativistic precession quenches KL oscillations.  This is
+  the case if epsilon_GR, the ratio of the rate of GR precession to the KL
+  rate for a circular inner orbit, exceeds 9/4, above which eccentricity
+  cannot be excited from zero at any inclination (Liu et al. 2015).
+
+  Parameters:
+    factor: Stop when epsilon_GR exceeds factor * 9/4
+  '''
+
+  name = 'gr_quenched'
+
+  def __init__(self, factor=1.):
+    self.factor = float(factor)
+    self.spec = '%s=%r' % (self.name, self.factor)
+
+  def __call__(self, triple):
+    if not getattr(triple, 'gr', False):
+      return False
+    m12 = (triple.m1 + triple.m2) * M_sun
+    a1 = triple.a1 * au
+    a2 = triple.a2 * au
+    eps_gr = (3 * G * m12**2 * a2**3 * (1 - triple.e2**2)**(3/2.) / (c**2 *
+      a1**4 * triple.m3 * M_sun))
+    return eps_gr > self.factor * 9/4.
+
+def merger_time(a1, e1, m1, m2):
+  '''Return the gravitational wave merger time of a binary in years.  This
+  is the merger time of a circular orbit (Peters 1964), T_c, times the fit
+  of Mandel (2021) to the integral of Peters for an eccentric orbit,
+
+    T = T_c (1 - e^2)^(7/2) (1 + 0.27 e^10 + 0.33 e^20 + 0.2 e^1000),
+
+  which is accurate to 3% at any eccentricity.  As e goes to 1 the last
+  factor goes to 1.8, i.e., to the 768/425 of the limit of Peters.
+
+  Parameters:
+    a1: The semi-major axis in AU
+    e1: The eccentricity
+    m1, m2: The masses in solar masses
+  '''
+  m1 = m1 * M_sun
+  m2 = m2 * M_sun
+  tc = 5/256. * c**5 * (a1 * au)**4 / (G**3 * m1 * m2 * (m1 + m2))
+  return (tc * (1 - e1**2)**(7/2.) * (1 + .27 * e1**10 + .33 * e1**20 + .2 *
+    e1**1000) / yr2s)
+
+class MergerTime(Condition):
+  '''Stop once the gravitational wave merger time of the inner binary is
+  less than tmax.  See merger_time.
+
+  Parameters:
+    tmax: The merger time in years below which to stop
+  '''
+
+  name = 'merger_time'
+
+  def __init__(self, tmax=1e8):
+    self.tmax = float(tmax)
+    self.spec = '%s=%r' % (self.name, self.tmax)
+
+  def __call__(self, triple):
+    if triple.m2 == 0:
+      return False
+    return merger_time(triple.a1, triple.e1, triple.m1, triple.m2) < self.tmax
+
+class OutsideKozaiWindow(Condition):
+  '''Stop once the inclination has stayed outside the Kozai window, 39.2 <
+  i < 140.8 degrees, for ncycles KL timescales.  See kl_timescale.
+
+  Parameters:
+    ncycles: The number of KL timescales
+  '''
+
+  name = 'kozai_window'
+
+  def __init__(self, ncycles=10):
+    self.ncycles = float(ncycles)
+    self.spec = '%s=%r' % (self.name, self.ncycles)
+    self._tinside = None
+
+  def __call__(self, triple):
+    if self._tinside is None or _cosi(triple)**2 < 3/5.:
+      self._tinside = triple.t
+      return False
+    return triple.t - self._tinside > self.ncycles * kl_timescale(triple)
+
+# The built-in conditions by name
+CONDITIONS = dict((cls.name, cls) for cls in [GRQuenched, MergerTime,
+  OutsideKozaiWindow])
+
+def make_condition(spec):
+  '''Create a built-in condition from a string 'name' or 'name=value'.'''
+  name, sep, value = spec.partition('=')
+  if name not in CONDITIONS:
+    raise ValueError('Unknown stopping condition %s' % name)
+  if not sep:
+    return CONDITIONS[name]()
+  try:
+    value = float(value)
+  except ValueError:
+    raise ValueError('The value of stopping condition %s must be a number, '
+      'e.g., %s' % (spec, CONDITIONS[name]().spec))
+  return CONDITIONS[name](value)
+
+def make_conditions(conditions):
+  '''Return a list of Conditions from a list of Conditions and strings (see
+  make_condition), or an empty list if conditions is None.'''
+  if conditions is None:
+    return []
+  return [make_condition(cond) if isinstance(cond, basestring) else cond for
+    cond in conditions]
+
+def specs(conditions):
+  '''Return the strings that create the built-in conditions of a list.'''
+  return [cond.spec for cond in make_conditions(conditions) if cond.spec is
+    not None]
+
+def check(triple):
+  '''Return the name of the first of the stop_conditions of a triple that
+  is met, or None if none are.'''
+  for cond in triple.stop_conditions:
+    if cond(triple):
+      return cond.name
+  return None
+
+def get_state(triple):
+  '''Return the states of the built-in stop_conditions of a triple by
+  spec.'''
+  return dict((cond.spec, cond.get_state()) for cond in
+    triple.stop_conditions if cond.spec is not None)
+
+def set_state(triple, state):
+  '''Restore the states of the built-in stop_conditions of a triple.'''
+  for cond in triple.stop_conditions:
+    if cond.spec in state:
+      cond.set_state(state[cond.spec])
@@ -0,0 +1,306 @@
+#! /usr/bin/env python
+
+'''
+ts_summary
+
+Summary statistics of the trajectory of a triple that are accumulated
+during the integration, so that the trajectory itself need not be written.
+Each statistic is a Reducer, which is updated after every step of
+Triple.integrate and Triple_vector.integrate (at every output time if
+outtimes is set) in constant time and memory.  Flips are found as events
+(see ts_events), so their times are as precise as the integration.  If
+outtimes is set, however, the solver is not stopped between output times,
+so flips are only seen by the sign of cos i at the output times: a pair of
+flips between two output times is missed, and a flip is counted at the
+output time after it.  The summary of an
+integration is a dictionary of the values of its reducers by name, and is
+the summary attribute of the triple.
+
+The built-in reducers are:
+
+  e1_max: The largest inner eccentricity
+  periapsis_min: The smallest periapsis of the inner binary in AU (in units
+    of a1 if a1 is not set)
+  inc_min: The smallest inclination in degrees
+  inc_max: The largest inclination in degrees
+  nflips: The number of times the inner orbit flips between prograde and
+    retrograde
+  t_first_flip: The time of the first flip in years, or None if there is
+    none
+  time_above: The fraction of the time for which e1 is above a threshold
+    (0.9 by default, e.g., 'time_above=0.99')
+
+DEFAULT is all of them.  Any other statistic can be given as a Reducer with
+a function of the current value and the triple, e.g.,
+
+    Reducer('a1_min', lambda value, triple: min(value, triple.a1), np.inf)
+
+As with ts_stopping, built-in reducers may be given by name as strings of
+the form 'name' or 'name=value', which is how they are saved in checkpoints
+and given on the command line.  A checkpoint also saves the state of each
+built-in reducer, so a resumed integration continues its summary.
+
+With outformat='none' (--format none) nothing is written during the
+integration, so an integration of which only the summary is needed does no
+I/O at all:
+
+    python triplesec.py -t 1e6 -i 85 --format none --summary default
+'''
+
+# Numerical modules
+from math import acos, degrees, sqrt
+import numpy as np
+
+class Reducer:
+  '''A statistic of the trajectory of a triple.
+
+  Parameters:
+    name: The name of the statistic in the summary
+    func: A function func(value, triple) of the current value of the
+      statistic and the triple after a step that returns its new value
+    initial: The value of the statistic before the first step
+  '''
+
+  # The string that creates the reducer (see make_reducers), if any
+  spec = None
+
+  def __init__(self, name, func, initial=None):
+    self.name = name
+    self.func = func
+    self.value = initial
+
+  def update(self, triple):
+    '''Update the statistic after a step.'''
+    self.value = self.func(self.value, triple)
+
+  def get_state(self):
+    '''Return the state of a built-in reducer for a checkpoint.'''
+    return dict((key, val) for key, val in vars(self).items() if key !=
+      'spec')
+
+  def set_state(self, state):
+    '''Restore the state of a built-in reducer from a checkpoint.'''
+    vars(self).update((str(key), val) for key, val in state.items())
+
+def cos_inclination(triple):
+  '''Return the cosine of the inclination of a Triple or Triple_vector.
+  This is called several times per step, so it avoids arithmetic on NumPy
+  scalars.'''
+  if hasattr(triple, 'jvec'):
+    jx, jy, jz = triple.jvec.tolist()
+    return jz / sqrt(jx * jx + jy * jy + jz * jz)
+  return float(triple.th)
+
+class EccMax(Reducer):
+  '''The largest inner eccentricity.'''
+
+  name = 'e1_max'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = 0.
+
+  def update(self, triple):
+    self.value = max(self.value, triple.e1)
+
+class PeriapsisMin(Reducer):
+  '''The smallest periapsis of the inner binary in AU.  If a1 is not set
+  (i.e., the triple was created with epsoct), this is in units of a1.'''
+
+  name = 'periapsis_min'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = np.inf
+
+  def update(self, triple):
+    a1 = triple.a1 if triple.a1 is not None else 1.
+    self.value = min(self.value, a1 * (1 - triple.e1))
+
+class IncMin(Reducer):
+  '''The smallest inclination in degrees.  The largest cos i is kept, and
+  converted to an angle only when it changes.'''
+
+  name = 'inc_min'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = 180.
+    self._cosi = -1.
+
+  def update(self, triple):
+    cosi = cos_inclination(triple)
+    if cosi > self._cosi:
+      self._cosi = cosi
+      self.value = degrees(acos(min(cosi, 1.)))
+
+class IncMax(Reducer):
+  '''The largest inclination in degrees.  See IncMin.'''
+
+  name = 'inc_max'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = 0.
+    self._cosi = 1.
+
+  def update(self, triple):
+    cosi = cos_inclination(triple)
+    if cosi < self._cosi:
+      self._cosi = cosi
+      self.value = degrees(acos(max(cosi, -1.)))
+
+class Flips(Reducer):
+  '''The number of flips of the inner orbit, i.e., of times cos i changes
+  sign.  The flips are given to flip by the integrator as they are found;
+  otherwise (e.g., if outtimes is set) they are counted by update when the
+  sign differs from that of the last update.'''
+
+  name = 'nflips'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = 0
+    self._prograde = None
+
+  def update(self, triple):
+    prograde = cos_inclination(triple) > 0
+    if self._prograde is not None and prograde != self._prograde:
+      self.value += 1
+    self._prograde = prograde
+
+  def flip(self, t):
+    '''Count a flip at time t in years found as an event.'''
+    self.value += 1
+    self._prograde = not self._prograde
+
+class FirstFlip(Reducer):
+  '''The time of the first flip in years, or None if the orbit has not
+  flipped.  This is the time of the flip event (see Flips), or if outtimes
+  is set, the first output time after the flip.'''
+
+  name = 't_first_flip'
+
+  def __init__(self):
+    self.spec = self.name
+    self.value = None
+    self._prograde = None
+
+  def update(self, triple):
+    if self.value is not None:
+      return
+    prograde = cos_inclination(triple) > 0
+    if self._prograde is not None and prograde != self._prograde:
+      self.value = triple.t
+    self._prograde = prograde
+
+  def flip(self, t):
+    '''Record a flip at time t in years found as an event.'''
+    if self.value is None:
+      self.value = t
+    self._prograde = not self._prograde
+
+class TimeAbove(Reducer):
+  '''The fraction of the time for which the inner eccentricity is above a
+  threshold.  The eccentricity is taken to be constant over each step, at
+  its value at the start of the step.
+
+  Parameters:
+    threshold: The eccentricity
+  '''
+
+  name = 'time_above'
+
+  def __init__(self, threshold=.9):
+    self.threshold = float(threshold)
+    self.spec = '%s=%r' % (self.name, self.threshold)
+    self.value = 0.
+    self._t0 = None
+    self._t = None
+    self._above = False
+    self._tabove = 0.
+
+  def update(self, triple):
+    if self._t0 is None:
+      self._t0 = triple.t
+    elif self._above:
+      self._tabove += triple.t - self._t
+    self._t = triple.t
+    self._above = bool(triple.e1 > self.threshold)
+    if self._t > self._t0:
+      self.value = self._tabove / (self._t - self._t0)
+
+# The built-in reducers by name
+REDUCERS = dict((cls.name, cls) for cls in [EccMax, PeriapsisMin, IncMin,
+  IncMax, Flips, FirstFlip, TimeAbove])
+
+# All of the built-in reducers
+DEFAULT = ['e1_max', 'periapsis_min', 'inc_min', 'inc_max', 'nflips',
+  't_first_flip', 'time_above']
+
+def make_reducer(spec):
+  '''Create a built-in reducer from a string 'name' or 'name=value'.'''
+  name, sep, value = spec.partition('=')
+  if name not in REDUCERS:
+    raise ValueError('Unknown reducer %s' % name)
+  if sep:
+    return REDUCERS[name](float(value))
+  return REDUCERS[name]()
+
+def make_reducers(reducers):
+  '''Return a list of Reducers from a list of Reducers and strings (see
+  make_reducer), or an empty list if reducers is None.  The string
+  'default' stands for DEFAULT.'''
+  if reducers is None:
+    return []
+  result = []
+  for reducer in reducers:
+    if reducer == 'default':
+      result.extend(make_reducer(spec) for spec in DEFAULT)
+    elif isinstance(reducer, basestring):
+      result.append(make_reducer(reducer))
+    else:
+      result.append(reducer)
+  return result
+
+def names(reducers):
+  '''Return the names of the statistics of a list of reducers in order.'''
+  return [reducer.name for reducer in make_reducers(reducers)]
+
+def specs(reducers):
+  '''Return the strings that create the built-in reducers of a list.'''
+  return [reducer.spec for reducer in make_reducers(reducers) if
+    reducer.spec is not None]
+
+def update(triple):
+  '''Update the reducers of a triple after a step.'''
+  for reducer in triple.reducers:
+    reducer.update(triple)
+
+def counts_flips(triple):
+  '''Whether any reducer of a triple is given the flips found as events.'''
+  return any(hasattr(reducer, 'flip') for reducer in triple.reducers)
+
+def flip(triple, t):
+  '''Give a flip of a triple at time t in years to its reducers.'''
+  for reducer in triple.reducers:
+    if hasattr(reducer, 'flip'):
+      reducer.flip(t)
+
+def summarize(triple):
+  '''Return the summary of a triple so far, or None if it has no
+  reducers.'''
+  if not triple.reducers:
+    return None
+  return dict((reducer.name, reducer.value) for reducer in triple.reducers)
+
+def get_state(triple):
+  '''Return the states of the built-in reducers of a triple by spec.'''
+  return dict((reducer.spec, reducer.get_state()) for reducer in
+    triple.reducers if reducer.spec is not None)
+
+def set_state(triple, state):
+  '''Restore the states of the built-in reducers of a triple.'''
+  for reducer in triple.reducers:
+    if reducer.spec in state:
+      reducer.set_state(state[reducer.spec])
@@ -12,15 +12,29 @@ if __name__ == '__main__':
   import __init__
 
 # System packages
-import argparse
 import sys
 import time
 
 # Numerical packages
-from math import sin, cos
+from math import sin, cos, sqrt
 import numpy as np
-from scipy.integrate import ode, quad
-from scipy.optimize import root, fsolve
+
+# Triplesec packages
+import ts_checkpoint
+import ts_events
+import ts_output
+import ts_solvers
+import ts_stats
+import ts_stopping
+import ts_summary
+
+def _row_e1(row):
+  '''The eccentricity in a row of output of Triple_vector.'''
+  return sqrt(row[4]**2 + row[5]**2 + row[6]**2)
+
+def _row_cosi(row):
+  '''The cosine of the inclination in a row of output of Triple_vector.'''
+  return row[3] / sqrt(row[1]**2 + row[2]**2 + row[3]**2)
 
 class Triple_vector:
   '''Evolve a triple in time using the vectorial equations of motion.  This
@@ -43,18 +57,56 @@ class Triple_vector:
     cputstop: The maximum amount of CPU time to integrate in seconds
     outfreq: Print output on every nth step
     outfilename: Write output to this file.  If None, print to stdout.
+    outformat: The format of the output file, 'text', 'npy', or 'none'.  See
+      ts_output.
     atol: Absolute tolerance of the integrator
     rtol: Relative tolerance of the integrator
-    integration_algo: The integration algorithm.  See scipy.ode
-      documentation
+    integration_algo: The integration algorithm.  See ts_solvers.
     quadrupole: Include the quadrupole term of the potential
     octupole: Include the octupole term of the potential
+    stiff: Use the stiff (BDF) method of VODE rather than the Adams method
+    jacobian: Supply the analytic Jacobian of the EOMs to the integrator.
+      The Jacobian is only used by the implicit methods.  See ts_solvers.
+    outtimes: Print output only at these times in years.  If set, the
+      solver integrates without interruption between output times and the
+      output is interpolated by the solver.  The final state at tstop is
+      always printed.  outfreq is ignored.
+    stats: Count and time the parts of the integration.  See ts_stats.
+    stats_outfilename: Write the stats in JSON format to this file at the
+      end of the integration ('stderr' for stderr).
+    checkpoint_filename: Write a checkpoint to this file every
+      checkpoint_interval seconds and at the end of the integration.  See
+      ts_checkpoint.
+    checkpoint_interval: The wall time between checkpoints in seconds
+    stop_conditions: Stop the integration early when any of these
+      conditions is met, and record its name in stop_reason.  See
+      ts_stopping.
+    decimate: Write only the rows at which e1 or the inclination is
+      largest or smallest in each interval of this many years, as well as
+      the first and last rows.  See ts_output.DecimatedOutput.
+    reducers: Summary statistics to accumulate during the integration,
+      e.g., ['e1_max', 'nflips'] or ['default'].  A list of
+      ts_summary.Reducers or their names.  Their values are the summary of
+      the triple after integrate.  See ts_summary.
   '''
 
+  # The columns of the output.  See printout.
+  columns = ['t', 'jx', 'jy', 'jz', 'ex', 'ey', 'ez']
+
+  # The functions of a row of output whose extrema are kept when the output
+  # is decimated.  See ts_output.DecimatedOutput.
+  decimation_keys = [_row_e1, _row_cosi]
+
   def __init__(self, a1=1., a2=20., e1=.1, e2=.3, inc=80., longascnode=180.,
     argperi=0., m1=1, m3=1, epsoct=None, tstop=1e3, cputstop=300, outfreq=1,
     outfilename=None, atol=1e-9, rtol=1e-9, integration_algo='vode',
-    quadrupole=True, octupole=True):
+    quadrupole=True, octupole=True, outtimes=None, stiff=False,
+    jacobian=True, outformat='text', stats=False, stats_outfilename=None,
+    checkpoint_filename=None, checkpoint_interval=600,
+    stop_conditions=None, decimate=None, reducers=None):
+
+    # The parameters, to be saved in checkpoints
+    self._params = ts_checkpoint.parameters(locals())
 
     # Given parameters
     self.a1 = float(a1)
@@ -89,14 +141,8 @@ class Triple_vector:
       self.e1**2 * (1 - self.th**2) * np.cos(2 * self.g1))
 
     # The vectorial elements
-    self.jhatvec = np.array([
-      sin(self.inc) * sin(self.Omega),
-      -sin(self.inc) * cos(self.Omega),
-      cos(self.inc)])
+    self.jhatvec, self.ehatvec = unit_vectors(self.inc, self.Omega, self.g1)
     self.jvec = self.j * self.jhatvec
-
-    ehatvec_sol = root(_evec_root, [.5, .5, .5], (self.jhatvec, self.g1))
-    self.ehatvec = ehatvec_sol.x
     self.evec = self.e1 * self.ehatvec
 
     # Elements of the potential
@@ -120,25 +166,43 @@ class Triple_vector:
     self.tstop = tstop
     self.cputstop = cputstop
     self.outfreq = outfreq
+    self.outtimes = outtimes
     self.outfilename = outfilename
+    self.outformat = outformat
+    self.decimate = decimate
     self.integration_algo = integration_algo
+    self.stiff = stiff
+    self.jacobian = jacobian
+    self.stop_conditions = ts_stopping.make_conditions(stop_conditions)
+    self.stop_reason = None # The stopping condition that was met
+    self.reducers = ts_summary.make_reducers(reducers)
+    self.summary = None # The values of the reducers
     self.y = list(np.concatenate((self.jvec, self.evec)))
 
     # We have saved some of the initial values (e.g., jvec_0).  Here we set
     # them to their respective parameters.  (I.e., we set jvec = jvec_0[:].)
     self._save_initial_params()
 
-    if self.outfilename is not None:
-      self.outfile = open(self.outfilename, 'w')
+    self.outfile = ts_output.open_output(self.outfilename, self.columns,
+      self.outformat)
+    ts_output.decimate(self)
 
-    # Set up the integrator
+    # Set up the integrator.  See ts_solvers.
     self.atol = atol
     self.rtol = rtol
-    self.solver = ode(self._deriv)
-    self.solver.set_integrator(self.integration_algo, nsteps=1, 
-      atol=self.atol, rtol=self.rtol)
-    self.solver.set_initial_value(self.y, self._t).set_f_params(self.epsoct)
-    self.solver._integrator.iwork[2] = -1 # Don't print FORTRAN errors
+    self.stats = ts_stats.Stats() if stats else None
+    self.stats_outfilename = stats_outfilename
+    self.checkpoint_filename = checkpoint_filename
+    self.checkpoint_interval = checkpoint_interval
+    self._tcheckpoint = time.time()
+    # The derivatives are written into this buffer by _deriv.  See
+    # ts_solvers.IvpSolver.
+    self._dy = np.empty(6)
+    self.solver = ts_solvers.make_solver(self.integration_algo, self._deriv,
+      self.y, self._t, self.tstop / self.tsec, self.atol, self.rtol,
+      jac=self._jac if self.jacobian else None, args=(self.epsoct,),
+      stiff=self.stiff, stats=self.stats)
+    ts_stats.instrument(self)
 
   def _save_initial_params(self):
     '''Set the variables to their initial values.  Just a clone of
@@ -197,99 +261,199 @@ class Triple_vector:
       np.sin(self.g1)**2))
 
   def _deriv(self, t, y, epsoct):
-    '''The EOMs.  See Eqs. 4 of Katz et al. (2011).'''
+    '''The EOMs.  See Eqs. 4 of Katz et al. (2011) and _deriv_kernel.  The
+    derivatives are written into the same array at every call.'''
+    return _deriv_kernel(y, epsoct, self._dy)
 
-    # Note that we have the following correspondences:
-    # y[0]  y[1]  y[2]  y[3]  y[4]  y[5]
-    # j_x   j_y   j_z   e_x   e_y   e_z
+  def _jac(self, t, y, epsoct):
+    '''The Jacobian of the EOMs.'''
 
-    #The total eccentricity:
     jx, jy, jz, ex, ey, ez = y
-    e_sq = ex**2 + ey**2 + ez**2
-
-    # Calculate the derivatives of phi.
-    grad_j_phi_q = np.array([0, 0, 3/4. * jz])
-    grad_j_phi_oct = -75/32. * np.array([ez * jz, 0,
-      ex * jz + ez * jx])
-    grad_e_phi_q = np.array([3/2. * ex, 3/2. * ey, -9/4. * ez])
-    grad_e_phi_oct = np.array([
-      75/64. * (1/5. - 8/5. * e_sq + 7 * ez**2 - jz**2) - 15/4. * ex**2,
-      -15/4. * ex * ey,
-      75/64. * (54/5. * ex * ez - 2 * jx * jz)])
-
-    grad_j_phi = grad_j_phi_q + epsoct * grad_j_phi_oct
-    grad_e_phi = grad_e_phi_q + epsoct * grad_e_phi_oct
-
-    djdtau = np.cross(y[:3], grad_j_phi) + np.cross(y[3:], grad_e_phi)
-    dedtau = np.cross(y[:3], grad_e_phi) + np.cross(y[3:], grad_j_phi)
+    jvec = np.array(y[:3])
+    evec = np.array(y[3:])
 
-    ret = np.concatenate((djdtau, dedtau))
-    return list(ret)
+    # The gradients of phi, as in _deriv
+    e_sq = ex**2 + ey**2 + ez**2
+    grad_j_phi = np.array([
+      -75/32. * epsoct * ez * jz,
+      0,
+      3/4. * jz - 75/32. * epsoct * (ex * jz + ez * jx)])
+    grad_e_phi = np.array([
+      3/2. * ex + epsoct * (75/64. * (1/5. - 8/5. * e_sq + 7 * ez**2 -
+        jz**2) - 15/4. * ex**2),
+      3/2. * ey - epsoct * 15/4. * ex * ey,
+      -9/4. * ez + epsoct * 75/64. * (54/5. * ex * ez - 2 * jx * jz)])
+
+    # The Hessian of phi
+    phi_jj = np.array([
+      [0, 0, -75/32. * epsoct * ez],
+      [0, 0, 0],
+      [-75/32. * epsoct * ez, 0, 3/4. - 75/32. * epsoct * ex]])
+    phi_je = np.array([
+      [0, 0, -75/32. * epsoct * jz],
+      [0, 0, 0],
+      [-75/32. * epsoct * jz, 0, -75/32. * epsoct * jx]])
+    phi_ee = np.array([
+      [3/2. - 45/4. * epsoct * ex, -15/4. * epsoct * ey, 405/32. * epsoct *
+        ez],
+      [-15/4. * epsoct * ey, 3/2. - 15/4. * epsoct * ex, 0],
+      [405/32. * epsoct * ez, 0, -9/4. + 405/32. * epsoct * ex]])
+
+    # d(a x b) = [a]_x db - [b]_x da
+    J = _skew(jvec)
+    E = _skew(evec)
+    jac = np.empty((6, 6))
+    jac[:3, :3] = -_skew(grad_j_phi) + J.dot(phi_jj) + E.dot(phi_je.T)
+    jac[:3, 3:] = J.dot(phi_je) - _skew(grad_e_phi) + E.dot(phi_ee)
+    jac[3:, :3] = -_skew(grad_e_phi) + J.dot(phi_je.T) + E.dot(phi_jj)
+    jac[3:, 3:] = J.dot(phi_ee) - _skew(grad_j_phi) + E.dot(phi_je)
+
+    return jac
 
   def _step(self):
-    self.solver.integrate(self.tstop, step=True)
+    self.solver.step()
     self.nstep += 1
-    self._t = self.solver.t
-    self.jvec = self.solver.y[:3]
-    self.evec = self.solver.y[3:]
+    self._read_solver()
+
+  def _read_solver(self):
+    '''Set the state of the triple from the solver.'''
+    self._set_state(self.solver.t, self.solver.y)
+
+  def _set_state(self, t, y):
+    '''Set the state of the triple from a time and state in the units of
+    the solver.'''
+    self._t = t
+    self.jvec = y[:3]
+    self.evec = y[3:]
     self.update()
 
+  def ecc_event(self, direction=0):
+    '''An event at the extrema of the inner eccentricity: maxima if
+    direction is -1, minima if it is 1, and both if it is 0.  See
+    ts_events.'''
+    return ts_events.Event(lambda t, y: np.dot(y[3:], self._deriv(t, y,
+      self.epsoct)[3:]), direction)
+
+  def flip_event(self):
+    '''An event whenever the inner orbit flips between prograde and
+    retrograde.'''
+    return ts_events.Event(lambda t, y: y[2])
+
+  def checkpoint(self, filename=None):
+    '''Write a checkpoint of the integration to filename, or to
+    checkpoint_filename if filename is None.  See ts_checkpoint.'''
+    ts_checkpoint.save(self, filename or self.checkpoint_filename)
+
+  @classmethod
+  def resume(cls, filename, **kwargs):
+    '''Continue an integration from a checkpoint.  Parameters given as
+    keyword arguments (e.g., tstop) override those of the checkpoint.  See
+    ts_checkpoint.load.'''
+    return ts_checkpoint.load(cls, filename, **kwargs)
+
+  def _advance(self, tout):
+    '''Integrate without interruption to tout (in units of tsec).  Return
+    False if the CPU time limit or an integration failure stopped the
+    solver first.'''
+    while self.solver.t < tout:
+      if time.time() - self.tstart > self.cputstop:
+        return False
+      if not self.solver.advance(tout):
+        return False
+    return True
+
+  def _integrate_dense(self):
+    '''Integrate the triple, printing out only at the times in outtimes.'''
+    self.tstart = time.time()
+    if self.nstep == 0:
+      ts_summary.update(self)
+    # A resumed integration continues after the last output time
+    outtimes = sorted(t for t in self.outtimes if t < self.tstop and (t >
+      self.t or self.nstep == 0))
+    for tout in outtimes + [self.tstop]:
+      finished = self._advance(tout / self.tsec)
+      self.nstep = self.solver.nsteps
+      self._read_solver()
+      self.printout()
+      ts_summary.update(self)
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
+      self.stop_reason = ts_stopping.check(self)
+      if not finished or self.stop_reason is not None:
+        break
+
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
+    self.outfile.close()
+    self.summary = ts_summary.summarize(self)
+
+  @ts_stats.measured
   def integrate(self):
     '''Integrate the triple in time.'''
-    self.printout()
+    if self.outtimes is not None:
+      self._integrate_dense()
+      return
+
+    # A resumed integration has already printed its state
+    if self.nstep == 0:
+      self.printout()
+      ts_summary.update(self)
+    # Flips are only looked for if a reducer counts them, since finding
+    # events adds about 10% to the cost of a step
+    finder = None
+    if ts_summary.counts_flips(self):
+      finder = ts_events.EventFinder(self, [self.flip_event()])
     self.tstart = time.time()
     while ((self.t < self.tstop) and 
       (time.time() - self.tstart < self.cputstop)):
 
-      self._step()
+      if finder is None:
+        self._step()
+      else:
+        for event, t, y in finder.step():
+          ts_summary.flip(self, t * self.tsec)
+      ts_summary.update(self)
+      self.stop_reason = ts_stopping.check(self)
+      if self.stop_reason is not None:
+        break
       if self.nstep % self.outfreq == 0:
         self.printout()
+      if self.checkpoint_filename is not None:
+        ts_checkpoint.periodic(self)
 
+    if self.checkpoint_filename is not None:
+      self.checkpoint()
     self.printout()
-    if self.outfilename is not None:
-      self.outfile.close()
+    self.outfile.close()
+    self.summary = ts_summary.summarize(self)
 
+  @ts_stats.measured
   def ecc_extrema(self):
     '''Integrate the triple, but only print out on eccentricity extrema.'''
-    t_prev = 0
-    e_prev = 0
-    e_prev2 = 0
+    self.outfile.close()
+    self.outfile = ts_output.open_output(self.outfilename, ['t', 'e1'],
+      self.outformat)
+    ts_stats.instrument_output(self)
+    finder = ts_events.EventFinder(self, [self.ecc_event(-1)])
     while self.t < self.tstop:
-      self._step()
-      e = np.linalg.norm(self.evec)
-      if e_prev2 < e_prev > e:
-        outstring = ' '.join(map(str, [t_prev, e_prev]))
-        if self.outfilename is None:
-          print outstring
-        else:
-          self.outfile.write(outstring + '\n')
-      t_prev = self.t
-      e_prev2 = e_prev
-      e_prev = e
-
-    if self.outfilename is not None:
-      self.outfile.close()
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        self.outfile.write([self.t, self.e1])
+
+    self.outfile.close()
 
+  @ts_stats.measured
   def printflips(self):
     '''Integrate the triple, but print out only when there is a flip.'''
-    t_prev = 0
-    e_prev = 0
-    e_prev2 = 0
-    sign_prev = np.sign(self.jvec[2])
+    self.outfile.close()
+    self.outfile = ts_output.open_output(self.outfilename, ['t', 'e1'],
+      self.outformat)
+    ts_stats.instrument_output(self)
+    finder = ts_events.EventFinder(self, [self.flip_event()])
     while self.t < self.tstop:
-      self._step()
-      e = np.linalg.norm(self.evec)
-      if e_prev2 < e_prev > e:
-        if np.sign(self.jvec[2]) != sign_prev:
-          outstring = ' '.join(map(str, [t_prev, e_prev]))
-          if self.outfilename is None:
-            print outstring
-          else:
-            self.outfile.write(outstring + '\n')
-        sign_prev = np.sign(self.jvec[2])
-      t_prev = self.t
-      e_prev2 = e_prev
-      e_prev = e
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        self.outfile.write([self.t, self.e1])
     self.outfile.close()
 
   def printout(self):
@@ -299,47 +463,34 @@ class Triple_vector:
 
     '''
 
-    outstring = ' '.join(map(str, np.concatenate((np.array([self.t]), 
-      self.jvec, self.evec))))
-    if self.outfilename is None:
-      print outstring
-    else:
-      self.outfile.write(outstring + '\n')
+    self.outfile.write(np.concatenate(([self.t], self.jvec, self.evec)))
 
+  @ts_stats.measured
   def flip_times(self, nflips=3):
     '''Find the times that the inner binary flips.'''
-    sign = np.sign(self.jvec[2])
-    sign_prev = sign
+    finder = ts_events.EventFinder(self, [self.flip_event()])
     flip_count = 0
 
     # Integrate along...
     while flip_count < nflips:
-      self._step()
-      sign = np.sign(self.jvec[2])
-      if sign != sign_prev:
+      for event, t, y in finder.step():
+        self._set_state(t, y)
         flip_count += 1
         self.printout()
-      sign_prev = sign
 
+  @ts_stats.measured
   def flip_period(self, nflips=3):
     '''Return the period of flips.'''
-    sign = np.sign(self.jvec[2])
-    sign_prev = sign
-    flip_count = 0
-    fliptime_prev = 0
-    periods = []
+    finder = ts_events.EventFinder(self, [self.flip_event()])
+    fliptimes = []
 
     # Integrate along...
-    while len(periods) < nflips:
-      self._step()
-      sign = np.sign(self.jvec[2])
-      if sign != sign_prev:
-        if fliptime_prev != 0:
-          periods.append(self.t - fliptime_prev)
-        fliptime_prev = self.t
-      sign_prev = sign
+    while len(fliptimes) <= nflips:
+      for event, t, y in finder.step():
+        self._set_state(t, y)
+        fliptimes.append(self.t)
 
-    return np.mean(periods)
+    return np.mean(np.diff(fliptimes[:nflips + 1]))
 
   def __exit__(self):
     try:
@@ -348,20 +499,124 @@ class Triple_vector:
       pass
 
 
-def _evec_root(x, j, g1):
-  '''The set of equations that determine evec.'''
+def _deriv_python(y, epsoct, out):
+  '''The EOMs written out component by component.  The derivatives are
+  written into out, which is returned.
+
+  We have the following correspondences:
+    y[0]  y[1]  y[2]  y[3]  y[4]  y[5]
+    j_x   j_y   j_z   e_x   e_y   e_z
+  '''
+
+  jx = y[0]
+  jy = y[1]
+  jz = y[2]
+  ex = y[3]
+  ey = y[4]
+  ez = y[5]
+  e_sq = ex * ex + ey * ey + ez * ez
+
+  # The gradients of phi.  The y component of grad_j phi vanishes.
+  gjx = -75/32. * epsoct * ez * jz
+  gjz = 3/4. * jz - 75/32. * epsoct * (ex * jz + ez * jx)
+  gex = 3/2. * ex + epsoct * (75/64. * (1/5. - 8/5. * e_sq + 7 * ez * ez -
+    jz * jz) - 15/4. * ex * ex)
+  gey = 3/2. * ey - epsoct * 15/4. * ex * ey
+  gez = -9/4. * ez + epsoct * 75/64. * (54/5. * ex * ez - 2 * jx * jz)
+
+  # dj/dtau = j x grad_j phi + e x grad_e phi
+  out[0] = jy * gjz + ey * gez - ez * gey
+  out[1] = jz * gjx - jx * gjz + ez * gex - ex * gez
+  out[2] = -jy * gjx + ex * gey - ey * gex
+
+  # de/dtau = j x grad_e phi + e x grad_j phi
+  out[3] = jy * gez - jz * gey + ey * gjz
+  out[4] = jz * gex - jx * gez + ez * gjx - ex * gjz
+  out[5] = jx * gey - jy * gex - ey * gjx
+
+  return out
+
+# Numba is optional.  If it is installed the derivative kernel is compiled,
+# but only once it has been called _JIT_CALLS times.  Importing numba and
+# compiling the kernel take about a second, and the compiled kernel saves
+# about 7 microseconds per call, so short integrations (and programs that
+# never integrate a Triple_vector) are faster without it.  The compiled
+# kernel is not cached on disk, since the cache does not work for a module
+# that is imported both as a script and as part of the package.
+_JIT_CALLS = 50000
+_ncalls = [0]
+
+def _deriv_counting(y, epsoct, out):
+  '''The Python kernel, which compiles the kernel with numba once it has
+  been called _JIT_CALLS times.'''
+  global _deriv_kernel
+  _ncalls[0] += 1
+  if _ncalls[0] >= _JIT_CALLS:
+    try:
+      from numba import njit
+      _deriv_kernel = njit(_deriv_python)
+    except ImportError:
+      _deriv_kernel = _deriv_python
+  return _deriv_python(y, epsoct, out)
+
+_deriv_kernel = _deriv_counting
+
+def _skew(v):
+  '''The matrix [v]_x such that [v]_x u = v x u.'''
+  return np.array([
+    [0, -v[2], v[1]],
+    [v[2], 0, -v[0]],
+    [-v[1], v[0], 0]])
+
+def unit_vectors(inc, Omega, g1):
+  '''Return the unit vectors along the angular momentum and the
+  eccentricity vector of the inner binary.  The eccentricity vector is the
+  direction of the ascending node rotated by g1 about the angular momentum.
+
+  Parameters:
+    inc: Inclination in radians
+    Omega: Longitude of ascending node in radians
+    g1: Argument of periapsis in radians
+
+  The parameters may be arrays of any shape that can be broadcast together,
+  in which case the unit vectors have an extra last axis of length 3.
+
+  Returns:
+    jhatvec, ehatvec
+  '''
+
+  inc, Omega, g1 = np.broadcast_arrays(inc, Omega, g1)
+  sini, cosi = np.sin(inc), np.cos(inc)
+  sinO, cosO = np.sin(Omega), np.cos(Omega)
+  sing, cosg = np.sin(g1), np.cos(g1)
+
+  jhatvec = np.stack([sini * sinO, -sini * cosO, cosi], axis=-1)
+  ehatvec = np.stack([
+    cosO * cosg - sinO * sing * cosi,
+    sinO * cosg + cosO * sing * cosi,
+    sing * sini], axis=-1)
+  return jhatvec, ehatvec
 
-  # Orthogonal to j
-  cond1 = x[0] * j[0] + x[1] * j[1] + x[2] * j[2]
+def vector_elements(e1, inc, Omega, g1):
+  '''Return the dimensionless angular momentum and eccentricity vectors of
+  the inner binary from its orbital elements.
 
-  # Normalized
-  cond2 = x[0]**2 + x[1]**2 + x[2]**2 - 1.
+  Parameters:
+    e1: Eccentricity of the inner binary
+    inc: Inclination in radians
+    Omega: Longitude of ascending node in radians
+    g1: Argument of periapsis in radians
+
+  The parameters may be arrays of any shape that can be broadcast together,
+  in which case the vectors have an extra last axis of length 3.
 
-  # Gives the right argument of periapsis
-  crossnorm = np.sqrt(j[0]**2 + j[1]**2)
-  cond3 = x[0] * j[1] / crossnorm - x[1] * j[0] / crossnorm + cos(g1)
+  Returns:
+    jvec, evec
+  '''
 
-  return [cond1, cond2, cond3]
+  jhatvec, ehatvec = unit_vectors(inc, Omega, g1)
+  e1 = np.asarray(e1, dtype=float)[..., np.newaxis]
+  return np.sqrt(1 - e1**2) * jhatvec, e1 * ehatvec
 
 def process_command_line(argv):
   '''Process the command line.'''
@@ -370,80 +625,149 @@ def process_command_line(argv):
     argv = sys.argv[1:]
 
   # Configure the command line options
+  import argparse
   parser = argparse.ArgumentParser()
 
-  def_trip = Triple_vector()
+  defaults = ts_checkpoint.defaults(Triple_vector)
   parser.add_argument('-m', '--m1', dest='m1', type=float, 
-    default=def_trip.m1, help = 
-    'Mass of star 1 in inner binary in solar masses [%g]' % def_trip.m1,
+    default=defaults['m1'], help = 
+    'Mass of star 1 in inner binary in solar masses [%g]' % defaults['m1'],
     metavar='\b')
   parser.add_argument('-o', '--m3', dest='m3', type=float, 
-    default=def_trip.m3, help = 
-    'Mass of tertiary in solar masses [%g]' % def_trip.m3, metavar='\b')
+    default=defaults['m3'], help = 
+    'Mass of tertiary in solar masses [%g]' % defaults['m3'], metavar='\b')
   parser.add_argument('-a', '--a1', dest='a1', type=float, 
-    default=def_trip.a1, help = 
-    'Inner semi-major axis in au [%g]' % def_trip.a1, metavar='\b')
+    default=defaults['a1'], help = 
+    'Inner semi-major axis in au [%g]' % defaults['a1'], metavar='\b')
   parser.add_argument('-b', '--a2', dest='a2', type=float, 
-    default=def_trip.a2, help = 
-    'Outer semi-major axis in au [%g]' % def_trip.a2, metavar='\b')
+    default=defaults['a2'], help = 
+    'Outer semi-major axis in au [%g]' % defaults['a2'], metavar='\b')
   parser.add_argument('-g', '--g1', dest='g1', type=float, 
-    default=def_trip.g1, help = 
-    'Inner argument of periapsis in degrees [%g]' % (def_trip.g1 * 180 /
-      np.pi), metavar='\b')
+    default=defaults['argperi'], help = 
+    'Inner argument of periapsis in degrees [%g]' % defaults['argperi'],
+    metavar='\b')
   parser.add_argument('-L', '--Omega', dest='Omega', type=float, 
-    default=def_trip.Omega, help = 
-    'Longitude of ascending node in degrees [%g]' % def_trip.Omega,
+    default=defaults['longascnode'], help = 
+    'Longitude of ascending node in degrees [%g]' % defaults['longascnode'],
     metavar='\b')
   parser.add_argument('-e', '--e1', dest='e1', type=float, 
-    default=def_trip.e1, help = 
-    'Inner eccentricity [%g]' % def_trip.e1, metavar='\b')
+    default=defaults['e1'], help = 
+    'Inner eccentricity [%g]' % defaults['e1'], metavar='\b')
   parser.add_argument('-f', '--e2', dest='e2', type=float, 
-    default=def_trip.e2, help = 
-    'Outer eccentricity [%g]' % def_trip.e2, metavar='\b')
+    default=defaults['e2'], help = 
+    'Outer eccentricity [%g]' % defaults['e2'], metavar='\b')
   parser.add_argument('-i', '--inc', dest='inc', type=float,
-    default=def_trip.inc, help = 
-    'Inclination of the third body in degrees [%g]' % def_trip.inc,
+    default=defaults['inc'], help = 
+    'Inclination of the third body in degrees [%g]' % defaults['inc'],
     metavar='\b')
   parser.add_argument('-t', '--end', dest='tstop', type=float, 
-    default=def_trip.tstop, help = 'Total time of integration in years [%g]' 
-    % def_trip.tstop, metavar='\b')
+    default=defaults['tstop'], help =
+    'Total time of integration in years [%g]' % defaults['tstop'],
+    metavar='\b')
   parser.add_argument('-C', '--cpu', dest='cputstop', type=float, 
-    default=def_trip.cputstop, help = 
+    default=defaults['cputstop'], help = 
     'cpu time limit in seconds, if -1 then no limit [%g]' %
-    def_trip.cputstop, metavar='\b')
+    defaults['cputstop'], metavar='\b')
   parser.add_argument('-F', '--freq', dest='outfreq', type=int, 
-    default=def_trip.outfreq, help = 'Output frequency [%g]' % 
-    def_trip.outfreq, metavar='\b')
+    default=defaults['outfreq'], help = 'Output frequency [%g]' % 
+    defaults['outfreq'], metavar='\b')
+  parser.add_argument('-N', '--nout', dest='nout', type=int, help = 
+    'Print output at this many evenly spaced times without stopping the '
+    'integrator in between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--dt', dest='dt', type=float, help =
+    'Print output every dt years without stopping the integrator in '
+    'between (overrides output frequency)', metavar='\b')
+  parser.add_argument('--log', dest='nlog', type=int, help =
+    'Print output at this many times spaced evenly in log from 1e-6 tstop '
+    'to tstop (overrides output frequency)', metavar='\b')
+  parser.add_argument('--decimate', dest='decimate', type=float, help =
+    'Print only the extrema of e1 and inc in each interval of this many '
+    'years', metavar='\b')
   parser.add_argument('-A', '--abstol', dest='atol', type=float, 
-    default=def_trip.atol, help = 'Absolute accuracy [%g]' % 
-    def_trip.atol, metavar='\b')
+    default=defaults['atol'], help = 'Absolute accuracy [%g]' % 
+    defaults['atol'], metavar='\b')
   parser.add_argument('-R', '--reltol', dest='rtol', type=float, 
-    default=def_trip.rtol, help = 'Relative accuracy [%g]' % 
-    def_trip.rtol, metavar='\b')
+    default=defaults['rtol'], help = 'Relative accuracy [%g]' % 
+    defaults['rtol'], metavar='\b')
   parser.add_argument('--epsoct', dest='epsoct', type=float, help = 
     'Set epsilon_octupole parameter (override SMA and e2 settings)',
     metavar='\b')
   parser.add_argument('--noquad', dest='quad', action='store_false',
-    default=def_trip.quadrupole, help = 'Turn off quadrupole terms')
+    default=defaults['quadrupole'], help = 'Turn off quadrupole terms')
   parser.add_argument('--nooct', dest='oct', action='store_false',
-    default=def_trip.octupole, help = 'Turn off octupole terms')
+    default=defaults['octupole'], help = 'Turn off octupole terms')
   parser.add_argument('--algorithm', dest='algo', type=str,
-    default=def_trip.integration_algo, help = 'Integration algorithm [%s]' 
-    % def_trip.integration_algo)
+    default=defaults['integration_algo'], choices=ts_solvers.SOLVERS, help =
+    'Integration algorithm [%s]' % defaults['integration_algo'])
+  parser.add_argument('--stiff', dest='stiff', action='store_true',
+    default=defaults['stiff'], help = 'Use the stiff (BDF) integrator')
+  parser.add_argument('-O', '--outfile', dest='outfilename', type=str, help =
+    'Write output to this file [stdout]', metavar='\b')
+  parser.add_argument('--format', dest='outformat', type=str,
+    default=defaults['outformat'], choices=ts_output.FORMATS, help =
+    'Format of the output file [%s]' % defaults['outformat'])
+  parser.add_argument('--stats', dest='stats_outfilename', type=str, help =
+    'Write counts and timings of the integration in JSON format to this '
+    'file (stderr for stderr)', metavar='\b')
+  parser.add_argument('--checkpoint', dest='checkpoint_filename', type=str,
+    help = 'Write checkpoints of the integration to this file',
+    metavar='\b')
+  parser.add_argument('--checkpoint-interval', dest='checkpoint_interval',
+    type=float, default=defaults['checkpoint_interval'], help =
+    'Wall time between checkpoints in seconds [%g]' %
+    defaults['checkpoint_interval'], metavar='\b')
+  parser.add_argument('--resume', dest='resume', type=str, help =
+    'Continue the integration from this checkpoint.  Only the time and CPU '
+    'limits and the checkpoint options are taken from the command line.',
+    metavar='\b')
+  parser.add_argument('--stop', dest='stop_conditions', action='append',
+    help = 'Stop early on this condition, e.g., kozai_window=10 (may be '
+    'repeated).  See ts_stopping.', metavar='\b')
+  parser.add_argument('--summary', dest='reducers', action='append',
+    help = 'Accumulate this summary statistic, e.g., e1_max or '
+    'time_above=0.99, and print the summary in JSON format to stderr at the '
+    'end (may be repeated; default for all of them).  See ts_summary.',
+    metavar='\b')
 
   arguments = parser.parse_args()
   return arguments
 
 def main(argv=None):
   args = process_command_line(argv)
-  tv = Triple_vector(a1=args.a1, a2=args.a2, e1=args.e1, e2=args.e2, 
-        inc=args.inc, longascnode=args.Omega, argperi=args.g1, m1=args.m1,
-        m3=args.m3, epsoct=args.epsoct, tstop=args.tstop, 
-        cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol, 
-        rtol=args.rtol, integration_algo=args.algo, quadrupole=args.quad,
-        octupole=args.oct)
+  outtimes = None
+  if args.nout is not None:
+    outtimes = np.linspace(0, args.tstop, args.nout)
+  elif args.dt is not None:
+    outtimes = ts_output.uniform_times(args.tstop, args.dt)
+  elif args.nlog is not None:
+    outtimes = ts_output.log_times(args.tstop, args.nlog, 1e-6 * args.tstop)
+  if args.resume is not None:
+    kwargs = {'tstop': args.tstop, 'cputstop': args.cputstop}
+    if args.checkpoint_filename is not None:
+      kwargs.update(checkpoint_filename=args.checkpoint_filename,
+        checkpoint_interval=args.checkpoint_interval)
+    tv = Triple_vector.resume(args.resume, **kwargs)
+  else:
+    tv = Triple_vector(a1=args.a1, a2=args.a2, e1=args.e1, e2=args.e2, 
+          inc=args.inc, longascnode=args.Omega, argperi=args.g1, m1=args.m1,
+          m3=args.m3, epsoct=args.epsoct, tstop=args.tstop, 
+          cputstop=args.cputstop, outfreq=args.outfreq, atol=args.atol, 
+          rtol=args.rtol, integration_algo=args.algo, quadrupole=args.quad,
+          octupole=args.oct, outtimes=outtimes, stiff=args.stiff,
+          outfilename=args.outfilename, outformat=args.outformat,
+          stats=args.stats_outfilename is not None,
+          stats_outfilename=args.stats_outfilename,
+          checkpoint_filename=args.checkpoint_filename,
+          checkpoint_interval=args.checkpoint_interval,
+          stop_conditions=args.stop_conditions, decimate=args.decimate,
+          reducers=args.reducers)
 
   tv.integrate()
+  if tv.stop_reason is not None:
+    print >> sys.stderr, 'Stopped: %s' % tv.stop_reason
+  if tv.summary is not None:
+    import json
+    print >> sys.stderr, json.dumps(tv.summary, sort_keys=True)
   return 0
 
 if __name__=='__main__':